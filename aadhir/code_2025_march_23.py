@@ -1,3 +1,7 @@
+# SPIKE APP: do not paste this file into the app - it needs spike/motion.py.
+# Build the upload (build/spike/code_2025_march_23.py) and paste that instead:
+#     python -m tools.build_spike_program aadhir/code_2025_march_23.py
+
 from hub import light_matrix, port, motion_sensor
 import motor
 import runloop
@@ -5,91 +9,9 @@ import math
 import motor_pair
 from math import *
 
-WHEEL_CIRCUMFERENCE = 17.6
-DISTANCE_BETWEEN_WHEELS = 9.6 #cm - please measure your own robot.
-
-motor_pair.pair(motor_pair.PAIR_1, port.A, port.B)
-drive_motor_pair = motor_pair.PAIR_1
-default_velocity = 1000
-turn_velocity= 100
-
-FRONT_MOTOR_PORT = port.D
-BACK_MOTOR_PORT = port.C
-# input must be in the same unit as WHEEL_CIRCUMFERENCE
-def convert_distance_to_degree(distance_cm):
-    # Add multiplier for gear ratio if needed
-    return int((distance_cm/WHEEL_CIRCUMFERENCE) * 360)
-
-# input must be in the same unit as WHEEL_CIRCUMFERENCE
-def move_for_distance(distance_cm,velocity=default_velocity):
-        degrees = convert_distance_to_degree(distance_cm)
-        return motor_pair.move_for_degrees(drive_motor_pair,degrees,0, velocity=velocity)
-
-
-PIVOT_CIRCUMFERENCE = 2 * DISTANCE_BETWEEN_WHEELS * math.pi
-async def pivot_turn(robot_degrees, motor_speed=turn_velocity):
-    # Add a multiplier for gear ratios if you’re using gears
-    motor_degrees = int((PIVOT_CIRCUMFERENCE/WHEEL_CIRCUMFERENCE) * abs(robot_degrees))
-    if robot_degrees > 0:
-        # pivot clockwise
-        await motor_pair.move_for_degrees(motor_pair.PAIR_1, motor_degrees, 50, velocity=motor_speed)
-    else:
-        #pivot counter clockwise
-        await motor_pair.move_for_degrees(motor_pair.PAIR_1, motor_degrees, -50, velocity=motor_speed)
-
-#Spin Turn Functions
-global degrees_to_turn, stop_angle
-# Function that returns true when the absolute yaw angle is 90 degrees
-def turn_done():
-    global degrees_to_turn, stop_angle
-    # convert tuple decidegree into the same format as in app and blocks
-    yaw_angle = motion_sensor.tilt_angles()[0] * -0.1
-    # if we need to turn less than 180 degrees, check the absolute values
-    if abs(degrees_to_turn) < 180 :
-        return abs(yaw_angle) > stop_angle
-    # If we need to turn more than 180 degrees, compute the yaw angle we need to stop at.
-    if degrees_to_turn >= 0: # moving clockwise
-    # The adjusted yaw angle is positive until we cross 180.
-    # Then, we are negative numbers counting up.
-        return yaw_angle < 0 and yaw_angle > stop_angle
-    else:
-    # The adjusted yaw angle is negative until we cross 180
-    # Then, we are positive numbers counting down.
-        return yaw_angle > 0 and yaw_angle < stop_angle
-
-async def spin_turn(degrees, velocity=100):
-    if abs(degrees) > 355:
-        print("Out of range")
-        return
-    motion_sensor.reset_yaw(0)
-    await runloop.until(motion_sensor.stable)
-    global degrees_to_turn, stop_angle
-    degrees_to_turn = degrees # set the global to use in the turn_done function
-    # set the stop_angle global to use in the turn_done function
-    if (abs(degrees) < 180):
-        stop_angle = abs(degrees_to_turn)
-    else:
-        stop_angle = (360 - abs(degrees)) if degrees < 0 else (abs(degrees) - 360)
-    # set the steering vlaue based on turn direction
-    steering_val = 100 if degrees >= 0 else -100
-    motor_pair.move(drive_motor_pair, steering_val, velocity=velocity)
-    await runloop.until(turn_done)
-    motor_pair.stop(drive_motor_pair)
-
-async def move_arm(degree, direction, arm):
-    if(direction=="up"):
-        #up is minus degree
-        degree = abs(degree)
-    else:
-        degree = - abs(degree)
-    await motor.run_for_degrees(arm, degree, 360)
-
-async def move_front_arm(degree, direction):
-    await move_arm(degree,direction,FRONT_MOTOR_PORT)
-
-
-async def move_back_arm(degree, direction):
-    await move_arm(degree,direction,BACK_MOTOR_PORT)
+# Robot profile and shared primitives from spike/motion.py
+ROBOT = "aadhir_march"
+from motion import *
 
 async def mission_2():
     #reset arm
@@ -1,3 +1,7 @@
+# SPIKE APP: do not paste this file into the app - it needs spike/motion.py.
+# Build the upload (build/spike/fll2-functions.py) and paste that instead:
+#     python -m tools.build_spike_program joshua/fll2-functions.py
+
 from hub import light_matrix, port, motion_sensor, power_off
 import motor
 import runloop
@@ -7,92 +11,28 @@ from math import *
 import hub
 #functions
 #forward(centimeters,speed) and bacwards(centimeters,speed)
-#turn_right(deegres) and turn_left(deegres) cannot go over 355 deegrees in one turn
+#turn_right(deegres) and turn_left(deegres)
 #arm_up(deegres) and arm_down(deegres)
 #
 
-DEFAULT_TURN_SPEED=75
-
-#Small Wheels
-WHEEL_CIRCUMFERENCE = 17.5
-#Big Wheels
-#WHEEL_CIRCUMFERENCE = 27.4
-DISTANCE_BETWEEN_WHEELS = 9.7 # 11.4 #cm - please measure your own robot.
+# Robot profile and shared primitives from spike/motion.py
+ROBOT = "joshua"
+from motion import *
 
-#ports underneath
-motor_pair.pair(motor_pair.PAIR_1, port.B, port.F)
-drive_motor_pair = motor_pair.PAIR_1
-default_velocity = 30
-turn_velocity= 100
 LEFT_MOTOR=port.A
 RIGHT_MOTOR=port.E
 
 
-# input must be in the same unit as WHEEL_CIRCUMFERENCE
-def convert_distance_to_degree(distance_cm):
-    # Add multiplier for gear ratio if needed
-    return int((distance_cm/WHEEL_CIRCUMFERENCE) * 360)
-
-# input must be in the same unit as WHEEL_CIRCUMFERENCE
 def backward(distance_cm, speed=360):
         degrees = convert_distance_to_degree(abs(distance_cm)*-1)
         return motor_pair.move_for_degrees(drive_motor_pair,degrees,0, velocity=speed)
 
 
-def move_for_distance(distance_cm):
-        degrees = convert_distance_to_degree(distance_cm)
-        return motor_pair.move_for_degrees(drive_motor_pair,degrees,0)
-
 def forward(distance_cm, speed=360):
         degrees = convert_distance_to_degree(abs(distance_cm))
         return motor_pair.move_for_degrees(drive_motor_pair,degrees,0, velocity=speed)
 
 
-PIVOT_CIRCUMFERENCE = 2 * DISTANCE_BETWEEN_WHEELS * math.pi
-async def pivot_turn(robot_degrees, motor_speed=turn_velocity):
-    # Add a multiplier for gear ratios if you’re using gears
-    motor_degrees = int((PIVOT_CIRCUMFERENCE/WHEEL_CIRCUMFERENCE) * abs(robot_degrees))
-    if robot_degrees > 0:
-        # pivot clockwise
-        await motor_pair.move_for_degrees(motor_pair.PAIR_1, motor_degrees, 50, velocity=motor_speed)
-    else:
-        #pivot counter clockwise
-        await motor_pair.move_for_degrees(motor_pair.PAIR_1, motor_degrees, -50, velocity=motor_speed)
-
-# Function that returns true when the absolute yaw angle is 90 degrees
-def turn_done():
-    # convert tuple decidegree into same format as in app and blocks
-    return abs(motion_sensor.tilt_angles()[0] * -0.1) > abs(degrees_to_turn)
-
-
-
-async def spin_turn(degrees,speed=DEFAULT_TURN_SPEED):
-    if abs(degrees) > 355: #cannot be used over 355 degrees
-        print("Out of range")
-        return
-    if speed > 75:
-        print("Higher speed on turn can produce marginal error and turn more!")
-    motion_sensor.reset_yaw(0)
-    await runloop.until(motion_sensor.stable)
-    global degrees_to_turn, stop_angle
-    degrees_to_turn = degrees # set the global to use in the turn_done function
-    # set the stop_angle global to use in the turn_done function
-    if (abs(degrees) < 180):
-        stop_angle = abs(degrees_to_turn)
-    else:
-        stop_angle = (360 - abs(degrees)) if degrees < 0 else (abs(degrees) - 360)
-    # set the steering laue based on turn direction
-    steering_val = 100 if degrees >= 0 else -100
-    motor_pair.move(motor_pair.PAIR_1, steering_val, velocity=speed)
-    await runloop.until(turn_done)
-    motor_pair.stop(motor_pair.PAIR_1)
-
-async def turn_left(degrees,velocity=DEFAULT_TURN_SPEED):
-    await spin_turn(abs(degrees)*-1,velocity)
-
-async def turn_right(degrees,velocity=DEFAULT_TURN_SPEED):
-    await spin_turn(abs(degrees),velocity)
-
 async def arm_up(degrees:int,velocity=360,port=LEFT_MOTOR):
     await motor.run_for_degrees(port, (abs(degrees)*2), velocity)
 
@@ -137,8 +77,7 @@ async def reset_arm(arm):
 
 
 async def main():
-    await reset_arm(LEFT_MOTOR)
-    await reset_arm(RIGHT_MOTOR)
+    await together(reset_arm(LEFT_MOTOR), reset_arm(RIGHT_MOTOR))
 
     await forward(30, speed=900)
     await turn_left(89,150)
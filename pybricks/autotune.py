@@ -0,0 +1,447 @@
+#!/usr/bin/env pybricks-micropython
+"""
+AUTOTUNE - Controller Gain Tuning per Speed Preset
+==================================================
+
+Finds the fastest stable controller gains for each speed preset instead of
+one conservative global value found by trial and error.
+
+Heading gain (move_straight_gyro, forward and backward):
+    Relay feedback test. While driving at the preset speed, the turn rate is
+    switched between +RELAY_AMPLITUDE and -RELAY_AMPLITUDE whenever the
+    heading crosses zero. The robot settles into a small oscillation; its
+    amplitude gives the "ultimate gain" Ku where a P controller would
+    oscillate forever:
+
+        Ku = 4 * relay_amplitude / (pi * oscillation_amplitude)
+
+    (with the relay's hysteresis taken out of the amplitude). The tuned gain
+    is RELAY_GAIN_FACTOR * Ku (Ziegler-Nichols P rule). The test lasts a
+    number of oscillation cycles at speed, not a distance, so fast presets
+    get as many cycles as slow ones. Every preset is tested driving forward
+    and driving backward, because the robot does not behave the same way in
+    reverse (caster/skid in front).
+
+    A preset faster than the wheels can go while still steering is tested
+    at the fastest speed that leaves room for the relay - that is what
+    move_straight_gyro() gets at that preset, too. A test that does not
+    oscillate, or gives a gain above HEADING_KP_MAX, fails loudly and the
+    preset is left out of the table.
+
+Spin turn gain (spin_turn):
+    Step response test. Each candidate gain turns SPIN_TEST_ANGLE degrees
+    SPIN_TRIALS times (alternating left/right so the robot stays in place)
+    and is judged by its worst turn. The candidate with the fastest worst
+    turn that still finishes within SPIN_TURN_TOLERANCE wins, and
+    SPIN_GAIN_MARGIN of its gain is stored, so the stored gain is not
+    right next to one that overshoots.
+
+Usage:
+    On the hub:  run this file with ~1m of clear mat in front of the robot
+    Simulator:   python -m simulator.run autotune --main --imu-delay 20 --motor-delay 20
+                 (a check of this file only: the simulator has no speed
+                 dependence, so its gains are the same at every speed and
+                 must not be copied into robot_config.py)
+    Then copy the printed heading_gains / heading_gains_backward /
+    spin_gains into the profile in robot_config.py.
+
+Created: 2026-10-19
+For: Teams who want every speed preset to track as tightly as possible
+"""
+
+from robot import (
+    hub,
+    robot,
+    wait,
+    Color,
+    StopWatch,
+    left_motor,
+    right_motor,
+    move_straight,
+    spin_turn,
+    mm_to_motor_degrees,
+    motor_degrees_to_mm,
+    calibrate_gyro,
+    DriveSpeed,
+    TurnSpeed,
+    PROFILE,
+    AXLE_TRACK,
+    GYRO_PROPORTIONAL_GAIN,
+    SPIN_TURN_KP,
+    SPIN_TURN_TOLERANCE,
+)
+
+try:
+    from umath import pi, sqrt
+except ImportError:
+    from math import pi, sqrt
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+# Relay test (heading gain)
+RELAY_AMPLITUDE = 40        # deg/s - turn rate applied by the relay
+RELAY_HYSTERESIS = 0.5      # degrees - ignore sign changes smaller than this
+RELAY_CYCLES = 4            # oscillation cycles measured at speed
+RELAY_SKIP_CYCLES = 1       # first cycle at speed is still a transient
+RELAY_AT_SPEED = 0.9        # cycles count once the robot reaches 90% of the speed
+RELAY_MAX_DISTANCE = 1500   # mm - give up if the cycles take longer than this
+RELAY_GAIN_FACTOR = 0.5     # Ziegler-Nichols P controller: Kp = 0.5 * Ku
+WHEEL_MAX_SPEED = 1000      # deg/s - drive motor top speed
+HEADING_KP_MAX = 8.0        # 4x the hand-tuned gain - more is not stored
+
+# Step test (spin turn gain)
+SPIN_TEST_ANGLE = 90        # degrees per test turn
+SPIN_KP_CANDIDATES = (3, 5, 7, 9, 12, 15, 20)
+SPIN_SETTLE_MS = 200        # wait after the turn before measuring error
+SPIN_TRIALS = 3             # turns per candidate; the worst one counts
+SPIN_GAIN_MARGIN = 0.8      # store this fraction of the fastest safe gain
+
+# Presets to tune (PUSHING is tuned like any other drive speed)
+DRIVE_PRESETS = (
+    ("PRECISE", DriveSpeed.PRECISE),
+    ("APPROACH", DriveSpeed.APPROACH),
+    ("COLLECTION", DriveSpeed.COLLECTION),
+    ("PUSHING", DriveSpeed.PUSHING),
+    ("TRANSIT", DriveSpeed.TRANSIT),
+    ("RETURN", DriveSpeed.RETURN),
+)
+
+TURN_PRESETS = (
+    ("ALIGNMENT", TurnSpeed.ALIGNMENT),
+    ("PRECISE", TurnSpeed.PRECISE),
+    ("STANDARD", TurnSpeed.STANDARD),
+    ("APPROACH", TurnSpeed.APPROACH),
+    ("QUICK", TurnSpeed.QUICK),
+    ("REPOSITION", TurnSpeed.REPOSITION),
+)
+
+# ============================================================================
+# HEADING GAIN - RELAY FEEDBACK TEST
+# ============================================================================
+
+def relay_speed(speed, amplitude=RELAY_AMPLITUDE):
+    """
+    Fastest drive speed (mm/s) at which the relay can still steer.
+
+    Args:
+        speed (int/DriveSpeed): Requested drive speed in mm/s
+        amplitude (int): Relay turn rate in deg/s
+
+    Returns:
+        int: speed, or less if the outer wheel would hit WHEEL_MAX_SPEED
+    """
+    headroom = amplitude * pi / 180 * AXLE_TRACK / 2
+    return int(min(speed, motor_degrees_to_mm(WHEEL_MAX_SPEED) - headroom))
+
+
+def relay_test(speed, direction=1, amplitude=RELAY_AMPLITUDE, cycles=RELAY_CYCLES,
+               max_distance_mm=RELAY_MAX_DISTANCE):
+    """
+    Run one relay feedback experiment while driving.
+
+    Args:
+        speed (int/DriveSpeed): Drive speed in mm/s (see relay_speed())
+        direction (int): 1 = forward, -1 = backward
+        amplitude (int): Relay turn rate in deg/s
+        cycles (int): Oscillation cycles to measure once at speed
+        max_distance_mm (int): Stop (and fail) after this distance
+
+    Returns:
+        dict: {
+            'ultimate_gain': float,    # Ku
+            'period_ms': float,        # oscillation period Tu
+            'amplitude': float,        # heading oscillation amplitude (degrees)
+            'cycles': int,             # cycles measured
+            'distance_mm': int         # distance driven during the test
+        }
+        ultimate_gain/period_ms/amplitude are None if the robot did not
+        oscillate for enough cycles
+    """
+    hub.imu.reset_heading(0)
+    wait(50)
+
+    left_start = left_motor.angle()
+    right_start = right_motor.angle()
+    limit_sum = 2 * mm_to_motor_degrees(max_distance_mm)
+    travelled = 0
+    at_speed = RELAY_AT_SPEED * speed
+
+    stopwatch = StopWatch()
+    output = amplitude
+    high = 0
+    low = 0
+    last_cycle_ms = None
+    amplitudes = []
+    periods = []
+
+    try:
+        while len(amplitudes) < RELAY_SKIP_CYCLES + cycles:
+            travelled = abs(left_motor.angle() - left_start) + abs(right_motor.angle() - right_start)
+            if travelled >= limit_sum:
+                break
+
+            heading = hub.imu.heading()
+            if heading > high:
+                high = heading
+            if heading < low:
+                low = heading
+
+            # Relay: turn against the heading error
+            if output > 0 and heading > RELAY_HYSTERESIS:
+                output = -amplitude
+            elif output < 0 and heading < -RELAY_HYSTERESIS:
+                output = amplitude
+                # One full cycle ends on each switch back to positive;
+                # cycles only count once the robot is at speed
+                now = stopwatch.time()
+                if abs(robot.state()[1]) < at_speed:
+                    last_cycle_ms = None
+                elif last_cycle_ms is not None:
+                    periods.append(now - last_cycle_ms)
+                    amplitudes.append((high - low) / 2)
+                    last_cycle_ms = now
+                else:
+                    last_cycle_ms = now
+                high = heading
+                low = heading
+
+            robot.drive(speed * direction, output)
+            wait(10)
+    finally:
+        robot.stop()
+
+    distance_mm = motor_degrees_to_mm(travelled >> 1)
+    amplitudes = amplitudes[RELAY_SKIP_CYCLES:]
+    periods = periods[RELAY_SKIP_CYCLES:]
+
+    if len(amplitudes) < cycles:
+        return {'ultimate_gain': None, 'period_ms': None, 'amplitude': None,
+                'cycles': len(amplitudes), 'distance_mm': distance_mm}
+
+    avg_amplitude = sum(amplitudes) / len(amplitudes)
+    avg_period = sum(periods) / len(periods)
+    # Relay with hysteresis: the describing function sees sqrt(a^2 - e^2)
+    effective = sqrt(max(0.0, avg_amplitude ** 2 - RELAY_HYSTERESIS ** 2))
+    ultimate_gain = 4 * amplitude / (pi * effective) if effective > 0 else None
+
+    return {
+        'ultimate_gain': ultimate_gain,
+        'period_ms': avg_period,
+        'amplitude': avg_amplitude,
+        'cycles': len(amplitudes),
+        'distance_mm': distance_mm,
+    }
+
+
+def tune_heading_gain(speed, direction=1):
+    """
+    Tune the move_straight_gyro() gain for one drive speed and direction.
+
+    Drives for the relay test, then back to the start.
+
+    Args:
+        speed (int/DriveSpeed): Drive speed in mm/s
+        direction (int): 1 = forward, -1 = backward
+
+    Returns:
+        float: Tuned gain, or None if the test failed (with the reason printed)
+    """
+    test_speed = relay_speed(speed)
+    if test_speed < speed:
+        print(f"  ⚠ {speed}mm/s leaves the wheels no room to steer - "
+              f"testing at {test_speed}mm/s, the speed the robot really drives")
+    result = relay_test(test_speed, direction)
+
+    # Return to start for the next test
+    wait(200)
+    move_straight(-direction * result['distance_mm'], DriveSpeed.TRANSIT)
+
+    if result['ultimate_gain'] is None:
+        print(f"  ✗ FAILED: {result['cycles']} of {RELAY_CYCLES} cycles in "
+              f"{result['distance_mm']}mm at {test_speed}mm/s - no gain stored")
+        return None
+
+    kp = RELAY_GAIN_FACTOR * result['ultimate_gain']
+    print(f"  Ku={result['ultimate_gain']:.2f}  Tu={result['period_ms']:.0f}ms  "
+          f"amp={result['amplitude']:.2f}°  ({result['cycles']} cycles, "
+          f"{result['distance_mm']}mm) -> kp={kp:.2f}")
+    if kp > HEADING_KP_MAX:
+        print(f"  ✗ FAILED: kp={kp:.2f} is above HEADING_KP_MAX={HEADING_KP_MAX} - "
+              f"no gain stored (check the gyro and RELAY_AMPLITUDE)")
+        return None
+    return kp
+
+# ============================================================================
+# SPIN TURN GAIN - STEP RESPONSE TEST
+# ============================================================================
+
+def spin_step_test(speed, kp, angle=SPIN_TEST_ANGLE):
+    """
+    Run one spin turn with a given gain and measure time and final error.
+
+    Args:
+        speed (int/TurnSpeed): Spin turn base speed in deg/s
+        kp (float): Gain to test
+        angle (int): Turn angle in degrees (sign = direction)
+
+    Returns:
+        dict: {'time_ms': int, 'error': float}
+    """
+    stopwatch = StopWatch()
+    spin_turn(angle, speed, kp)
+    time_ms = stopwatch.time()
+
+    wait(SPIN_SETTLE_MS)
+    error = abs(hub.imu.heading()) - abs(angle)
+
+    return {'time_ms': time_ms, 'error': error}
+
+
+def tune_spin_gain(speed, candidates=SPIN_KP_CANDIDATES):
+    """
+    Tune the spin_turn() gain for one turn speed.
+
+    Args:
+        speed (int/TurnSpeed): Spin turn base speed in deg/s
+        candidates (tuple): Gains to try
+
+    Returns:
+        float: SPIN_GAIN_MARGIN * the gain with the fastest worst-case turn
+               that stays within SPIN_TURN_TOLERANCE, or None if no
+               candidate did
+    """
+    best_kp = None
+    best_time = None
+    direction = 1
+
+    for kp in candidates:
+        worst_time = 0
+        worst_error = 0.0
+        for _ in range(SPIN_TRIALS):
+            result = spin_step_test(speed, kp, direction * SPIN_TEST_ANGLE)
+            direction = -direction
+            worst_time = max(worst_time, result['time_ms'])
+            if abs(result['error']) > abs(worst_error):
+                worst_error = result['error']
+
+        ok = abs(worst_error) <= SPIN_TURN_TOLERANCE
+        print(f"  kp={kp:<4} worst of {SPIN_TRIALS}: {worst_time:>5}ms  "
+              f"error={worst_error:+.1f}° {'✓' if ok else '✗'}")
+
+        if ok and (best_time is None or worst_time < best_time):
+            best_kp = kp
+            best_time = worst_time
+
+    if best_kp is None:
+        return None
+    kp = SPIN_GAIN_MARGIN * best_kp
+    print(f"  fastest safe kp={best_kp} -> storing {kp:.2f} ({SPIN_GAIN_MARGIN * 100:.0f}%)")
+    return kp
+
+# ============================================================================
+# FULL AUTOTUNE
+# ============================================================================
+
+def print_gain_table(name, gains):
+    """Print one {speed: kp} table as a RobotProfile keyword argument."""
+    print(f"    {name}={{")
+    for speed in sorted(gains):
+        print(f"        {speed}: {gains[speed]:.2f},")
+    print("    },")
+
+
+def print_gain_tables(heading_gains, heading_gains_backward, spin_gains):
+    """Print gain tables ready to paste into the profile in robot_config.py."""
+    print("\n" + "=" * 50)
+    print(f"TUNED GAINS FOR PROFILE '{PROFILE.name}'")
+    print("=" * 50)
+    print_gain_table("heading_gains", heading_gains)
+    print_gain_table("heading_gains_backward", heading_gains_backward)
+    print_gain_table("spin_gains", spin_gains)
+    print("=" * 50)
+    print("Copy these into robot_config.py (only from a run on the robot)")
+
+
+def run_autotune(drive_presets=DRIVE_PRESETS, turn_presets=TURN_PRESETS):
+    """
+    Tune heading and spin turn gains for every speed preset.
+
+    Presets whose test fails keep the global gain (GYRO_PROPORTIONAL_GAIN or
+    SPIN_TURN_KP), are left out of the printed table and are listed at the
+    end; the light turns ORANGE instead of GREEN.
+
+    Args:
+        drive_presets (tuple): (name, speed) pairs for move_straight_gyro()
+        turn_presets (tuple): (name, speed) pairs for spin_turn()
+
+    Returns:
+        dict: {
+            'heading_gains': {speed: kp},
+            'heading_gains_backward': {speed: kp},
+            'spin_gains': {speed: kp},
+            'failed': [str]            # presets without a tuned gain
+        }
+    """
+    heading_gains = {}
+    heading_gains_backward = {}
+    spin_gains = {}
+    failed = []
+    results = {
+        'heading_gains': heading_gains,
+        'heading_gains_backward': heading_gains_backward,
+        'spin_gains': spin_gains,
+        'failed': failed,
+    }
+
+    print("=" * 50)
+    print("CONTROLLER AUTOTUNE")
+    print("=" * 50)
+
+    if not calibrate_gyro():
+        print("✗ Gyro calibration failed - robot must be still")
+        hub.light.on(Color.RED)
+        return results
+
+    hub.light.on(Color.YELLOW)
+
+    print("\n--- Heading gain (relay test) ---")
+    for name, speed in drive_presets:
+        for direction, label, gains in ((1, "forward", heading_gains),
+                                        (-1, "backward", heading_gains_backward)):
+            print(f"\nDriveSpeed.{name} ({speed} mm/s) {label}")
+            kp = tune_heading_gain(speed, direction)
+            if kp is None:
+                print(f"  keeping global gain {GYRO_PROPORTIONAL_GAIN}")
+                failed.append(f"DriveSpeed.{name} {label}")
+            else:
+                gains[speed] = kp
+
+    print("\n--- Spin turn gain (step test) ---")
+    for name, speed in turn_presets:
+        print(f"\nTurnSpeed.{name} ({speed} deg/s)")
+        kp = tune_spin_gain(speed)
+        if kp is None:
+            print(f"  keeping global gain {SPIN_TURN_KP}")
+            failed.append(f"TurnSpeed.{name}")
+        else:
+            spin_gains[speed] = kp
+
+    print_gain_tables(heading_gains, heading_gains_backward, spin_gains)
+    if failed:
+        print(f"✗ {len(failed)} presets NOT tuned (global gain kept):")
+        for preset in failed:
+            print(f"    - {preset}")
+        hub.light.on(Color.ORANGE)
+    else:
+        hub.light.on(Color.GREEN)
+    return results
+
+
+# ============================================================================
+# ENTRY POINT
+# ============================================================================
+
+if __name__ == "__main__":
+    run_autotune()
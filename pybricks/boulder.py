@@ -0,0 +1,31 @@
+# GENERATED by tools/build_missions.py from missions/boulder.mission - DO NOT EDIT.
+#     python -m tools.build_missions missions/boulder.mission
+from robot import *
+
+
+# Boulder - align at square 3 from the left
+def boulder():
+    move_straight_gyro(650, DriveSpeed.PUSHING)
+    left_arm_up(90, ArmSpeed.DELICATE)
+    move_straight_gyro(-650, DriveSpeed.PUSHING)
+
+# Structure floor - align at square 3 from the left
+# The arm comes back up while the robot backs away.
+def structure_floor():
+    move_straight_gyro(610, DriveSpeed.PUSHING)
+    wait(500)
+    move_straight_gyro(40, DriveSpeed.PRECISE)
+    left_arm_down(160, ArmSpeed.DELICATE)
+    left_arm_up(160, ArmSpeed.DELICATE, blocking=False)
+    move_straight_gyro(-260, DriveSpeed.RETURN)
+    spin_turn(-45, TurnSpeed.QUICK)
+    wait_for_arms()
+    move_straight_gyro(-300, DriveSpeed.RETURN)
+
+# Marketplace flippy and boulder - start 5.75 squares from the left
+def marketplace_and_boulder():
+    move_straight_gyro(680, DriveSpeed.TRANSIT)
+    wait(100)
+    spin_turn(35)
+    left_arm_up(70)
+    move_straight_gyro(-710, DriveSpeed.TRANSIT)
@@ -0,0 +1,430 @@
+#!/usr/bin/env pybricks-micropython
+"""
+CALIBRATION - Automatic Wheel Diameter and Axle Track Measurement
+=================================================================
+
+Measures the EFFECTIVE wheel diameter and axle track of the robot using its
+own sensors, then prints updated values for robot_config.py.
+
+Why calibrate?
+- Tyres compress, wheels wobble and the axle track is never exactly the
+  LEGO stud spacing. Small errors here add up to centimeters per run.
+- With correct numbers, missions don't need hand-padded distances and can
+  run at faster speeds with the same accuracy.
+
+Calibration steps:
+1. Wheel diameter (choose one):
+   a. Wall method   - ultrasonic sensor facing a wall, robot drives toward it
+   b. Line method   - color sensor crosses two mat lines a known distance apart
+2. Axle track      - robot spins in place several times against the IMU
+
+Usage:
+    1. Place robot facing a wall (wall method) or before two lines (line method)
+    2. Run this file
+    3. Copy the printed profile values into robot_config.py
+
+Created: 2026-10-19
+For: Teams who want accurate distances without a ruler
+"""
+
+from robot import (
+    hub,
+    robot,
+    left_motor,
+    right_motor,
+    wait,
+    Port,
+    Color,
+    ColorSensor,
+    UltrasonicSensor,
+    StopWatch,
+    PROFILE,
+    check_battery,
+    calibrate_gyro,
+)
+
+try:
+    from umath import pi
+except ImportError:
+    from math import pi
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+# Sensor ports (free ports on the competition profile)
+CALIBRATION_ULTRASONIC_PORT = Port.D
+CALIBRATION_COLOR_PORT = Port.C
+
+# Wall method
+WALL_START_MIN_MM = 300     # Robot must start at least this far from the wall
+WALL_TRAVEL_MM = 250        # Nominal distance to drive toward the wall
+ULTRASONIC_SAMPLES = 10     # Readings averaged per distance measurement
+
+# Line method
+LINE_SPACING_MM = 300       # Distance between the two line edges on the mat
+LINE_THRESHOLD = 30         # Reflection below this = on the line
+LINE_TIMEOUT_MS = 10000     # Give up if second line not found
+
+# Axle track (spin) method
+SPIN_TURNS = 3              # Full 360° rotations to average over
+SPIN_MOTOR_SPEED = 200      # deg/s - slow enough to avoid wheel slip
+SPIN_SLOWDOWN_DEGREES = 30  # Start slowing this many degrees before target
+
+# Drive speed for calibration moves (slow = no slip)
+CALIBRATION_SPEED = 150     # deg/s motor speed
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+def _encoder_average(left_start, right_start):
+    """Average absolute encoder travel of both drive motors (degrees)."""
+    left = abs(left_motor.angle() - left_start)
+    right = abs(right_motor.angle() - right_start)
+    return (left + right) / 2
+
+
+def _read_distance(sensor, samples=ULTRASONIC_SAMPLES):
+    """
+    Average several ultrasonic readings, ignoring 'no echo' values.
+
+    Returns:
+        float: Distance in mm, or None if the sensor saw nothing
+    """
+    total = 0
+    count = 0
+    for _ in range(samples):
+        distance = sensor.distance()
+        if distance < 2000:  # 2000 = nothing detected
+            total += distance
+            count += 1
+        wait(20)
+
+    if count == 0:
+        return None
+    return total / count
+
+
+def _run_both(speed_left, speed_right):
+    """Run both drive motors at raw motor speeds (bypasses DriveBase geometry)."""
+    left_motor.run(speed_left)
+    right_motor.run(speed_right)
+
+
+def _stop_both():
+    """Hold both drive motors."""
+    left_motor.hold()
+    right_motor.hold()
+
+
+def diameter_from_travel(distance_mm, motor_degrees):
+    """
+    Solve for effective wheel diameter from a measured travel.
+
+    distance = pi * D * motor_degrees / 360  ->  D = 360 * distance / (pi * motor_degrees)
+
+    Args:
+        distance_mm (float): Distance the robot really traveled
+        motor_degrees (float): Average encoder degrees over that travel
+
+    Returns:
+        float: Effective wheel diameter in mm
+    """
+    return 360 * distance_mm / (pi * motor_degrees)
+
+
+def axle_track_from_spin(robot_degrees, motor_degrees, wheel_diameter):
+    """
+    Solve for effective axle track from an in-place spin.
+
+    Each wheel travels an arc of radius track/2:
+        pi * D * motor_degrees / 360 = (track / 2) * robot_degrees * pi / 180
+    ->  track = D * motor_degrees / robot_degrees
+
+    Args:
+        robot_degrees (float): Rotation measured by the IMU
+        motor_degrees (float): Average encoder degrees of each wheel
+        wheel_diameter (float): Effective wheel diameter in mm
+
+    Returns:
+        float: Effective axle track in mm
+    """
+    return wheel_diameter * motor_degrees / robot_degrees
+
+# ============================================================================
+# WHEEL DIAMETER - WALL METHOD (ULTRASONIC)
+# ============================================================================
+
+def calibrate_diameter_wall(sensor_port=CALIBRATION_ULTRASONIC_PORT,
+                            travel_mm=WALL_TRAVEL_MM):
+    """
+    Measure wheel diameter by driving toward a wall with the ultrasonic sensor.
+
+    The sensor measures how far the robot REALLY moved; the encoders measure
+    how many degrees the wheels turned. The ratio gives the effective diameter.
+
+    Args:
+        sensor_port (Port): Ultrasonic sensor port (sensor facing forward)
+        travel_mm (int): Nominal distance to drive (default: 250)
+
+    Returns:
+        float: Effective wheel diameter in mm, or None if measurement failed
+
+    Example:
+        diameter = calibrate_diameter_wall(Port.D)
+    """
+    try:
+        sensor = UltrasonicSensor(sensor_port)
+
+        start_distance = _read_distance(sensor)
+        if start_distance is None:
+            print("  ✗ No wall detected - face the robot toward a wall")
+            return None
+        if start_distance < WALL_START_MIN_MM:
+            print(f"  ✗ Too close to wall ({start_distance:.0f}mm, need >{WALL_START_MIN_MM}mm)")
+            return None
+
+        print(f"  Start distance: {start_distance:.1f}mm")
+
+        # Drive a fixed number of motor degrees using the CURRENT profile guess
+        target_degrees = travel_mm * PROFILE.degrees_per_mm
+        left_start = left_motor.angle()
+        right_start = right_motor.angle()
+
+        _run_both(CALIBRATION_SPEED, CALIBRATION_SPEED)
+        while _encoder_average(left_start, right_start) < target_degrees:
+            wait(5)
+        _stop_both()
+        wait(300)  # Let the robot settle before measuring
+
+        motor_degrees = _encoder_average(left_start, right_start)
+        end_distance = _read_distance(sensor)
+        if end_distance is None:
+            print("  ✗ Lost the wall during calibration")
+            return None
+
+        traveled = start_distance - end_distance
+        print(f"  End distance: {end_distance:.1f}mm (traveled {traveled:.1f}mm)")
+        print(f"  Encoders: {motor_degrees:.0f}°")
+
+        # Back up to the start so the test can be repeated
+        _run_both(-CALIBRATION_SPEED, -CALIBRATION_SPEED)
+        left_start = left_motor.angle()
+        right_start = right_motor.angle()
+        while _encoder_average(left_start, right_start) < motor_degrees:
+            wait(5)
+        _stop_both()
+
+        return diameter_from_travel(traveled, motor_degrees)
+
+    except Exception as e:
+        print(f"calibrate_diameter_wall error: {e}")
+        _stop_both()
+        return None
+
+# ============================================================================
+# WHEEL DIAMETER - LINE METHOD (COLOR SENSOR)
+# ============================================================================
+
+def calibrate_diameter_lines(sensor_port=CALIBRATION_COLOR_PORT,
+                             line_spacing_mm=LINE_SPACING_MM,
+                             threshold=LINE_THRESHOLD):
+    """
+    Measure wheel diameter by driving across two mat lines a known distance apart.
+
+    Records the encoder position at the leading edge of each line. The known
+    spacing divided by the encoder travel between edges gives the diameter.
+
+    Args:
+        sensor_port (Port): Color sensor port (facing down)
+        line_spacing_mm (int): Distance between the two line edges
+        threshold (int): Reflection below this value counts as "on line"
+
+    Returns:
+        float: Effective wheel diameter in mm, or None if measurement failed
+
+    Example:
+        diameter = calibrate_diameter_lines(Port.C, line_spacing_mm=300)
+    """
+    try:
+        sensor = ColorSensor(sensor_port)
+        left_start = left_motor.angle()
+        right_start = right_motor.angle()
+
+        edges = []
+        on_line = sensor.reflection() < threshold
+
+        stopwatch = StopWatch()
+        _run_both(CALIBRATION_SPEED, CALIBRATION_SPEED)
+
+        while len(edges) < 2 and stopwatch.time() < LINE_TIMEOUT_MS:
+            now_on_line = sensor.reflection() < threshold
+            # Leading edge: light -> dark
+            if now_on_line and not on_line:
+                edges.append(_encoder_average(left_start, right_start))
+                print(f"  Line {len(edges)} at {edges[-1]:.0f}°")
+            on_line = now_on_line
+            wait(2)
+
+        _stop_both()
+
+        if len(edges) < 2:
+            print(f"  ✗ Found {len(edges)} of 2 lines before timeout")
+            return None
+
+        motor_degrees = edges[1] - edges[0]
+        return diameter_from_travel(line_spacing_mm, motor_degrees)
+
+    except Exception as e:
+        print(f"calibrate_diameter_lines error: {e}")
+        _stop_both()
+        return None
+
+# ============================================================================
+# AXLE TRACK - SPIN METHOD (IMU)
+# ============================================================================
+
+def calibrate_axle_track(wheel_diameter, turns=SPIN_TURNS):
+    """
+    Measure axle track by spinning in place against the IMU.
+
+    Spins several full turns (errors average out), then compares the IMU
+    rotation with the wheel encoder travel.
+
+    Args:
+        wheel_diameter (float): Effective wheel diameter (from a diameter calibration)
+        turns (int): Number of full rotations (default: 3)
+
+    Returns:
+        float: Effective axle track in mm, or None if measurement failed
+
+    Example:
+        track = calibrate_axle_track(55.4, turns=3)
+    """
+    try:
+        hub.imu.reset_heading(0)
+        wait(200)
+
+        target = 360 * turns
+        left_start = left_motor.angle()
+        right_start = right_motor.angle()
+
+        _run_both(SPIN_MOTOR_SPEED, -SPIN_MOTOR_SPEED)
+        while True:
+            remaining = target - abs(hub.imu.heading())
+            if remaining <= 0:
+                break
+            # Slow down near the end so the final reading is not smeared
+            if remaining < SPIN_SLOWDOWN_DEGREES:
+                slow = max(50, SPIN_MOTOR_SPEED * remaining / SPIN_SLOWDOWN_DEGREES)
+                _run_both(slow, -slow)
+            wait(5)
+        _stop_both()
+        wait(300)
+
+        robot_degrees = abs(hub.imu.heading())
+        motor_degrees = _encoder_average(left_start, right_start)
+        print(f"  IMU: {robot_degrees:.1f}°  Encoders: {motor_degrees:.0f}°")
+
+        return axle_track_from_spin(robot_degrees, motor_degrees, wheel_diameter)
+
+    except Exception as e:
+        print(f"calibrate_axle_track error: {e}")
+        _stop_both()
+        return None
+
+# ============================================================================
+# FULL CALIBRATION
+# ============================================================================
+
+def print_profile_update(wheel_diameter, axle_track):
+    """
+    Print updated profile values ready to paste into robot_config.py.
+
+    Args:
+        wheel_diameter (float): Effective wheel diameter in mm
+        axle_track (float): Effective axle track in mm
+    """
+    print("\n" + "=" * 50)
+    print(f"UPDATED VALUES FOR PROFILE '{PROFILE.name}'")
+    print("=" * 50)
+    print(f"    wheel_diameter={wheel_diameter:.2f},   # was {PROFILE.wheel_diameter}")
+    print(f"    axle_track={axle_track:.2f},       # was {PROFILE.axle_track}")
+    print("=" * 50)
+    print("Copy these into robot_config.py")
+
+
+def run_calibration(method="wall", turns=SPIN_TURNS):
+    """
+    Run the full automatic calibration.
+
+    Args:
+        method (str): Wheel diameter method - 'wall' (ultrasonic) or 'lines' (color)
+        turns (int): Full spins for axle track measurement (default: 3)
+
+    Returns:
+        dict: {
+            'wheel_diameter': float or None,
+            'axle_track': float or None
+        }
+
+    Example:
+        result = run_calibration("lines")
+    """
+    result = {'wheel_diameter': None, 'axle_track': None}
+
+    print("=" * 50)
+    print("AUTOMATIC CALIBRATION")
+    print("=" * 50)
+
+    voltage, ok = check_battery()
+    if not ok:
+        print("WARNING: Battery too low for accurate calibration")
+
+    if not calibrate_gyro():
+        print("✗ Gyro calibration failed - robot must be still")
+        hub.light.on(Color.RED)
+        return result
+
+    # Step 1: Wheel diameter
+    print(f"\n[1/2] Wheel diameter ({method} method)...")
+    if method == "lines":
+        diameter = calibrate_diameter_lines()
+    else:
+        diameter = calibrate_diameter_wall()
+
+    if diameter is None:
+        hub.light.on(Color.RED)
+        return result
+
+    print(f"  ✓ Wheel diameter: {diameter:.2f}mm (profile: {PROFILE.wheel_diameter}mm)")
+    result['wheel_diameter'] = diameter
+
+    # Step 2: Axle track
+    print(f"\n[2/2] Axle track ({turns} spins)...")
+    track = calibrate_axle_track(diameter, turns)
+
+    if track is None:
+        hub.light.on(Color.RED)
+        return result
+
+    print(f"  ✓ Axle track: {track:.2f}mm (profile: {PROFILE.axle_track}mm)")
+    result['axle_track'] = track
+
+    print_profile_update(diameter, track)
+    hub.light.on(Color.GREEN)
+    return result
+
+
+# ============================================================================
+# ENTRY POINT
+# ============================================================================
+
+if __name__ == "__main__":
+    """
+    Main execution.
+
+    Change the method to "lines" to use the color sensor instead of a wall.
+    """
+    run_calibration("wall")
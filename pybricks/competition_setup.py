@@ -15,6 +15,15 @@ Competition Workflow:
 2. At competition, use hub buttons to select mission (no computer!)
 3. Press center button to run selected mission
 
+Fast Boot:
+    The register_mission() calls in load_all_missions() are also the input
+    for the generated mission table. After changing them, run on the laptop:
+
+        python -m tools.build_mission_table
+
+    then run mission_table.py on the hub. The menu appears without importing
+    this file; a mission's code is loaded only when it is started.
+
 Mission Models (2025 Unearthed):
 1. Angler Artifacts
 2. Tip the Scales
@@ -558,6 +567,18 @@ def load_all_missions():
     """
     Load all missions to program slots.
 
+    The planning annotations for mission_loader.plan_runs() hold only what
+    the team has written down: the launch areas of the two side missions
+    and the "Estimated Time" of each mission docstring (estimated_ms).
+    Everything else is None until the team fills it in - plan_runs() then
+    does not group runs by attachment or launch area, and does not prefer
+    one run over another by points:
+
+    - attachment: the attachment each run needs
+    - start_zone / end_zone: launch areas of the other missions
+    - points: the score each run is worth
+    - duration_ms: measured run time (tools/decode_telemetry.py)
+
     Slot Assignment:
     0: Angler Artifacts (left side)
     1: Tip the Scales (center)
@@ -578,21 +599,39 @@ def load_all_missions():
         0,
         "Angler-40pts",
         mission_01_angler_artifacts,
-        "Left: Angler artifacts with adaptive grab (25s)"
+        "Left: Angler artifacts with adaptive grab (25s)",
+        start_zone="left",
+        end_zone="left",
+        attachment=None,
+        estimated_ms=25000,
+        duration_ms=None,
+        points=None,
     )
 
     register_mission(
         1,
         "Scales-35pts",
         mission_02_tip_scales,
-        "Center: Tip the scales with precision (20s)"
+        "Center: Tip the scales with precision (20s)",
+        start_zone=None,
+        end_zone=None,
+        attachment=None,
+        estimated_ms=20000,
+        duration_ms=None,
+        points=None,
     )
 
     register_mission(
         2,
         "Map-30pts",
         mission_03_map_reveal,
-        "Right: Map reveal mechanism (22s)"
+        "Right: Map reveal mechanism (22s)",
+        start_zone="right",
+        end_zone="right",
+        attachment=None,
+        estimated_ms=22000,
+        duration_ms=None,
+        points=None,
     )
 
     # Secondary missions
@@ -600,14 +639,26 @@ def load_all_missions():
         3,
         "Statue-50pts",
         mission_04_statue_rebuild,
-        "Precision: Statue rebuild ultra-precise (30s)"
+        "Precision: Statue rebuild ultra-precise (30s)",
+        start_zone=None,
+        end_zone=None,
+        attachment=None,
+        estimated_ms=30000,
+        duration_ms=None,
+        points=None,
     )
 
     register_mission(
         4,
         "Brush-25pts",
         mission_05_surface_brushing,
-        "Cleaning: Surface brushing (25s)"
+        "Cleaning: Surface brushing (25s)",
+        start_zone=None,
+        end_zone=None,
+        attachment=None,
+        estimated_ms=25000,
+        duration_ms=None,
+        points=None,
     )
 
     # Combo and specialized missions
@@ -615,14 +666,26 @@ def load_all_missions():
         5,
         "Mineshaft-60pts",
         mission_06_mineshaft_explorer,
-        "COMBO: Mineshaft explorer multi-objective (35s)"
+        "COMBO: Mineshaft explorer multi-objective (35s)",
+        start_zone=None,
+        end_zone=None,
+        attachment=None,
+        estimated_ms=35000,
+        duration_ms=None,
+        points=None,
     )
 
     register_mission(
         6,
         "Recovery-40pts",
         mission_07_careful_recovery,
-        "Delicate: Careful recovery with load sensing (32s)"
+        "Delicate: Careful recovery with load sensing (32s)",
+        start_zone=None,
+        end_zone=None,
+        attachment=None,
+        estimated_ms=32000,
+        duration_ms=None,
+        points=None,
     )
 
     # Test mission
@@ -630,7 +693,13 @@ def load_all_missions():
         7,
         "Test-0pts",
         mission_08_quick_test,
-        "Quick verification (15s)"
+        "Quick verification (15s)",
+        start_zone=None,
+        end_zone=None,
+        attachment=None,
+        estimated_ms=15000,
+        duration_ms=None,
+        points=None,
     )
 
     print("\n✓ All missions loaded!")
@@ -660,7 +729,6 @@ if __name__ == "__main__":
     if RUN_PRE_CHECK:
         print("\nRunning pre-competition check...")
         print("(Set RUN_PRE_CHECK = False to skip)")
-        wait(2000)
 
         ready = run_competition_check()
 
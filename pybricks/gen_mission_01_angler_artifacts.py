@@ -0,0 +1,111 @@
+#!/usr/bin/env pybricks-micropython
+"""
+GENERATED by tools/build_mission_table.py from competition_setup.py - DO NOT EDIT.
+
+mission_01_angler_artifacts() and what it uses, so mission_table.py loads only this mission.
+"""
+
+from robot import (
+    move_straight,
+    move_straight_gyro,
+    spin_turn,
+    left_arm_up,
+    left_arm_down,
+    reset_arms,
+    grab_until_load,
+    lift_adaptive,
+    DriveSpeed,
+    TurnSpeed,
+    ArmSpeed,
+    hub,
+    wait,
+    Color,
+    check_battery,
+    calibrate_gyro,
+)
+
+
+AUTO_CALIBRATE = True  # Auto-calibrate gyro before each mission?
+
+
+def pre_mission_setup():
+    """
+    Standard pre-mission setup.
+    Call this at the start of every mission.
+    """
+    if AUTO_CALIBRATE:
+        print("Calibrating gyro...")
+        calibrate_gyro()
+        wait(500)
+
+    # Check battery (warning only, doesn't stop mission)
+    voltage, ok = check_battery()
+    if not ok:
+        print(f"⚠ Battery low: {voltage}mV")
+        hub.light.on(Color.ORANGE)
+        wait(1000)
+
+
+def mission_complete(name):
+    """
+    Standard mission completion.
+    Call this at the end of every mission.
+    """
+    print(f"✓ {name} complete!")
+    hub.light.on(Color.GREEN)
+    wait(1000)
+    hub.light.off()
+
+
+def mission_01_angler_artifacts():
+    """
+    Mission 1: Angler Artifacts
+
+    Strategy:
+    - Start from left home area
+    - Navigate to artifact site
+    - Collect/place angler artifacts
+    - Return to base
+
+    Estimated Points: 30-40
+    Estimated Time: 25 seconds
+    """
+    print("Starting Mission 1: Angler Artifacts")
+    pre_mission_setup()
+
+    # Reset arms to starting position
+    reset_arms()
+    wait(500)
+
+    # === PHASE 1: Navigate to Artifact Site ===
+    print("Phase 1: Navigate to artifacts")
+    move_straight_gyro(450, DriveSpeed.TRANSIT)
+    spin_turn(-35, TurnSpeed.PRECISE)
+    move_straight_gyro(200, DriveSpeed.APPROACH)
+
+    # === PHASE 2: Collect Artifact ===
+    print("Phase 2: Collect artifact")
+    move_straight(80, DriveSpeed.PRECISE)
+    result = grab_until_load(target_load=35, max_degrees=90, arm='left')
+
+    if result['grabbed']:
+        print(f"  Artifact grabbed! Load: {result['final_load']}%")
+        lift_adaptive(60, arm='left')
+    else:
+        left_arm_down(90, ArmSpeed.GRAB)
+        wait(500)
+        left_arm_up(90, ArmSpeed.GRAB)
+
+    # === PHASE 3: Return to Base ===
+    print("Phase 3: Return to base")
+    move_straight(-280, DriveSpeed.APPROACH)
+    spin_turn(35, TurnSpeed.QUICK)
+    move_straight_gyro(-450, DriveSpeed.RETURN)
+
+    # === PHASE 4: Deposit Artifact ===
+    print("Phase 4: Deposit artifact")
+    left_arm_down(90, ArmSpeed.DELICATE)
+    wait(500)
+
+    mission_complete("Angler Artifacts")
+    return True
@@ -0,0 +1,99 @@
+#!/usr/bin/env pybricks-micropython
+"""
+GENERATED by tools/build_mission_table.py from competition_setup.py - DO NOT EDIT.
+
+mission_02_tip_scales() and what it uses, so mission_table.py loads only this mission.
+"""
+
+from robot import (
+    move_straight,
+    move_straight_gyro,
+    spin_turn,
+    right_arm_up,
+    right_arm_down,
+    DriveSpeed,
+    TurnSpeed,
+    ArmSpeed,
+    hub,
+    wait,
+    Color,
+    check_battery,
+    calibrate_gyro,
+)
+
+
+AUTO_CALIBRATE = True  # Auto-calibrate gyro before each mission?
+
+
+def pre_mission_setup():
+    """
+    Standard pre-mission setup.
+    Call this at the start of every mission.
+    """
+    if AUTO_CALIBRATE:
+        print("Calibrating gyro...")
+        calibrate_gyro()
+        wait(500)
+
+    # Check battery (warning only, doesn't stop mission)
+    voltage, ok = check_battery()
+    if not ok:
+        print(f"⚠ Battery low: {voltage}mV")
+        hub.light.on(Color.ORANGE)
+        wait(1000)
+
+
+def mission_complete(name):
+    """
+    Standard mission completion.
+    Call this at the end of every mission.
+    """
+    print(f"✓ {name} complete!")
+    hub.light.on(Color.GREEN)
+    wait(1000)
+    hub.light.off()
+
+
+def mission_02_tip_scales():
+    """
+    Mission 2: Tip the Scales
+
+    Strategy:
+    - Navigate to scales
+    - Place weight/objects to tip scales
+    - Balance mechanism with precision
+    - Return
+
+    Estimated Points: 25-35
+    Estimated Time: 20 seconds
+    """
+    print("Starting Mission 2: Tip the Scales")
+    pre_mission_setup()
+
+    # === PHASE 1: Navigate to Scales ===
+    print("Phase 1: Navigate to scales")
+    move_straight_gyro(550, DriveSpeed.TRANSIT)
+    spin_turn(0, TurnSpeed.STANDARD)  # Straight ahead
+
+    # === PHASE 2: Approach with Precision ===
+    print("Phase 2: Precise approach")
+    move_straight(200, DriveSpeed.APPROACH)
+    move_straight(50, DriveSpeed.PRECISE)
+    spin_turn(-5, TurnSpeed.ALIGNMENT)
+
+    # === PHASE 3: Tip Scales (Push) ===
+    print("Phase 3: Tip the scales")
+    right_arm_down(60, ArmSpeed.GRAB)
+    wait(300)
+    move_straight(120, DriveSpeed.PUSHING)
+    wait(500)
+    right_arm_up(60, ArmSpeed.GRAB)
+
+    # === PHASE 4: Return ===
+    print("Phase 4: Return")
+    move_straight(-370, DriveSpeed.RETURN)
+    spin_turn(5, TurnSpeed.QUICK)
+    move_straight_gyro(-550, DriveSpeed.RETURN)
+
+    mission_complete("Tip the Scales")
+    return True
@@ -0,0 +1,99 @@
+#!/usr/bin/env pybricks-micropython
+"""
+GENERATED by tools/build_mission_table.py from competition_setup.py - DO NOT EDIT.
+
+mission_03_map_reveal() and what it uses, so mission_table.py loads only this mission.
+"""
+
+from robot import (
+    move_straight,
+    move_straight_gyro,
+    spin_turn,
+    left_arm_up,
+    left_arm_down,
+    reset_arms,
+    DriveSpeed,
+    TurnSpeed,
+    ArmSpeed,
+    hub,
+    wait,
+    Color,
+    check_battery,
+    calibrate_gyro,
+)
+
+
+AUTO_CALIBRATE = True  # Auto-calibrate gyro before each mission?
+
+
+def pre_mission_setup():
+    """
+    Standard pre-mission setup.
+    Call this at the start of every mission.
+    """
+    if AUTO_CALIBRATE:
+        print("Calibrating gyro...")
+        calibrate_gyro()
+        wait(500)
+
+    # Check battery (warning only, doesn't stop mission)
+    voltage, ok = check_battery()
+    if not ok:
+        print(f"⚠ Battery low: {voltage}mV")
+        hub.light.on(Color.ORANGE)
+        wait(1000)
+
+
+def mission_complete(name):
+    """
+    Standard mission completion.
+    Call this at the end of every mission.
+    """
+    print(f"✓ {name} complete!")
+    hub.light.on(Color.GREEN)
+    wait(1000)
+    hub.light.off()
+
+
+def mission_03_map_reveal():
+    """
+    Mission 3: Map Reveal
+
+    Strategy:
+    - Navigate to map area
+    - Reveal hidden map sections
+    - Use arm to flip/uncover map
+    - Return
+
+    Estimated Points: 20-30
+    Estimated Time: 22 seconds
+    """
+    print("Starting Mission 3: Map Reveal")
+    pre_mission_setup()
+
+    reset_arms()
+    wait(500)
+
+    # === PHASE 1: Navigate to Map ===
+    print("Phase 1: Navigate to map area")
+    move_straight_gyro(500, DriveSpeed.TRANSIT)
+    spin_turn(30, TurnSpeed.PRECISE)
+    move_straight(180, DriveSpeed.APPROACH)
+
+    # === PHASE 2: Reveal Map ===
+    print("Phase 2: Reveal map")
+    move_straight(60, DriveSpeed.PRECISE)
+    left_arm_down(80, ArmSpeed.COLLECT)
+    wait(300)
+    move_straight(100, DriveSpeed.PUSHING)
+    left_arm_up(80, ArmSpeed.COLLECT)
+    wait(500)
+
+    # === PHASE 3: Return ===
+    print("Phase 3: Return")
+    move_straight(-340, DriveSpeed.RETURN)
+    spin_turn(-30, TurnSpeed.QUICK)
+    move_straight_gyro(-500, DriveSpeed.RETURN)
+
+    mission_complete("Map Reveal")
+    return True
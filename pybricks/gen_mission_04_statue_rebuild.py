@@ -0,0 +1,101 @@
+#!/usr/bin/env pybricks-micropython
+"""
+GENERATED by tools/build_mission_table.py from competition_setup.py - DO NOT EDIT.
+
+mission_04_statue_rebuild() and what it uses, so mission_table.py loads only this mission.
+"""
+
+from robot import (
+    move_straight,
+    move_straight_gyro,
+    spin_turn,
+    both_arms_up,
+    both_arms_down,
+    DriveSpeed,
+    TurnSpeed,
+    ArmSpeed,
+    hub,
+    wait,
+    Color,
+    check_battery,
+    calibrate_gyro,
+)
+
+
+AUTO_CALIBRATE = True  # Auto-calibrate gyro before each mission?
+
+
+def pre_mission_setup():
+    """
+    Standard pre-mission setup.
+    Call this at the start of every mission.
+    """
+    if AUTO_CALIBRATE:
+        print("Calibrating gyro...")
+        calibrate_gyro()
+        wait(500)
+
+    # Check battery (warning only, doesn't stop mission)
+    voltage, ok = check_battery()
+    if not ok:
+        print(f"⚠ Battery low: {voltage}mV")
+        hub.light.on(Color.ORANGE)
+        wait(1000)
+
+
+def mission_complete(name):
+    """
+    Standard mission completion.
+    Call this at the end of every mission.
+    """
+    print(f"✓ {name} complete!")
+    hub.light.on(Color.GREEN)
+    wait(1000)
+    hub.light.off()
+
+
+def mission_04_statue_rebuild():
+    """
+    Mission 4: Statue Rebuild
+
+    Strategy:
+    - Navigate to statue site
+    - Carefully position statue pieces
+    - Ultra-precise alignment required
+    - Return
+
+    Estimated Points: 35-50
+    Estimated Time: 30 seconds
+    """
+    print("Starting Mission 4: Statue Rebuild")
+    pre_mission_setup()
+
+    # === PHASE 1: Navigate to Statue ===
+    print("Phase 1: Navigate to statue site")
+    move_straight_gyro(400, DriveSpeed.TRANSIT)
+    spin_turn(-45, TurnSpeed.PRECISE)
+    move_straight_gyro(250, DriveSpeed.APPROACH)
+
+    # === PHASE 2: Precision Approach ===
+    print("Phase 2: Ultra-precise approach")
+    move_straight(100, DriveSpeed.APPROACH)
+    move_straight(40, DriveSpeed.PRECISE)
+    spin_turn(-8, TurnSpeed.ALIGNMENT)  # Ultra-precise
+    move_straight(20, DriveSpeed.PRECISE)
+
+    # === PHASE 3: Place Statue Piece ===
+    print("Phase 3: Place statue piece")
+    both_arms_down(70, ArmSpeed.DELICATE)
+    wait(500)
+    move_straight(60, DriveSpeed.PRECISE)
+    both_arms_up(70, ArmSpeed.DELICATE)
+    wait(1000)  # Let piece settle
+
+    # === PHASE 4: Return ===
+    print("Phase 4: Return")
+    move_straight(-220, DriveSpeed.APPROACH)
+    spin_turn(53, TurnSpeed.REPOSITION)
+    move_straight_gyro(-650, DriveSpeed.RETURN)
+
+    mission_complete("Statue Rebuild")
+    return True
@@ -0,0 +1,99 @@
+#!/usr/bin/env pybricks-micropython
+"""
+GENERATED by tools/build_mission_table.py from competition_setup.py - DO NOT EDIT.
+
+mission_05_surface_brushing() and what it uses, so mission_table.py loads only this mission.
+"""
+
+from robot import (
+    move_straight,
+    move_straight_gyro,
+    spin_turn,
+    right_arm_up,
+    right_arm_down,
+    DriveSpeed,
+    TurnSpeed,
+    ArmSpeed,
+    hub,
+    wait,
+    Color,
+    check_battery,
+    calibrate_gyro,
+)
+
+
+AUTO_CALIBRATE = True  # Auto-calibrate gyro before each mission?
+
+
+def pre_mission_setup():
+    """
+    Standard pre-mission setup.
+    Call this at the start of every mission.
+    """
+    if AUTO_CALIBRATE:
+        print("Calibrating gyro...")
+        calibrate_gyro()
+        wait(500)
+
+    # Check battery (warning only, doesn't stop mission)
+    voltage, ok = check_battery()
+    if not ok:
+        print(f"⚠ Battery low: {voltage}mV")
+        hub.light.on(Color.ORANGE)
+        wait(1000)
+
+
+def mission_complete(name):
+    """
+    Standard mission completion.
+    Call this at the end of every mission.
+    """
+    print(f"✓ {name} complete!")
+    hub.light.on(Color.GREEN)
+    wait(1000)
+    hub.light.off()
+
+
+def mission_05_surface_brushing():
+    """
+    Mission 5: Surface Brushing
+
+    Strategy:
+    - Navigate to artifact surface
+    - Use attachment to brush/clean surface
+    - Move along surface systematically
+    - Return
+
+    Estimated Points: 20-25
+    Estimated Time: 25 seconds
+    """
+    print("Starting Mission 5: Surface Brushing")
+    pre_mission_setup()
+
+    # === PHASE 1: Navigate to Surface ===
+    print("Phase 1: Navigate to brushing area")
+    move_straight_gyro(520, DriveSpeed.TRANSIT)
+    spin_turn(15, TurnSpeed.STANDARD)
+
+    # === PHASE 2: Position Brush ===
+    print("Phase 2: Position brush attachment")
+    move_straight(180, DriveSpeed.APPROACH)
+    right_arm_down(50, ArmSpeed.GRAB)
+    wait(300)
+
+    # === PHASE 3: Brush Surface ===
+    print("Phase 3: Brush surface")
+    move_straight(150, DriveSpeed.COLLECTION)  # Slow brushing
+    wait(300)
+    move_straight(80, DriveSpeed.COLLECTION)
+    wait(300)
+    right_arm_up(50, ArmSpeed.GRAB)
+
+    # === PHASE 4: Return ===
+    print("Phase 4: Return")
+    move_straight(-410, DriveSpeed.RETURN)
+    spin_turn(-15, TurnSpeed.QUICK)
+    move_straight_gyro(-520, DriveSpeed.RETURN)
+
+    mission_complete("Surface Brushing")
+    return True
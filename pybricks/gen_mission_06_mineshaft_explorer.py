@@ -0,0 +1,109 @@
+#!/usr/bin/env pybricks-micropython
+"""
+GENERATED by tools/build_mission_table.py from competition_setup.py - DO NOT EDIT.
+
+mission_06_mineshaft_explorer() and what it uses, so mission_table.py loads only this mission.
+"""
+
+from robot import (
+    move_straight,
+    move_straight_gyro,
+    spin_turn,
+    left_arm_up,
+    left_arm_down,
+    right_arm_up,
+    right_arm_down,
+    reset_arms,
+    DriveSpeed,
+    TurnSpeed,
+    ArmSpeed,
+    hub,
+    wait,
+    Color,
+    check_battery,
+    calibrate_gyro,
+)
+
+
+AUTO_CALIBRATE = True  # Auto-calibrate gyro before each mission?
+
+
+def pre_mission_setup():
+    """
+    Standard pre-mission setup.
+    Call this at the start of every mission.
+    """
+    if AUTO_CALIBRATE:
+        print("Calibrating gyro...")
+        calibrate_gyro()
+        wait(500)
+
+    # Check battery (warning only, doesn't stop mission)
+    voltage, ok = check_battery()
+    if not ok:
+        print(f"⚠ Battery low: {voltage}mV")
+        hub.light.on(Color.ORANGE)
+        wait(1000)
+
+
+def mission_complete(name):
+    """
+    Standard mission completion.
+    Call this at the end of every mission.
+    """
+    print(f"✓ {name} complete!")
+    hub.light.on(Color.GREEN)
+    wait(1000)
+    hub.light.off()
+
+
+def mission_06_mineshaft_explorer():
+    """
+    Mission 6: Mineshaft Explorer
+
+    Strategy:
+    - Navigate to mineshaft entrance
+    - Deploy explorer vehicle/robot
+    - Activate mechanisms
+    - Combo mission for multiple objectives
+
+    Estimated Points: 40-60
+    Estimated Time: 35 seconds
+    """
+    print("Starting Mission 6: Mineshaft Explorer")
+    pre_mission_setup()
+
+    reset_arms()
+    wait(500)
+
+    # === PHASE 1: Navigate to Mineshaft ===
+    print("Phase 1: Navigate to mineshaft")
+    move_straight_gyro(650, DriveSpeed.TRANSIT)
+    spin_turn(20, TurnSpeed.STANDARD)
+    move_straight(220, DriveSpeed.APPROACH)
+
+    # === PHASE 2: Deploy Explorer ===
+    print("Phase 2: Deploy explorer")
+    left_arm_down(80, ArmSpeed.GRAB)
+    wait(500)
+    move_straight(120, DriveSpeed.PUSHING)
+    left_arm_up(80, ArmSpeed.GRAB)
+    wait(500)
+
+    # === PHASE 3: Activate Mechanism ===
+    print("Phase 3: Activate mineshaft mechanism")
+    spin_turn(30, TurnSpeed.STANDARD)
+    move_straight(100, DriveSpeed.APPROACH)
+    right_arm_down(90, ArmSpeed.COLLECT)
+    wait(300)
+    move_straight(80, DriveSpeed.PRECISE)
+    right_arm_up(90, ArmSpeed.COLLECT)
+
+    # === PHASE 4: Return ===
+    print("Phase 4: Return")
+    move_straight(-320, DriveSpeed.RETURN)
+    spin_turn(-50, TurnSpeed.REPOSITION)
+    move_straight_gyro(-870, DriveSpeed.RETURN)
+
+    mission_complete("Mineshaft Explorer")
+    return True
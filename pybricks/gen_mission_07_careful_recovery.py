@@ -0,0 +1,117 @@
+#!/usr/bin/env pybricks-micropython
+"""
+GENERATED by tools/build_mission_table.py from competition_setup.py - DO NOT EDIT.
+
+mission_07_careful_recovery() and what it uses, so mission_table.py loads only this mission.
+"""
+
+from robot import (
+    move_straight,
+    move_straight_gyro,
+    spin_turn,
+    right_arm_up,
+    right_arm_down,
+    grab_until_load,
+    lift_adaptive,
+    DriveSpeed,
+    TurnSpeed,
+    ArmSpeed,
+    hub,
+    wait,
+    Color,
+    check_battery,
+    calibrate_gyro,
+)
+
+
+AUTO_CALIBRATE = True  # Auto-calibrate gyro before each mission?
+
+
+def pre_mission_setup():
+    """
+    Standard pre-mission setup.
+    Call this at the start of every mission.
+    """
+    if AUTO_CALIBRATE:
+        print("Calibrating gyro...")
+        calibrate_gyro()
+        wait(500)
+
+    # Check battery (warning only, doesn't stop mission)
+    voltage, ok = check_battery()
+    if not ok:
+        print(f"⚠ Battery low: {voltage}mV")
+        hub.light.on(Color.ORANGE)
+        wait(1000)
+
+
+def mission_complete(name):
+    """
+    Standard mission completion.
+    Call this at the end of every mission.
+    """
+    print(f"✓ {name} complete!")
+    hub.light.on(Color.GREEN)
+    wait(1000)
+    hub.light.off()
+
+
+def mission_07_careful_recovery():
+    """
+    Mission 7: Careful Recovery
+
+    Strategy:
+    - Navigate to fragile artifact
+    - Use adaptive grabbing and lifting
+    - Extremely gentle handling
+    - Return with artifact
+
+    Estimated Points: 30-40
+    Estimated Time: 32 seconds
+    """
+    print("Starting Mission 7: Careful Recovery")
+    pre_mission_setup()
+
+    # === PHASE 1: Navigate to Artifact ===
+    print("Phase 1: Navigate to fragile artifact")
+    move_straight_gyro(480, DriveSpeed.TRANSIT)
+    spin_turn(-28, TurnSpeed.PRECISE)
+    move_straight(230, DriveSpeed.APPROACH)
+
+    # === PHASE 2: Smart Grab (Ultra-Delicate) ===
+    print("Phase 2: Careful grab with load sensing")
+    move_straight(70, DriveSpeed.PRECISE)
+
+    # Use adaptive grabbing with low load threshold
+    result = grab_until_load(target_load=25, max_degrees=90, arm='right')
+
+    if result['grabbed']:
+        print(f"  Artifact grabbed gently! Load: {result['final_load']}%")
+
+        # Adaptive lift - extra gentle
+        lift_result = lift_adaptive(
+            70,
+            min_speed=ArmSpeed.DELICATE,
+            max_speed=ArmSpeed.COLLECT,
+            arm='right'
+        )
+        print(f"  Lifted carefully! Avg load: {lift_result['avg_load']}%")
+    else:
+        print("  Using standard delicate grab")
+        right_arm_down(90, ArmSpeed.DELICATE)
+        wait(500)
+        right_arm_up(90, ArmSpeed.DELICATE)
+
+    # === PHASE 3: Return with Artifact (Gentle) ===
+    print("Phase 3: Return with artifact")
+    move_straight(-300, DriveSpeed.APPROACH)  # Very careful
+    spin_turn(28, TurnSpeed.STANDARD)
+    move_straight_gyro(-480, DriveSpeed.COLLECTION)  # Not too fast
+
+    # === PHASE 4: Deposit Artifact ===
+    print("Phase 4: Deposit artifact gently")
+    right_arm_down(90, ArmSpeed.DELICATE)
+    wait(800)  # Extra settling time
+
+    mission_complete("Careful Recovery")
+    return True
@@ -0,0 +1,98 @@
+#!/usr/bin/env pybricks-micropython
+"""
+GENERATED by tools/build_mission_table.py from competition_setup.py - DO NOT EDIT.
+
+mission_08_quick_test() and what it uses, so mission_table.py loads only this mission.
+"""
+
+from robot import (
+    move_straight,
+    spin_turn,
+    both_arms_up,
+    both_arms_down,
+    DriveSpeed,
+    TurnSpeed,
+    ArmSpeed,
+    hub,
+    wait,
+    Color,
+    check_battery,
+    calibrate_gyro,
+)
+
+
+AUTO_CALIBRATE = True  # Auto-calibrate gyro before each mission?
+
+
+def pre_mission_setup():
+    """
+    Standard pre-mission setup.
+    Call this at the start of every mission.
+    """
+    if AUTO_CALIBRATE:
+        print("Calibrating gyro...")
+        calibrate_gyro()
+        wait(500)
+
+    # Check battery (warning only, doesn't stop mission)
+    voltage, ok = check_battery()
+    if not ok:
+        print(f"⚠ Battery low: {voltage}mV")
+        hub.light.on(Color.ORANGE)
+        wait(1000)
+
+
+def mission_complete(name):
+    """
+    Standard mission completion.
+    Call this at the end of every mission.
+    """
+    print(f"✓ {name} complete!")
+    hub.light.on(Color.GREEN)
+    wait(1000)
+    hub.light.off()
+
+
+def mission_08_quick_test():
+    """
+    Mission 8: Quick Test
+
+    Strategy:
+    - Fast movement verification
+    - Test basic robot functions
+    - Use before competition for final check
+    - No points, just verification
+
+    Time: 15 seconds
+    """
+    print("Starting Mission 8: Quick Test")
+    pre_mission_setup()
+
+    # Test forward movement
+    print("Test: Forward")
+    move_straight(300, DriveSpeed.APPROACH)
+    wait(500)
+
+    # Test turn
+    print("Test: Turn right")
+    spin_turn(90, TurnSpeed.STANDARD)
+    wait(500)
+
+    # Test backward
+    print("Test: Backward")
+    move_straight(-300, DriveSpeed.RETURN)
+    wait(500)
+
+    # Test turn left
+    print("Test: Turn left")
+    spin_turn(-90, TurnSpeed.STANDARD)
+    wait(500)
+
+    # Test arms
+    print("Test: Arms")
+    both_arms_up(45, ArmSpeed.GRAB)
+    wait(300)
+    both_arms_down(45, ArmSpeed.GRAB)
+
+    mission_complete("Quick Test")
+    return True
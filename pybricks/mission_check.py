@@ -11,18 +11,23 @@ extensive testing.
 
 Checks performed:
 1. Battery voltage (must be >4400mV for reliable operation)
-2. Gyro calibration and stability
+2. Gyro stability (drift and noise over a short window)
 3. Motor connectivity and response
-4. Basic alignment verification
-5. Hub status
+4. Attachment motors (informational)
+5. Alignment reminder
 
-Time: ~30 seconds (fast enough to run before every round!)
+Checks 2-4 overlap: the attachments move out and back in the background
+while the gyro is sampled, then the drive wheels do (they would turn the
+robot under the gyro), and the hub light blinks BLUE without holding
+anything up.
+
+Time: under 1 second (fast enough to run before every mission!)
 
 Usage:
     1. Place robot on flat surface in home position
     2. Run this file
-    3. Wait for GREEN light = Ready to compete!
-    4. RED light = Fix issues before running mission
+    3. GREEN light = Ready to compete!
+    4. Blinking RED light = Fix issues before running mission
 
 Created: 2025-10-19
 For: FLL teams who need quick, reliable pre-competition verification
@@ -33,6 +38,7 @@ from robot import (
     hub,
     wait,
     Color,
+    StopWatch,
 
     # Motors
     left_motor,
@@ -42,10 +48,8 @@ from robot import (
 
     # Utility functions
     check_battery,
-    calibrate_gyro,
 
     # Speed constants
-    DriveSpeed,
     ArmSpeed,
 )
 
@@ -56,11 +60,23 @@ from robot import (
 # Minimum battery voltage for competition (mV)
 MIN_BATTERY_VOLTAGE = 4400  # Adjust if needed (4400-4800 mV is typical)
 
-# Gyro stability tolerance (degrees)
-GYRO_STABILITY_TOLERANCE = 5  # Robot shouldn't drift more than 5° when stationary
+# Gyro stability, judged from all samples in the window
+GYRO_WINDOW_MS = 300        # Sample the gyro this long, before the wheels move
+GYRO_SAMPLE_MS = 10         # Time between samples
+GYRO_MAX_DRIFT = 2.0        # Heading trend (°/s) - more means the robot moves or the gyro drifts
+GYRO_MAX_NOISE = 0.5        # Spread around the trend (°) - more means the robot is being touched
 
-# Motor response test distance (degrees)
+# Motor response test (out and back, all motors at once)
 MOTOR_TEST_DEGREES = 90
+MOTOR_TEST_SPEED = 500              # deg/s
+ATTACHMENT_TEST_DEGREES = 45
+ATTACHMENT_TEST_SPEED = ArmSpeed.COLLECT
+MOTOR_TEST_TOLERANCE = 10           # A motor must move at least DEGREES - this
+CHECK_TIMEOUT_MS = 1500             # Give up on motors not finished this long after checks 2-4 start
+
+# LED patterns for hub.light.blink() (on/off ms) - they run in the background
+CHECKING_BLINK = [100, 100]
+FAILED_BLINK = [300, 300]
 
 # ============================================================================
 # CHECK FUNCTIONS
@@ -89,86 +105,181 @@ def check_1_battery():
         return False, voltage
 
 
-def check_2_gyro_calibration():
+class MotorTest:
+    """
+    Moves one motor out and back without waiting for it.
+
+    Call start() once, then poll() until finished. Errors (e.g. an
+    unplugged motor) end the test instead of stopping the check.
+    """
+
+    def __init__(self, name, motor, degrees, speed):
+        self.name = name
+        self.motor = motor
+        self.degrees = degrees
+        self.speed = speed
+        self.moved = 0
+        self.error = None
+        self.finished = False
+        self._back = False
+
+    def start(self):
+        try:
+            self._initial = self.motor.angle()
+            self.motor.run_angle(self.speed, self.degrees, wait=False)
+        except Exception as e:
+            self.error = e
+            self.finished = True
+
+    def poll(self):
+        if self.finished:
+            return
+        try:
+            if not self.motor.done():
+                return
+            if not self._back:
+                self.moved = abs(self.motor.angle() - self._initial)
+                self.motor.run_angle(self.speed, -self.degrees, wait=False)
+                self._back = True
+            else:
+                self.finished = True
+        except Exception as e:
+            self.error = e
+            self.finished = True
+
+    def ok(self):
+        return (self.finished and self.error is None
+                and self.moved >= self.degrees - MOTOR_TEST_TOLERANCE)
+
+    def describe(self):
+        if self.error is not None:
+            return f"{self.name} error: {self.error}"
+        if not self.finished:
+            return f"{self.name} did not finish within {CHECK_TIMEOUT_MS}ms"
+        if not self.ok():
+            return f"{self.name} only moved {self.moved}° (expected {self.degrees}°)"
+        return f"{self.name} OK (moved {self.moved}°)"
+
+
+def run_tests_together():
     """
-    CHECK 2: Gyro Calibration
+    Sample the gyro while the attachments move, then test the drive motors.
 
-    Calibrates the IMU gyro sensor for accurate turning and straight movement.
-    Robot MUST be stationary during this check.
+    The drive wheels turn the robot, so the gyro window ends before the
+    drive tests start; the attachment tests run from the start.
 
     Returns:
-        bool: True if calibration successful
+        tuple: (gyro samples [(ms, heading)], drive tests, attachment tests)
     """
-    print("\n[2/5] Calibrating gyro sensor...")
-    print("  (Robot must be still on flat surface)")
+    drive_tests = [
+        MotorTest("Left motor", left_motor, MOTOR_TEST_DEGREES, MOTOR_TEST_SPEED),
+        MotorTest("Right motor", right_motor, MOTOR_TEST_DEGREES, MOTOR_TEST_SPEED),
+    ]
+    attachment_tests = []
+    if attachment_motor_left is not None:
+        attachment_tests.append(MotorTest("Left attachment (Port A)", attachment_motor_left,
+                                          ATTACHMENT_TEST_DEGREES, ATTACHMENT_TEST_SPEED))
+    if attachment_motor_right is not None:
+        attachment_tests.append(MotorTest("Right attachment (Port E)", attachment_motor_right,
+                                          ATTACHMENT_TEST_DEGREES, ATTACHMENT_TEST_SPEED))
+    tests = list(attachment_tests)
 
-    # Reset and wait for stability
     hub.imu.reset_heading(0)
-    wait(1500)  # Give gyro time to settle
+    timer = StopWatch()
+    for test in tests:
+        test.start()
+
+    samples = []
+    while timer.time() < CHECK_TIMEOUT_MS:
+        now = timer.time()
+        if len(tests) == len(attachment_tests):
+            samples.append((now, hub.imu.heading()))
+            if now >= GYRO_WINDOW_MS:
+                # Gyro window done: the wheels may move now
+                for test in drive_tests:
+                    test.start()
+                tests.extend(drive_tests)
+        for test in tests:
+            test.poll()
+        if len(tests) > len(attachment_tests) and all(test.finished for test in tests):
+            break
+        wait(GYRO_SAMPLE_MS)
+
+    # Whatever did not finish must not keep moving into the mission
+    for test in tests:
+        if not test.finished:
+            try:
+                test.motor.stop()
+            except Exception:
+                pass
+    return samples, drive_tests, attachment_tests
+
+
+def gyro_stability(samples):
+    """
+    Trend and spread of gyro samples (least-squares line through them).
+
+    Args:
+        samples (list): (time_ms, heading) pairs
+
+    Returns:
+        tuple: (drift in °/s, noise as standard deviation around the trend in °)
+    """
+    count = len(samples)
+    if count < 2:
+        return 0.0, 0.0
+    mean_t = sum(t for t, _ in samples) / count
+    mean_h = sum(h for _, h in samples) / count
+    spread_t = sum((t - mean_t) ** 2 for t, _ in samples)
+    slope = (sum((t - mean_t) * (h - mean_h) for t, h in samples) / spread_t
+             if spread_t else 0.0)
+    residuals = [h - (mean_h + slope * (t - mean_t)) for t, h in samples]
+    noise = (sum(r * r for r in residuals) / count) ** 0.5
+    return slope * 1000, noise
+
+
+def check_2_gyro(samples):
+    """
+    CHECK 2: Gyro Stability
 
-    # Check if gyro is stable
-    heading = hub.imu.heading()
+    Judges the gyro from all samples taken in the window before the wheel
+    test (the attachment test runs alongside), not from a single reading
+    after a long wait. Robot MUST be stationary during this check.
 
-    if abs(heading) > GYRO_STABILITY_TOLERANCE:
-        print(f"  ✗ Gyro UNSTABLE: {heading}° (should be near 0°)")
+    Returns:
+        bool: True if the gyro is steady
+    """
+    print("\n[2/5] Gyro stability...")
+    drift, noise = gyro_stability(samples)
+    window = samples[-1][0] - samples[0][0] if samples else 0
+
+    if abs(drift) > GYRO_MAX_DRIFT or noise > GYRO_MAX_NOISE:
+        print(f"  ✗ Gyro UNSTABLE: drift {drift:.2f}°/s, noise {noise:.2f}° "
+              f"(max {GYRO_MAX_DRIFT}°/s, {GYRO_MAX_NOISE}°)")
         print(f"  → Check robot is on flat surface")
         print(f"  → Robot must not be moving")
         return False
 
-    print(f"  ✓ Gyro calibrated: {heading}° (stable)")
+    print(f"  ✓ Gyro stable: drift {drift:.2f}°/s, noise {noise:.2f}° "
+          f"({len(samples)} samples over {window}ms)")
     return True
 
 
-def check_3_motors():
+def check_3_motors(drive_tests):
     """
     CHECK 3: Motor Connectivity and Response
 
     Verifies that drive motors are connected and responding correctly.
-    Small test movements ensure motors work before starting mission.
 
     Returns:
         bool: True if all motors responding
     """
     print("\n[3/5] Checking drive motors...")
 
-    issues = []
-
-    # Test left motor
-    try:
-        initial_left = left_motor.angle()
-        left_motor.run_angle(100, MOTOR_TEST_DEGREES, wait=True)
-        final_left = left_motor.angle()
-        movement_left = abs(final_left - initial_left)
-
-        if movement_left < MOTOR_TEST_DEGREES - 10:
-            issues.append(f"Left motor only moved {movement_left}° (expected {MOTOR_TEST_DEGREES}°)")
-        else:
-            print(f"  ✓ Left motor OK (moved {movement_left}°)")
-
-    except Exception as e:
-        issues.append(f"Left motor error: {e}")
-
-    # Test right motor
-    try:
-        initial_right = right_motor.angle()
-        right_motor.run_angle(100, MOTOR_TEST_DEGREES, wait=True)
-        final_right = right_motor.angle()
-        movement_right = abs(final_right - initial_right)
-
-        if movement_right < MOTOR_TEST_DEGREES - 10:
-            issues.append(f"Right motor only moved {movement_right}° (expected {MOTOR_TEST_DEGREES}°)")
-        else:
-            print(f"  ✓ Right motor OK (moved {movement_right}°)")
-
-    except Exception as e:
-        issues.append(f"Right motor error: {e}")
-
-    # Return motors to original position
-    try:
-        left_motor.run_angle(-100, MOTOR_TEST_DEGREES, wait=False)
-        right_motor.run_angle(-100, MOTOR_TEST_DEGREES, wait=True)
-    except:
-        pass
+    issues = [test.describe() for test in drive_tests if not test.ok()]
+    for test in drive_tests:
+        if test.ok():
+            print(f"  ✓ {test.describe()}")
 
     if issues:
         print("  ✗ Motor issues detected:")
@@ -179,11 +290,10 @@ def check_3_motors():
     return True
 
 
-def check_4_attachments():
+def check_4_attachments(attachment_tests):
     """
     CHECK 4: Attachment Motors (Optional)
 
-    Checks if attachment motors are connected and responsive.
     This is informational - not required for mission readiness.
 
     Returns:
@@ -191,31 +301,13 @@ def check_4_attachments():
     """
     print("\n[4/5] Checking attachment motors...")
 
-    # Check left attachment
-    if attachment_motor_left is not None:
-        try:
-            initial = attachment_motor_left.angle()
-            attachment_motor_left.run_angle(200, 45, wait=True)
-            wait(100)
-            attachment_motor_left.run_angle(200, -45, wait=True)
-            print(f"  ✓ Left attachment OK (Port A)")
-        except Exception as e:
-            print(f"  ⚠ Left attachment warning: {e}")
-    else:
+    if attachment_motor_left is None:
         print(f"  ⚠ No attachment on Port A")
-
-    # Check right attachment
-    if attachment_motor_right is not None:
-        try:
-            initial = attachment_motor_right.angle()
-            attachment_motor_right.run_angle(200, 45, wait=True)
-            wait(100)
-            attachment_motor_right.run_angle(200, -45, wait=True)
-            print(f"  ✓ Right attachment OK (Port E)")
-        except Exception as e:
-            print(f"  ⚠ Right attachment warning: {e}")
-    else:
+    if attachment_motor_right is None:
         print(f"  ⚠ No attachment on Port E")
+    for test in attachment_tests:
+        mark = "✓" if test.ok() else "⚠"
+        print(f"  {mark} {test.describe()}")
 
     # Attachments are optional, so always pass
     return True
@@ -238,14 +330,6 @@ def check_5_alignment():
     print("  → Robot should be in starting position")
     print("  → Attachments should be in starting configuration")
 
-    # Visual confirmation with LED
-    print("\n  Flashing BLUE for 2 seconds - check alignment now...")
-    for _ in range(4):
-        hub.light.on(Color.BLUE)
-        wait(250)
-        hub.light.off()
-        wait(250)
-
     return True
 
 
@@ -257,7 +341,9 @@ def run_competition_check():
     """
     Main competition readiness check routine.
 
-    Runs all 5 checks and reports overall status.
+    Runs all 5 checks and reports overall status. The light blinks BLUE
+    while checking, then stays GREEN (ready) or blinks RED (not ready);
+    nothing waits for the light.
 
     Returns:
         bool: True if robot is competition ready
@@ -271,15 +357,13 @@ def run_competition_check():
     print("  - Robot must be STATIONARY")
     print("  - Do NOT touch robot during checks")
     print()
-    print("Starting checks in 2 seconds...")
-    wait(2000)
+    # Runs in the background while the checks work
+    hub.light.blink(Color.BLUE, CHECKING_BLINK)
 
     # Track results
     checks_passed = []
     checks_failed = []
 
-    # Run all checks
-
     # Check 1: Battery
     battery_ok, voltage = check_1_battery()
     if battery_ok:
@@ -287,22 +371,25 @@ def run_competition_check():
     else:
         checks_failed.append("Battery (charge needed)")
 
+    # Checks 2-4 run together; results are printed afterwards
+    samples, drive_tests, attachment_tests = run_tests_together()
+
     # Check 2: Gyro
-    gyro_ok = check_2_gyro_calibration()
+    gyro_ok = check_2_gyro(samples)
     if gyro_ok:
         checks_passed.append("Gyro")
     else:
         checks_failed.append("Gyro (unstable or moving)")
 
     # Check 3: Motors
-    motors_ok = check_3_motors()
+    motors_ok = check_3_motors(drive_tests)
     if motors_ok:
         checks_passed.append("Motors")
     else:
         checks_failed.append("Motors (check connections)")
 
     # Check 4: Attachments (informational)
-    attachments_ok = check_4_attachments()
+    attachments_ok = check_4_attachments(attachment_tests)
     if attachments_ok:
         checks_passed.append("Attachments")
 
@@ -330,14 +417,8 @@ def run_competition_check():
         print("=" * 50)
         print("\nFix failed checks before running mission!")
 
-        # Flash RED
-        for _ in range(3):
-            hub.light.on(Color.RED)
-            wait(300)
-            hub.light.off()
-            wait(300)
-
-        hub.light.on(Color.RED)
+        # Keeps blinking RED in the background
+        hub.light.blink(Color.RED, FAILED_BLINK)
         return False
 
     else:
@@ -350,20 +431,10 @@ def run_competition_check():
         print("=" * 50)
         print("\nYou may run your mission now!")
         print(f"Battery: {voltage}mV")
-        print(f"Gyro: Calibrated")
+        print(f"Gyro: Stable")
         print(f"Motors: Responding")
 
-        # Flash GREEN
-        for _ in range(5):
-            hub.light.on(Color.GREEN)
-            wait(200)
-            hub.light.off()
-            wait(200)
-
         hub.light.on(Color.GREEN)
-        wait(1000)
-        hub.light.off()
-
         return True
 
 
@@ -380,7 +451,7 @@ if __name__ == "__main__":
     Usage:
         pybricksdev run ble mission_check.py
 
-    Expected time: ~30 seconds
+    Expected time: under 1 second
     """
     try:
         ready = run_competition_check()
@@ -20,11 +20,36 @@ Competition Workflow:
 
 Features:
 - Load mission functions to specific slots
+- Use a slot table generated at build time (no registration at boot)
+- Plan the run order from mission annotations (zones, attachment, time)
 - List all loaded missions
 - Clear individual slots
 - Export mission metadata
 - Competition-ready organization
 
+Generated Mission Table:
+    tools/build_mission_table.py reads the register_mission() calls in
+    competition_setup.py and writes mission_table.py: a static tuple indexed
+    by slot, whose entries import their mission module only when run.
+    Booting with the table skips importing and registering every mission.
+
+        from mission_table import MISSIONS
+        use_mission_table(MISSIONS)
+        competition_mode()
+
+Lazy Mission Modules:
+    A mission can be registered as a "module:function" string instead of a
+    function. Its module is imported when the mission starts, and after the
+    run every module the mission pulled in is removed from sys.modules and
+    garbage-collected (except RESIDENT_MODULES). Only the running mission's
+    code takes up RAM.
+
+        register_mission(8, "Silo", "Missions_10_23:mission8_Silo")
+
+    pybricksdev only uploads modules it sees imported, so list string-path
+    missions in the generated table (it turns them into real imports) or
+    import the module somewhere in the program.
+
 Created: 2025-10-19
 For: FLL teams who need organized mission management at competitions
 """
@@ -33,6 +58,16 @@ from pybricks.hubs import PrimeHub
 from pybricks.parameters import Color, Button
 from pybricks.tools import wait, StopWatch
 
+try:
+    import usys as sys
+except ImportError:
+    import sys
+
+try:
+    import gc
+except ImportError:
+    gc = None
+
 # Initialize hub
 hub = PrimeHub()
 
@@ -41,22 +76,77 @@ hub = PrimeHub()
 # ============================================================================
 
 # Dictionary mapping slot numbers to mission information
-# Format: slot_number: {'name': str, 'function': callable, 'description': str}
+# Format: slot_number: {'name': str, 'function': callable, 'description': str,
+#                       'start_zone': str, 'end_zone': str,
+#                       'attachment': str, 'estimated_ms': int,
+#                       'duration_ms': int, 'points': int}
 MISSION_REGISTRY = {}
 
+# Slot-indexed table generated by tools/build_mission_table.py
+# Format: MISSION_TABLE[slot] = (name, description, function, start_zone,
+#                               end_zone, attachment, estimated_ms,
+#                               duration_ms, points)
+#         or None for an empty slot
+# Slots in the table take priority over MISSION_REGISTRY.
+MISSION_TABLE = ()
+
+# Unload mission modules after each run to keep the heap small
+UNLOAD_AFTER_RUN = True
+
+# Shared modules (and packages) that stay loaded between missions
+RESIDENT_MODULES = ("pybricks", "robot", "robot_config", "mission_loader",
+                    "mission_table", "mission_check", "telemetry", "trace_recorder")
+
+# Library modules a mission may import; never unloaded (MicroPython u-names
+# and their plain names, which the firmware aliases)
+LIBRARY_MODULES = ("micropython", "gc", "sys", "usys", "struct", "ustruct", "_struct",
+                   "math", "umath", "random", "urandom", "json", "ujson", "io", "uio",
+                   "time", "utime", "errno", "uerrno", "select", "uselect",
+                   "asyncio", "uasyncio", "collections", "ucollections")
+
+# Time each run and its primitives and keep the history (see telemetry.py)
+RECORD_TELEMETRY = True
+
+# Record the control loops of each run at full rate (see trace_recorder.py)
+# and print the trace afterwards for tools/decode_trace.py
+RECORD_TRACE = False
+DUMP_TRACE_AFTER_RUN = True
+
+# ============================================================================
+# MENU TIMING
+# ============================================================================
+
+# Every millisecond here is dead time at the table, times 6-8 runs per match.
+START_DELAY_MS = 0          # Pause between launch and the robot moving
+RETURN_DELAY_MS = 0         # Pause after a run before the menu takes input
+BUTTON_POLL_MS = 5          # Button sampling interval
+LAUNCH_ON_RELEASE = True    # Start when CENTER is released (hand off the robot)
+
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
-def register_mission(slot, name, function, description=""):
+def register_mission(slot, name, function, description="",
+                     start_zone=None, end_zone=None, attachment=None,
+                     estimated_ms=None, duration_ms=None, points=None):
     """
     Register a mission function to a specific program slot.
 
+    The optional annotations are used by plan_runs() to pick the run order.
+
     Args:
         slot (int): Program slot number (0-19)
         name (str): Short name for the mission (e.g., "Mission 1")
-        function (callable): The mission function to execute
+        function (callable/str): The mission function to execute, or a
+                                 "module:function" path imported on demand
         description (str): Optional description of what mission does
+        start_zone (str): Launch area the run starts in (e.g. "left")
+        end_zone (str): Launch area the robot returns to
+        attachment (str): Attachment the run needs (None = bare robot)
+        estimated_ms (int): The team's estimate of the run time
+        duration_ms (int): Measured run time (used instead of estimated_ms)
+        points (int): Score the run is worth, for dropping runs that do
+                      not fit the match
 
     Returns:
         bool: True if registered successfully
@@ -67,25 +157,186 @@ def register_mission(slot, name, function, description=""):
             turn(90)
 
         register_mission(0, "Test Mission", my_mission, "Basic movement test")
+        register_mission(1, "Silo", "Missions_10_23:mission8_Silo")
     """
     if not 0 <= slot <= 19:
         print(f"ERROR: Slot must be 0-19, got {slot}")
         return False
 
-    if not callable(function):
+    if isinstance(function, str):
+        if ":" not in function:
+            print(f"ERROR: mission path must be 'module:function', got '{function}'")
+            return False
+    elif not callable(function):
         print(f"ERROR: function must be callable")
         return False
 
     MISSION_REGISTRY[slot] = {
         'name': name,
         'function': function,
-        'description': description
+        'description': description,
+        'start_zone': start_zone,
+        'end_zone': end_zone,
+        'attachment': attachment,
+        'estimated_ms': estimated_ms,
+        'duration_ms': duration_ms,
+        'points': points,
     }
 
     print(f"✓ Registered '{name}' to slot {slot}")
     return True
 
 
+def use_mission_table(table):
+    """
+    Use a generated slot table (mission_table.MISSIONS) for mission lookup.
+
+    Args:
+        table (tuple): Slot-indexed tuple of (name, description, function,
+                       start_zone, end_zone, attachment, estimated_ms,
+                       duration_ms, points) or None for empty slots
+
+    Returns:
+        int: Number of missions in the table
+
+    Example:
+        from mission_table import MISSIONS
+        use_mission_table(MISSIONS)
+    """
+    global MISSION_TABLE
+    MISSION_TABLE = table
+    return sum(1 for entry in table if entry is not None)
+
+
+def get_mission(slot):
+    """
+    Look up the mission in a slot.
+
+    Args:
+        slot (int): Program slot number (0-19)
+
+    Returns:
+        tuple: (name, description, function), or None if the slot is empty
+    """
+    if 0 <= slot < len(MISSION_TABLE) and MISSION_TABLE[slot] is not None:
+        return MISSION_TABLE[slot][:3]
+
+    mission = MISSION_REGISTRY.get(slot)
+    if mission is None:
+        return None
+    return (mission['name'], mission['description'], mission['function'])
+
+
+def get_mission_info(slot):
+    """
+    Planning annotations of the mission in a slot.
+
+    Args:
+        slot (int): Program slot number (0-19)
+
+    Returns:
+        dict: {'start_zone', 'end_zone', 'attachment', 'estimated_ms',
+               'duration_ms', 'points'}
+              (values are None when not annotated), or None if the slot
+              is empty
+    """
+    if 0 <= slot < len(MISSION_TABLE) and MISSION_TABLE[slot] is not None:
+        start_zone, end_zone, attachment, estimated_ms, duration_ms, points = MISSION_TABLE[slot][3:9]
+        return {
+            'start_zone': start_zone,
+            'end_zone': end_zone,
+            'attachment': attachment,
+            'estimated_ms': estimated_ms,
+            'duration_ms': duration_ms,
+            'points': points,
+        }
+
+    mission = MISSION_REGISTRY.get(slot)
+    if mission is None:
+        return None
+    return {
+        'start_zone': mission['start_zone'],
+        'end_zone': mission['end_zone'],
+        'attachment': mission['attachment'],
+        'estimated_ms': mission['estimated_ms'],
+        'duration_ms': mission['duration_ms'],
+        'points': mission['points'],
+    }
+
+
+def mission_slots():
+    """
+    All slots that hold a mission, from the table and the registry.
+
+    Returns:
+        list: Sorted slot numbers
+    """
+    slots = [slot for slot, entry in enumerate(MISSION_TABLE) if entry is not None]
+    for slot in MISSION_REGISTRY:
+        if slot not in slots:
+            slots.append(slot)
+    return sorted(slots)
+
+
+def resolve_mission(function):
+    """
+    Turn a registered mission into something callable.
+
+    Args:
+        function (callable/str): Mission function or "module:function" path
+
+    Returns:
+        callable: The mission function (importing its module if needed)
+    """
+    if callable(function):
+        return function
+
+    module_name, function_name = function.split(":", 1)
+    module = __import__(module_name)
+    return getattr(module, function_name)
+
+
+def _directory(path):
+    return path.rsplit("/", 1)[0] if "/" in path else ""
+
+
+def _program_module(name):
+    """True if a module is one of the program's files (not firmware or library)."""
+    if name.split(".")[0] in RESIDENT_MODULES or name in LIBRARY_MODULES:
+        return False
+    path = getattr(sys.modules[name], "__file__", None)
+    if path is None:
+        # Built into the firmware (or a program module the hub gives no path)
+        return not name.startswith("_")
+    return _directory(path) == _directory(__file__)
+
+
+def unload_mission_modules(loaded_before):
+    """
+    Remove program modules imported by a mission run and free their memory.
+
+    Only modules from the program directory are removed; library modules a
+    mission pulled in (struct, math...) stay, so the next run does not load
+    them again.
+
+    Args:
+        loaded_before (set): Module names that were loaded before the run
+
+    Returns:
+        list: Names of the modules removed
+    """
+    removed = []
+    for name in list(sys.modules):
+        if name in loaded_before or not _program_module(name):
+            continue
+        del sys.modules[name]
+        removed.append(name)
+
+    if gc is not None:
+        gc.collect()
+    return removed
+
+
 def run_mission(slot):
     """
     Run the mission registered to a specific slot.
@@ -93,52 +344,90 @@ def run_mission(slot):
     Args:
         slot (int): Program slot number (0-19)
 
+    With RECORD_TELEMETRY, the run time and the time spent in each kind of
+    robot.py primitive are stored in the telemetry history. With RECORD_TRACE,
+    the control loops of the run are recorded and dumped afterwards.
+
     Returns:
         bool: True if mission completed successfully
 
     Example:
         run_mission(0)  # Runs mission in slot 0
     """
-    if slot not in MISSION_REGISTRY:
+    mission = get_mission(slot)
+    if mission is None:
         print(f"ERROR: No mission registered in slot {slot}")
         hub.light.on(Color.RED)
         return False
 
-    mission = MISSION_REGISTRY[slot]
+    name, description, function = mission
+    loaded_before = set(sys.modules)
     print(f"\n{'=' * 50}")
-    print(f"Running: {mission['name']} (Slot {slot})")
-    if mission['description']:
-        print(f"Description: {mission['description']}")
+    print(f"Running: {name} (Slot {slot})")
+    if description:
+        print(f"Description: {description}")
     print('=' * 50)
 
+    success = False
+    timing = None
+    if RECORD_TELEMETRY:
+        import telemetry
+        timing = telemetry
+
     try:
         # Visual feedback - starting mission
         hub.light.on(Color.BLUE)
-        wait(500)
+        if START_DELAY_MS:
+            wait(START_DELAY_MS)
+
+        if timing is not None:
+            timing.start_mission()
+
+        if RECORD_TRACE:
+            import trace_recorder
+            if trace_recorder.enable():
+                trace_recorder.mark(trace_recorder.KIND_MISSION, extra=slot)
 
-        # Execute mission
-        result = mission['function']()
+        # Execute mission (imports its module now if registered by path)
+        result = resolve_mission(function)()
 
         # Visual feedback - mission complete
         if result is False:
-            print(f"\n✗ Mission '{mission['name']}' FAILED")
+            print(f"\n✗ Mission '{name}' FAILED")
             hub.light.on(Color.RED)
             return False
         else:
-            print(f"\n✓ Mission '{mission['name']}' COMPLETE")
+            success = True
+            print(f"\n✓ Mission '{name}' COMPLETE")
             hub.light.on(Color.GREEN)
             return True
 
     except KeyboardInterrupt:
-        print(f"\n⚠ Mission '{mission['name']}' INTERRUPTED")
+        print(f"\n⚠ Mission '{name}' INTERRUPTED")
         hub.light.on(Color.ORANGE)
         return False
 
     except Exception as e:
-        print(f"\n✗ Mission '{mission['name']}' ERROR: {e}")
+        print(f"\n✗ Mission '{name}' ERROR: {e}")
         hub.light.on(Color.RED)
         return False
 
+    finally:
+        if timing is not None:
+            record = timing.finish_mission(slot, success)
+            print(f"Time: {record['mission_ms'] / 1000:.1f}s")
+
+        if RECORD_TRACE:
+            import trace_recorder
+            trace_recorder.disable()
+            if DUMP_TRACE_AFTER_RUN:
+                trace_recorder.dump()
+
+        if UNLOAD_AFTER_RUN:
+            removed = unload_mission_modules(loaded_before)
+            if removed:
+                print(f"Unloaded: {', '.join(removed)}")
+
 
 def list_missions():
     """
@@ -146,7 +435,8 @@ def list_missions():
 
     Prints a formatted table of all missions currently registered.
     """
-    if not MISSION_REGISTRY:
+    slots = mission_slots()
+    if not slots:
         print("No missions registered")
         return
 
@@ -156,14 +446,14 @@ def list_missions():
     print(f"{'Slot':<6} {'Name':<20} {'Description':<40}")
     print("-" * 70)
 
-    for slot in sorted(MISSION_REGISTRY.keys()):
-        mission = MISSION_REGISTRY[slot]
-        name = mission['name'][:19]  # Truncate if too long
-        desc = mission['description'][:39]  # Truncate if too long
+    for slot in slots:
+        name, description, _ = get_mission(slot)
+        name = name[:19]  # Truncate if too long
+        desc = description[:39]  # Truncate if too long
         print(f"{slot:<6} {name:<20} {desc:<40}")
 
     print("=" * 70)
-    print(f"Total: {len(MISSION_REGISTRY)} missions")
+    print(f"Total: {len(slots)} missions")
 
 
 def clear_mission(slot):
@@ -177,7 +467,10 @@ def clear_mission(slot):
         bool: True if cleared successfully
     """
     if slot not in MISSION_REGISTRY:
-        print(f"Slot {slot} is already empty")
+        if get_mission(slot) is not None:
+            print(f"Slot {slot} comes from mission_table.py - rebuild the table to change it")
+        else:
+            print(f"Slot {slot} is already empty")
         return False
 
     mission_name = MISSION_REGISTRY[slot]['name']
@@ -188,13 +481,15 @@ def clear_mission(slot):
 
 def clear_all_missions():
     """
-    Clear all registered missions.
+    Clear all registered missions (and stop using the generated table).
 
     Returns:
         int: Number of missions cleared
     """
-    count = len(MISSION_REGISTRY)
+    global MISSION_TABLE
+    count = len(mission_slots())
     MISSION_REGISTRY.clear()
+    MISSION_TABLE = ()
     print(f"✓ Cleared {count} missions")
     return count
 
@@ -203,7 +498,58 @@ def clear_all_missions():
 # INTERACTIVE MISSION SELECTOR
 # ============================================================================
 
-def select_mission_interactive():
+def wait_for_button(buttons=(Button.LEFT, Button.RIGHT, Button.CENTER)):
+    """
+    Wait for a new press of one of the buttons (edge-triggered).
+
+    Buttons that are already held when this is called are ignored until they
+    are released and pressed again, so no fixed debounce delay is needed and
+    a button still held from the last action never triggers twice.
+
+    With LAUNCH_ON_RELEASE, Button.CENTER is reported when it is released,
+    so the mission starts with the hand already off the robot.
+
+    Args:
+        buttons (tuple): Buttons to react to
+
+    Returns:
+        Button: The button that was pressed
+    """
+    previous = hub.buttons.pressed()
+    while True:
+        wait(BUTTON_POLL_MS)
+        pressed = hub.buttons.pressed()
+
+        for button in buttons:
+            if button in pressed and button not in previous:
+                if button == Button.CENTER and LAUNCH_ON_RELEASE:
+                    while Button.CENTER in hub.buttons.pressed():
+                        wait(BUTTON_POLL_MS)
+                return button
+
+        previous = pressed
+
+
+def next_planned_slot(plan, slot):
+    """
+    Slot to preselect after running a mission.
+
+    Args:
+        plan (list): Slots in the order they will be run
+        slot (int): Slot that just ran
+
+    Returns:
+        int: The slot after it in the plan (wraps around), or the first
+             planned slot if it was not in the plan
+    """
+    if not plan:
+        return slot
+    if slot not in plan:
+        return plan[0]
+    return plan[(plan.index(slot) + 1) % len(plan)]
+
+
+def select_mission_interactive(start_slot=None):
     """
     Interactive mission selector using hub buttons.
 
@@ -212,17 +558,20 @@ def select_mission_interactive():
     - Right button: Next mission
     - Center button: Run selected mission
 
+    Args:
+        start_slot (int): Slot to preselect (e.g. the next planned run)
+
     Returns:
         int: Selected slot number, or None if cancelled
     """
-    if not MISSION_REGISTRY:
+    # Get sorted list of available slots
+    available_slots = mission_slots()
+    if not available_slots:
         print("No missions to select")
         hub.light.on(Color.RED)
         return None
 
-    # Get sorted list of available slots
-    available_slots = sorted(MISSION_REGISTRY.keys())
-    current_index = 0
+    current_index = available_slots.index(start_slot) if start_slot in available_slots else 0
 
     print("\n" + "=" * 50)
     print("MISSION SELECTOR")
@@ -236,12 +585,12 @@ def select_mission_interactive():
     while True:
         # Get current slot and mission
         slot = available_slots[current_index]
-        mission = MISSION_REGISTRY[slot]
+        name, description, _ = get_mission(slot)
 
         # Display current selection
-        print(f"\n[{current_index + 1}/{len(available_slots)}] Slot {slot}: {mission['name']}")
-        if mission['description']:
-            print(f"  {mission['description']}")
+        print(f"\n[{current_index + 1}/{len(available_slots)}] Slot {slot}: {name}")
+        if description:
+            print(f"  {description}")
 
         # Visual feedback - show slot number via LED color
         # Colors cycle: Red, Orange, Yellow, Green, Cyan, Blue, Violet
@@ -249,26 +598,20 @@ def select_mission_interactive():
                   Color.CYAN, Color.BLUE, Color.VIOLET]
         hub.light.on(colors[slot % len(colors)])
 
-        # Wait for button press
-        pressed = []
-        while not pressed:
-            pressed = hub.buttons.pressed()
-            wait(10)
+        # Wait for a new button press (no debounce delay needed)
+        button = wait_for_button()
 
-        if Button.LEFT in pressed:
+        if button == Button.LEFT:
             # Previous mission
             current_index = (current_index - 1) % len(available_slots)
-            wait(300)  # Debounce
 
-        elif Button.RIGHT in pressed:
+        elif button == Button.RIGHT:
             # Next mission
             current_index = (current_index + 1) % len(available_slots)
-            wait(300)  # Debounce
 
-        elif Button.CENTER in pressed:
+        elif button == Button.CENTER:
             # Select and run this mission
             print(f"\n✓ Selected slot {slot}")
-            wait(300)  # Debounce
             return slot
 
 
@@ -323,33 +666,268 @@ def run_mission_sequence(slots, delay_ms=1000):
     return results
 
 
+# ============================================================================
+# RUN PLANNER
+# ============================================================================
+
+# Match and table-side timing (ms) used to score a run order
+MATCH_TIME_MS = 150000      # FLL match length
+RELAUNCH_MS = 2000          # Align in the launch area and press CENTER
+ZONE_CHANGE_MS = 4000       # Carry the robot to the other launch area
+ATTACHMENT_SWAP_MS = 8000   # Take one attachment off and put another on
+UNKNOWN_DURATION_MS = 20000 # Used for missions without duration_ms or estimated_ms
+
+# Exact search up to this many missions, greedy above (RAM and time on hub)
+PLAN_EXACT_LIMIT = 10
+
+
+def transition_ms(before, after):
+    """
+    Table-side time between two runs.
+
+    Args:
+        before (dict): get_mission_info() of the run that just finished
+        after (dict): get_mission_info() of the next run
+
+    Returns:
+        int: Milliseconds from the robot arriving home to the next launch
+    """
+    total = RELAUNCH_MS
+    if before['end_zone'] and after['start_zone'] and before['end_zone'] != after['start_zone']:
+        total += ZONE_CHANGE_MS
+    if before['attachment'] != after['attachment']:
+        total += ATTACHMENT_SWAP_MS
+    return total
+
+
+def _greedy_order(indices, cost):
+    """Nearest-neighbour order starting from the first mission."""
+    order = [indices[0]]
+    remaining = list(indices[1:])
+    while remaining:
+        last = order[-1]
+        best = min(remaining, key=lambda j: cost[last][j])
+        order.append(best)
+        remaining.remove(best)
+    return order
+
+
+def _exact_tables(count, cost):
+    """Held-Karp dynamic programming over every subset of the missions."""
+    size = 1 << count
+    # best[mask][last] = cheapest transitions to run the set 'mask' ending at 'last'
+    best = [[None] * count for _ in range(size)]
+    previous = [[-1] * count for _ in range(size)]
+    for i in range(count):
+        best[1 << i][i] = 0
+
+    for mask in range(1, size):
+        row = best[mask]
+        for last in range(count):
+            so_far = row[last]
+            if so_far is None:
+                continue
+            for nxt in range(count):
+                if mask & (1 << nxt):
+                    continue
+                new_mask = mask | (1 << nxt)
+                candidate = so_far + cost[last][nxt]
+                if best[new_mask][nxt] is None or candidate < best[new_mask][nxt]:
+                    best[new_mask][nxt] = candidate
+                    previous[new_mask][nxt] = last
+    return best, previous
+
+
+def _exact_order(best, previous, mask):
+    """Cheapest order of the missions in 'mask', from _exact_tables()."""
+    row = best[mask]
+    last = min((i for i in range(len(row)) if row[i] is not None), key=lambda i: row[i])
+    order = []
+    while last != -1:
+        order.append(last)
+        before = previous[mask][last]
+        mask &= ~(1 << last)
+        last = before
+    order.reverse()
+    return order
+
+
+def _exact_plan(count, cost, run, points, time_limit_ms):
+    """
+    Best order over all subsets: every mission if it fits, otherwise the
+    subset worth the most points that fits (then the most missions, then
+    the fewest ms).
+    """
+    best, previous = _exact_tables(count, cost)
+    full = (1 << count) - 1
+    chosen = None
+    chosen_key = None
+    for mask in range(1, full + 1):
+        transitions = min(t for t in best[mask] if t is not None)
+        total = transitions + sum(run[i] for i in range(count) if mask & (1 << i))
+        if total > time_limit_ms and mask != full:
+            continue
+        members = [i for i in range(count) if mask & (1 << i)]
+        key = (total <= time_limit_ms, sum(points[i] for i in members), len(members), -total)
+        if chosen_key is None or key > chosen_key:
+            chosen = mask
+            chosen_key = key
+    return _exact_order(best, previous, chosen)
+
+
+def _greedy_plan(count, cost, run, points, time_limit_ms):
+    """Greedy order; drops the fewest points per second until it fits."""
+    kept = list(range(count))
+    while True:
+        order = _greedy_order(kept, cost)
+        total = sum(run[i] for i in order) + sum(
+            cost[order[k]][order[k + 1]] for k in range(len(order) - 1))
+        if total <= time_limit_ms or len(kept) == 1:
+            return order
+        kept.remove(min(kept, key=lambda i: points[i] / run[i] if run[i] else points[i]))
+
+
+def plan_runs(slots=None, durations=None, time_limit_ms=MATCH_TIME_MS, verbose=True):
+    """
+    Pick the run order that minimizes total match time.
+
+    Uses the start_zone / end_zone / attachment annotations, and the
+    measured duration_ms or else the team's estimated_ms of each run.
+    Missions that share an attachment and whose zones line up end up next to
+    each other, so attachment swaps and robot carries are as few as possible.
+    The first run is free of table-side time (set up before the match).
+
+    If all missions do not fit in time_limit_ms, the plan is the set of
+    missions worth the most points (points annotation) that does fit; the
+    others are listed in 'dropped'. Missions without points count as 0,
+    so with no points at all the plan keeps as many missions as fit.
+
+    Args:
+        slots (list): Slots to plan (default: all missions)
+        durations (dict): Override durations {slot: ms}, e.g. measured times
+        time_limit_ms (int): Match length to fit
+        verbose (bool): Print the plan
+
+    Returns:
+        dict: {
+            'order': [slot, ...],         # run order for competition_mode()
+            'dropped': [slot, ...],       # missions left out to fit the match
+            'points': int,                # points of the planned runs
+            'total_ms': int,              # runs + table-side time
+            'run_ms': int,                # sum of mission durations
+            'transition_ms': int,         # table-side time
+            'swaps': int,                 # attachment changes
+            'fits': bool                  # total_ms <= time_limit_ms
+        }
+
+    Example:
+        plan = plan_runs()
+        competition_mode(plan=plan['order'])
+    """
+    slots = list(slots) if slots is not None else mission_slots()
+    result = {'order': [], 'dropped': [], 'points': 0, 'total_ms': 0, 'run_ms': 0,
+              'transition_ms': 0, 'swaps': 0, 'fits': True}
+    if not slots:
+        return result
+
+    durations = durations or {}
+    infos = [get_mission_info(slot) for slot in slots]
+    count = len(slots)
+    cost = [[transition_ms(infos[i], infos[j]) for j in range(count)] for i in range(count)]
+    run = []
+    for i in range(count):
+        duration = durations.get(slots[i], infos[i]['duration_ms'])
+        if duration is None:
+            duration = infos[i]['estimated_ms']
+        run.append(duration if duration is not None else UNKNOWN_DURATION_MS)
+    points = [infos[i]['points'] or 0 for i in range(count)]
+
+    if count <= PLAN_EXACT_LIMIT:
+        order = _exact_plan(count, cost, run, points, time_limit_ms)
+    else:
+        order = _greedy_plan(count, cost, run, points, time_limit_ms)
+
+    run_ms = sum(run[i] for i in order)
+    between = sum(cost[order[k]][order[k + 1]] for k in range(len(order) - 1))
+    swaps = sum(1 for k in range(len(order) - 1)
+                if infos[order[k]]['attachment'] != infos[order[k + 1]]['attachment'])
+
+    result['order'] = [slots[i] for i in order]
+    result['dropped'] = [slots[i] for i in range(count) if i not in order]
+    result['points'] = sum(points[i] for i in order)
+    result['run_ms'] = run_ms
+    result['transition_ms'] = between
+    result['total_ms'] = run_ms + between
+    result['swaps'] = swaps
+    result['fits'] = result['total_ms'] <= time_limit_ms
+
+    if verbose:
+        print("\n" + "=" * 50)
+        print("RUN PLAN")
+        print("=" * 50)
+        for position, i in enumerate(order, 1):
+            info = infos[i]
+            name, _, _ = get_mission(slots[i])
+            print(f"{position}. Slot {slots[i]:<3} {name:<18} "
+                  f"{info['start_zone'] or '-'}->{info['end_zone'] or '-'}  "
+                  f"[{info['attachment'] or '-'}]")
+        for slot in result['dropped']:
+            name, _, _ = get_mission(slot)
+            print(f"   Slot {slot:<3} {name:<18} DROPPED (does not fit)")
+        if result['dropped'] and not any(points):
+            print("⚠ No points annotated: kept as many runs as fit, not the best ones")
+        print("-" * 50)
+        print(f"Runs: {run_ms / 1000:.1f}s  Table: {between / 1000:.1f}s  "
+              f"Swaps: {swaps}  Points: {result['points']}")
+        print(f"Total: {result['total_ms'] / 1000:.1f}s of {time_limit_ms / 1000:.0f}s "
+              f"{'✓' if result['fits'] else '✗ OVER LIMIT'}")
+
+    return result
+
+
 # ============================================================================
 # COMPETITION MODE
 # ============================================================================
 
-def competition_mode():
+def competition_mode(plan=None, return_delay_ms=RETURN_DELAY_MS):
     """
     Competition mode - interactive mission selector with continuous operation.
 
     Workflow:
-    1. Select mission using hub buttons
+    1. Select mission using hub buttons (next planned mission is preselected)
     2. Run selected mission
-    3. After completion, return to selector
+    3. After completion, return to selector with the next mission ready
     4. Repeat until hub is turned off
 
     This mode is perfect for competition use - no computer needed!
+
+    Args:
+        plan (list): Slots in run order (default: all slots in order).
+                     After each run the menu jumps to the next one, so in a
+                     normal match only CENTER is ever pressed.
+        return_delay_ms (int): Pause after each run (default: RETURN_DELAY_MS)
+
+    Example:
+        competition_mode(plan=[2, 0, 1, 5])
+        competition_mode(plan=plan_runs()['order'])
     """
+    plan = list(plan) if plan else mission_slots()
+    next_slot = plan[0] if plan else None
+
+    # CENTER selects missions; stop the program with CENTER + BLUETOOTH
+    hub.system.set_stop_button((Button.CENTER, Button.BLUETOOTH))
+
     print("\n" + "=" * 50)
     print("COMPETITION MODE ACTIVATED")
     print("=" * 50)
     print("Use hub buttons to select and run missions")
-    print("Turn off hub to exit")
+    print("Stop with CENTER + BLUETOOTH, or turn off hub to exit")
     print("=" * 50)
 
     while True:
         try:
             # Select mission
-            slot = select_mission_interactive()
+            slot = select_mission_interactive(next_slot)
 
             if slot is None:
                 continue
@@ -357,9 +935,12 @@ def competition_mode():
             # Run selected mission
             run_mission(slot)
 
-            # Wait before returning to selector
-            print("\nReturning to mission selector in 3 seconds...")
-            wait(3000)
+            # Preselect the next planned mission
+            next_slot = next_planned_slot(plan, slot)
+
+            if return_delay_ms:
+                print(f"\nReturning to mission selector in {return_delay_ms}ms...")
+                wait(return_delay_ms)
 
         except KeyboardInterrupt:
             print("\nCompetition mode interrupted")
@@ -383,7 +964,8 @@ def export_mission_list():
     Returns:
         str: Formatted mission list
     """
-    if not MISSION_REGISTRY:
+    slots = mission_slots()
+    if not slots:
         return "No missions registered"
 
     output = []
@@ -392,15 +974,15 @@ def export_mission_list():
     output.append("=" * 70)
     output.append("")
 
-    for slot in sorted(MISSION_REGISTRY.keys()):
-        mission = MISSION_REGISTRY[slot]
-        output.append(f"Slot {slot}: {mission['name']}")
-        if mission['description']:
-            output.append(f"  Description: {mission['description']}")
+    for slot in slots:
+        name, description, _ = get_mission(slot)
+        output.append(f"Slot {slot}: {name}")
+        if description:
+            output.append(f"  Description: {description}")
         output.append("")
 
     output.append("=" * 70)
-    output.append(f"Total: {len(MISSION_REGISTRY)} missions")
+    output.append(f"Total: {len(slots)} missions")
 
     text = "\n".join(output)
     print(text)
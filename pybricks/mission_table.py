@@ -0,0 +1,80 @@
+#!/usr/bin/env pybricks-micropython
+"""
+MISSION TABLE - Generated Slot Table
+====================================
+
+GENERATED by tools/build_mission_table.py from competition_setup.py - DO NOT EDIT.
+Change the register_mission() calls there and rebuild:
+
+    python -m tools.build_mission_table
+
+MISSIONS[slot] is (name, description, run, start_zone, end_zone, attachment,
+estimated_ms, duration_ms, points) or None for an empty slot. run() imports
+the mission's own module (gen_<function>.py: that mission and what it uses)
+only when the mission starts.
+
+Usage:
+    Run this file on the hub to start the competition menu, or:
+
+        from mission_table import MISSIONS
+        use_mission_table(MISSIONS)
+"""
+
+
+def _slot_0():
+    from gen_mission_01_angler_artifacts import mission_01_angler_artifacts
+    return mission_01_angler_artifacts()
+
+
+def _slot_1():
+    from gen_mission_02_tip_scales import mission_02_tip_scales
+    return mission_02_tip_scales()
+
+
+def _slot_2():
+    from gen_mission_03_map_reveal import mission_03_map_reveal
+    return mission_03_map_reveal()
+
+
+def _slot_3():
+    from gen_mission_04_statue_rebuild import mission_04_statue_rebuild
+    return mission_04_statue_rebuild()
+
+
+def _slot_4():
+    from gen_mission_05_surface_brushing import mission_05_surface_brushing
+    return mission_05_surface_brushing()
+
+
+def _slot_5():
+    from gen_mission_06_mineshaft_explorer import mission_06_mineshaft_explorer
+    return mission_06_mineshaft_explorer()
+
+
+def _slot_6():
+    from gen_mission_07_careful_recovery import mission_07_careful_recovery
+    return mission_07_careful_recovery()
+
+
+def _slot_7():
+    from gen_mission_08_quick_test import mission_08_quick_test
+    return mission_08_quick_test()
+
+
+MISSIONS = (
+    ("Angler-40pts", "Left: Angler artifacts with adaptive grab (25s)", _slot_0, "left", "left", None, 25000, None, None),  # slot 0
+    ("Scales-35pts", "Center: Tip the scales with precision (20s)", _slot_1, None, None, None, 20000, None, None),  # slot 1
+    ("Map-30pts", "Right: Map reveal mechanism (22s)", _slot_2, "right", "right", None, 22000, None, None),  # slot 2
+    ("Statue-50pts", "Precision: Statue rebuild ultra-precise (30s)", _slot_3, None, None, None, 30000, None, None),  # slot 3
+    ("Brush-25pts", "Cleaning: Surface brushing (25s)", _slot_4, None, None, None, 25000, None, None),  # slot 4
+    ("Mineshaft-60pts", "COMBO: Mineshaft explorer multi-objective (35s)", _slot_5, None, None, None, 35000, None, None),  # slot 5
+    ("Recovery-40pts", "Delicate: Careful recovery with load sensing (32s)", _slot_6, None, None, None, 32000, None, None),  # slot 6
+    ("Test-0pts", "Quick verification (15s)", _slot_7, None, None, None, 15000, None, None),  # slot 7
+)
+
+
+if __name__ == "__main__":
+    from mission_loader import use_mission_table, competition_mode
+
+    use_mission_table(MISSIONS)
+    competition_mode()
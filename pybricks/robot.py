@@ -5,167 +5,48 @@ from pybricks.parameters import Port, Direction, Color, Stop, Button
 from pybricks.robotics import DriveBase
 from pybricks.tools import wait, StopWatch, hub_menu
 
+from robot_config import get_profile, interpolate_gain, FIXED_SHIFT, FIXED_HALF
+import trace_recorder
+
 # ============================================================================
 # ROBOT CONFIGURATION CONSTANTS
 # ============================================================================
 
-# Physical Robot Measurements (measure your specific robot!)
-WHEEL_DIAMETER = 56  # mm - SPIKE Prime small wheels
-AXLE_TRACK = 96     # mm - distance between wheel centers
-WHEEL_CIRCUMFERENCE = 3.14159 * WHEEL_DIAMETER  # mm - calculated
+# Active robot profile (select in robot_config.py - see ACTIVE_PROFILE)
+PROFILE = get_profile()
+
+# Physical Robot Measurements (measure your specific robot in robot_config.py!)
+WHEEL_DIAMETER = PROFILE.wheel_diameter            # mm
+AXLE_TRACK = PROFILE.axle_track                    # mm - distance between wheel centers
+WHEEL_CIRCUMFERENCE = PROFILE.wheel_circumference  # mm - calculated once per profile
 
 # Movement Performance Constants
-DEFAULT_SPEED = 300              # mm/s - default straight movement speed
-DEFAULT_TURN_SPEED = 100         # deg/s - default turning speed
-DEFAULT_ACCELERATION = 500       # mm/s² - acceleration for straight movement
-DEFAULT_TURN_ACCELERATION = 200  # deg/s² - acceleration for turning
-GYRO_PROPORTIONAL_GAIN = 2.0     # Proportional gain for gyro correction
-
-# Mission-Optimized Speed Presets (based on FLL analysis)
-# Type-safe speed constants (prevents typos with autocomplete)
-class DriveSpeed:
-    """
-    Mission-optimized speed presets for FLL robot DRIVE/MOVEMENT control.
-
-    Using DriveSpeed.PRECISE, DriveSpeed.APPROACH, etc. provides autocomplete
-    and prevents typos compared to numeric literals.
+DEFAULT_SPEED = PROFILE.default_speed                          # mm/s - default straight movement speed
+DEFAULT_TURN_SPEED = PROFILE.default_turn_speed                # deg/s - default turning speed
+DEFAULT_ACCELERATION = PROFILE.default_acceleration            # mm/s² - acceleration for straight movement
+DEFAULT_TURN_ACCELERATION = PROFILE.default_turn_acceleration  # deg/s² - acceleration for turning
+GYRO_PROPORTIONAL_GAIN = PROFILE.gyro_kp                       # Proportional gain for gyro correction
 
-    Usage:
-        move_straight(300, DriveSpeed.TRANSIT)     # Use predefined constant (recommended)
-        move_straight(300, 800)                     # Custom numeric speed
-        move_straight_gyro(500, DriveSpeed.APPROACH)  # With gyro correction
-    """
-    PRECISE = 100       # Final positioning, delicate operations (±0.5cm accuracy)
-    APPROACH = 300      # Approaching mission models (±1cm accuracy)
-    COLLECTION = 500    # Object collection runs (±2cm accuracy)
-    TRANSIT = 700       # Moving between areas (speed priority)
-    RETURN = 900        # Returning to base (maximum safe speed)
-    PUSHING = 600       # Pushing heavy objects (use slower speed with high power)
-
-# Turn Speed Presets (based on FLL competition analysis and robotics best practices)
-# Optimized for turn accuracy vs speed tradeoffs in different mission scenarios
-class TurnSpeed:
-    """
-    Mission-optimized turn speed presets for FLL robot TURNING control.
-
-    Different turn scenarios require different speed/accuracy tradeoffs.
-    Using TurnSpeed.PRECISE, TurnSpeed.QUICK, etc. provides clear intent
-    and prevents magic numbers.
-
-    Usage:
-        turn(90, TurnSpeed.STANDARD)       # Balanced turn
-        spin_turn(45, TurnSpeed.PRECISE)   # Precise IMU turn
-        turn(180, TurnSpeed.QUICK)         # Fast repositioning
-    """
-    # PRECISE TURNS (40-80 deg/s) - Highest accuracy
-    ALIGNMENT = 40      # Final alignment with mission models (±0.5° accuracy)
-                        # Use: Precise positioning before pickup/delivery, docking
-                        # Example: Aligning with narrow slots, critical angles
-
-    PRECISE = 60        # High-precision turns for critical angles (±1° accuracy)
-                        # Use: IMU-based turns, angle-critical missions
-                        # Most common for spin_turn() operations
-                        # Default for missions requiring reliable angles
-
-    # STANDARD TURNS (80-120 deg/s) - Good balance
-    STANDARD = 100      # Default turn speed, good accuracy (±2° accuracy)
-                        # Use: General purpose turning, most missions
-                        # Best balance of speed and accuracy for typical missions
-
-    APPROACH = 120      # Approaching turn position (±3° accuracy)
-                        # Use: Turns while moving between mission areas
-                        # Good for transitions where precision not critical
-
-    # FAST TURNS (150-200 deg/s) - Speed priority
-    QUICK = 150         # Quick repositioning turns (±4° accuracy)
-                        # Use: Mid-run repositioning, non-critical angles
-                        # Time-saving turns when angle is approximate
-
-    REPOSITION = 200    # Fast turns for time-critical situations (±5° accuracy)
-                        # Use: Emergency repositioning, return to base
-                        # Maximum safe turn speed
-
-    # SPECIALIZED TURNS
-    PIVOT = 80          # Pivot turn speed (one wheel stationary)
-                        # Use: Space-constrained environments, tight turns
-                        # Slower because less predictable than spin turns
-
-    CURVE = 60          # Curved path speed (continuous turning while moving)
-                        # Use: Following curved paths, arc movements
-                        # Smooth continuous turning with good control
-
-# Arm Speed Presets (based on FLL 2025 mission analysis)
-# Optimized for SPIKE Prime small motors controlling arms/attachments
-class ArmSpeed:
-    """
-    Mission-optimized speed presets for FLL robot ARM/ATTACHMENT control.
-
-    Based on analysis of FLL 2025 Submerged/Unearthed missions and successful
-    team implementations. Speeds in degrees/second for small motors.
-
-    Usage:
-        left_arm_up(90, ArmSpeed.GRAB)       # Grab object carefully
-        right_arm_down(45, ArmSpeed.QUICK)   # Quick release
-        both_arms_up(90, ArmSpeed.COLLECT)   # Standard collection speed
-    """
-    # DELICATE OPERATIONS (200-360 deg/s) - Highest accuracy
-    DELICATE = 200      # Ultra-precise for fragile objects, final positioning
-                        # Use: Placing coral in nursery, aligning with small targets
-
-    GRAB = 360          # Default safe speed, best accuracy (±0-1 degrees)
-                        # Use: Grabbing sharks, picking up krill, controlled grips
-                        # Most common speed used by successful teams
-
-    # COLLECTION OPERATIONS (500-640 deg/s) - Good balance
-    COLLECT = 500       # Standard collection missions, routine operations
-                        # Use: Collecting coral pieces, grabbing multiple objects
-
-    MODERATE = 640      # Faster collections, medium-priority operations
-                        # Use: Multi-object sequences, timed missions
-
-    # QUICK OPERATIONS (720-1000 deg/s) - Speed priority
-    RESET = 720         # Arm resets, non-critical movements
-                        # Use: Moving to home position, repositioning between tasks
-
-    QUICK = 1000        # Maximum safe speed for urgent actions
-                        # Use: Fast releases, emergency returns, clearing obstacles
-
-    # FORCE OPERATIONS (200-400 deg/s) - Power priority
-    PUSH = 400          # Pushing objects, applying force
-                        # Use: Pushing building structures, sliding heavy objects
-
-    STALL = 200         # Slow speed for stall detection operations
-                        # Use: Finding mechanical limits, pushing until resistance
-
-# Drive Speed Selection Guide - Use DriveSpeed class constants:
-#   move_straight(300, DriveSpeed.TRANSIT)       # Fast movement (700 mm/s)
-#   move_straight_gyro(500, DriveSpeed.APPROACH) # Moderate speed (300 mm/s)
-#   move_straight(100, DriveSpeed.PRECISE)       # Slow, accurate (100 mm/s)
-#   move_straight(400, 650)                      # Custom numeric speed
-#
-# Usage Guide:
-# - DriveSpeed.PRECISE (100) for: Final alignment, close to models
-# - DriveSpeed.APPROACH (300) for: Moving toward mission areas with moderate precision
-# - DriveSpeed.COLLECTION (500) for: Collecting objects, moderate speed missions
-# - DriveSpeed.TRANSIT (700) for: Long straight runs between areas
-# - DriveSpeed.RETURN (900) for: Returning to base when precision doesn't matter
-# - DriveSpeed.PUSHING (600) for: Heavy objects, ramps, need extra power
+# Speed Presets (tables live in robot_config.py, one set per profile)
+DriveSpeed = PROFILE.drive_speed
+TurnSpeed = PROFILE.turn_speed
+ArmSpeed = PROFILE.arm_speed
 
 # Spin Turn Constants (for precise IMU-based turning)
-SPIN_TURN_BASE_SPEED = 60   # deg/s - base motor speed for spin turns
-SPIN_TURN_KP = 9            # Proportional gain for spin turn control
-SPIN_TURN_TOLERANCE = 2     # degrees - stopping tolerance for spin turns
+SPIN_TURN_BASE_SPEED = PROFILE.spin_turn_base_speed  # deg/s - base motor speed for spin turns
+SPIN_TURN_KP = PROFILE.spin_turn_kp                  # Proportional gain for spin turn control
+SPIN_TURN_TOLERANCE = PROFILE.spin_turn_tolerance    # degrees - stopping tolerance for spin turns
 
 # Validation Limits
 MAX_DISTANCE = 2000  # mm - maximum single movement distance
 MAX_SPEED = 1000     # mm/s - maximum safe speed
 MAX_TURN_RATE = 500  # deg/s - maximum turn rate
 
-# Port Assignments (modify these to match your robot wiring)
-LEFT_MOTOR_PORT = Port.B
-RIGHT_MOTOR_PORT = Port.F
-ATTACHMENT_PORT_LEFT = Port.A  # Front/left attachment
-ATTACHMENT_PORT_RIGHT = Port.E  # Back/right attachment
+# Port Assignments (wiring is part of the profile in robot_config.py)
+LEFT_MOTOR_PORT = PROFILE.left_motor_port
+RIGHT_MOTOR_PORT = PROFILE.right_motor_port
+ATTACHMENT_PORT_LEFT = PROFILE.attachment_port_left  # Front/left attachment
+ATTACHMENT_PORT_RIGHT = PROFILE.attachment_port_right  # Back/right attachment
 
 # ============================================================================
 # ROBOT INITIALIZATION
@@ -175,9 +56,9 @@ ATTACHMENT_PORT_RIGHT = Port.E  # Back/right attachment
 hub = PrimeHub()
 
 # Initialize the drive motors
-# NOTE: If robot spins instead of going straight, swap CLOCKWISE/COUNTERCLOCKWISE
-left_motor = Motor(LEFT_MOTOR_PORT, Direction.COUNTERCLOCKWISE)
-right_motor = Motor(RIGHT_MOTOR_PORT, Direction.CLOCKWISE)
+# NOTE: If robot spins instead of going straight, swap the motor directions in the profile
+left_motor = Motor(LEFT_MOTOR_PORT, PROFILE.left_motor_direction)
+right_motor = Motor(RIGHT_MOTOR_PORT, PROFILE.right_motor_direction)
 
 # Initialize the drive base
 robot = DriveBase(left_motor, right_motor,
@@ -212,6 +93,109 @@ try:
 except Exception as e:
     print(f"No attachment motor on {ATTACHMENT_PORT_RIGHT}: {e}")
 
+# ============================================================================
+# UNIT CONVERSION (fixed-point, precomputed per profile)
+# ============================================================================
+
+def _fixed_mul(value, factor_q16):
+    """
+    Multiply a value by a Q16 conversion factor, rounding to the nearest int.
+
+    Sign is applied after rounding so forward and backward moves of the same
+    size always convert to the same number of degrees.
+    """
+    scaled = (int(abs(value) * factor_q16) + FIXED_HALF) >> FIXED_SHIFT
+    return -scaled if value < 0 else scaled
+
+def mm_to_motor_degrees(distance_mm):
+    """
+    Convert a wheel travel distance to motor degrees.
+
+    Args:
+        distance_mm (int/float): Distance in millimeters (sign is kept)
+
+    Returns:
+        int: Motor rotation in degrees
+
+    Example:
+        mm_to_motor_degrees(176)   # ~360 with 56mm wheels
+    """
+    return _fixed_mul(distance_mm, PROFILE.degrees_per_mm_q16)
+
+def motor_degrees_to_mm(motor_degrees):
+    """
+    Convert motor degrees to wheel travel distance.
+
+    Args:
+        motor_degrees (int): Motor rotation in degrees (sign is kept)
+
+    Returns:
+        int: Distance in millimeters
+    """
+    return _fixed_mul(motor_degrees, PROFILE.mm_per_degree_q16)
+
+def pivot_motor_degrees(angle_degrees):
+    """
+    Convert a robot angle to motor degrees for a pivot turn (one wheel stationary).
+
+    Args:
+        angle_degrees (int/float): Robot angle in degrees (sign is kept)
+
+    Returns:
+        int: Rotation of the moving wheel in motor degrees
+    """
+    return _fixed_mul(angle_degrees, PROFILE.pivot_ratio_q16)
+
+# ============================================================================
+# CONTROLLER GAINS (tuned per speed by autotune.py)
+# ============================================================================
+
+def heading_schedule(direction):
+    """
+    Gain schedule for move_straight_gyro() in one direction of travel.
+
+    Args:
+        direction (int): 1 = forward, -1 = backward
+
+    Returns:
+        tuple: ((speed, kp), ...) breakpoints from the profile
+    """
+    if direction < 0:
+        return PROFILE.heading_schedule_backward
+    return PROFILE.heading_schedule_forward
+
+def heading_gain(speed, direction=1):
+    """
+    Heading correction gain for move_straight_gyro() at a drive speed.
+
+    Interpolates between the profile's tuned gains (PROFILE.heading_gains,
+    or heading_gains_backward when reversing). Falls back to
+    GYRO_PROPORTIONAL_GAIN if the profile has not been tuned.
+
+    Args:
+        speed (int/DriveSpeed): Drive speed in mm/s
+        direction (int): 1 = forward, -1 = backward
+
+    Returns:
+        float: Proportional gain
+    """
+    return interpolate_gain(heading_schedule(direction), speed, GYRO_PROPORTIONAL_GAIN)
+
+def spin_gain(speed):
+    """
+    Proportional gain for spin_turn() at a turn speed.
+
+    Uses the profile's tuned gain table (PROFILE.spin_gains) when the
+    speed has an entry, otherwise SPIN_TURN_KP.
+
+    Args:
+        speed (int/TurnSpeed): Spin turn base speed in deg/s
+
+    Returns:
+        float: Proportional gain
+    """
+    return PROFILE.spin_gains.get(speed, SPIN_TURN_KP)
+
 # ============================================================================
 # VALIDATION FUNCTIONS
 # ============================================================================
@@ -427,12 +411,8 @@ def pivot_turn(angle_degrees, speed=None):
     validate_speed(speed)
 
     try:
-        # Calculate arc length: s = r × θ (in radians)
-        # For pivot turn, radius = AXLE_TRACK
-        arc_length_mm = abs(AXLE_TRACK * angle_degrees * 3.14159 / 180)
-
-        # Convert arc length to motor rotation degrees
-        motor_degrees = int((arc_length_mm / WHEEL_CIRCUMFERENCE) * 360)
+        # Robot angle to motor degrees (pivot radius = AXLE_TRACK)
+        motor_degrees = pivot_motor_degrees(abs(angle_degrees))
 
         if angle_degrees > 0:  # Pivot right (left motor moves, right motor stationary)
             left_motor.run_angle(speed, motor_degrees, wait=True)
@@ -463,7 +443,7 @@ def tank_move(left_speed, right_speed, duration_ms):
     # Stop the robot
     robot.stop()
 
-def move_straight_gyro(distance_mm, speed=DEFAULT_SPEED, kp=GYRO_PROPORTIONAL_GAIN):
+def move_straight_gyro(distance_mm, speed=DEFAULT_SPEED, kp=None, finish_mm=0, finish_speed=None):
     """
     Move straight using gyro sensor to maintain direction, even with obstacles.
 
@@ -481,9 +461,16 @@ def move_straight_gyro(distance_mm, speed=DEFAULT_SPEED, kp=GYRO_PROPORTIONAL_GA
                                - DriveSpeed.APPROACH (300) - Moderate speed
                                - DriveSpeed.PRECISE (100) - Slow, accurate
                                - Numeric: 100-900 (custom speed)
-        kp (float): Proportional gain for correction (default: GYRO_PROPORTIONAL_GAIN=2.0)
-                   Increase if robot doesn't correct enough (try 2.5-3.0)
-                   Decrease if robot oscillates/overcorrects (try 1.0-1.5)
+        kp (float): Proportional gain for correction
+                   Default: gain schedule - the tuned gain is interpolated
+                   from the robot's ACTUAL speed every loop, so it stays
+                   right while accelerating (see heading_gain()).
+                   Falls back to GYRO_PROPORTIONAL_GAIN=2.0 if not tuned yet.
+                   Run autotune.py to tune instead of guessing.
+        finish_mm (int/float): Drive the last finish_mm of the distance at
+                               finish_speed without stopping in between
+                               (one move instead of a fast and a slow one)
+        finish_speed (int/DriveSpeed): Speed for the last finish_mm
 
     Returns:
         bool: True if movement completed successfully
@@ -497,16 +484,27 @@ def move_straight_gyro(distance_mm, speed=DEFAULT_SPEED, kp=GYRO_PROPORTIONAL_GA
         move_straight_gyro(300, DriveSpeed.APPROACH, 2.5)  # Moderate speed (300 mm/s)
         move_straight_gyro(1000, DriveSpeed.TRANSIT)       # Fast transit (700 mm/s)
         move_straight_gyro(400, 600, 2.0)                  # Custom speed with custom kp
+        move_straight_gyro(740, DriveSpeed.APPROACH,       # 640mm fast, last 100mm slow
+                           finish_mm=100, finish_speed=DriveSpeed.PRECISE)
 
     Note:
         - Recommended for distances > 200mm where drift matters
-        - Works best for FORWARD movement (backward is less reliable)
+        - Backward works the same way, with its own tuned gains
+          (PROFILE.heading_gains_backward, see autotune.py)
         - Update rate: 100Hz (10ms loop)
         - Typical accuracy: ±1cm at 200mm/s, ±2cm at 500mm/s
     """
     # Validate inputs
     validate_distance(distance_mm)
     validate_speed(speed)
+    if finish_speed is not None:
+        validate_speed(finish_speed)
+
+    # Fixed gain if given, otherwise schedule by speed and direction
+    direction = 1 if distance_mm > 0 else -1
+    schedule = () if kp is not None else heading_schedule(direction)
+    if kp is None:
+        kp = heading_gain(speed, direction)
 
     try:
         # Reset the heading before starting
@@ -517,30 +515,61 @@ def move_straight_gyro(distance_mm, speed=DEFAULT_SPEED, kp=GYRO_PROPORTIONAL_GA
         left_start = left_motor.angle()
         right_start = right_motor.angle()
 
-        # Calculate target motor rotation in degrees
-        target_degrees = abs((distance_mm / WHEEL_CIRCUMFERENCE) * 360)
+        # Target as the SUM of both encoders (2x average) so the loop
+        # compares integers instead of dividing by 2 every iteration
+        target_sum = 2 * mm_to_motor_degrees(abs(distance_mm))
+        drive_speed = speed * direction
+        # Where the finish speed takes over (never, without a finish)
+        finish_sum = target_sum
+        if finish_speed is not None and finish_mm > 0:
+            finish_sum = target_sum - 2 * mm_to_motor_degrees(abs(finish_mm))
+
+        # Negative sign to counteract drift: if robot drifts right (+heading), turn left (-)
+        # Same sign backward: drive() turn_rate is the robot's own rotation,
+        # not a steering direction, so it does not flip when reversing
+        correction_gain = -kp
+
+        # A single breakpoint (or none) means the gain never changes
+        scheduled = len(schedule) > 1
+
+        if trace_recorder.active:
+            trace_recorder.mark(trace_recorder.KIND_GYRO, distance_mm, speed)
 
         # Keep moving until we reach the target distance
         while True:
-            # Calculate average motor position
-            left_pos = abs(left_motor.angle() - left_start)
-            right_pos = abs(right_motor.angle() - right_start)
-            avg_pos = (left_pos + right_pos) / 2
+            # Total encoder travel (integer adds only)
+            left = left_motor.angle()
+            right = right_motor.angle()
+            travelled = abs(left - left_start) + abs(right - right_start)
 
             # Check if we've reached the target distance
-            if avg_pos >= target_degrees:
+            if travelled >= target_sum:
                 robot.stop()
+                if trace_recorder.active:
+                    trace_recorder.sample(trace_recorder.KIND_GYRO, hub.imu.heading(),
+                                          left - left_start, right - right_start, 0, 0,
+                                          (left_motor.load() + right_motor.load()) >> 1)
                 break
 
-            # Get current heading error
-            heading_error = hub.imu.heading()
+            if travelled >= finish_sum:
+                drive_speed = finish_speed * direction
 
-            # Calculate turn rate correction using proportional control
-            # Negative sign to counteract drift: if robot drifts right (+heading), turn left (-)
-            turn_rate = -heading_error * kp
+            # Gain for the speed the robot is actually doing right now
+            if scheduled:
+                correction_gain = -interpolate_gain(schedule, robot.state()[1], kp)
+
+            # Proportional heading correction
+            heading = hub.imu.heading()
+            turn_rate = heading * correction_gain
 
             # Apply the correction while maintaining forward/backward motion
-            robot.drive(speed if distance_mm > 0 else -speed, turn_rate)
+            robot.drive(drive_speed, turn_rate)
+
+            if trace_recorder.active:
+                trace_recorder.sample(trace_recorder.KIND_GYRO, heading,
+                                      left - left_start, right - right_start,
+                                      drive_speed, turn_rate,
+                                      (left_motor.load() + right_motor.load()) >> 1)
 
             # Small delay to prevent overwhelming the system (100Hz update rate)
             wait(10)
@@ -551,7 +580,7 @@ def move_straight_gyro(distance_mm, speed=DEFAULT_SPEED, kp=GYRO_PROPORTIONAL_GA
         robot.stop()
         return False
 
-def spin_turn(target_angle, speed=None):
+def spin_turn(target_angle, speed=None, kp=None):
     """
     Make a precise spin turn using the hub's IMU sensor with proportional control.
 
@@ -572,6 +601,9 @@ def spin_turn(target_angle, speed=None):
                               - TurnSpeed.PRECISE (60) - High precision (±1°)
                               - TurnSpeed.STANDARD (100) - Faster turn (±2°)
                               - Numeric: Custom base speed
+        kp (float): Proportional gain
+                   Default: tuned gain for this speed (see spin_gain()),
+                   or SPIN_TURN_KP=9 if not tuned yet.
 
     Returns:
         float: Final angle achieved (for verification)
@@ -590,12 +622,15 @@ def spin_turn(target_angle, speed=None):
         - Uses proportional control: faster when far from target, slower when close
         - Stopping tolerance: ±2 degrees (SPIN_TURN_TOLERANCE)
         - Update rate: 100Hz (10ms loop)
-        - Actual motor speed = base_speed + (error × SPIN_TURN_KP)
+        - Actual motor speed = base_speed + (error × kp)
     """
     # Default speed
     if speed is None:
         speed = TurnSpeed.PRECISE
 
+    if kp is None:
+        kp = spin_gain(speed)
+
     # Validate input
     validate_angle(target_angle)
 
@@ -611,23 +646,41 @@ def spin_turn(target_angle, speed=None):
         direction = 1 if target_angle >= 0 else -1
         target_abs = abs(target_angle)
 
+        if trace_recorder.active:
+            trace_recorder.mark(trace_recorder.KIND_SPIN, target_angle, speed)
+            left_start = left_motor.angle()
+            right_start = right_motor.angle()
+
         # Single loop for both directions (eliminates duplication)
         while True:
-            current_angle = abs(hub.imu.heading())
+            heading = hub.imu.heading()
+            current_angle = abs(heading)
             error = target_abs - current_angle
 
             # Stop if within tolerance
             if abs(error) < SPIN_TURN_TOLERANCE:
+                if trace_recorder.active:
+                    trace_recorder.sample(trace_recorder.KIND_SPIN, heading,
+                                          left_motor.angle() - left_start,
+                                          right_motor.angle() - right_start, 0, error,
+                                          (left_motor.load() - right_motor.load()) >> 1)
                 break
 
             # Proportional control: speed increases with error
-            adjustment = error * SPIN_TURN_KP
+            adjustment = error * kp
             motor_speed = base_speed + adjustment
 
             # Apply direction-adjusted speeds to motors
             left_motor.run(direction * motor_speed)
             right_motor.run(-direction * motor_speed)
 
+            if trace_recorder.active:
+                trace_recorder.sample(trace_recorder.KIND_SPIN, heading,
+                                      left_motor.angle() - left_start,
+                                      right_motor.angle() - right_start,
+                                      direction * motor_speed, error,
+                                      (left_motor.load() - right_motor.load()) >> 1)
+
             wait(10)  # 100Hz update rate
 
         # Stop both motors with hold for precise positioning
@@ -648,7 +701,7 @@ def spin_turn(target_angle, speed=None):
 # ATTACHMENT CONTROL FUNCTIONS
 # ============================================================================
 
-def run_attachment(port, degrees, speed=360):
+def run_attachment(port, degrees, speed=360, blocking=True):
     """
     Run an attachment motor for a specified number of degrees.
 
@@ -660,9 +713,11 @@ def run_attachment(port, degrees, speed=360):
                             Positive = one direction, Negative = opposite
         speed (int): Motor speed in degrees/s (default: 360)
                     Range: 0-1000 deg/s
+        blocking (bool): False = start the move and return at once, so it
+                         runs while the robot drives (see wait_for_arms())
 
     Returns:
-        bool: True if movement completed successfully
+        bool: True if movement completed (or started, with blocking=False)
 
     Raises:
         TypeError: If parameters are not valid types
@@ -692,7 +747,7 @@ def run_attachment(port, degrees, speed=360):
             print(f"No motor connected on {port}")
             return False
 
-        motor.run_angle(speed, degrees, wait=True)
+        motor.run_angle(speed, degrees, wait=blocking)
         return True
     except Exception as e:
         print(f"run_attachment error on {port}: {e}")
@@ -745,7 +800,7 @@ def attachment_to_position(port, position, speed=360):
 # LEFT ARM FUNCTIONS (Port A)
 # ============================================================================
 
-def left_arm_up(degrees, speed=None):
+def left_arm_up(degrees, speed=None, blocking=True):
     """
     Raise the LEFT arm (Port A).
 
@@ -758,6 +813,8 @@ def left_arm_up(degrees, speed=None):
                              - ArmSpeed.GRAB (360) - Standard grab (recommended)
                              - ArmSpeed.COLLECT (500) - Collection missions
                              - ArmSpeed.QUICK (1000) - Fast movements
+        blocking (bool): False = return at once and let the arm move while
+                         driving (see wait_for_arms())
 
     Returns:
         bool: True if successful
@@ -770,15 +827,16 @@ def left_arm_up(degrees, speed=None):
     """
     if speed is None:
         speed = ArmSpeed.GRAB
-    return run_attachment(ATTACHMENT_PORT_LEFT, abs(degrees), speed)
+    return run_attachment(ATTACHMENT_PORT_LEFT, abs(degrees), speed, blocking)
 
-def left_arm_down(degrees, speed=None):
+def left_arm_down(degrees, speed=None, blocking=True):
     """
     Lower the LEFT arm (Port A).
 
     Args:
         degrees (int): Degrees to lower (positive value)
         speed (int/ArmSpeed): Motor speed (default: ArmSpeed.GRAB = 360)
+        blocking (bool): False = return at once (see wait_for_arms())
 
     Returns:
         bool: True if successful
@@ -790,7 +848,7 @@ def left_arm_down(degrees, speed=None):
     """
     if speed is None:
         speed = ArmSpeed.GRAB
-    return run_attachment(ATTACHMENT_PORT_LEFT, -abs(degrees), speed)
+    return run_attachment(ATTACHMENT_PORT_LEFT, -abs(degrees), speed, blocking)
 
 def left_arm_to(position, speed=None):
     """
@@ -817,13 +875,14 @@ def left_arm_to(position, speed=None):
 # RIGHT ARM FUNCTIONS (Port E)
 # ============================================================================
 
-def right_arm_up(degrees, speed=None):
+def right_arm_up(degrees, speed=None, blocking=True):
     """
     Raise the RIGHT arm (Port E).
 
     Args:
         degrees (int): Degrees to raise (positive value)
         speed (int/ArmSpeed): Motor speed (default: ArmSpeed.GRAB = 360)
+        blocking (bool): False = return at once (see wait_for_arms())
 
     Returns:
         bool: True if successful
@@ -835,15 +894,16 @@ def right_arm_up(degrees, speed=None):
     """
     if speed is None:
         speed = ArmSpeed.GRAB
-    return run_attachment(ATTACHMENT_PORT_RIGHT, abs(degrees), speed)
+    return run_attachment(ATTACHMENT_PORT_RIGHT, abs(degrees), speed, blocking)
 
-def right_arm_down(degrees, speed=None):
+def right_arm_down(degrees, speed=None, blocking=True):
     """
     Lower the RIGHT arm (Port E).
 
     Args:
         degrees (int): Degrees to lower (positive value)
         speed (int/ArmSpeed): Motor speed (default: ArmSpeed.GRAB = 360)
+        blocking (bool): False = return at once (see wait_for_arms())
 
     Returns:
         bool: True if successful
@@ -855,7 +915,7 @@ def right_arm_down(degrees, speed=None):
     """
     if speed is None:
         speed = ArmSpeed.GRAB
-    return run_attachment(ATTACHMENT_PORT_RIGHT, -abs(degrees), speed)
+    return run_attachment(ATTACHMENT_PORT_RIGHT, -abs(degrees), speed, blocking)
 
 def right_arm_to(position, speed=None):
     """
@@ -881,6 +941,37 @@ def right_arm_to(position, speed=None):
 # BOTH ARMS FUNCTIONS
 # ============================================================================
 
+def wait_for_arms(timeout_ms=5000):
+    """
+    Wait until both arms have finished moves started with blocking=False.
+
+    An arm still moving after timeout_ms is stuck (usually against its end
+    stop), so it is stopped instead of being left to push.
+
+    Args:
+        timeout_ms (int): Longest time to wait for both arms together
+
+    Returns:
+        bool: True if both arms finished, False if one had to be stopped
+
+    Example:
+        left_arm_up(90, ArmSpeed.COLLECT, blocking=False)
+        move_straight_gyro(300, DriveSpeed.APPROACH)   # arm rises meanwhile
+        wait_for_arms()
+    """
+    timer = StopWatch()
+    finished = True
+    for name, motor in (("Left", attachment_motor_left), ("Right", attachment_motor_right)):
+        if motor is None:
+            continue
+        while not motor.done() and timer.time() < timeout_ms:
+            wait(10)
+        if not motor.done():
+            motor.stop()
+            print(f"WARNING: {name} arm did not finish within {timeout_ms}ms - stopped")
+            finished = False
+    return finished
+
 def both_arms_up(degrees, speed=None):
     """
     Raise BOTH arms at the same time.
@@ -1374,37 +1465,47 @@ def push_until_resistance(distance_mm, speed=None, load_threshold=75, timeout_ms
         initial_left = left_motor.angle()
         initial_right = right_motor.angle()
 
+        # Compare SUMS of both motors against doubled limits (no division in loop)
+        load_sum_threshold = 2 * load_threshold
+        target_sum = 2 * mm_to_motor_degrees(abs(distance_mm))
+
+        if trace_recorder.active:
+            trace_recorder.mark(trace_recorder.KIND_PUSH, distance_mm, speed, load_threshold)
+
         while stopwatch.time() < timeout_ms:
             # Check drive motor loads
-            left_load = left_motor.load()
-            right_load = right_motor.load()
-            avg_load = (left_load + right_load) / 2
+            load_sum = left_motor.load() + right_motor.load()
+
+            # Encoder travel of both motors
+            left = left_motor.angle() - initial_left
+            right = right_motor.angle() - initial_right
+            travelled = abs(left) + abs(right)
 
-            # Calculate distance traveled
-            left_degrees = abs(left_motor.angle() - initial_left)
-            right_degrees = abs(right_motor.angle() - initial_right)
-            avg_degrees = (left_degrees + right_degrees) / 2
-            distance_traveled = int((avg_degrees / 360) * WHEEL_CIRCUMFERENCE)
+            if trace_recorder.active:
+                trace_recorder.sample(trace_recorder.KIND_PUSH, hub.imu.heading(),
+                                      left, right, speed, 0, load_sum >> 1)
 
             # Check if hit resistance
-            if avg_load >= load_threshold:
+            if load_sum >= load_sum_threshold:
                 robot.stop()
-                print(f"Resistance detected! Load: {avg_load}%, Distance: {distance_traveled}mm")
+                distance_traveled = motor_degrees_to_mm(travelled >> 1)
+                print(f"Resistance detected! Load: {load_sum >> 1}%, Distance: {distance_traveled}mm")
                 return {
                     'success': True,
                     'distance_traveled': distance_traveled,
-                    'final_load': int(avg_load),
+                    'final_load': load_sum >> 1,
                     'stopped_reason': 'resistance'
                 }
 
             # Check if reached max distance
-            if distance_traveled >= distance_mm:
+            if travelled >= target_sum:
                 robot.stop()
+                distance_traveled = motor_degrees_to_mm(travelled >> 1)
                 print(f"Max distance reached: {distance_traveled}mm")
                 return {
                     'success': True,
                     'distance_traveled': distance_traveled,
-                    'final_load': int(avg_load),
+                    'final_load': load_sum >> 1,
                     'stopped_reason': 'distance'
                 }
 
@@ -1412,16 +1513,14 @@ def push_until_resistance(distance_mm, speed=None, load_threshold=75, timeout_ms
 
         # Timeout
         robot.stop()
-        left_degrees = abs(left_motor.angle() - initial_left)
-        right_degrees = abs(right_motor.angle() - initial_right)
-        avg_degrees = (left_degrees + right_degrees) / 2
-        distance_traveled = int((avg_degrees / 360) * WHEEL_CIRCUMFERENCE)
+        travelled = abs(left_motor.angle() - initial_left) + abs(right_motor.angle() - initial_right)
+        distance_traveled = motor_degrees_to_mm(travelled >> 1)
 
         print(f"Push timeout after {distance_traveled}mm")
         return {
             'success': False,
             'distance_traveled': distance_traveled,
-            'final_load': int((left_motor.load() + right_motor.load()) / 2),
+            'final_load': (left_motor.load() + right_motor.load()) >> 1,
             'stopped_reason': 'timeout'
         }
 
@@ -1468,8 +1567,19 @@ def move_until_line(speed=DEFAULT_SPEED, sensor_port=Port.E,
         stopwatch = StopWatch()
         stopwatch.reset()
 
+        if trace_recorder.active:
+            trace_recorder.mark(trace_recorder.KIND_LINE, target_reflection, speed)
+            left_start = left_motor.angle()
+            right_start = right_motor.angle()
+
         while stopwatch.time() < timeout_ms:
-            if sensor.reflection() < target_reflection:
+            reflection = sensor.reflection()
+            if trace_recorder.active:
+                trace_recorder.sample(trace_recorder.KIND_LINE, hub.imu.heading(),
+                                      left_motor.angle() - left_start,
+                                      right_motor.angle() - right_start,
+                                      speed, 0, reflection)
+            if reflection < target_reflection:
                 robot.stop()
                 return True
             wait(10)
@@ -1778,6 +1888,9 @@ def calibration_test():
 
     Tests movement accuracy over known distances.
     Measure actual distance traveled and compare to expected.
+
+    For automatic measurement of wheel diameter and axle track (no ruler
+    needed), run calibration.py instead.
     """
     print("=== Calibration Test ===")
 
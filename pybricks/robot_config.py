@@ -0,0 +1,458 @@
+#!/usr/bin/env pybricks-micropython
+"""
+ROBOT CONFIG - Robot Profiles
+=============================
+
+One place for everything that describes a specific robot: wheel geometry,
+port wiring, controller gains and speed tables.
+
+Each robot (competition robot, practice robot, the big-wheel chassis) gets a
+RobotProfile. robot.py loads the active profile once at startup and builds
+its drive base, motors and conversion constants from it.
+
+Selecting a profile:
+    1. Edit ACTIVE_PROFILE below (used by every program on the hub), or
+    2. Select it before robot.py is imported:
+
+        import robot_config
+        robot_config.select_profile("big_wheels")
+        from robot import *
+
+Adding a robot:
+    Copy one of the profiles in PROFILES, give it a new name and update the
+    measurements. Derived values (mm per degree, pivot ratios) are computed
+    automatically - never hand-calculate them in mission code.
+
+Created: 2026-10-19
+For: Teams running the same mission code on more than one robot
+"""
+
+from pybricks.parameters import Port, Direction
+
+try:
+    from umath import pi
+except ImportError:
+    from math import pi
+
+# ============================================================================
+# FIXED-POINT FORMAT
+# ============================================================================
+
+# Conversion factors are also stored as Q16 integers (value * 65536) so the
+# control loops in robot.py can convert with one integer multiply and shift.
+FIXED_SHIFT = 16
+FIXED_ONE = 1 << FIXED_SHIFT
+FIXED_HALF = FIXED_ONE >> 1
+
+# ============================================================================
+# SPEED TABLES
+# ============================================================================
+
+# Mission-Optimized Speed Presets (based on FLL analysis)
+# Type-safe speed constants (prevents typos with autocomplete)
+class DriveSpeed:
+    """
+    Mission-optimized speed presets for FLL robot DRIVE/MOVEMENT control.
+
+    Using DriveSpeed.PRECISE, DriveSpeed.APPROACH, etc. provides autocomplete
+    and prevents typos compared to numeric literals.
+
+    Usage:
+        move_straight(300, DriveSpeed.TRANSIT)     # Use predefined constant (recommended)
+        move_straight(300, 800)                     # Custom numeric speed
+        move_straight_gyro(500, DriveSpeed.APPROACH)  # With gyro correction
+    """
+    PRECISE = 100       # Final positioning, delicate operations (±0.5cm accuracy)
+    APPROACH = 300      # Approaching mission models (±1cm accuracy)
+    COLLECTION = 500    # Object collection runs (±2cm accuracy)
+    TRANSIT = 700       # Moving between areas (speed priority)
+    RETURN = 900        # Returning to base (maximum safe speed)
+    PUSHING = 600       # Pushing heavy objects (use slower speed with high power)
+
+# Turn Speed Presets (based on FLL competition analysis and robotics best practices)
+# Optimized for turn accuracy vs speed tradeoffs in different mission scenarios
+class TurnSpeed:
+    """
+    Mission-optimized turn speed presets for FLL robot TURNING control.
+
+    Different turn scenarios require different speed/accuracy tradeoffs.
+    Using TurnSpeed.PRECISE, TurnSpeed.QUICK, etc. provides clear intent
+    and prevents magic numbers.
+
+    Usage:
+        turn(90, TurnSpeed.STANDARD)       # Balanced turn
+        spin_turn(45, TurnSpeed.PRECISE)   # Precise IMU turn
+        turn(180, TurnSpeed.QUICK)         # Fast repositioning
+    """
+    # PRECISE TURNS (40-80 deg/s) - Highest accuracy
+    ALIGNMENT = 40      # Final alignment with mission models (±0.5° accuracy)
+                        # Use: Precise positioning before pickup/delivery, docking
+                        # Example: Aligning with narrow slots, critical angles
+
+    PRECISE = 60        # High-precision turns for critical angles (±1° accuracy)
+                        # Use: IMU-based turns, angle-critical missions
+                        # Most common for spin_turn() operations
+                        # Default for missions requiring reliable angles
+
+    # STANDARD TURNS (80-120 deg/s) - Good balance
+    STANDARD = 100      # Default turn speed, good accuracy (±2° accuracy)
+                        # Use: General purpose turning, most missions
+                        # Best balance of speed and accuracy for typical missions
+
+    APPROACH = 120      # Approaching turn position (±3° accuracy)
+                        # Use: Turns while moving between mission areas
+                        # Good for transitions where precision not critical
+
+    # FAST TURNS (150-200 deg/s) - Speed priority
+    QUICK = 150         # Quick repositioning turns (±4° accuracy)
+                        # Use: Mid-run repositioning, non-critical angles
+                        # Time-saving turns when angle is approximate
+
+    REPOSITION = 200    # Fast turns for time-critical situations (±5° accuracy)
+                        # Use: Emergency repositioning, return to base
+                        # Maximum safe turn speed
+
+    # SPECIALIZED TURNS
+    PIVOT = 80          # Pivot turn speed (one wheel stationary)
+                        # Use: Space-constrained environments, tight turns
+                        # Slower because less predictable than spin turns
+
+    CURVE = 60          # Curved path speed (continuous turning while moving)
+                        # Use: Following curved paths, arc movements
+                        # Smooth continuous turning with good control
+
+# Arm Speed Presets (based on FLL 2025 mission analysis)
+# Optimized for SPIKE Prime small motors controlling arms/attachments
+class ArmSpeed:
+    """
+    Mission-optimized speed presets for FLL robot ARM/ATTACHMENT control.
+
+    Based on analysis of FLL 2025 Submerged/Unearthed missions and successful
+    team implementations. Speeds in degrees/second for small motors.
+
+    Usage:
+        left_arm_up(90, ArmSpeed.GRAB)       # Grab object carefully
+        right_arm_down(45, ArmSpeed.QUICK)   # Quick release
+        both_arms_up(90, ArmSpeed.COLLECT)   # Standard collection speed
+    """
+    # DELICATE OPERATIONS (200-360 deg/s) - Highest accuracy
+    DELICATE = 200      # Ultra-precise for fragile objects, final positioning
+                        # Use: Placing coral in nursery, aligning with small targets
+
+    GRAB = 360          # Default safe speed, best accuracy (±0-1 degrees)
+                        # Use: Grabbing sharks, picking up krill, controlled grips
+                        # Most common speed used by successful teams
+
+    # COLLECTION OPERATIONS (500-640 deg/s) - Good balance
+    COLLECT = 500       # Standard collection missions, routine operations
+                        # Use: Collecting coral pieces, grabbing multiple objects
+
+    MODERATE = 640      # Faster collections, medium-priority operations
+                        # Use: Multi-object sequences, timed missions
+
+    # QUICK OPERATIONS (720-1000 deg/s) - Speed priority
+    RESET = 720         # Arm resets, non-critical movements
+                        # Use: Moving to home position, repositioning between tasks
+
+    QUICK = 1000        # Maximum safe speed for urgent actions
+                        # Use: Fast releases, emergency returns, clearing obstacles
+
+    # FORCE OPERATIONS (200-400 deg/s) - Power priority
+    PUSH = 400          # Pushing objects, applying force
+                        # Use: Pushing building structures, sliding heavy objects
+
+    STALL = 200         # Slow speed for stall detection operations
+                        # Use: Finding mechanical limits, pushing until resistance
+
+# Drive Speed Selection Guide - Use DriveSpeed class constants:
+#   move_straight(300, DriveSpeed.TRANSIT)       # Fast movement (700 mm/s)
+#   move_straight_gyro(500, DriveSpeed.APPROACH) # Moderate speed (300 mm/s)
+#   move_straight(100, DriveSpeed.PRECISE)       # Slow, accurate (100 mm/s)
+#   move_straight(400, 650)                      # Custom numeric speed
+#
+# Usage Guide:
+# - DriveSpeed.PRECISE (100) for: Final alignment, close to models
+# - DriveSpeed.APPROACH (300) for: Moving toward mission areas with moderate precision
+# - DriveSpeed.COLLECTION (500) for: Collecting objects, moderate speed missions
+# - DriveSpeed.TRANSIT (700) for: Long straight runs between areas
+# - DriveSpeed.RETURN (900) for: Returning to base when precision doesn't matter
+# - DriveSpeed.PUSHING (600) for: Heavy objects, ramps, need extra power
+
+# ============================================================================
+# GAIN SCHEDULES
+# ============================================================================
+
+def gain_schedule(gains):
+    """
+    Turn a {speed: kp} table into sorted (speed, kp) breakpoints.
+
+    Args:
+        gains (dict): Tuned gain per speed
+
+    Returns:
+        tuple: ((speed, kp), ...) sorted by speed, empty if no gains
+    """
+    return tuple((speed, gains[speed]) for speed in sorted(gains))
+
+
+def interpolate_gain(schedule, speed, default):
+    """
+    Look up the gain for a speed by linear interpolation between breakpoints.
+
+    Speeds below the first or above the last breakpoint use that end's gain.
+
+    Args:
+        schedule (tuple): Breakpoints from gain_schedule()
+        speed (int/float): Speed (sign is ignored)
+        default (float): Gain to use when the schedule is empty
+
+    Returns:
+        float: Proportional gain
+
+    Example:
+        schedule = gain_schedule({100: 4.0, 500: 2.0})
+        interpolate_gain(schedule, 300, 2.0)   # 3.0
+    """
+    if not schedule:
+        return default
+
+    speed = abs(speed)
+    low_speed, low_kp = schedule[0]
+    if speed <= low_speed:
+        return low_kp
+
+    for high_speed, high_kp in schedule[1:]:
+        if speed <= high_speed:
+            return low_kp + (high_kp - low_kp) * (speed - low_speed) / (high_speed - low_speed)
+        low_speed, low_kp = high_speed, high_kp
+
+    return low_kp
+
+
+# ============================================================================
+# ROBOT PROFILE
+# ============================================================================
+
+class RobotProfile:
+    """
+    Everything robot.py needs to know about one physical robot.
+
+    Measured values are passed in; derived values are computed once here so
+    the movement functions never repeat the same float math on every call.
+
+    Args:
+        name (str): Short profile name (e.g., "competition")
+        wheel_diameter (int/float): Wheel diameter in mm
+        axle_track (int/float): Distance between wheel centers in mm
+        left_motor_port (Port): Left drive motor port
+        right_motor_port (Port): Right drive motor port
+        attachment_port_left (Port): Front/left attachment port
+        attachment_port_right (Port): Back/right attachment port
+        left_motor_direction (Direction): Positive direction of left motor
+        right_motor_direction (Direction): Positive direction of right motor
+        gyro_kp (float): Heading correction gain for move_straight_gyro()
+        spin_turn_kp (float): Proportional gain for spin_turn()
+        spin_turn_base_speed (int): Base motor speed for spin turns (deg/s)
+        spin_turn_tolerance (int/float): Spin turn stopping tolerance (degrees)
+        default_speed (int): Default straight speed (mm/s)
+        default_turn_speed (int): Default turn rate (deg/s)
+        default_acceleration (int): Straight acceleration (mm/s²)
+        default_turn_acceleration (int): Turn acceleration (deg/s²)
+        drive_speed (class): DriveSpeed table for this robot
+        turn_speed (class): TurnSpeed table for this robot
+        arm_speed (class): ArmSpeed table for this robot
+        heading_gains (dict): Tuned gyro_kp per forward drive speed
+                              {mm/s: kp} (from autotune.py)
+        heading_gains_backward (dict): Same for backward driving
+                                       (defaults to heading_gains)
+        spin_gains (dict): Tuned spin_turn_kp per turn speed {deg/s: kp}
+                           (from autotune.py; missing speeds use spin_turn_kp)
+
+    Derived attributes:
+        wheel_circumference: mm traveled per wheel revolution
+        mm_per_degree: mm traveled per motor degree
+        degrees_per_mm: motor degrees per mm traveled
+        pivot_ratio: motor degrees per robot degree (one wheel stationary)
+        spin_ratio: motor degrees per robot degree (wheels opposite)
+        *_q16: the first three factors as Q16 fixed-point integers
+        heading_schedule_forward: heading_gains as sorted (speed, kp)
+                                  breakpoints for interpolation
+        heading_schedule_backward: the same for backward driving
+
+    Example:
+        practice = RobotProfile("practice", 56, 112,
+                                Port.A, Port.B, Port.C, Port.D)
+        motor_degrees = 90 * practice.pivot_ratio
+    """
+
+    def __init__(self, name, wheel_diameter, axle_track,
+                 left_motor_port, right_motor_port,
+                 attachment_port_left, attachment_port_right,
+                 left_motor_direction=Direction.COUNTERCLOCKWISE,
+                 right_motor_direction=Direction.CLOCKWISE,
+                 gyro_kp=2.0,
+                 spin_turn_kp=9,
+                 spin_turn_base_speed=60,
+                 spin_turn_tolerance=2,
+                 default_speed=300,
+                 default_turn_speed=100,
+                 default_acceleration=500,
+                 default_turn_acceleration=200,
+                 drive_speed=DriveSpeed,
+                 turn_speed=TurnSpeed,
+                 arm_speed=ArmSpeed,
+                 heading_gains=None,
+                 heading_gains_backward=None,
+                 spin_gains=None):
+        self.name = name
+
+        # Geometry (measured)
+        self.wheel_diameter = wheel_diameter
+        self.axle_track = axle_track
+
+        # Wiring
+        self.left_motor_port = left_motor_port
+        self.right_motor_port = right_motor_port
+        self.attachment_port_left = attachment_port_left
+        self.attachment_port_right = attachment_port_right
+        self.left_motor_direction = left_motor_direction
+        self.right_motor_direction = right_motor_direction
+
+        # Controller gains
+        self.gyro_kp = gyro_kp
+        self.spin_turn_kp = spin_turn_kp
+        self.spin_turn_base_speed = spin_turn_base_speed
+        self.spin_turn_tolerance = spin_turn_tolerance
+        self.heading_gains = heading_gains if heading_gains is not None else {}
+        self.heading_gains_backward = (heading_gains_backward
+                                       if heading_gains_backward is not None
+                                       else self.heading_gains)
+        self.spin_gains = spin_gains if spin_gains is not None else {}
+
+        # Gain schedules: sorted breakpoints, built once so the drive loop
+        # only interpolates
+        self.heading_schedule_forward = gain_schedule(self.heading_gains)
+        self.heading_schedule_backward = gain_schedule(self.heading_gains_backward)
+
+        # Drive base settings
+        self.default_speed = default_speed
+        self.default_turn_speed = default_turn_speed
+        self.default_acceleration = default_acceleration
+        self.default_turn_acceleration = default_turn_acceleration
+
+        # Speed tables
+        self.drive_speed = drive_speed
+        self.turn_speed = turn_speed
+        self.arm_speed = arm_speed
+
+        # Geometry (derived once per profile)
+        self.wheel_circumference = pi * wheel_diameter
+        self.mm_per_degree = self.wheel_circumference / 360
+        self.degrees_per_mm = 360 / self.wheel_circumference
+        # Pivot: outer wheel travels an arc of radius axle_track
+        self.pivot_ratio = 2 * axle_track / wheel_diameter
+        # Spin: both wheels travel an arc of radius axle_track / 2
+        self.spin_ratio = axle_track / wheel_diameter
+
+        # Fixed-point copies for integer-only conversions
+        self.degrees_per_mm_q16 = round(self.degrees_per_mm * FIXED_ONE)
+        self.mm_per_degree_q16 = round(self.mm_per_degree * FIXED_ONE)
+        self.pivot_ratio_q16 = round(self.pivot_ratio * FIXED_ONE)
+
+    def __repr__(self):
+        return (f"RobotProfile({self.name}: wheel={self.wheel_diameter}mm, "
+                f"track={self.axle_track}mm)")
+
+
+# ============================================================================
+# PROFILES
+# ============================================================================
+
+# Competition robot (SPIKE Prime small wheels)
+COMPETITION = RobotProfile(
+    "competition",
+    wheel_diameter=56,
+    axle_track=96,
+    left_motor_port=Port.B,
+    right_motor_port=Port.F,
+    attachment_port_left=Port.A,
+    attachment_port_right=Port.E,
+)
+
+# Big-wheel chassis (88mm wheels, wider track - same build as joshua/ and Shay/)
+BIG_WHEELS = RobotProfile(
+    "big_wheels",
+    wheel_diameter=88,
+    axle_track=114,
+    left_motor_port=Port.A,
+    right_motor_port=Port.C,
+    attachment_port_left=Port.D,
+    attachment_port_right=Port.B,
+)
+
+# Wide small-wheel chassis (same build as the early aadhir/ and tamil/ robots)
+WIDE_TRACK = RobotProfile(
+    "wide_track",
+    wheel_diameter=56,
+    axle_track=142,
+    left_motor_port=Port.A,
+    right_motor_port=Port.E,
+    attachment_port_left=Port.C,
+    attachment_port_right=Port.D,
+)
+
+# Name -> profile lookup
+PROFILES = {
+    COMPETITION.name: COMPETITION,
+    BIG_WHEELS.name: BIG_WHEELS,
+    WIDE_TRACK.name: WIDE_TRACK,
+}
+
+# Profile used by robot.py (change this to switch robots)
+ACTIVE_PROFILE = "competition"
+
+
+def select_profile(name):
+    """
+    Select the active robot profile.
+
+    Must be called BEFORE robot.py is imported - robot.py reads the active
+    profile once when it initializes the motors and drive base.
+
+    Args:
+        name (str): Profile name (key in PROFILES)
+
+    Returns:
+        bool: True if the profile exists and is now active
+    """
+    global ACTIVE_PROFILE
+
+    if name not in PROFILES:
+        print(f"ERROR: Unknown robot profile '{name}'")
+        print(f"  Available: {', '.join(sorted(PROFILES.keys()))}")
+        return False
+
+    ACTIVE_PROFILE = name
+    return True
+
+
+def get_profile(name=None):
+    """
+    Get a robot profile by name.
+
+    Args:
+        name (str): Profile name, or None for the active profile
+
+    Returns:
+        RobotProfile: The requested profile (falls back to COMPETITION
+                      with a warning if the name is unknown)
+    """
+    if name is None:
+        name = ACTIVE_PROFILE
+
+    profile = PROFILES.get(name)
+    if profile is None:
+        print(f"WARNING: Unknown robot profile '{name}', using '{COMPETITION.name}'")
+        return COMPETITION
+
+    return profile
@@ -0,0 +1,300 @@
+#!/usr/bin/env pybricks-micropython
+"""
+TELEMETRY - Mission and Primitive Timing History
+================================================
+
+Times every mission run and every movement/arm primitive it calls, and keeps
+a rolling history of the last HISTORY_RECORDS runs in the hub's persistent
+storage. After a practice session or a tournament, dump the history and
+decode it on a laptop to see where the match time really goes.
+
+How it works:
+- mission_loader.run_mission() calls start_mission() / finish_mission()
+- start_mission() wraps the primitives in robot.py (once) so each call is
+  timed with a StopWatch. Only the outermost call counts: the arm helpers
+  calling run_attachment() are not counted twice.
+- finish_mission() packs one fixed-size record and writes it to storage
+
+Missions imported AFTER start_mission() get the timed primitives. That is
+the case for missions run from mission_table.py or registered as
+"module:function" paths. Missions imported earlier are only timed as a whole.
+
+Record layout (little-endian, RECORD_SIZE = 28 bytes):
+    B    slot
+    B    flags (bit 0 = success)
+    H    mission time (10 ms units)
+    8H   time per primitive group (10 ms units, see PRIMITIVE_GROUPS)
+    8B   calls per primitive group (capped at 255)
+
+Storage layout at TELEMETRY_OFFSET:
+    B magic, B version, B next record index, B record count,
+    then HISTORY_RECORDS records (ring buffer)
+
+Storage is written to flash when the hub is switched off with the button.
+
+Usage:
+    print_history()   # readable table on the hub console
+    dump_history()    # one "TLM1:<hex>" line for tools/decode_telemetry.py
+    clear_history()
+
+Created: 2026-10-19
+For: Teams deciding which runs are worth optimizing
+"""
+
+from pybricks.hubs import PrimeHub
+from pybricks.tools import StopWatch
+
+try:
+    import ustruct as struct
+except ImportError:
+    import struct
+
+hub = PrimeHub()
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+TELEMETRY_OFFSET = 0        # Byte offset in hub.system.storage()
+HISTORY_RECORDS = 16        # Runs kept (oldest is overwritten)
+TIME_UNIT_MS = 10           # Stored time resolution
+
+MAGIC = 0x7E
+VERSION = 1
+
+HEADER_FORMAT = "<BBBB"
+RECORD_FORMAT = "<BBH8H8B"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+STORAGE_SIZE = HEADER_SIZE + HISTORY_RECORDS * RECORD_SIZE
+
+# Primitive groups (index = position in the record)
+PRIMITIVE_GROUPS = ("straight", "gyro", "turn", "spin", "arm", "adaptive", "sensor", "setup")
+
+# robot.py functions timed for each group
+GROUP_FUNCTIONS = (
+    ("move_straight", "tank_move"),
+    ("move_straight_gyro",),
+    ("turn", "pivot_turn"),
+    ("spin_turn",),
+    ("run_attachment", "attachment_to_position",
+     "left_arm_up", "left_arm_down", "left_arm_to",
+     "right_arm_up", "right_arm_down", "right_arm_to",
+     "both_arms_up", "both_arms_down", "reset_arms",
+     "left_arm_up_monitored", "right_arm_up_monitored", "reset_arm_to_limit"),
+    ("grab_until_load", "lift_adaptive", "push_until_resistance"),
+    ("move_until_line", "move_until_distance"),
+    ("calibrate_gyro", "check_battery"),
+)
+
+# ============================================================================
+# PRIMITIVE TIMING
+# ============================================================================
+
+_clock = StopWatch()
+_group_ms = [0] * len(PRIMITIVE_GROUPS)
+_group_calls = [0] * len(PRIMITIVE_GROUPS)
+_mission_start = 0
+_depth = 0
+_instrumented = False
+
+
+def _timed(function, group):
+    """Wrap a primitive so its outermost calls add to a group's totals."""
+    def timed_primitive(*args, **kwargs):
+        global _depth
+        if _depth:
+            return function(*args, **kwargs)
+
+        _depth = 1
+        start = _clock.time()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _depth = 0
+            _group_ms[group] += _clock.time() - start
+            _group_calls[group] += 1
+
+    return timed_primitive
+
+
+def instrument_robot():
+    """
+    Replace the primitives in robot.py with timed versions (only once).
+
+    Returns:
+        bool: True if robot.py is instrumented
+    """
+    global _instrumented
+    if _instrumented:
+        return True
+
+    try:
+        import robot
+    except ImportError as e:
+        print(f"instrument_robot error: {e}")
+        return False
+
+    for group, names in enumerate(GROUP_FUNCTIONS):
+        for name in names:
+            function = getattr(robot, name, None)
+            if function is not None:
+                setattr(robot, name, _timed(function, group))
+
+    _instrumented = True
+    return True
+
+
+def start_mission():
+    """Reset the per-run totals and start timing a mission."""
+    global _mission_start, _depth
+    instrument_robot()
+    for group in range(len(PRIMITIVE_GROUPS)):
+        _group_ms[group] = 0
+        _group_calls[group] = 0
+    _depth = 0
+    _mission_start = _clock.time()
+
+
+def finish_mission(slot, success):
+    """
+    Stop timing, store the record and return it.
+
+    Args:
+        slot (int): Slot that ran
+        success (bool): Whether the mission completed
+
+    Returns:
+        dict: Decoded record (see decode_record())
+    """
+    elapsed = _clock.time() - _mission_start
+    record = pack_record(slot, success, elapsed, _group_ms, _group_calls)
+    try:
+        append_record(record)
+    except Exception as e:
+        print(f"finish_mission error: {e}")
+    return decode_record(record)
+
+# ============================================================================
+# RECORDS
+# ============================================================================
+
+def _units(ms):
+    return min(0xFFFF, (ms + TIME_UNIT_MS // 2) // TIME_UNIT_MS)
+
+
+def pack_record(slot, success, mission_ms, group_ms, group_calls):
+    """Pack one run into RECORD_SIZE bytes."""
+    times = [_units(ms) for ms in group_ms]
+    calls = [min(255, count) for count in group_calls]
+    return struct.pack(RECORD_FORMAT, slot, 1 if success else 0,
+                       _units(mission_ms), *(times + calls))
+
+
+def decode_record(data):
+    """
+    Unpack one record.
+
+    Returns:
+        dict: {
+            'slot': int,
+            'success': bool,
+            'mission_ms': int,
+            'group_ms': [int, ...],      # per PRIMITIVE_GROUPS
+            'group_calls': [int, ...]
+        }
+    """
+    fields = struct.unpack(RECORD_FORMAT, data)
+    count = len(PRIMITIVE_GROUPS)
+    return {
+        'slot': fields[0],
+        'success': bool(fields[1] & 1),
+        'mission_ms': fields[2] * TIME_UNIT_MS,
+        'group_ms': [units * TIME_UNIT_MS for units in fields[3:3 + count]],
+        'group_calls': list(fields[3 + count:3 + 2 * count]),
+    }
+
+# ============================================================================
+# PERSISTENT HISTORY
+# ============================================================================
+
+def _read_header():
+    magic, version, next_index, count = struct.unpack(
+        HEADER_FORMAT, hub.system.storage(TELEMETRY_OFFSET, read=HEADER_SIZE))
+    if magic != MAGIC or version != VERSION or next_index >= HISTORY_RECORDS:
+        return 0, 0
+    return next_index, min(count, HISTORY_RECORDS)
+
+
+def append_record(record):
+    """Write a record over the oldest one and update the header."""
+    next_index, count = _read_header()
+    offset = TELEMETRY_OFFSET + HEADER_SIZE + next_index * RECORD_SIZE
+    hub.system.storage(offset, write=record)
+
+    next_index = (next_index + 1) % HISTORY_RECORDS
+    count = min(count + 1, HISTORY_RECORDS)
+    hub.system.storage(TELEMETRY_OFFSET,
+                       write=struct.pack(HEADER_FORMAT, MAGIC, VERSION, next_index, count))
+
+
+def load_history():
+    """
+    Read the stored runs.
+
+    Returns:
+        list: Decoded records, oldest first
+    """
+    next_index, count = _read_header()
+    first = (next_index - count) % HISTORY_RECORDS
+    records = []
+    for i in range(count):
+        index = (first + i) % HISTORY_RECORDS
+        offset = TELEMETRY_OFFSET + HEADER_SIZE + index * RECORD_SIZE
+        records.append(decode_record(hub.system.storage(offset, read=RECORD_SIZE)))
+    return records
+
+
+def clear_history():
+    """Forget all stored runs."""
+    hub.system.storage(TELEMETRY_OFFSET,
+                       write=struct.pack(HEADER_FORMAT, MAGIC, VERSION, 0, 0))
+    print("✓ Telemetry history cleared")
+
+
+def dump_history():
+    """
+    Print the raw history as one line for tools/decode_telemetry.py.
+
+    Returns:
+        str: The printed line
+    """
+    data = hub.system.storage(TELEMETRY_OFFSET, read=STORAGE_SIZE)
+    line = f"TLM{VERSION}:" + "".join("%02x" % byte for byte in data)
+    print(line)
+    return line
+
+
+def print_history():
+    """Print the stored runs as a table (times in seconds)."""
+    records = load_history()
+    if not records:
+        print("No telemetry recorded")
+        return
+
+    print("\n" + "=" * 70)
+    print("MISSION TIMING HISTORY (oldest first)")
+    print("=" * 70)
+    header = "Slot OK  Total " + " ".join(f"{name[:5]:>5}" for name in PRIMITIVE_GROUPS)
+    print(header)
+    print("-" * len(header))
+    for record in records:
+        groups = " ".join(f"{ms / 1000:>5.1f}" for ms in record['group_ms'])
+        print(f"{record['slot']:<4} {'✓' if record['success'] else '✗':<2} "
+              f"{record['mission_ms'] / 1000:>5.1f} {groups}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    print_history()
+    dump_history()
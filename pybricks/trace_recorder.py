@@ -0,0 +1,221 @@
+#!/usr/bin/env pybricks-micropython
+"""
+TRACE RECORDER - Control Loop Traces Without Prints
+===================================================
+
+A fixed-size ring buffer that the control loops in robot.py write one
+sample into per iteration. Printing inside a loop takes milliseconds and
+changes the timing being debugged; writing a sample takes microseconds and
+allocates nothing (the buffer is preallocated, samples are packed into it
+in place).
+
+Recorded loops:
+- move_straight_gyro()     heading, encoders, drive speed, turn rate, load
+- spin_turn()              heading, encoders, motor speed, error
+- push_until_resistance()  heading, encoders, drive speed, load
+- move_until_line()        heading, encoders, drive speed, reflection
+
+Every sample holds the sensor values that iteration acted on. Loops that
+stop on a sensor value write one last sample for the iteration that
+stopped them (command 0), so simulator/replay.py can feed the recording
+back through robot.py.
+
+Sample layout (little-endian, SAMPLE_SIZE = 22 bytes):
+    I  time (ms since enable())
+    f  heading (degrees, the hub's own float - stop tests on the heading
+       replay exactly)
+    i  left encoder (degrees)
+    i  right encoder (degrees)
+    h  command A (drive speed mm/s, or motor speed deg/s for spin)
+    h  command B (0.1 units: turn rate deg/s for gyro, error deg for spin)
+    B  load (% average of both drive motors), reflection for KIND_LINE
+    B  tag: loop kind (KIND_*), bit 7 set = marker
+
+Integer fields are rounded, not truncated, so a replay computes the same
+stored values.
+
+A marker is written when a loop (or a mission) starts. Its encoder fields
+hold the target (0.1 units) and an extra value (mission slot, push load
+threshold), command A holds the requested speed.
+
+Pybricks MicroPython has no 'array' module, so the buffer is a bytearray
+written with ustruct.pack_into() - same effect, no allocation per sample.
+
+Usage:
+    import trace_recorder
+    trace_recorder.enable()         # allocate buffer, start recording
+    move_straight_gyro(500)
+    trace_recorder.dump()           # print for tools/decode_trace.py
+
+Host:
+    python -m tools.decode_trace hub_log.txt --csv trace.csv
+
+Created: 2026-10-19
+For: Debugging drift and overshoot with full-rate data
+"""
+
+from pybricks.tools import StopWatch
+
+try:
+    import ustruct as struct
+except ImportError:
+    import struct
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+TRACE_SAMPLES = 1000        # Ring buffer size (22 KB = 10 s at 100 Hz)
+DUMP_LINE_SAMPLES = 16      # Samples per printed line
+
+VERSION = 2
+SAMPLE_FORMAT = "<IfiihhBB"
+SAMPLE_SIZE = struct.calcsize(SAMPLE_FORMAT)
+
+# Loop kinds (tag values)
+KIND_MISSION = 0
+KIND_GYRO = 1
+KIND_SPIN = 2
+KIND_PUSH = 3
+KIND_LINE = 4
+MARKER = 0x80
+
+# ============================================================================
+# STATE
+# ============================================================================
+
+# Checked by robot.py before every sample - keep it a plain module flag
+active = False
+
+_buffer = None
+_capacity = 0
+_next = 0
+_count = 0
+_clock = StopWatch()
+
+# ============================================================================
+# RECORDING
+# ============================================================================
+
+def enable(samples=TRACE_SAMPLES):
+    """
+    Allocate the buffer (once) and start recording.
+
+    Args:
+        samples (int): Ring buffer size in samples
+
+    Returns:
+        bool: True if recording
+    """
+    global active, _buffer, _capacity, _next, _count
+    try:
+        if _buffer is None or _capacity != samples:
+            _buffer = bytearray(samples * SAMPLE_SIZE)
+            _capacity = samples
+        _next = 0
+        _count = 0
+        _clock.reset()
+        active = True
+        return True
+    except MemoryError:
+        print(f"trace_recorder error: no memory for {samples} samples")
+        active = False
+        return False
+
+
+def disable():
+    """Stop recording (the buffer is kept for dump())."""
+    global active
+    active = False
+
+
+def release():
+    """Stop recording and free the buffer."""
+    global active, _buffer, _capacity, _next, _count
+    active = False
+    _buffer = None
+    _capacity = 0
+    _next = 0
+    _count = 0
+
+
+def sample(kind, heading, left, right, command_a, command_b, load):
+    """
+    Write one sample (overwrites the oldest when full).
+
+    Args:
+        kind (int): KIND_* of the loop
+        heading (float): IMU heading in degrees
+        left (int): Left encoder in degrees
+        right (int): Right encoder in degrees
+        command_a (int/float): Speed command
+        command_b (float): Second command (stored in 0.1 units)
+        load (int): Drive motor load in % (stored as magnitude),
+                    or reflection for KIND_LINE
+    """
+    global _next, _count
+    struct.pack_into(SAMPLE_FORMAT, _buffer, _next * SAMPLE_SIZE,
+                     _clock.time(), heading, round(left), round(right),
+                     round(command_a), round(command_b * 10), min(255, abs(round(load))), kind)
+    _next += 1
+    if _next == _capacity:
+        _next = 0
+    if _count < _capacity:
+        _count += 1
+
+
+def mark(kind, target=0, speed=0, extra=0):
+    """
+    Write a marker at the start of a loop or mission.
+
+    Args:
+        kind (int): KIND_* being started
+        target (int/float): Target distance (mm), angle (degrees) or reflection
+        speed (int): Requested speed
+        extra (int): Kind-specific value (mission slot, load threshold)
+    """
+    global _next, _count
+    struct.pack_into(SAMPLE_FORMAT, _buffer, _next * SAMPLE_SIZE,
+                     _clock.time(), 0, round(target * 10), round(extra),
+                     round(speed), 0, 0, kind | MARKER)
+    _next += 1
+    if _next == _capacity:
+        _next = 0
+    if _count < _capacity:
+        _count += 1
+
+# ============================================================================
+# DUMP
+# ============================================================================
+
+def dump():
+    """
+    Print the buffer (oldest sample first) for tools/decode_trace.py.
+
+    Output:
+        TRC1 BEGIN <count>
+        TRC1:<hex of up to DUMP_LINE_SAMPLES samples>
+        ...
+        TRC1 END
+
+    Returns:
+        int: Number of samples printed
+    """
+    if _buffer is None or _count == 0:
+        print("No trace recorded")
+        return 0
+
+    first = (_next - _count) % _capacity
+    print(f"TRC{VERSION} BEGIN {_count}")
+    line = []
+    for i in range(_count):
+        offset = ((first + i) % _capacity) * SAMPLE_SIZE
+        for byte in _buffer[offset:offset + SAMPLE_SIZE]:
+            line.append("%02x" % byte)
+        if len(line) >= DUMP_LINE_SAMPLES * SAMPLE_SIZE:
+            print(f"TRC{VERSION}:" + "".join(line))
+            line = []
+    if line:
+        print(f"TRC{VERSION}:" + "".join(line))
+    print(f"TRC{VERSION} END")
+    return _count
@@ -0,0 +1,8 @@
+"""
+Host simulator for the Pybricks robot code.
+
+Runs the programs in pybricks/ (robot.py, missions, tools) on a laptop
+against a simulated robot instead of a hub. See session.py to set up a
+world and run.py for the command line. replay.py runs robot.py against
+control-loop traces recorded on the real hub.
+"""
@@ -0,0 +1,7 @@
+"""
+Host stand-in for the Pybricks MicroPython API.
+
+Implements the parts of pybricks.hubs, pupdevices, parameters, robotics and
+tools that the code in pybricks/ uses, backed by the simulated World in
+simulator/world.py. Programs run unchanged; wait() advances simulated time.
+"""
@@ -0,0 +1,90 @@
+"""Stand-in for pybricks.hubs."""
+
+from simulator.world import get_world
+
+
+class _IMU:
+    def heading(self):
+        return get_world().heading()
+
+    def reset_heading(self, angle):
+        get_world().reset_heading(angle)
+
+    def ready(self):
+        return True
+
+    def stationary(self):
+        world = get_world()
+        return world.left is None or (abs(world.left.speed) < 1 and abs(world.right.speed) < 1)
+
+
+class _Battery:
+    def voltage(self):
+        return get_world().battery_mv
+
+    def current(self):
+        return 150
+
+
+class _Light:
+    def on(self, color):
+        get_world().light = color
+
+    def off(self):
+        get_world().light = None
+
+    def blink(self, color, durations):
+        get_world().light = color
+
+
+class _Buttons:
+    def pressed(self):
+        return get_world().pressed_buttons()
+
+
+class _Display:
+    def text(self, text, on=500, off=50):
+        get_world().display = str(text)
+
+    def number(self, number):
+        get_world().display = str(number)
+
+    def char(self, char):
+        get_world().display = str(char)
+
+    def off(self):
+        get_world().display = None
+
+
+class _System:
+    def set_stop_button(self, button):
+        pass
+
+    def storage(self, offset, read=None, write=None):
+        storage = get_world().storage
+        if write is not None:
+            if offset + len(write) > len(storage):
+                raise ValueError("storage write out of range")
+            storage[offset:offset + len(write)] = write
+            return None
+        if offset + read > len(storage):
+            raise ValueError("storage read out of range")
+        return bytes(storage[offset:offset + read])
+
+
+class _Speaker:
+    def beep(self, frequency=500, duration=100):
+        get_world().advance(duration)
+
+
+class PrimeHub:
+    """Simulated SPIKE Prime hub."""
+
+    def __init__(self, top_side=None, front_side=None):
+        self.imu = _IMU()
+        self.battery = _Battery()
+        self.light = _Light()
+        self.buttons = _Buttons()
+        self.display = _Display()
+        self.system = _System()
+        self.speaker = _Speaker()
@@ -0,0 +1,29 @@
+"""Stand-in for pybricks.parameters."""
+
+
+class _Constant:
+    """Named constant that prints like the real Pybricks enum values."""
+
+    def __init__(self, group, name):
+        self.group = group
+        self.name = name
+
+    def __repr__(self):
+        return f"{self.group}.{self.name}"
+
+    __str__ = __repr__
+
+
+def _constants(group, names):
+    return type(group, (), {name: _Constant(group, name) for name in names})
+
+
+Port = _constants("Port", ["A", "B", "C", "D", "E", "F"])
+Direction = _constants("Direction", ["CLOCKWISE", "COUNTERCLOCKWISE"])
+Stop = _constants("Stop", ["COAST", "COAST_SMART", "BRAKE", "HOLD", "NONE"])
+Button = _constants("Button", ["LEFT", "RIGHT", "CENTER", "BLUETOOTH"])
+Side = _constants("Side", ["TOP", "BOTTOM", "FRONT", "BACK", "LEFT", "RIGHT"])
+Axis = _constants("Axis", ["X", "Y", "Z"])
+Color = _constants("Color", ["NONE", "BLACK", "GRAY", "WHITE", "RED", "ORANGE",
+                             "BROWN", "YELLOW", "GREEN", "CYAN", "BLUE",
+                             "VIOLET", "MAGENTA"])
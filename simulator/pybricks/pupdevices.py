@@ -0,0 +1,128 @@
+"""Stand-in for pybricks.pupdevices."""
+
+from simulator.world import get_world
+from pybricks.parameters import Stop, Color
+
+
+class _Control:
+    def stalls(self, speed=None, time=None, duty_limit=None):
+        return (speed, time)
+
+    def limits(self, speed=None, acceleration=None, torque=None):
+        return (speed, acceleration, torque)
+
+
+class Motor:
+    """Simulated motor; several Motor objects on one port share state."""
+
+    def __init__(self, port, positive_direction=None, gears=None,
+                 reset_angle=True, profile=None):
+        self.port = port
+        self.positive_direction = positive_direction
+        self._sim = get_world().motor(port)
+        self.control = _Control()
+
+    def _finish(self, then):
+        if then == Stop.HOLD:
+            self._sim.hold()
+        elif then == Stop.BRAKE:
+            self._sim.brake()
+        elif then in (Stop.COAST, Stop.COAST_SMART):
+            self._sim.coast()
+
+    def _wait_done(self, then):
+        world = get_world()
+        while not self._sim.done():
+            world.step()
+        self._finish(then)
+
+    def angle(self):
+        return int(round(self._sim.angle))
+
+    def speed(self):
+        return int(round(self._sim.speed))
+
+    def load(self):
+        return self._sim.load()
+
+    def stalled(self):
+        return self._sim.stalled
+
+    def done(self):
+        return self._sim.done()
+
+    def reset_angle(self, angle=None):
+        self._sim.angle = 0.0 if angle is None else float(angle)
+        if self._sim.mode in ("position", "hold"):
+            self._sim.target_angle = self._sim.angle
+
+    def run(self, speed):
+        self._sim.run(speed)
+
+    def dc(self, duty):
+        self._sim.run(self._sim.max_speed * duty / 100)
+
+    def stop(self):
+        self._sim.coast()
+
+    def brake(self):
+        self._sim.brake()
+
+    def hold(self):
+        self._sim.hold()
+
+    def run_angle(self, speed, rotation_angle, then=Stop.HOLD, wait=True):
+        direction = 1 if speed * rotation_angle >= 0 else -1
+        target = self._sim.angle + direction * abs(rotation_angle)
+        self._sim.run_to(target, speed)
+        if wait:
+            self._wait_done(then)
+
+    def run_target(self, speed, target_angle, then=Stop.HOLD, wait=True):
+        self._sim.run_to(target_angle, speed)
+        if wait:
+            self._wait_done(then)
+
+    def run_time(self, speed, time, then=Stop.HOLD, wait=True):
+        self._sim.run(speed)
+        if wait:
+            get_world().advance(time)
+            self._finish(then)
+
+    def run_until_stalled(self, speed, then=Stop.COAST, duty_limit=None):
+        world = get_world()
+        self._sim.run(speed)
+        world.step()
+        while not self._sim.stalled:
+            world.step()
+        self._finish(then)
+        return self.angle()
+
+
+class ColorSensor:
+    """Simulated downward-facing color sensor at the robot front."""
+
+    def __init__(self, port):
+        self.port = port
+
+    def reflection(self):
+        return get_world().reflection()
+
+    def color(self):
+        return Color.BLACK if self.reflection() < 50 else Color.WHITE
+
+    def hsv(self):
+        return (0, 0, self.reflection())
+
+
+class UltrasonicSensor:
+    """Simulated forward-facing ultrasonic sensor."""
+
+    def __init__(self, port):
+        self.port = port
+
+    def distance(self):
+        return get_world().ultrasonic_distance()
+
+    def presence(self):
+        return False
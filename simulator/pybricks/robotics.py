@@ -0,0 +1,103 @@
+"""Stand-in for pybricks.robotics."""
+
+import math
+
+from simulator.world import get_world
+from pybricks.parameters import Stop
+
+
+class DriveBase:
+    """
+    Simulated DriveBase.
+
+    Converts with the geometry it was GIVEN (the profile), while the world
+    moves with its TRUE geometry - so calibration errors show up like on a
+    real robot.
+    """
+
+    def __init__(self, left_motor, right_motor, wheel_diameter, axle_track):
+        self.left_motor = left_motor
+        self.right_motor = right_motor
+        self.wheel_diameter = wheel_diameter
+        self.axle_track = axle_track
+        self._straight_speed = 300
+        self._straight_acceleration = 500
+        self._turn_rate = 100
+        self._turn_acceleration = 200
+        self._left_start = left_motor.angle()
+        self._right_start = right_motor.angle()
+        get_world().attach_drive(left_motor._sim, right_motor._sim)
+
+    def _degrees_per_mm(self):
+        return 360 / (math.pi * self.wheel_diameter)
+
+    def settings(self, straight_speed=None, straight_acceleration=None,
+                 turn_rate=None, turn_acceleration=None):
+        if straight_speed is not None:
+            self._straight_speed = straight_speed
+        if straight_acceleration is not None:
+            self._straight_acceleration = straight_acceleration
+        if turn_rate is not None:
+            self._turn_rate = turn_rate
+        if turn_acceleration is not None:
+            self._turn_acceleration = turn_acceleration
+        return (self._straight_speed, self._straight_acceleration,
+                self._turn_rate, self._turn_acceleration)
+
+    def _move(self, left_degrees, right_degrees, speed, then, wait):
+        left = self.left_motor._sim
+        right = self.right_motor._sim
+        left.run_to(left.angle + left_degrees, speed)
+        right.run_to(right.angle + right_degrees, speed)
+        if wait:
+            world = get_world()
+            while not (left.done() and right.done()):
+                world.step()
+            self.left_motor._finish(then)
+            self.right_motor._finish(then)
+
+    def straight(self, distance, then=Stop.HOLD, wait=True):
+        degrees = distance * self._degrees_per_mm()
+        speed = self._straight_speed * self._degrees_per_mm()
+        self._move(degrees, degrees, speed, then, wait)
+
+    def turn(self, angle, then=Stop.HOLD, wait=True):
+        degrees = angle * self.axle_track / self.wheel_diameter
+        speed = self._turn_rate * self.axle_track / self.wheel_diameter
+        self._move(degrees, -degrees, speed, then, wait)
+
+    def drive(self, speed, turn_rate):
+        offset = math.radians(turn_rate) * self.axle_track / 2
+        self.left_motor._sim.run((speed + offset) * self._degrees_per_mm())
+        self.right_motor._sim.run((speed - offset) * self._degrees_per_mm())
+
+    def stop(self):
+        self.left_motor._sim.coast()
+        self.right_motor._sim.coast()
+
+    def brake(self):
+        self.left_motor._sim.brake()
+        self.right_motor._sim.brake()
+
+    def distance(self):
+        left = self.left_motor.angle() - self._left_start
+        right = self.right_motor.angle() - self._right_start
+        return int((left + right) / 2 / self._degrees_per_mm())
+
+    def angle(self):
+        return int(get_world().heading())
+
+    def state(self):
+        left = self.left_motor._sim
+        right = self.right_motor._sim
+        drive_speed = (left.speed + right.speed) / 2 / self._degrees_per_mm()
+        turn_rate = math.degrees((left.speed - right.speed) / self._degrees_per_mm()
+                                 / self.axle_track)
+        return (self.distance(), int(drive_speed), self.angle(), int(turn_rate))
+
+    def reset(self):
+        self._left_start = self.left_motor.angle()
+        self._right_start = self.right_motor.angle()
+
+    def done(self):
+        return self.left_motor.done() and self.right_motor.done()
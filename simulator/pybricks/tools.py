@@ -0,0 +1,39 @@
+"""Stand-in for pybricks.tools (simulated clock)."""
+
+from simulator.world import get_world
+
+
+def wait(time):
+    """Advance simulated time by time milliseconds."""
+    get_world().advance(time)
+
+
+class StopWatch:
+    """Stopwatch driven by the simulated clock."""
+
+    def __init__(self):
+        self._start = get_world().time
+        self._paused_at = None
+
+    def time(self):
+        now = self._paused_at if self._paused_at is not None else get_world().time
+        return now - self._start
+
+    def reset(self):
+        self._start = get_world().time
+        if self._paused_at is not None:
+            self._paused_at = self._start
+
+    def pause(self):
+        if self._paused_at is None:
+            self._paused_at = get_world().time
+
+    def resume(self):
+        if self._paused_at is not None:
+            self._start += get_world().time - self._paused_at
+            self._paused_at = None
+
+
+def hub_menu(*symbols):
+    """The simulator has no menu - always picks the first entry."""
+    return symbols[0]
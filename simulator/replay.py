@@ -0,0 +1,493 @@
+"""
+REPLAY - Recorded Hub Traces Through the Unchanged robot.py
+===========================================================
+
+A World that, inside every control loop recorded by trace_recorder.py,
+serves the RECORDED sensor values (IMU heading, encoders, motor load,
+reflection) instead of simulating them, and checks that robot.py computes
+the same commands the robot did. Outside the recorded loops (arm moves,
+robot.straight(), waits) it is the normal simulator.
+
+How it works:
+- trace_recorder's mark()/sample() hooks in robot.py are pointed at the
+  ReplayWorld. mark() starts the next recorded loop, sample() compares
+  the commands robot.py just computed with the recorded ones and moves on
+  to the next recorded iteration.
+- While a loop is replayed, wait() jumps the clock to the recorded time of
+  the next iteration, so StopWatch timeouts behave as on the hub.
+- A different sequence of loops is reported as a mismatch; after it the
+  rest of the run is simulated only. A loop that stops earlier or later
+  than on the robot is only a mismatch once a command has differed too -
+  on its own it is listed as a note.
+
+Commands are compared in the units the trace stores them in (1 mm/s or
+deg/s for command A, 0.1 for command B), within COMMAND_TOLERANCE.
+
+--round-trip records every mission_table.py slot in the simulator and
+replays it at once: nothing has changed in between, so every slot must
+replay with the same commands. Run it after changing trace_recorder.py or
+this file.
+
+Limitations: gain-scheduled gyro moves read the drive speed, which replay
+derives from the recorded encoders; loops that are not traced are not
+replayed.
+
+Usage:
+    python -m simulator.replay hub_log.txt Missions_10_23 mission8_Silo
+    python -m simulator.replay hub_log.txt              # slot from the trace, via mission_table.py
+    python -m simulator.replay hub_log.txt --slot 3 --run 2
+    python -m simulator.replay --round-trip            # self-check, every slot
+
+Created: 2026-10-19
+For: Reproducing competition failures and regression-testing controller changes
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+
+from simulator import session
+from simulator.world import World, SimMotor, SimulationTimeout, set_world
+from tools.decode_trace import find_traces, decode_trace, KIND_NAMES, KIND_MISSION, KIND_LINE
+
+COMMAND_TOLERANCE = 2       # Stored units (see above)
+PRINTED_MISMATCHES = 10     # print_report() lists this many
+
+# Loop-length problems: failures only next to a command difference
+LENGTH_PROBLEMS = ("loop stopped early", "loop ran longer than recorded",
+                   "run ended inside a loop")
+
+# World the --round-trip recordings are made in (noisy, but seeded)
+ROUND_TRIP_WORLD = {'imu_noise': 0.3, 'slip_left': 0.02, 'seed': 1}
+
+# ============================================================================
+# REPLAY WORLD
+# ============================================================================
+
+class ReplayMotor(SimMotor):
+    """SimMotor whose load can be replaced by a recorded value."""
+
+    def __init__(self, world, port, **params):
+        super().__init__(world, port, **params)
+        self.replay_load = None
+
+    def load(self):
+        if self.replay_load is not None:
+            return self.replay_load
+        return super().load()
+
+
+class ReplayWorld(World):
+    """
+    World that replays the loops of one decoded trace.
+
+    Args:
+        segments (list): Loop markers from decode_trace()
+        samples (list): Samples from decode_trace()
+        tolerance (int): Allowed command difference in stored units
+        **params: Passed to World (geometry, max_time_ms...)
+    """
+
+    def __init__(self, segments, samples, tolerance=COMMAND_TOLERANCE, **params):
+        super().__init__(**params)
+        self.segments = segments
+        self.loops = {segment['segment']: [] for segment in segments}
+        for sample in samples:
+            if sample['segment'] in self.loops:
+                self.loops[sample['segment']].append(sample)
+        self.tolerance = tolerance
+
+        self.next_segment = 0
+        self.segment = None     # Loop marker being replayed
+        self.loop = None        # Its samples
+        self.index = 0
+        self.origin = 0         # World time of recorded time 0
+        self.left_base = 0
+        self.right_base = 0
+        self.replay_heading = 0.0
+        self.replay_reflection = None
+        self.extra_reported = False
+        self.diverged = False
+
+        self.compared = 0
+        self.mismatches = []
+
+    def motor(self, port):
+        motor = self.motors.get(port)
+        if motor is None:
+            motor = ReplayMotor(self, port)
+            self.motors[port] = motor
+        return motor
+
+    def _mismatch(self, problem, **details):
+        entry = {'problem': problem,
+                 'segment': self.segment['segment'] if self.segment else None,
+                 'index': self.index if self.loop is not None else None}
+        entry.update(details)
+        self.mismatches.append(entry)
+
+    # --- trace_recorder hooks -------------------------------------------------
+
+    def mark(self, kind, target=0, speed=0, extra=0):
+        """Called where robot.py starts a loop: begin replaying the next one."""
+        if kind == KIND_MISSION or self.diverged:
+            return
+
+        if self.loop is not None:
+            remaining = len(self.loop) - self.index
+            self._mismatch("loop stopped early", missing_samples=remaining)
+            self._finish_loop()
+
+        name = f"{KIND_NAMES.get(kind, '?')} {target:g}"
+        if self.next_segment >= len(self.segments):
+            self._mismatch("loop not in trace", replayed=name)
+            self.diverged = True
+            return
+
+        segment = self.segments[self.next_segment]
+        expected = f"{KIND_NAMES.get(segment['kind'], '?')} {segment['target']:g}"
+        if segment['kind'] != kind or round(segment['target'] * 10) != round(target * 10):
+            self._mismatch("different loop", recorded=expected, replayed=name)
+            self.diverged = True
+            return
+
+        self.next_segment += 1
+        self.segment = segment
+        self.extra_reported = False
+        loop = self.loops[segment['segment']]
+        if not loop:
+            return
+
+        self.loop = loop
+        self.index = 0
+        self.origin = self.time - segment['t_ms']
+        self.left.angle = float(round(self.left.angle))
+        self.right.angle = float(round(self.right.angle))
+        self.left_base = self.left.angle
+        self.right_base = self.right.angle
+        self._apply()
+
+    def sample(self, kind, heading, left, right, command_a, command_b, load):
+        """Called once per loop iteration: compare the commands, step on."""
+        if self.diverged:
+            return
+        if self.loop is None:
+            # The robot stopped this loop here, the replayed code did not
+            if self.segment is not None and not self.extra_reported:
+                self._mismatch("loop ran longer than recorded")
+                self.extra_reported = True
+            return
+
+        recorded = self.loop[self.index]
+        checks = (("command_a", round(command_a), recorded['command_a']),
+                  ("command_b", round(command_b * 10), round(recorded['command_b'] * 10)))
+        for field, replayed, stored in checks:
+            if abs(replayed - stored) > self.tolerance:
+                self._mismatch("command differs", field=field, t_ms=recorded['t_ms'],
+                               recorded=stored, replayed=replayed)
+        self.compared += 1
+
+        self.index += 1
+        if self.index < len(self.loop):
+            self._apply()
+        else:
+            self._finish_loop()
+
+    # --- Recorded sensors -----------------------------------------------------
+
+    def _apply(self):
+        """Make the sensors read the current recorded sample."""
+        sample = self.loop[self.index]
+        left = self.left_base + sample['left']
+        right = self.right_base + sample['right']
+        if self.index > 0:
+            previous = self.loop[self.index - 1]
+            dt = (sample['t_ms'] - previous['t_ms']) / 1000
+            if dt > 0:
+                self.left.speed = (left - self.left.angle) / dt
+                self.right.speed = (right - self.right.angle) / dt
+        self.left.angle = left
+        self.right.angle = right
+        self.replay_heading = sample['heading']
+
+        if sample['kind'] == KIND_LINE:
+            self.replay_reflection = sample['load']
+        else:
+            self.left.replay_load = sample['load']
+            self.right.replay_load = sample['load']
+
+    def _finish_loop(self):
+        """Back to simulation, continuing from the last recorded state."""
+        self.loop = None
+        self.left.replay_load = None
+        self.right.replay_load = None
+        self.replay_reflection = None
+        self.reset_heading(self.replay_heading)
+
+    def heading(self):
+        if self.loop is not None:
+            return self.replay_heading
+        return super().heading()
+
+    def reflection(self):
+        if self.replay_reflection is not None:
+            return self.replay_reflection
+        return super().reflection()
+
+    # --- Time ----------------------------------------------------------------
+
+    def advance(self, ms):
+        if self.loop is None:
+            super().advance(ms)
+            return
+        # Jump to the recorded time of the next iteration
+        self.time = max(self.time + self.dt_ms, self.origin + self.loop[self.index]['t_ms'])
+        if self.time > self.max_time_ms:
+            raise SimulationTimeout(f"simulation exceeded {self.max_time_ms}ms")
+
+    def step(self):
+        if self.loop is None:
+            super().step()
+            return
+        # Motors and pose stand still - the recording says where they are
+        self.time += self.dt_ms
+        if self.time > self.max_time_ms:
+            raise SimulationTimeout(f"simulation exceeded {self.max_time_ms}ms")
+
+    def report(self):
+        """Summary of the replay (see replay())."""
+        unreplayed = len(self.segments) - self.next_segment
+        mismatches = list(self.mismatches)
+        if self.loop is not None:
+            mismatches.append({'problem': "run ended inside a loop",
+                               'segment': self.segment['segment'], 'index': self.index})
+        if unreplayed and not self.diverged:
+            mismatches.append({'problem': "recorded loops never started",
+                               'segment': self.next_segment, 'index': None,
+                               'count': unreplayed})
+
+        # A loop ending one iteration apart with the same commands is a
+        # stop test on the edge, not a regression
+        notes = []
+        if not any(m['problem'] == "command differs" for m in mismatches):
+            notes = [m for m in mismatches if m['problem'] in LENGTH_PROBLEMS]
+            mismatches = [m for m in mismatches if m['problem'] not in LENGTH_PROBLEMS]
+        return {
+            'loops': self.next_segment,
+            'recorded_loops': len(self.segments),
+            'samples': self.compared,
+            'mismatches': mismatches,
+            'notes': notes,
+            'match': not mismatches,
+        }
+
+# ============================================================================
+# RUNNING A REPLAY
+# ============================================================================
+
+def _mission_function(slot):
+    """The function in a mission_table.py slot."""
+    table = session.load_module("mission_table")
+    loader = session.load_module("mission_loader")
+    loader.use_mission_table(table.MISSIONS)
+    mission = loader.get_mission(slot)
+    if mission is None:
+        raise ValueError(f"no mission in slot {slot}")
+    return loader.resolve_mission(mission[2])
+
+
+def replay(data, module_name=None, function_name=None, slot=None, args=(),
+           tolerance=COMMAND_TOLERANCE, profile=None, max_time_ms=600000):
+    """
+    Replay one recorded trace through the hub code.
+
+    Args:
+        data (bytes): One trace block (tools.decode_trace.find_traces())
+        module_name (str): Hub program with the function that was recorded
+        function_name (str): That function
+        args (tuple): Its arguments
+        slot (int): Instead of module/function: mission_table.py slot
+                    (None = the slot recorded in the trace)
+        tolerance (int): Allowed command difference in stored units
+        profile (str): robot_config profile name (None = ACTIVE_PROFILE)
+        max_time_ms (int): Simulated time limit
+
+    Returns:
+        dict: {
+            'loops': int,            # recorded loops that were replayed
+            'recorded_loops': int,
+            'samples': int,          # iterations compared
+            'mismatches': [dict],    # 'problem' plus details
+            'notes': [dict],         # loop-length differences without a command difference
+            'match': bool,           # same commands and loops
+            'result': return value of the function,
+            'timeout': bool
+        }
+    """
+    segments, samples = decode_trace(data)
+
+    # Fresh modules and profile, then swap in the replay world
+    geometry = session.new_world(profile=profile)
+    world = set_world(ReplayWorld(segments, samples, tolerance,
+                                  wheel_diameter=geometry.wheel_diameter,
+                                  axle_track=geometry.axle_track,
+                                  max_time_ms=max_time_ms))
+
+    recorder = session.load_module("trace_recorder")
+    recorder.active = True
+    recorder.mark = world.mark
+    recorder.sample = world.sample
+
+    if module_name is not None:
+        function = getattr(session.load_module(module_name), function_name)
+    else:
+        if slot is None:
+            slots = [segment['mission'] for segment in segments if segment['mission'] >= 0]
+            if not slots:
+                raise ValueError("trace has no mission slot - give a module and function")
+            slot = slots[0]
+        function = _mission_function(slot)
+
+    result = None
+    timeout = False
+    try:
+        result = function(*args)
+    except SimulationTimeout:
+        timeout = True
+
+    report = world.report()
+    report['result'] = result
+    report['timeout'] = timeout
+    return report
+
+
+def record(slot, **world_params):
+    """
+    Run a mission_table.py slot in the simulator with RECORD_TRACE on.
+
+    Returns:
+        bytes: The trace block it dumped
+
+    Raises:
+        ValueError: If the slot is empty or no complete trace was dumped
+    """
+    session.new_world(**world_params)
+    table = session.load_module("mission_table")
+    loader = session.load_module("mission_loader")
+    loader.use_mission_table(table.MISSIONS)
+    if loader.get_mission(slot) is None:
+        raise ValueError(f"no mission in slot {slot}")
+    loader.RECORD_TRACE = True
+    loader.DUMP_TRACE_AFTER_RUN = True
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        loader.run_mission(slot)
+    blocks = find_traces(output.getvalue().splitlines())
+    if not blocks:
+        raise ValueError(f"slot {slot} dumped no complete trace")
+    return blocks[-1]
+
+
+def round_trip(**world_params):
+    """
+    Record and replay every mission_table.py slot.
+
+    Returns:
+        list: (slot, replay() report) per slot with a mission
+    """
+    session.new_world()
+    table = session.load_module("mission_table")
+    results = []
+    for slot, mission in enumerate(table.MISSIONS):
+        if mission is None:
+            continue
+        data = record(slot, **world_params)
+        with contextlib.redirect_stdout(io.StringIO()):
+            report = replay(data, slot=slot)
+        results.append((slot, report))
+    return results
+
+
+def _print_entry(entry, mark):
+    details = ", ".join(f"{key}={value}" for key, value in entry.items()
+                        if key not in ("problem", "segment", "index") and value is not None)
+    where = f"loop {entry['segment']}" if entry['segment'] is not None else "run"
+    if entry.get('index') is not None:
+        where += f" sample {entry['index']}"
+    print(f"  {mark} {where}: {entry['problem']}" + (f" ({details})" if details else ""))
+
+
+def print_report(report):
+    for entry in report['mismatches'][:PRINTED_MISMATCHES]:
+        _print_entry(entry, "✗")
+    for entry in report.get('notes', []):
+        _print_entry(entry, "⚠")
+    hidden = len(report['mismatches']) - PRINTED_MISMATCHES
+    if hidden > 0:
+        print(f"  ... {hidden} more")
+
+    status = "✓ Same commands" if report['match'] else "✗ Commands differ"
+    print(f"{status}: {report['loops']}/{report['recorded_loops']} loops, "
+          f"{report['samples']} iterations compared"
+          + (", hit the time limit" if report['timeout'] else ""))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a hub trace through robot.py")
+    parser.add_argument("log", nargs="?", help="hub output containing trace dumps")
+    parser.add_argument("module", nargs="?", help="hub program (default: mission_table.py)")
+    parser.add_argument("function", nargs="?", help="function that was recorded")
+    parser.add_argument("--slot", type=int, help="mission_table.py slot (default: from the trace)")
+    parser.add_argument("--run", type=int, default=0,
+                        help="which dump in the log, 1 = first (default: last)")
+    parser.add_argument("--profile", help="robot_config profile name")
+    parser.add_argument("--tolerance", type=int, default=COMMAND_TOLERANCE)
+    parser.add_argument("--round-trip", action="store_true",
+                        help="record every mission_table.py slot in the simulator and replay it")
+    args = parser.parse_args(argv)
+
+    if args.round_trip:
+        try:
+            results = round_trip(**ROUND_TRIP_WORLD)
+        except ValueError as e:
+            print(f"replay error: {e}", file=sys.stderr)
+            return 1
+        for slot, report in results:
+            print(f"Slot {slot}")
+            print_report(report)
+        failed = [slot for slot, report in results if not report['match']]
+        if failed:
+            print(f"✗ Round trip fails for slots {', '.join(map(str, failed))}")
+            return 2
+        print(f"✓ Round trip OK for all {len(results)} slots")
+        return 0
+    if not args.log:
+        parser.error("give a hub log (or --round-trip)")
+
+    if args.module and not args.function:
+        parser.error("give the function to run with the module")
+
+    with open(args.log, encoding="utf-8", errors="replace") as f:
+        blocks = find_traces(f)
+    if not blocks:
+        print("replay error: no complete trace found", file=sys.stderr)
+        return 1
+    if args.run > len(blocks):
+        print(f"replay error: the log has {len(blocks)} dumps", file=sys.stderr)
+        return 1
+    data = blocks[args.run - 1] if args.run else blocks[-1]
+
+    try:
+        report = replay(data, args.module, args.function, args.slot,
+                        tolerance=args.tolerance, profile=args.profile)
+    except ValueError as e:
+        print(f"replay error: {e}", file=sys.stderr)
+        return 1
+
+    print_report(report)
+    return 0 if report['match'] else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""
+Run a hub program in the simulator.
+
+Usage:
+    python -m simulator.run Missions_10_23 mission8_Silo
+    python -m simulator.run autotune --main --imu-delay 20 --motor-delay 20
+    python -m simulator.run robot test_movements --slip-left 0.03 --imu-noise 0.5
+
+The module name is a file in pybricks/ (with or without .py). With a
+function name, that function is called; with --main, the file runs as
+__main__ exactly like on the hub.
+"""
+
+import argparse
+import os
+import runpy
+
+from simulator import session
+from simulator.world import SimulationTimeout
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a Pybricks program in the simulator")
+    parser.add_argument("module", help="program in pybricks/ (e.g. Missions_10_23)")
+    parser.add_argument("function", nargs="?", help="function to call")
+    parser.add_argument("--main", action="store_true", help="run the file as __main__")
+    parser.add_argument("--profile", help="robot_config profile name")
+    parser.add_argument("--diameter-error", type=float, default=0.0)
+    parser.add_argument("--track-error", type=float, default=0.0)
+    parser.add_argument("--slip-left", type=float, default=0.0)
+    parser.add_argument("--slip-right", type=float, default=0.0)
+    parser.add_argument("--imu-noise", type=float, default=0.0)
+    parser.add_argument("--imu-drift", type=float, default=0.0)
+    parser.add_argument("--imu-delay", type=int, default=0, help="ms the heading lags behind")
+    parser.add_argument("--motor-delay", type=int, default=0, help="ms before a motor command acts")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--max-time", type=int, default=600000, help="ms of simulated time")
+    args = parser.parse_args(argv)
+
+    module = os.path.splitext(os.path.basename(args.module))[0]
+    world = session.new_world(
+        profile=args.profile,
+        diameter_error=args.diameter_error,
+        track_error=args.track_error,
+        slip_left=args.slip_left,
+        slip_right=args.slip_right,
+        imu_noise=args.imu_noise,
+        imu_drift=args.imu_drift,
+        imu_delay_ms=args.imu_delay,
+        motor_delay_ms=args.motor_delay,
+        seed=args.seed,
+        max_time_ms=args.max_time,
+    )
+
+    try:
+        if args.main or not args.function:
+            runpy.run_path(os.path.join(session.PYBRICKS_DIR, module + ".py"),
+                           run_name="__main__")
+        else:
+            result = getattr(session.load_module(module), args.function)()
+            print(f"\n[sim] {args.function}() returned {result!r}")
+    except SimulationTimeout as e:
+        print(f"\n[sim] stopped: {e}")
+
+    x, y, heading = world.pose()
+    print(f"[sim] time {world.time / 1000:.2f}s  pose x={x:.1f}mm y={y:.1f}mm heading={heading:.1f}°")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+SESSION - Running Hub Programs Against a Simulated World
+========================================================
+
+robot.py initializes its motors and drive base when it is imported, so every
+simulation run needs a fresh import. new_world() creates a World, makes it
+active and forgets every module loaded from pybricks/ so the next import
+connects to the new world.
+
+Example:
+    from simulator import session
+
+    session.new_world(slip_left=0.02, imu_noise=0.3, seed=1)
+    missions = session.load_module("Missions_10_23")
+    missions.mission8_Silo()
+    print(session.get_world().pose())
+"""
+
+import importlib
+import os
+import sys
+
+from simulator import world as world_module
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SIMULATOR_DIR = os.path.join(REPO_ROOT, "simulator")
+PYBRICKS_DIR = os.path.join(REPO_ROOT, "pybricks")
+
+
+def install_paths():
+    """Put the stand-in pybricks package and the hub programs on sys.path."""
+    for path in (PYBRICKS_DIR, SIMULATOR_DIR, REPO_ROOT):
+        if path in sys.path:
+            sys.path.remove(path)
+    # SIMULATOR_DIR first: its pybricks/ package shadows the hub folder name
+    sys.path[0:0] = [SIMULATOR_DIR, PYBRICKS_DIR, REPO_ROOT]
+
+
+def forget_hub_modules():
+    """Drop every module imported from pybricks/ so it re-initializes."""
+    prefix = PYBRICKS_DIR + os.sep
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None) or ""
+        if path.startswith(prefix):
+            del sys.modules[name]
+
+
+def new_world(profile=None, diameter_error=0.0, track_error=0.0, **params):
+    """
+    Create a fresh simulated world and make it active.
+
+    The TRUE robot geometry defaults to the selected profile's geometry.
+    diameter_error / track_error scale it (0.02 = real wheels 2% larger than
+    the profile says), which is what calibration is meant to find.
+
+    Args:
+        profile (str): robot_config profile name (None = ACTIVE_PROFILE)
+        diameter_error (float): Relative error of the profile wheel diameter
+        track_error (float): Relative error of the profile axle track
+        **params: Passed to World (slip, noise, start pose, lines, walls...)
+
+    Returns:
+        World: The new active world
+    """
+    install_paths()
+    forget_hub_modules()
+
+    robot_config = importlib.import_module("robot_config")
+    if profile is not None and not robot_config.select_profile(profile):
+        raise ValueError(f"unknown profile {profile!r}")
+    active = robot_config.get_profile()
+
+    params.setdefault("wheel_diameter", active.wheel_diameter * (1 + diameter_error))
+    params.setdefault("axle_track", active.axle_track * (1 + track_error))
+    return world_module.set_world(world_module.World(**params))
+
+
+def get_world():
+    """The active simulated world."""
+    return world_module.get_world()
+
+
+def load_module(name):
+    """Import a hub program module (e.g. "robot", "Missions_10_23")."""
+    install_paths()
+    return importlib.import_module(name)
+
+
+def run_function(module_name, function_name, *args, **world_params):
+    """
+    Run one function from a hub program in a fresh world.
+
+    Returns:
+        dict: {
+            'result': return value of the function,
+            'time_ms': simulated duration,
+            'pose': (x_mm, y_mm, heading_degrees) at the end,
+            'timeout': True if the run hit max_time_ms
+        }
+    """
+    world = new_world(**world_params)
+    module = load_module(module_name)
+    start = world.time
+    result = None
+    timeout = False
+    try:
+        result = getattr(module, function_name)(*args)
+    except world_module.SimulationTimeout:
+        timeout = True
+    return {
+        'result': result,
+        'time_ms': world.time - start,
+        'pose': world.pose(),
+        'timeout': timeout,
+    }
@@ -0,0 +1,314 @@
+"""
+SWEEP - Monte Carlo Robustness of Missions
+==========================================
+
+Runs a mission many times in the simulator, each time with a slightly
+different start and robot, and reports how much the end pose spreads and
+how often the mission misses:
+
+- Start pose: x/y offset (mm) and heading offset (degrees), normal
+- Wheel slip: per wheel, uniform from 0 to --slip
+- IMU: heading noise per read and a drift rate, per run
+
+A run fails if its end pose is more than --tolerance mm (or
+--heading-tolerance degrees) from the undisturbed run of the same mission
+at the normal speeds, or if it times out.
+
+With --speed-scale the DriveSpeed and TurnSpeed presets are multiplied by
+each factor in turn, and the fastest factor whose success rate stays at
+--target or above is named - how much faster the mission can go before it
+gets fragile.
+
+Runs are independent, so they are spread over all CPU cores with
+multiprocessing; every run has its own seed, so a sweep can be repeated
+exactly (--seed).
+
+Usage:
+    python -m simulator.sweep Missions_10_23 mission8_Silo -n 2000
+    python -m simulator.sweep Missions_10_23 -n 500                  # every mission in the file
+    python -m simulator.sweep Missions_10_23 mission8_Silo --speed-scale 0.8,1,1.2,1.4 --target 0.95
+    python -m simulator.sweep RickRoll missions3 --slip 0.05 --start-heading 2 --workers 4
+
+Created: 2026-10-19
+For: Finding fragile missions (and safe speed-ups) before an event does
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import math
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+from simulator import session
+from simulator.world import SimulationTimeout
+
+# Default disturbances (one standard deviation, or the maximum for slip)
+START_XY_MM = 3.0
+START_HEADING_DEG = 1.0
+SLIP = 0.03
+IMU_NOISE_DEG = 0.3
+IMU_DRIFT_DEG_S = 0.1
+
+TOLERANCE_MM = 20.0
+HEADING_TOLERANCE_DEG = 5.0
+TARGET_SUCCESS = 0.95
+
+# Simulated time limit per run
+MAX_TIME_MS = 120000
+
+SCALED_PRESETS = ("DriveSpeed", "TurnSpeed")
+
+# ============================================================================
+# ONE RUN
+# ============================================================================
+
+def disturbances(rng, spread):
+    """
+    World parameters for one run.
+
+    Args:
+        rng (random.Random): Source of randomness for this run
+        spread (dict): start_xy, start_heading, slip, imu_noise, imu_drift
+
+    Returns:
+        dict: Keyword arguments for session.new_world()
+    """
+    return {
+        'start_x': rng.gauss(0, spread['start_xy']),
+        'start_y': rng.gauss(0, spread['start_xy']),
+        'start_heading': rng.gauss(0, spread['start_heading']),
+        'slip_left': rng.uniform(0, spread['slip']),
+        'slip_right': rng.uniform(0, spread['slip']),
+        'imu_noise': spread['imu_noise'],
+        'imu_drift': rng.gauss(0, spread['imu_drift']),
+    }
+
+
+def scale_presets(scale):
+    """Multiply the DriveSpeed/TurnSpeed presets of the fresh robot_config."""
+    if scale == 1:
+        return
+    robot_config = importlib.import_module("robot_config")
+    for name in SCALED_PRESETS:
+        presets = getattr(robot_config, name)
+        for key, value in vars(presets).items():
+            if key.isupper() and isinstance(value, (int, float)):
+                setattr(presets, key, round(value * scale))
+
+
+def run_once(task):
+    """
+    Run one mission in a fresh world (worker entry point).
+
+    Args:
+        task (tuple): (module, function, world_params, speed_scale, seed)
+
+    Returns:
+        dict: {'pose': (x_mm, y_mm, heading_degrees) on the mat, 'time_ms', 'timeout'}
+    """
+    module, function, params, scale, seed = task
+    world = session.new_world(seed=seed, max_time_ms=MAX_TIME_MS, **params)
+    scale_presets(scale)
+    timeout = False
+    # robot.py and the missions print a lot; a sweep only wants the numbers
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            getattr(session.load_module(module), function)()
+        except SimulationTimeout:
+            timeout = True
+    # Absolute mat pose: a crooked start is exactly what should show up here
+    return {
+        'pose': world.pose(),
+        'time_ms': world.time,
+        'timeout': timeout,
+    }
+
+# ============================================================================
+# STATISTICS
+# ============================================================================
+
+def _std(values):
+    if len(values) < 2:
+        return 0.0
+    mean = sum(values) / len(values)
+    return math.sqrt(sum((v - mean) ** 2 for v in values) / (len(values) - 1))
+
+
+def _percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def wilson_interval(successes, runs, z=1.96):
+    """95% confidence interval of a success rate (Wilson score)."""
+    if runs == 0:
+        return (0.0, 1.0)
+    rate = successes / runs
+    center = (rate + z * z / (2 * runs)) / (1 + z * z / runs)
+    half = z * math.sqrt(rate * (1 - rate) / runs + z * z / (4 * runs * runs)) / (1 + z * z / runs)
+    return (max(0.0, center - half), min(1.0, center + half))
+
+
+def summarize(results, nominal, tolerance, heading_tolerance):
+    """
+    Spread and failure rate of one mission at one speed.
+
+    Args:
+        results (list): run_once() results
+        nominal (dict): run_once() result without disturbances
+        tolerance (float): Allowed end position error (mm)
+        heading_tolerance (float): Allowed end heading error (degrees)
+
+    Returns:
+        dict: runs, time_s, sd_x, sd_y, sd_heading, p95_error, failures,
+              success, success_low, success_high
+    """
+    nx, ny, nh = nominal['pose']
+    errors = []
+    failures = 0
+    for result in results:
+        x, y, heading = result['pose']
+        error = math.hypot(x - nx, y - ny)
+        errors.append(error)
+        if result['timeout'] or error > tolerance or abs(heading - nh) > heading_tolerance:
+            failures += 1
+    runs = len(results)
+    low, high = wilson_interval(runs - failures, runs)
+    return {
+        'runs': runs,
+        'time_s': sum(r['time_ms'] for r in results) / runs / 1000,
+        'sd_x': _std([r['pose'][0] for r in results]),
+        'sd_y': _std([r['pose'][1] for r in results]),
+        'sd_heading': _std([r['pose'][2] for r in results]),
+        'p95_error': _percentile(errors, 0.95),
+        'failures': failures,
+        'success': (runs - failures) / runs,
+        'success_low': low,
+        'success_high': high,
+    }
+
+# ============================================================================
+# SWEEP
+# ============================================================================
+
+def sweep(module, function, runs, spread, scales=(1,), seed=0, pool=None,
+          tolerance=TOLERANCE_MM, heading_tolerance=HEADING_TOLERANCE_DEG):
+    """
+    Monte Carlo runs of one mission at each speed scale.
+
+    Args:
+        module (str): Program in pybricks/ (e.g. "Missions_10_23")
+        function (str): Mission function
+        runs (int): Runs per speed scale
+        spread (dict): See disturbances()
+        scales (tuple): Speed preset factors
+        seed (int): Base seed (run i uses seed + i at every scale)
+        pool (multiprocessing.Pool): Workers (None = run here)
+
+    Returns:
+        list: (scale, summarize() dict) per scale
+    """
+    nominal = run_once((module, function, {}, 1, seed))
+    rng_params = []
+    for index in range(runs):
+        rng = random.Random(seed + index)
+        rng_params.append(disturbances(rng, spread))
+
+    summaries = []
+    for scale in scales:
+        tasks = [(module, function, params, scale, seed + index)
+                 for index, params in enumerate(rng_params)]
+        if pool is None:
+            results = [run_once(task) for task in tasks]
+        else:
+            results = pool.map(run_once, tasks, chunksize=max(1, runs // 32))
+        summaries.append((scale, summarize(results, nominal, tolerance, heading_tolerance)))
+    return summaries
+
+
+def fastest_safe(summaries, target):
+    """The (scale, summary) with the shortest time whose success is >= target, or None."""
+    safe = [(scale, summary) for scale, summary in summaries if summary['success'] >= target]
+    return min(safe, key=lambda item: item[1]['time_s']) if safe else None
+
+
+def print_sweep(module, function, summaries, target, seconds):
+    runs = summaries[0][1]['runs']
+    print(f"{module}.{function} ({runs} runs per speed, {seconds:.1f}s)")
+    print(f"  {'speed':>5} {'time':>7} {'sd x':>7} {'sd y':>7} {'sd hdg':>6} "
+          f"{'p95 err':>8} {'success':>8} {'95% interval':>15}")
+    for scale, s in summaries:
+        mark = "✓" if s['success'] >= target else "✗"
+        print(f"  {scale:>5.2f} {s['time_s']:6.2f}s {s['sd_x']:5.1f}mm {s['sd_y']:5.1f}mm "
+              f"{s['sd_heading']:5.1f}° {s['p95_error']:6.1f}mm {s['success'] * 100:7.1f}% "
+              f"({s['success_low'] * 100:5.1f}-{s['success_high'] * 100:5.1f}%) {mark}")
+    best = fastest_safe(summaries, target)
+    if best is None:
+        print(f"  ✗ no speed reaches {target * 100:.0f}% success")
+    elif len(summaries) > 1:
+        print(f"  ✓ fastest speed with >= {target * 100:.0f}% success: x{best[0]:.2f} "
+              f"({best[1]['time_s']:.2f}s)")
+
+
+def mission_functions(module):
+    """Every mission in a pybricks/ program (as tools/estimate_time.py finds them)."""
+    from tools.estimate_time import Module, Walker, mission_names
+    path = os.path.join(session.PYBRICKS_DIR, module + ".py")
+    return mission_names(Walker(Module.load(path)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo robustness of missions in the simulator")
+    parser.add_argument("module", help="program in pybricks/ (e.g. Missions_10_23)")
+    parser.add_argument("functions", nargs="*", help="missions (default: every mission in the file)")
+    parser.add_argument("-n", "--runs", type=int, default=1000, help="runs per mission and speed")
+    parser.add_argument("--speed-scale", default="1",
+                        help="comma-separated factors for the DriveSpeed/TurnSpeed presets")
+    parser.add_argument("--target", type=float, default=TARGET_SUCCESS,
+                        help=f"success rate to keep (default: {TARGET_SUCCESS})")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE_MM,
+                        help=f"allowed end position error in mm (default: {TOLERANCE_MM})")
+    parser.add_argument("--heading-tolerance", type=float, default=HEADING_TOLERANCE_DEG)
+    parser.add_argument("--start-xy", type=float, default=START_XY_MM, help="start offset sd (mm)")
+    parser.add_argument("--start-heading", type=float, default=START_HEADING_DEG,
+                        help="start heading sd (degrees)")
+    parser.add_argument("--slip", type=float, default=SLIP, help="maximum wheel slip fraction")
+    parser.add_argument("--imu-noise", type=float, default=IMU_NOISE_DEG)
+    parser.add_argument("--imu-drift", type=float, default=IMU_DRIFT_DEG_S, help="drift sd (deg/s)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="processes (default: one per CPU core)")
+    args = parser.parse_args(argv)
+
+    module = os.path.splitext(os.path.basename(args.module))[0]
+    try:
+        scales = tuple(float(s) for s in args.speed_scale.split(","))
+    except ValueError:
+        parser.error("--speed-scale takes numbers like 0.8,1,1.2")
+    functions = args.functions or mission_functions(module)
+    spread = {'start_xy': args.start_xy, 'start_heading': args.start_heading,
+              'slip': args.slip, 'imu_noise': args.imu_noise, 'imu_drift': args.imu_drift}
+
+    fragile = 0
+    with multiprocessing.Pool(max(1, args.workers)) as pool:
+        for function in functions:
+            started = time.time()
+            summaries = sweep(module, function, args.runs, spread, scales, args.seed, pool,
+                              args.tolerance, args.heading_tolerance)
+            print_sweep(module, function, summaries, args.target, time.time() - started)
+            if fastest_safe(summaries, args.target) is None:
+                fragile += 1
+    if fragile:
+        print(f"\n✗ {fragile} of {len(functions)} missions below {args.target * 100:.0f}% success")
+    return 1 if fragile else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,375 @@
+"""
+WORLD - Physics Model for the Host Simulator
+============================================
+
+A small 2D model of one robot on the mat, detailed enough to exercise the
+control loops in robot.py:
+
+- Motors with acceleration limits, speed/position/hold control and stall
+- Differential drive kinematics with per-wheel slip
+- IMU heading with noise, drift and delay
+- Motor command delay (the hub's control loop and the motor driver)
+- Mat lines (for color sensors) and walls (for ultrasonic sensors and pushing)
+- Simulated clock: wait() advances time instead of sleeping
+
+Coordinates: the robot starts at (start_x, start_y) facing +y. Heading is
+clockwise-positive in degrees, like hub.imu.heading().
+
+The stand-in pybricks package (simulator/pybricks/) talks to the single
+active World returned by get_world(). Use simulator.session to create a
+fresh world and re-import robot.py against it.
+"""
+
+import collections
+import math
+import random
+
+# ============================================================================
+# EXCEPTIONS
+# ============================================================================
+
+class SimulationTimeout(BaseException):
+    """
+    Raised when simulated time passes World.max_time_ms.
+
+    Derives from BaseException so the broad ``except Exception`` handlers in
+    robot.py cannot swallow it (e.g. a button menu waiting forever).
+    """
+
+# ============================================================================
+# MOTOR MODEL
+# ============================================================================
+
+class SimMotor:
+    """
+    One simulated motor.
+
+    Angles and speeds are in the user-facing direction (after Direction is
+    applied), so positive angle on a drive motor always means "forward".
+    """
+
+    def __init__(self, world, port, max_speed=1000, acceleration=4000, delay_steps=0):
+        self.world = world
+        self.port = port
+        self.max_speed = max_speed
+        self.acceleration = acceleration
+        # Commands take effect this many physics steps late
+        self.pending = collections.deque([0.0] * delay_steps)
+
+        self.angle = 0.0
+        self.speed = 0.0
+        self.mode = "coast"       # run, position, hold, coast, brake
+        self.target_speed = 0.0
+        self.target_angle = 0.0
+        self.limit_speed = 0.0
+        self.limits = (-360.0, 360.0)   # mechanical end stops (None for wheels)
+        self.stalled = False
+        self.external_load = 0
+
+        # Last commanded output (recorded for traces and replay)
+        self.command = 0.0
+
+    # --- Commands -----------------------------------------------------------
+
+    def run(self, speed):
+        self.mode = "run"
+        self.target_speed = max(-self.max_speed, min(self.max_speed, speed))
+
+    def run_to(self, target_angle, speed):
+        self.mode = "position"
+        self.target_angle = target_angle
+        self.limit_speed = min(abs(speed), self.max_speed)
+
+    def hold(self):
+        self.mode = "hold"
+        self.target_angle = self.angle
+        self.limit_speed = self.max_speed
+
+    def coast(self):
+        self.mode = "coast"
+
+    def brake(self):
+        self.mode = "brake"
+
+    # --- Physics ------------------------------------------------------------
+
+    def _commanded_speed(self):
+        if self.mode == "run":
+            return self.target_speed
+        if self.mode in ("position", "hold"):
+            error = self.target_angle - self.angle
+            # Decelerate so the motor can stop on target (trapezoid profile)
+            reachable = math.sqrt(2 * self.acceleration * abs(error))
+            magnitude = min(self.limit_speed, reachable, 20 * abs(error))
+            return math.copysign(magnitude, error)
+        return 0.0
+
+    def step(self, dt):
+        command = self._commanded_speed()
+        self.command = command
+        if self.pending:
+            self.pending.append(command)
+            command = self.pending.popleft()
+
+        # Coasting loses speed slower than active braking
+        accel = self.acceleration if self.mode != "coast" else self.acceleration / 2
+        delta = command - self.speed
+        limit = accel * dt
+        if delta > limit:
+            delta = limit
+        elif delta < -limit:
+            delta = -limit
+        self.speed += delta
+
+        new_angle = self.angle + self.speed * dt
+        self.stalled = False
+        if self.limits is not None:
+            low, high = self.limits
+            if new_angle < low or new_angle > high:
+                new_angle = max(low, min(high, new_angle))
+                self.speed = 0.0
+                self.stalled = True
+        self.angle = new_angle
+
+    def block(self):
+        """Called by the world when the robot is pushing against a wall."""
+        self.speed = 0.0
+        self.stalled = True
+
+    def load(self):
+        if self.stalled:
+            return 100
+        base = 8 + abs(self.speed) * 0.01
+        return int(min(100, base + self.external_load))
+
+    def done(self):
+        if self.mode in ("position", "hold"):
+            return abs(self.target_angle - self.angle) < 2 and abs(self.speed) < 30
+        if self.mode in ("coast", "brake"):
+            return abs(self.speed) < 1
+        return False
+
+# ============================================================================
+# WORLD
+# ============================================================================
+
+class World:
+    """
+    Simulated robot, mat and clock.
+
+    Args:
+        wheel_diameter (float): TRUE wheel diameter in mm
+        axle_track (float): TRUE axle track in mm
+        slip_left (float): Fraction of left wheel travel lost (0.02 = 2%)
+        slip_right (float): Fraction of right wheel travel lost
+        imu_noise (float): Std. deviation of heading noise per read (degrees)
+        imu_drift (float): Heading drift in degrees per second
+        imu_delay_ms (int): Age of the heading the IMU reports
+        motor_delay_ms (int): Time before a motor command takes effect
+        start_x, start_y (float): Start position in mm
+        start_heading (float): Start heading in degrees (clockwise positive)
+        lines (list): Dark mat bands as (y_min, y_max) tuples in mm
+        walls (list): Walls across the mat at these y positions in mm
+        sensor_offset (float): Distance from wheel axle to front sensors (mm)
+        battery_mv (int): Battery voltage reported by the hub
+        dt_ms (int): Physics step in milliseconds
+        max_time_ms (int): Raise SimulationTimeout after this much sim time
+        seed (int): Random seed for noise
+    """
+
+    def __init__(self, wheel_diameter=56, axle_track=96,
+                 slip_left=0.0, slip_right=0.0,
+                 imu_noise=0.0, imu_drift=0.0, imu_delay_ms=0, motor_delay_ms=0,
+                 start_x=0.0, start_y=0.0, start_heading=0.0,
+                 lines=None, walls=None, sensor_offset=60,
+                 battery_mv=8000, dt_ms=2, max_time_ms=600000, seed=None):
+        self.wheel_diameter = wheel_diameter
+        self.axle_track = axle_track
+        self.slip_left = slip_left
+        self.slip_right = slip_right
+        self.imu_noise = imu_noise
+        self.imu_drift = imu_drift
+        self.motor_delay_ms = motor_delay_ms
+        self.lines = list(lines or [])
+        self.walls = list(walls or [])
+        self.sensor_offset = sensor_offset
+        self.battery_mv = battery_mv
+        self.dt_ms = dt_ms
+        self.max_time_ms = max_time_ms
+        self.random = random.Random(seed)
+
+        # Pose
+        self.x = start_x
+        self.y = start_y
+        self.theta = math.radians(start_heading)
+        self.start_heading = start_heading
+        self.heading_offset = -start_heading
+        self.distance_traveled = 0.0
+        # Past headings (radians), oldest first, for the IMU delay
+        self.theta_history = collections.deque(
+            [self.theta] * (imu_delay_ms // dt_ms), maxlen=max(1, imu_delay_ms // dt_ms))
+
+        # Time in milliseconds
+        self.time = 0
+
+        # Devices
+        self.motors = {}
+        self.left = None
+        self.right = None
+
+        # Buttons: list of (start_ms, end_ms, frozenset(buttons))
+        self.button_presses = []
+
+        # Hub outputs (for inspection)
+        self.light = None
+        self.display = None
+        self.storage = bytearray(512)
+
+        # Optional observer called after every step: fn(world)
+        self.observers = []
+
+    # --- Devices ------------------------------------------------------------
+
+    def motor(self, port):
+        """Get (or create) the simulated motor on a port."""
+        motor = self.motors.get(port)
+        if motor is None:
+            motor = SimMotor(self, port, delay_steps=self.motor_delay_ms // self.dt_ms)
+            self.motors[port] = motor
+        return motor
+
+    def attach_drive(self, left, right):
+        """Mark two motors as the drive wheels."""
+        self.left = left
+        self.right = right
+        left.limits = None
+        right.limits = None
+
+    def press(self, buttons, at_ms, duration_ms=100):
+        """Schedule a button press (buttons: iterable of Button values)."""
+        self.button_presses.append((at_ms, at_ms + duration_ms, frozenset(buttons)))
+
+    def pressed_buttons(self):
+        pressed = set()
+        for start, end, buttons in self.button_presses:
+            if start <= self.time < end:
+                pressed |= buttons
+        return pressed
+
+    # --- Sensors ------------------------------------------------------------
+
+    def heading(self):
+        """IMU heading in degrees (clockwise positive, continuous)."""
+        value = math.degrees(self._imu_theta()) + self.heading_offset
+        value += self.imu_drift * self.time / 1000
+        if self.imu_noise:
+            value += self.random.gauss(0, self.imu_noise)
+        return value
+
+    def _imu_theta(self):
+        return self.theta_history[0] if self.theta_history else self.theta
+
+    def reset_heading(self, angle):
+        true_heading = math.degrees(self._imu_theta()) + self.imu_drift * self.time / 1000
+        self.heading_offset = angle - true_heading
+
+    def _sensor_point(self):
+        return (self.x + self.sensor_offset * math.sin(self.theta),
+                self.y + self.sensor_offset * math.cos(self.theta))
+
+    def reflection(self):
+        """Reflection (0-100) seen by a downward color sensor at the front."""
+        _, y = self._sensor_point()
+        for y_min, y_max in self.lines:
+            if y_min <= y <= y_max:
+                return 10
+        return 90
+
+    def ultrasonic_distance(self):
+        """Distance (mm) from the front sensor to the nearest wall ahead."""
+        _, y = self._sensor_point()
+        facing = math.cos(self.theta)
+        if facing < 0.3:
+            return 2000
+        best = 2000
+        for wall_y in self.walls:
+            if wall_y >= y:
+                best = min(best, (wall_y - y) / facing)
+        return int(best)
+
+    # --- Time ---------------------------------------------------------------
+
+    def advance(self, ms):
+        """Advance simulated time by at least ms milliseconds."""
+        steps = max(1, int(math.ceil(ms / self.dt_ms))) if ms > 0 else 1
+        for _ in range(steps):
+            self.step()
+
+    def step(self):
+        dt = self.dt_ms / 1000
+        for motor in self.motors.values():
+            motor.step(dt)
+
+        if self.left is not None and self.right is not None:
+            self._move_robot()
+        if self.theta_history:
+            self.theta_history.append(self.theta)
+
+        self.time += self.dt_ms
+        for observer in self.observers:
+            observer(self)
+
+        if self.time > self.max_time_ms:
+            raise SimulationTimeout(f"simulation exceeded {self.max_time_ms}ms")
+
+    def _move_robot(self):
+        dt = self.dt_ms / 1000
+        mm_per_degree = math.pi * self.wheel_diameter / 360
+        d_left = self.left.speed * dt * mm_per_degree * (1 - self.slip_left)
+        d_right = self.right.speed * dt * mm_per_degree * (1 - self.slip_right)
+
+        d = (d_left + d_right) / 2
+        d_theta = (d_left - d_right) / self.axle_track
+
+        theta = self.theta + d_theta / 2
+        new_x = self.x + d * math.sin(theta)
+        new_y = self.y + d * math.cos(theta)
+
+        # Walls stop forward motion and stall the wheels
+        front = new_y + self.sensor_offset * math.cos(theta)
+        for wall_y in self.walls:
+            if d > 0 and front >= wall_y:
+                self.left.block()
+                self.right.block()
+                self.theta += d_theta
+                return
+
+        self.x = new_x
+        self.y = new_y
+        self.theta += d_theta
+        self.distance_traveled += abs(d)
+
+    # --- Reporting ----------------------------------------------------------
+
+    def pose(self):
+        """Current pose as (x_mm, y_mm, heading_degrees)."""
+        return (self.x, self.y, math.degrees(self.theta))
+
+
+# ============================================================================
+# ACTIVE WORLD
+# ============================================================================
+
+_world = World()
+
+
+def get_world():
+    """The world the stand-in pybricks modules are connected to."""
+    return _world
+
+
+def set_world(world):
+    """Replace the active world (use simulator.session.new_world())."""
+    global _world
+    _world = world
+    return world
@@ -0,0 +1,529 @@
+"""
+SPIKE MOTION - Shared Motion Library for SPIKE App Robots
+=========================================================
+
+One copy of the drive, turn, arm and line-squaring primitives for the
+robots programmed with the SPIKE app (hub / motor / motor_pair / runloop),
+replacing the copies pasted into each program in aadhir/, tamil/, joshua/
+and Shay/.
+
+The SPIKE app runs one file per slot and cannot import other files, so a
+program imports this library and tools/build_spike_program.py turns it into
+a single upload holding only the library code that program uses:
+
+    ROBOT = "aadhir"            # which chassis, see ROBOTS
+    from motion import *
+
+    python -m tools.build_spike_program aadhir/code_2025_march_23.py
+
+Units: distances in cm, velocities in motor degrees per second, angles in
+degrees (positive = clockwise).
+
+Created: 2026-10-19
+For: SPIKE app teams sharing one set of tuned primitives
+"""
+
+from hub import port, motion_sensor, button
+import motor
+import motor_pair
+import color_sensor
+import color
+import runloop
+import math
+import time
+
+# ============================================================================
+# ROBOTS
+# ============================================================================
+
+# Selected robot (set from the program's ROBOT line by the build tool)
+ROBOT = "aadhir"
+
+# Measure your own robot! Wheel circumference and wheel distance in cm.
+ROBOTS = {
+    # 56mm wheels, drive A/B, color sensors E/F for squaring on lines
+    "aadhir": {
+        'wheel_circumference': 17.6,
+        'distance_between_wheels': 9.6,
+        'left_drive': port.A, 'right_drive': port.B,
+        'front_arm': port.D, 'back_arm': port.C,
+        'left_sensor': port.E, 'right_sensor': port.F,
+        'velocity': 1000, 'turn_velocity': 200,
+        'arm_acceleration': 100,
+        'gyro_gain': 2, 'gyro_gain_backward': 2,
+        'pivot_steering': 50,
+    },
+    # aadhir's March programs: turns tuned at 100 deg/s, arms without a ramp
+    "aadhir_march": {
+        'wheel_circumference': 17.6,
+        'distance_between_wheels': 9.6,
+        'left_drive': port.A, 'right_drive': port.B,
+        'front_arm': port.D, 'back_arm': port.C,
+        'left_sensor': port.E, 'right_sensor': port.F,
+        'velocity': 1000, 'turn_velocity': 100,
+        'arm_acceleration': 1000,
+        'gyro_gain': 2, 'gyro_gain_backward': 2,
+        'pivot_steering': 50,
+    },
+    # Same chassis as aadhir
+    "tamil": {
+        'wheel_circumference': 17.6,
+        'distance_between_wheels': 9.6,
+        'left_drive': port.A, 'right_drive': port.B,
+        'front_arm': port.D, 'back_arm': port.C,
+        'left_sensor': port.E, 'right_sensor': port.F,
+        'velocity': 1000, 'turn_velocity': 200,
+        'arm_acceleration': 100,
+        'gyro_gain': 2, 'gyro_gain_backward': 2,
+        'pivot_steering': 50,
+    },
+    # tamil's March programs: turns tuned at 100 deg/s
+    "tamil_march": {
+        'wheel_circumference': 17.6,
+        'distance_between_wheels': 9.6,
+        'left_drive': port.A, 'right_drive': port.B,
+        'front_arm': port.D, 'back_arm': port.C,
+        'left_sensor': port.E, 'right_sensor': port.F,
+        'velocity': 1000, 'turn_velocity': 100,
+        'arm_acceleration': 100,
+        'gyro_gain': 2, 'gyro_gain_backward': 2,
+        'pivot_steering': 50,
+    },
+    # 56mm wheels, drive B/F, arms A (left) and E (right), no color sensors
+    "joshua": {
+        'wheel_circumference': 17.5,
+        'distance_between_wheels': 9.7,
+        'left_drive': port.B, 'right_drive': port.F,
+        'front_arm': port.A, 'back_arm': port.E,
+        'left_sensor': None, 'right_sensor': None,
+        'velocity': 360, 'turn_velocity': 75,
+        'arm_acceleration': 1000,
+        'gyro_gain': 2, 'gyro_gain_backward': 2,
+        'pivot_steering': 50,
+    },
+    # 88mm wheels, drive A/C
+    "shay": {
+        'wheel_circumference': 8.8 * math.pi,
+        'distance_between_wheels': 11.35,
+        'left_drive': port.A, 'right_drive': port.C,
+        'front_arm': port.D, 'back_arm': port.B,
+        'left_sensor': None, 'right_sensor': None,
+        'velocity': 500, 'turn_velocity': 100,
+        'arm_acceleration': 1000,
+        'gyro_gain': 2, 'gyro_gain_backward': 2,
+        # Shay's missions were tuned with steering 100 (both wheels, a spin)
+        'pivot_steering': 100,
+    },
+}
+
+_robot = ROBOTS[ROBOT]
+WHEEL_CIRCUMFERENCE = _robot['wheel_circumference']
+DISTANCE_BETWEEN_WHEELS = _robot['distance_between_wheels']
+LEFT_DRIVE_PORT = _robot['left_drive']
+RIGHT_DRIVE_PORT = _robot['right_drive']
+FRONT_MOTOR_PORT = _robot['front_arm']
+BACK_MOTOR_PORT = _robot['back_arm']
+LEFT_SENSOR_PORT = _robot['left_sensor']
+RIGHT_SENSOR_PORT = _robot['right_sensor']
+default_velocity = _robot['velocity']
+default_turn_velocity = _robot['turn_velocity']
+ARM_ACCELERATION = _robot['arm_acceleration']
+
+# Gyro correction gains for move_for_distance_gyro (forward and backward are tuned separately)
+GYRO_GAIN = _robot['gyro_gain']
+GYRO_GAIN_BACKWARD = _robot['gyro_gain_backward']
+
+# move_for_distance_gyro loop: 100 Hz corrections, then a slowdown into the target
+GYRO_PERIOD_MS = 10
+GYRO_DECELERATION = 1000    # wheel degrees/second^2
+GYRO_MIN_VELOCITY = 100     # wheel degrees/second at the very end
+
+# spin_turn PD loop: wheel speed = SPIN_KP * error - SPIN_KD * turn rate
+SPIN_PERIOD_MS = 10
+SPIN_KP = 6                 # wheel degrees/second per degree of heading error
+SPIN_KD = 0.3               # wheel degrees/second per degree/second of turning
+SPIN_MIN_VELOCITY = 40      # slowest wheel speed that still turns the robot
+SPIN_TOLERANCE = 1          # degrees
+
+PIVOT_CIRCUMFERENCE = 2 * DISTANCE_BETWEEN_WHEELS * math.pi
+PIVOT_STEERING = _robot['pivot_steering']     # 50 = one wheel stopped, 100 = spin
+
+# Squaring on lines: reflection thresholds, polling and the two approach speeds
+LINE_EDGE_REFLECTION = 98   # at or below: the sensor has left the white mat
+WHITE_REFLECTION = 95       # at or above: the sensor is on white
+SQUARE_PERIOD_MS = 5
+SQUARE_FAST_VELOCITY = 200
+SQUARE_SLOW_VELOCITY = 50
+SQUARE_BACKOFF_DEGREES = 40
+
+# Arm speed names used by the programs ("fast" and "high" are the same)
+ARM_SPEEDS = {"slow": 360, "medium": 640, "fast": 1000, "high": 1000}
+
+motor_pair.pair(motor_pair.PAIR_1, LEFT_DRIVE_PORT, RIGHT_DRIVE_PORT)
+drive_motor_pair = motor_pair.PAIR_1
+
+
+# ============================================================================
+# DRIVING
+# ============================================================================
+
+async def _wait_period(deadline, period_ms):
+    """
+    Sleep until one period after deadline (for fixed-rate control loops).
+
+    Returns:
+        int: The next deadline (restarts from now after an overrun)
+    """
+    deadline = time.ticks_add(deadline, period_ms)
+    wait = time.ticks_diff(deadline, time.ticks_ms())
+    if wait > 0:
+        await runloop.sleep_ms(wait)
+        return deadline
+    return time.ticks_ms()
+
+
+def cancel_token():
+    """A token for race(cancel=...): the moves given the same token stop when the race ends."""
+    return [False]
+
+
+def _cancelled(cancel):
+    return cancel is not None and cancel[0]
+
+
+def convert_distance_to_degree(distance_cm):
+    """Wheel degrees for a distance in cm (add a gear ratio here if needed)."""
+    return int((distance_cm / WHEEL_CIRCUMFERENCE) * 360)
+
+
+def move_for_distance(distance_cm, velocity=default_velocity):
+    """Drive straight on the encoders (negative = backward). Awaitable."""
+    degrees = convert_distance_to_degree(distance_cm)
+    return motor_pair.move_for_degrees(drive_motor_pair, degrees, 0, velocity=velocity,
+                                       acceleration=1000, stop=motor.SMART_BRAKE)
+
+
+async def move_for_distance_gyro(distance_cm, velocity=default_velocity, cancel=None):
+    """
+    Drive straight holding the heading with the gyro.
+
+    Corrects every GYRO_PERIOD_MS and slows down over the last encoder
+    degrees, so full speed still stops on the target.
+
+    Args:
+        distance_cm (float): Distance in cm (negative = backward)
+        velocity (int): Wheel speed in degrees/second
+        cancel (list): cancel_token() of a race() to stop with
+    """
+    motion_sensor.reset_yaw(0)
+    await runloop.until(motion_sensor.stable)
+
+    target_degrees = abs(convert_distance_to_degree(distance_cm))
+
+    # Backward uses the same loop with its own gain.
+    # Steering turns the robot the other way when the wheels run backward,
+    # so the correction sign is flipped too.
+    if distance_cm < 0:
+        direction = -1
+        gain = GYRO_GAIN_BACKWARD
+    else:
+        direction = 1
+        gain = GYRO_GAIN
+
+    motor.reset_relative_position(LEFT_DRIVE_PORT, 0)
+    motor.reset_relative_position(RIGHT_DRIVE_PORT, 0)
+
+    deadline = time.ticks_ms()
+    while True:
+        current_left = abs(motor.relative_position(LEFT_DRIVE_PORT))
+        current_right = abs(motor.relative_position(RIGHT_DRIVE_PORT))
+        remaining = target_degrees - (current_left + current_right) / 2
+        if remaining <= 0 or _cancelled(cancel):
+            motor_pair.stop(drive_motor_pair, stop=motor.SMART_BRAKE)
+            break
+
+        # Slow down so the robot can still stop in the remaining distance
+        # (v = sqrt(2 * a * d)), never below the creep speed
+        speed = min(velocity, max(GYRO_MIN_VELOCITY,
+                                  int(math.sqrt(2 * GYRO_DECELERATION * remaining))))
+        # The motor ramp would lag behind the slowdown, so only ramp at full speed
+        acceleration = 1000 if speed >= velocity else 10000
+
+        error = motion_sensor.tilt_angles()[0] * -0.1
+        correction = int(error * -gain) * direction
+        motor_pair.move(drive_motor_pair, correction,
+                        velocity=int(math.copysign(speed, distance_cm)),
+                        acceleration=acceleration)
+
+        deadline = await _wait_period(deadline, GYRO_PERIOD_MS)
+
+# ============================================================================
+# TURNING
+# ============================================================================
+
+async def pivot_turn(robot_degrees, velocity=default_turn_velocity):
+    """Turn around one stopped wheel (positive = clockwise)."""
+    motor_degrees = int((PIVOT_CIRCUMFERENCE / WHEEL_CIRCUMFERENCE) * abs(robot_degrees))
+    steering = PIVOT_STEERING if robot_degrees > 0 else -PIVOT_STEERING
+    await motor_pair.move_for_degrees(drive_motor_pair, motor_degrees, steering, velocity=velocity)
+
+
+async def spin_turn(degrees, velocity=default_turn_velocity, cancel=None):
+    """
+    Turn in place with the gyro (positive = clockwise, any angle).
+
+    A PD loop on the heading error: full velocity far from the target,
+    slowing down near it and turning back after an overshoot. The yaw is
+    unwrapped, so turns past 180 degrees need no special cases.
+
+    Args:
+        degrees (float): Robot degrees to turn
+        velocity (int): Highest wheel speed in degrees/second
+        cancel (list): cancel_token() of a race() to stop with
+    """
+    motion_sensor.reset_yaw(0)
+    await runloop.until(motion_sensor.stable)
+
+    turned = 0.0        # heading since the start, continues past +-180
+    last_yaw = 0.0
+    last_turned = 0.0
+    last_time = deadline = time.ticks_ms()
+    while True:
+        yaw = motion_sensor.tilt_angles()[0] * -0.1
+        # The yaw jumps by 360 where it wraps at +-180
+        step = yaw - last_yaw
+        if step > 180:
+            step -= 360
+        elif step < -180:
+            step += 360
+        turned += step
+        last_yaw = yaw
+
+        error = degrees - turned
+        if abs(error) <= SPIN_TOLERANCE or _cancelled(cancel):
+            break
+
+        now = time.ticks_ms()
+        dt = time.ticks_diff(now, last_time)
+        rate = (turned - last_turned) * 1000 / dt if dt > 0 else 0
+        last_turned = turned
+        last_time = now
+
+        # Negative command = turn back (overshoot, or braking from the D term)
+        command = SPIN_KP * error - SPIN_KD * rate
+        speed = min(velocity, max(SPIN_MIN_VELOCITY, int(abs(command))))
+        motor_pair.move(drive_motor_pair, 100 if command >= 0 else -100, velocity=speed)
+        deadline = await _wait_period(deadline, SPIN_PERIOD_MS)
+
+    motor_pair.stop(drive_motor_pair, stop=motor.SMART_BRAKE)
+
+
+async def turn_left(degrees, velocity=default_turn_velocity):
+    await spin_turn(-abs(degrees), velocity)
+
+
+async def turn_right(degrees, velocity=default_turn_velocity):
+    await spin_turn(abs(degrees), velocity)
+
+# ============================================================================
+# ARMS
+# ============================================================================
+
+async def move_arm(degree, direction, arm, speed="slow"):
+    """
+    Turn an arm motor.
+
+    Args:
+        degree (int): Motor degrees
+        direction (str): "up" (positive degrees) or "down"
+        arm (int): Motor port
+        speed (str/int): "slow", "medium" or "fast" (see ARM_SPEEDS), or degrees/second
+    """
+    degree = abs(degree) if direction == "up" else -abs(degree)
+    if isinstance(speed, int):
+        velocity = speed
+    else:
+        velocity = ARM_SPEEDS.get(speed, ARM_SPEEDS["slow"])
+    await motor.run_for_degrees(arm, degree, velocity, acceleration=ARM_ACCELERATION)
+
+
+async def move_front_arm(degree, direction, speed="slow"):
+    await move_arm(degree, direction, FRONT_MOTOR_PORT, speed)
+
+
+async def move_back_arm(degree, direction, speed="slow"):
+    await move_arm(degree, direction, BACK_MOTOR_PORT, speed)
+
+
+async def reset_back_arm():
+    await motor.run_to_relative_position(BACK_MOTOR_PORT, 20, 500)
+
+# ============================================================================
+# SQUARING ON LINES (two color sensors in front of the drive wheels)
+# ============================================================================
+
+def _off_white(sensor_port):
+    return color_sensor.reflection(sensor_port) <= LINE_EDGE_REFLECTION
+
+
+def _on_white(sensor_port):
+    return color_sensor.reflection(sensor_port) >= WHITE_REFLECTION
+
+
+def _off_red(sensor_port):
+    # Red needs the color; the other checks read the reflection only
+    return color_sensor.color(sensor_port) != color.RED
+
+
+async def _square_pass(found, velocity, cancel=None):
+    """Drive forward until each wheel's sensor finds the line, stopping that wheel at once."""
+    # The left motor is mirrored, so forward is negative on it
+    motor.run(LEFT_DRIVE_PORT, -velocity)
+    motor.run(RIGHT_DRIVE_PORT, velocity)
+    left_moving = right_moving = True
+    deadline = time.ticks_ms()
+    while left_moving or right_moving:
+        if _cancelled(cancel):
+            motor.stop(LEFT_DRIVE_PORT, stop=motor.HOLD)
+            motor.stop(RIGHT_DRIVE_PORT, stop=motor.HOLD)
+            return
+        if left_moving and found(LEFT_SENSOR_PORT):
+            motor.stop(LEFT_DRIVE_PORT, stop=motor.HOLD)
+            left_moving = False
+        if right_moving and found(RIGHT_SENSOR_PORT):
+            motor.stop(RIGHT_DRIVE_PORT, stop=motor.HOLD)
+            right_moving = False
+        deadline = await _wait_period(deadline, SQUARE_PERIOD_MS)
+
+
+async def square_on_line(found, passes=2, velocity=SQUARE_FAST_VELOCITY, cancel=None):
+    """
+    Square the robot on a line with the two color sensors.
+
+    The first pass approaches at velocity; every further pass backs off
+    SQUARE_BACKOFF_DEGREES and comes in again at SQUARE_SLOW_VELOCITY,
+    so the final stop is both quick and tight.
+
+    Args:
+        found (function): found(sensor_port) -> True once that sensor is on the line
+        passes (int): Number of approaches (1 = a single pass at velocity)
+        velocity (int): Wheel speed of the first pass in degrees/second
+        cancel (list): cancel_token() of a race() to stop with
+    """
+    await _square_pass(found, velocity, cancel)
+    for _ in range(passes - 1):
+        if _cancelled(cancel):
+            return
+        await motor_pair.move_for_degrees(drive_motor_pair, -SQUARE_BACKOFF_DEGREES, 0,
+                                          velocity=velocity)
+        await _square_pass(found, min(velocity, SQUARE_SLOW_VELOCITY), cancel)
+
+
+async def align_robot_on_black(passes=2, velocity=SQUARE_FAST_VELOCITY, cancel=None):
+    await square_on_line(_off_white, passes, velocity, cancel)
+
+
+async def align_robot_on_red(passes=1, velocity=10, cancel=None):
+    # Creep off the red patch (the first 6 cm are driven blind)
+    await move_for_distance(6, velocity=100)
+    await square_on_line(_off_red, passes, velocity, cancel)
+
+
+async def align_robot_on_white(passes=2, velocity=SQUARE_FAST_VELOCITY, cancel=None):
+    await square_on_line(_on_white, passes, velocity, cancel)
+
+# ============================================================================
+# RUNNING MOVES TOGETHER
+# ============================================================================
+#
+#     await together(move_for_distance(40), move_front_arm(90, "up"))
+#     await race(move_for_distance(60), runloop.sleep_ms(2000), stop_drive=True)
+#     stop = cancel_token()
+#     await race(move_for_distance_gyro(60, cancel=stop), align_robot_on_black(cancel=stop),
+#                cancel=stop)
+#     await together(move_for_distance(40), after(500, move_back_arm, 120, "down"))
+#
+# Motor calls start moving when they are called, not when awaited, so
+# after() takes the function and its arguments instead of a call.
+
+async def together(*moves):
+    """
+    Run moves at the same time and wait until all of them are done.
+
+    Args:
+        *moves: Awaitables (async function calls, motor moves, sleeps)
+    """
+    finished = [0]
+
+    async def run(move):
+        try:
+            await move
+        finally:
+            # A move that raised is done too, or together() would never return
+            finished[0] += 1
+
+    runloop.run(*[run(move) for move in moves])
+    await runloop.until(lambda: finished[0] == len(moves))
+
+
+async def race(*moves, stop_drive=False, stop_ports=(), cancel=None):
+    """
+    Run moves at the same time until the first one is done.
+
+    The control loops in this file (move_for_distance_gyro, spin_turn and
+    the line squaring) keep running unless they were given this race's
+    cancel token: then they stop at their next period, with their motors
+    stopped. Moves with another token, or none (e.g. in a together()
+    around this race), are not touched. Plain motor moves cannot be
+    cancelled: stop their motors with stop_drive and stop_ports, which also
+    ends the moves.
+
+    Args:
+        *moves: Awaitables
+        stop_drive (bool): Stop the drive motors afterwards
+        stop_ports (list): Other motor ports to stop afterwards
+        cancel (list): cancel_token() given to the moves to stop afterwards
+
+    Returns:
+        int: Index of the move that finished first
+    """
+    winner = [-1]
+
+    async def run(index, move):
+        try:
+            await move
+        finally:
+            if winner[0] < 0:
+                winner[0] = index
+
+    runloop.run(*[run(index, move) for index, move in enumerate(moves)])
+    await runloop.until(lambda: winner[0] >= 0)
+    if cancel is not None:
+        cancel[0] = True
+    if stop_drive:
+        motor_pair.stop(drive_motor_pair)
+    for motor_port in stop_ports:
+        motor.stop(motor_port)
+    return winner[0]
+
+
+async def after(delay_ms, function, *args, **kwargs):
+    """
+    Start function(*args, **kwargs) after delay_ms and wait for it.
+
+    Use inside together() to start an arm partway through a drive.
+    """
+    await runloop.sleep_ms(delay_ms)
+    result = function(*args, **kwargs)
+    if result is not None:
+        result = await result
+    return result
+
+# ============================================================================
+# BUTTONS
+# ============================================================================
+
+def wait_for_button():
+    """Block until the right button is pressed (for stepping through a run)."""
+    while not button.pressed(button.RIGHT):
+        pass
@@ -0,0 +1,29 @@
+"""
+Host-side tests for the tools, the simulator and the pure functions of the
+hub code. Run from the repository root:
+
+    python -m pytest -q
+"""
+
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from simulator import session  # noqa: E402  (needs REPO_ROOT on sys.path)
+
+
+@pytest.fixture
+def hub():
+    """
+    A fresh simulated world. Returns session.load_module, so a test imports
+    pybricks/ modules (robot, telemetry, ...) against the stand-in pybricks
+    package: robot = hub("robot").
+    """
+    session.new_world()
+    yield session.load_module
+    session.forget_hub_modules()
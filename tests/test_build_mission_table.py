@@ -0,0 +1,43 @@
+import os
+
+from tools import build_mission_table as bmt
+
+
+def _table():
+    missions = []
+    for path in bmt.DEFAULT_SOURCES:
+        missions.extend(bmt.read_missions(path))
+    return bmt.build_table(missions)
+
+
+def test_generated_files_are_up_to_date():
+    # pybricks/mission_table.py and gen_*.py are committed: a mission edited
+    # without a rebuild must fail here
+    problems = bmt.out_of_date(_table(), list(bmt.DEFAULT_SOURCES), bmt.DEFAULT_OUTPUT)
+    assert problems == [], "run: python -m tools.build_mission_table"
+
+
+def test_check_reports_a_changed_table(tmp_path):
+    output = tmp_path / "mission_table.py"
+    output.write_text("MISSIONS = ()\n", encoding="utf-8")
+    problems = bmt.out_of_date(_table(), list(bmt.DEFAULT_SOURCES), str(output))
+    assert (str(output), "differs") in problems
+
+
+def test_annotations_are_copied_into_the_table():
+    table = _table()
+    angler = table[0]
+    assert angler.function == "mission_01_angler_artifacts"
+    assert (angler.start_zone, angler.end_zone) == ("left", "left")
+    assert angler.estimated_ms == 25000
+    assert angler.duration_ms is None
+    text = bmt.render_table(table, list(bmt.DEFAULT_SOURCES))
+    assert '"left", "left", None, 25000, None, None),  # slot 0' in text
+
+
+def test_mission_module_holds_only_its_mission():
+    table = _table()
+    modules = bmt.mission_modules(table, bmt.PYBRICKS_DIR)
+    text = modules[os.path.join(bmt.PYBRICKS_DIR, "gen_mission_02_tip_scales.py")]
+    assert "def mission_02_tip_scales" in text
+    assert "def mission_01_angler_artifacts" not in text
@@ -0,0 +1,118 @@
+import os
+
+import pytest
+
+from tools import build_missions as bm
+
+EXAMPLE = """\
+robot joshua
+
+# Boulder - align at square 3
+#
+mission boulder
+    straight 650 pushing        # gyro straight
+    arm left up 90 delicate &
+    turn -45 300
+    pivot 30.5
+    sync
+    wait 200
+
+# Not a comment of the next mission (blank line in between)
+
+mission back_home
+    straight -650
+    arm right down 45 &
+"""
+
+
+@pytest.fixture(scope="module")
+def presets():
+    return bm.read_presets()
+
+
+def test_parse_steps(presets):
+    robot, missions = bm.parse_missions(EXAMPLE, "example.mission", presets)
+    assert robot == "joshua"
+    assert [m.name for m in missions] == ["boulder", "back_home"]
+
+    boulder = missions[0]
+    assert boulder.comment == ["Boulder - align at square 3", ""]
+    assert [step['op'] for step in boulder.steps] == ["straight", "arm", "turn", "pivot",
+                                                      "sync", "wait"]
+    straight, arm, turn, pivot, _, wait = boulder.steps
+    assert straight['distance'] == 650
+    assert straight['speed'] == ("DriveSpeed", "PUSHING", presets['DriveSpeed']['pushing'])
+    assert (arm['arm'], arm['direction'], arm['degrees'], arm['background']) == (
+        "left", "up", 90, True)
+    assert turn['angle'] == -45 and turn['speed'] == 300
+    assert pivot['angle'] == 30.5 and pivot['speed'] is None
+    assert wait['ms'] == 200
+    assert missions[1].comment == []
+
+
+def test_pybricks_output(presets):
+    _, missions = bm.parse_missions(EXAMPLE, "example.mission", presets)
+    text = bm.generate_pybricks(missions, "missions/example.mission")
+    assert text.startswith(f"# {bm.GENERATED} from missions/example.mission")
+    assert "    move_straight_gyro(650, DriveSpeed.PUSHING)\n" in text
+    assert "    left_arm_up(90, ArmSpeed.DELICATE, blocking=False)\n" in text
+    assert "    spin_turn(-45, 300)\n" in text
+    assert "    pivot_turn(30.5)\n" in text
+    assert "    wait_for_arms()\n    wait(200)\n" in text
+    # An arm still running at the end of a mission is waited for
+    assert text.endswith("    right_arm_down(45, blocking=False)\n    wait_for_arms()\n")
+    compile(text, "example.py", "exec")
+
+
+def test_spike_units():
+    units = bm.SpikeUnits(wheel_circumference=17.6, distance_between_wheels=11.2)
+    assert units.distance(655) == 65.5
+    assert units.drive_velocity(176) == 360
+    assert units.drive_velocity(5000) == bm.SPIKE_MAX_VELOCITY
+    # A 90 deg/s spin moves each wheel a quarter of the 11.2 cm wheel-base circle per second
+    assert units.turn_velocity(90) == round(90 * 3.141592653589793 * 11.2 / 17.6)
+
+
+def test_spike_output_runs_background_arms_together(presets):
+    _, missions = bm.parse_missions(EXAMPLE, "example.mission", presets)
+    units = bm.SpikeUnits(17.6, 11.2)
+    text = bm.generate_spike(missions[0], "joshua", units, "missions/example.mission")
+    assert 'ROBOT = "joshua"\nfrom motion import *\n' in text
+    assert "    async def leg_1():\n" in text
+    assert "        await spin_turn(-45, " in text
+    assert "    await together(move_front_arm(90, \"up\", " in text
+    assert ", leg_1())\n    await runloop.sleep_ms(200)\n" in text
+    assert text.endswith("runloop.run(boulder())\n")
+    compile(text, "boulder.py", "exec")
+
+
+@pytest.mark.parametrize("line, message", [
+    ("    straight ten", "example.mission:2: distance must be a number, got 'ten'"),
+    ("    straight 100 warp", "example.mission:2: unknown DriveSpeed preset 'warp'"),
+    ("    turn 90 &", "example.mission:2: only arm steps can run in the background"),
+    ("    arm middle up 90", "example.mission:2: arm needs left/right and up/down"),
+    ("    jump 3", "example.mission:2: cannot read 'jump 3'"),
+])
+def test_errors_name_the_line(presets, line, message):
+    with pytest.raises(ValueError) as error:
+        bm.parse_missions(f"mission broken\n{line}\n", "example.mission", presets)
+    assert str(error.value).startswith(message)
+
+
+def test_steps_need_a_mission(presets):
+    with pytest.raises(ValueError, match="before the first 'mission'"):
+        bm.parse_missions("straight 100\n", "example.mission", presets)
+
+
+def test_committed_pybricks_files_are_current(presets):
+    # pybricks/<name>.py is generated from missions/<name>.mission
+    folder = os.path.join(bm.REPO_ROOT, "missions")
+    for name in sorted(os.listdir(folder)):
+        if not name.endswith(".mission"):
+            continue
+        path = os.path.join(folder, name)
+        _, missions = bm.load_missions(path, presets)
+        output = os.path.join(bm.PYBRICKS_DIR, os.path.splitext(name)[0] + ".py")
+        with open(output, encoding="utf-8") as f:
+            assert f.read() == bm.generate_pybricks(missions, f"missions/{name}"), (
+                f"run: python -m tools.build_missions missions/{name}")
@@ -0,0 +1,116 @@
+import os
+import re
+import textwrap
+import warnings
+
+import pytest
+
+from tools import build_spike_program as bsp
+
+LIBRARY = '''\
+"""A small stand-in for spike/motion.py."""
+import math
+
+ROBOTS = {
+    'alpha': {'wheel': 56},
+    'beta': {'wheel': 88},
+}
+ROBOT = 'alpha'
+_robot = ROBOTS[ROBOT]
+WHEEL = _robot['wheel']
+
+
+def circumference():
+    """Wheel circumference in mm."""
+    return _round(math.pi * WHEEL)
+
+
+def _round(value):
+    return round(value, 1)
+
+
+def unused_move():
+    return 0
+'''
+
+
+def _write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(textwrap.dedent(text), encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def library(tmp_path):
+    return _write(tmp_path, "motion.py", LIBRARY)
+
+
+def test_library_is_spliced_over_the_import(tmp_path, library):
+    source = _write(tmp_path, "program.py", f"""\
+        {bsp.SOURCE_NOTE} - it needs spike/motion.py.
+        #     python -m tools.build_spike_program program.py
+
+        ROBOT = "beta"
+        from motion import *
+
+        result = circumference()
+        """)
+    built = bsp.build_program(source, library_path=library)
+    text = built['text']
+
+    assert built['robot'] == "beta"
+    assert text.startswith("# GENERATED by tools/build_spike_program.py")
+    assert bsp.SOURCE_NOTE not in text
+    assert "from motion import" not in text
+    assert "def circumference" in text and "def _round" in text
+    assert "unused_move" not in text
+    assert "'alpha'" not in text and "Wheel circumference" not in text
+    assert (built['kept'], built['total']) == (7, 8)
+
+    names = {}
+    exec(compile(text, "built.py", "exec"), names)
+    assert names['WHEEL'] == 88
+    assert names['result'] == round(3.141592653589793 * 88, 1)
+
+
+def test_robot_option_overrides_the_program(tmp_path, library):
+    source = _write(tmp_path, "program.py", """\
+        ROBOT = "beta"
+        from motion import *
+        print(WHEEL)
+        """)
+    assert bsp.build_program(source, robot="alpha", library_path=library)['robot'] == "alpha"
+
+
+def test_redefined_library_names_are_reported(tmp_path, library):
+    source = _write(tmp_path, "program.py", """\
+        ROBOT = "alpha"
+        from motion import *
+
+        def _round(value):
+            return int(value)
+
+        circumference()
+        """)
+    assert bsp.build_program(source, library_path=library)['shadowed'] == ["_round"]
+
+
+@pytest.mark.parametrize("program, message", [
+    ('ROBOT = "alpha"\nprint(1)\n', "has no 'from motion import *'"),
+    ("from motion import *\n", "has no ROBOT"),
+    ('ROBOT = "gamma"\nfrom motion import *\nprint(WHEEL)\n', "unknown robot 'gamma'"),
+])
+def test_unusable_programs_are_rejected(tmp_path, library, program, message):
+    source = _write(tmp_path, "program.py", program)
+    with pytest.raises(ValueError, match=re.escape(message)):
+        bsp.build_program(source, library_path=library)
+
+
+@pytest.mark.parametrize("source", bsp.DEFAULT_SOURCES)
+def test_team_programs_build(source):
+    built = bsp.build_program(os.path.join(bsp.REPO_ROOT, source))
+    with warnings.catch_warnings():
+        # Some programs compare numbers with "is" - theirs to fix, not the build's
+        warnings.simplefilter("ignore", SyntaxWarning)
+        compile(built['text'], bsp.output_path(source), "exec")
+    assert built['kept'] < built['total']
@@ -0,0 +1,108 @@
+import textwrap
+
+import pytest
+
+from tools import compile_missions as cm
+from tools.build_missions import read_presets
+
+
+@pytest.fixture(scope="module")
+def presets():
+    return read_presets()
+
+
+def _compile(presets, body):
+    source = "from robot import *\n\ndef mission():\n" + textwrap.indent(textwrap.dedent(body), "    ")
+    found = cm.compile_missions(source, presets)
+    return found, cm.rewrite(source, found)
+
+
+def _body(text):
+    return text.split("def mission():\n", 1)[1]
+
+
+def test_same_speed_straights_become_one(presets):
+    found, text = _compile(presets, """\
+        move_straight_gyro(300, DriveSpeed.APPROACH)
+        wait(100)
+        move_straight_gyro(200, DriveSpeed.APPROACH)
+        spin_turn(90)
+        """)
+    assert _body(text) == "    move_straight_gyro(500, DriveSpeed.APPROACH)\n    spin_turn(90)\n"
+    assert cm.summarize(found) == {'changes': 1, 'stops': 1, 'wait_ms': 100, 'overlapped': 0}
+
+
+def test_slower_last_leg_becomes_the_finish(presets):
+    _, text = _compile(presets, """\
+        move_straight_gyro(640, DriveSpeed.APPROACH)
+        move_straight_gyro(100, DriveSpeed.PRECISE)
+        spin_turn(90)
+        """)
+    assert _body(text).startswith(
+        "    move_straight_gyro(740, DriveSpeed.APPROACH, finish_mm=100, "
+        "finish_speed=DriveSpeed.PRECISE)\n")
+
+
+@pytest.mark.parametrize("body", [
+    # Direction changes
+    "move_straight_gyro(300)\nmove_straight_gyro(-300)\nspin_turn(90)\n",
+    # A long wait is part of the mission, not settling
+    "move_straight_gyro(300)\nwait(500)\nmove_straight_gyro(300)\nspin_turn(90)\n",
+    # Faster second leg would need a speed-up, which finish_speed cannot do
+    "move_straight_gyro(300, DriveSpeed.PRECISE)\nmove_straight_gyro(300, DriveSpeed.TRANSIT)\n"
+    "spin_turn(90)\n",
+    # Distances that are not literals
+    "move_straight_gyro(distance)\nmove_straight_gyro(300)\nspin_turn(90)\n",
+])
+def test_straights_that_must_stop_are_kept(presets, body):
+    found, _ = _compile(presets, body)
+    assert found == []
+
+
+def test_waits(presets):
+    found, text = _compile(presets, """\
+        wait(0)
+        spin_turn(90)
+        wait(300)
+        wait(200)
+        spin_turn(-90)
+        wait(1000)
+        """)
+    assert _body(text) == "    spin_turn(90)\n    wait(500)\n    spin_turn(-90)\n"
+    assert cm.summarize(found)['wait_ms'] == 1000
+
+
+def test_left_and_right_arm_overlap(presets):
+    found, text = _compile(presets, """\
+        left_arm_up(90, ArmSpeed.GRAB)
+        right_arm_down(45)
+        left_arm_up(10)
+        left_arm_down(10)
+        spin_turn(90)
+        """)
+    assert _body(text) == (
+        "    left_arm_up(90, ArmSpeed.GRAB, blocking=False)\n"
+        "    right_arm_down(45, blocking=False)\n"
+        "    wait_for_arms()\n"
+        "    left_arm_up(10)\n"
+        "    left_arm_down(10)\n"
+        "    spin_turn(90)\n")
+    assert cm.summarize(found)['overlapped'] == 1
+
+
+def test_comments_and_nested_blocks(presets):
+    _, text = _compile(presets, """\
+        if ready:
+            move_straight_gyro(100)
+            # keep this
+            move_straight_gyro(100)
+            wait(400)
+        spin_turn(90)
+        """)
+    assert _body(text) == (
+        "    if ready:\n"
+        "        # keep this\n"
+        "        move_straight_gyro(200)\n"
+        "        wait(400)\n"
+        "    spin_turn(90)\n")
+    compile(text, "mission.py", "exec")
@@ -0,0 +1,81 @@
+import textwrap
+
+import pytest
+
+from tools import estimate_time as et
+
+
+def test_move_time_trapezoid_and_triangle():
+    # 250 mm of ramps at 1000 mm/s^2, the rest at 500 mm/s
+    assert et.move_time(1000, 500, 1000) == pytest.approx(750 / 500 + 2 * 0.5)
+    # Too short to reach 1000 mm/s: accelerate half way, brake the rest
+    assert et.move_time(100, 1000, 1000) == pytest.approx(2 * (100 / 1000) ** 0.5)
+    assert et.move_time(-1000, 500, 1000) == et.move_time(1000, 500, 1000)
+    assert et.move_time(0, 500, 1000) == 0.0
+
+
+def test_legs_without_stopping_between_them():
+    one_leg = et.legs_time([(1000, 500)], 1000)
+    assert one_leg == pytest.approx(et.move_time(1000, 500, 1000, stop=False))
+    # Slowing down for a finish leg costs less than stopping in between
+    assert et.legs_time([(700, 500), (300, 100)], 1000) < (
+        et.move_time(700, 500, 1000) + et.move_time(300, 100, 1000))
+
+
+def test_proportional_turn_time():
+    assert et.proportional_turn_time(1, 100, 5, 1000, 1.7, 2) == 0.0
+    fast = et.proportional_turn_time(90, 100, 5, 1000, 1.7, 2)
+    slow = et.proportional_turn_time(90, 100, 2, 1000, 1.7, 2)
+    assert 0 < fast < slow
+    assert et.proportional_turn_time(180, 100, 5, 1000, 1.7, 2) > fast
+
+
+def _estimate(tmp_path, body, name="mission"):
+    path = tmp_path / "missions.py"
+    path.write_text(textwrap.dedent(body), encoding="utf-8")
+    missions, _ = et.find_missions(str(path))
+    return {mission: estimate for mission, estimate, _ in missions}[name]
+
+
+def test_background_arm_overlaps_the_wait(tmp_path):
+    estimate = _estimate(tmp_path, """\
+        def mission():
+            left_arm_up(90, 360, blocking=False)
+            wait(1000)
+            wait_for_arms()
+        """)
+    assert estimate.seconds['wait'] == 1.0
+    assert estimate.seconds['arm'] == 0.0
+
+
+def test_blocking_arm_adds_its_time(tmp_path):
+    estimate = _estimate(tmp_path, """\
+        def mission():
+            left_arm_up(90, 360)
+            wait(1000)
+        """)
+    assert estimate.seconds['arm'] == pytest.approx(
+        et.move_time(90, 360, et.MOTOR_ACCELERATION))
+    assert estimate.total == pytest.approx(1.0 + estimate.seconds['arm'])
+
+
+def test_loops_and_helpers_are_walked(tmp_path):
+    estimate = _estimate(tmp_path, """\
+        def pause(ms):
+            wait(ms)
+
+        def mission():
+            for _ in range(3):
+                pause(200)
+        """)
+    assert estimate.seconds['wait'] == pytest.approx(0.6)
+
+
+def test_sensor_moves_are_listed_not_guessed(tmp_path):
+    estimate = _estimate(tmp_path, """\
+        def mission():
+            move_until_line()
+            wait(100)
+        """)
+    assert estimate.total == pytest.approx(0.1)
+    assert any(et.SENSOR in text for _, text in estimate.unknown)
@@ -0,0 +1,37 @@
+import pytest
+
+
+@pytest.fixture
+def config(hub):
+    return hub("robot_config")
+
+
+def test_gain_schedule_sorts_by_speed(config):
+    assert config.gain_schedule({500: 2.0, 100: 4.0, 300: 3.5}) == (
+        (100, 4.0), (300, 3.5), (500, 2.0))
+    assert config.gain_schedule({}) == ()
+
+
+def test_interpolate_between_breakpoints(config):
+    schedule = config.gain_schedule({100: 4.0, 500: 2.0})
+    assert config.interpolate_gain(schedule, 300, 9.9) == pytest.approx(3.0)
+    assert config.interpolate_gain(schedule, 200, 9.9) == pytest.approx(3.5)
+    # Breakpoints themselves are exact
+    assert config.interpolate_gain(schedule, 100, 9.9) == 4.0
+    assert config.interpolate_gain(schedule, 500, 9.9) == 2.0
+
+
+def test_interpolate_clamps_to_the_ends(config):
+    schedule = config.gain_schedule({100: 4.0, 300: 3.0, 500: 2.0})
+    assert config.interpolate_gain(schedule, 20, 9.9) == 4.0
+    assert config.interpolate_gain(schedule, 900, 9.9) == 2.0
+    assert config.interpolate_gain(schedule, 400, 9.9) == pytest.approx(2.5)
+
+
+def test_interpolate_ignores_the_sign(config):
+    schedule = config.gain_schedule({100: 4.0, 500: 2.0})
+    assert config.interpolate_gain(schedule, -300, 9.9) == config.interpolate_gain(schedule, 300, 9.9)
+
+
+def test_empty_schedule_uses_the_default(config):
+    assert config.interpolate_gain((), 300, 2.0) == 2.0
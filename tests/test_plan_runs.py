@@ -0,0 +1,85 @@
+import itertools
+import random
+
+import pytest
+
+
+@pytest.fixture
+def loader(hub):
+    return hub("mission_loader")
+
+
+def _register(loader, slot, **annotations):
+    assert loader.register_mission(slot, f"Mission {slot}", lambda: None, **annotations)
+
+
+def _two_attachments(loader):
+    # Slots 0 and 2 share the arm in the left zone, 1 and 3 the scoop on the right
+    for slot in range(4):
+        side, attachment = ("left", "arm") if slot % 2 == 0 else ("right", "scoop")
+        _register(loader, slot, start_zone=side, end_zone=side, attachment=attachment,
+                  estimated_ms=10000)
+
+
+def _best_transitions(loader, slots):
+    infos = [loader.get_mission_info(slot) for slot in slots]
+    return min(sum(loader.transition_ms(infos[a], infos[b]) for a, b in zip(order, order[1:]))
+               for order in itertools.permutations(range(len(slots))))
+
+
+def test_missions_sharing_an_attachment_run_together(loader):
+    _two_attachments(loader)
+    plan = loader.plan_runs(verbose=False)
+    assert {frozenset(plan['order'][:2]), frozenset(plan['order'][2:])} == {
+        frozenset((0, 2)), frozenset((1, 3))}
+    assert plan['swaps'] == 1
+    change = loader.RELAUNCH_MS + loader.ZONE_CHANGE_MS + loader.ATTACHMENT_SWAP_MS
+    assert plan['transition_ms'] == 2 * loader.RELAUNCH_MS + change
+    assert plan['run_ms'] == 40000
+    assert plan['fits'] and plan['dropped'] == []
+
+
+def test_exact_plan_matches_brute_force(loader):
+    rng = random.Random(7)
+    for slot in range(6):
+        _register(loader, slot, start_zone=rng.choice(("left", "right")),
+                  end_zone=rng.choice(("left", "right")),
+                  attachment=rng.choice((None, "arm", "scoop")), estimated_ms=5000)
+    plan = loader.plan_runs(verbose=False)
+    assert sorted(plan['order']) == list(range(6))
+    assert plan['transition_ms'] == _best_transitions(loader, list(range(6)))
+
+
+def test_greedy_plan_for_many_missions(loader, monkeypatch):
+    _two_attachments(loader)
+    monkeypatch.setattr(loader, "PLAN_EXACT_LIMIT", 0)
+    plan = loader.plan_runs(verbose=False)
+    assert plan['order'][0] == 0
+    assert sorted(plan['order']) == [0, 1, 2, 3]
+    assert plan['swaps'] == 1
+
+
+@pytest.mark.parametrize("exact_limit", [10, 0])
+def test_missions_worth_the_fewest_points_are_dropped(loader, monkeypatch, exact_limit):
+    monkeypatch.setattr(loader, "PLAN_EXACT_LIMIT", exact_limit)
+    for slot, points in enumerate((10, 30, 20)):
+        _register(loader, slot, estimated_ms=60000, points=points)
+    plan = loader.plan_runs(verbose=False)
+    assert plan['dropped'] == [0]
+    assert sorted(plan['order']) == [1, 2]
+    assert plan['points'] == 50
+    assert plan['fits']
+
+
+def test_durations_fall_back_from_measured_to_estimated(loader):
+    _register(loader, 0, estimated_ms=30000, duration_ms=25000)
+    _register(loader, 1, estimated_ms=30000)
+    _register(loader, 2)
+    assert loader.plan_runs(verbose=False)['run_ms'] == 25000 + 30000 + loader.UNKNOWN_DURATION_MS
+    plan = loader.plan_runs(durations={0: 12000, 2: 8000}, verbose=False)
+    assert plan['run_ms'] == 12000 + 30000 + 8000
+
+
+def test_no_missions_is_an_empty_plan(loader):
+    plan = loader.plan_runs(slots=[], verbose=False)
+    assert plan['order'] == [] and plan['total_ms'] == 0 and plan['fits']
@@ -0,0 +1,69 @@
+import pytest
+
+from tools import decode_telemetry
+
+
+@pytest.fixture
+def telemetry(hub):
+    module = hub("telemetry")
+    module.clear_history()
+    return module
+
+
+def _record(telemetry, slot, mission_ms=40000):
+    groups = len(telemetry.PRIMITIVE_GROUPS)
+    group_ms = [1000 * (i + 1) for i in range(groups)]
+    group_calls = [i + slot for i in range(groups)]
+    return telemetry.pack_record(slot, slot % 2 == 0, mission_ms, group_ms, group_calls)
+
+
+def test_pack_and_decode_round_trip(telemetry):
+    groups = len(telemetry.PRIMITIVE_GROUPS)
+    data = telemetry.pack_record(3, True, 12340, [10 * i for i in range(groups)],
+                                 list(range(groups)))
+    assert len(data) == telemetry.RECORD_SIZE
+    assert telemetry.decode_record(data) == {
+        'slot': 3,
+        'success': True,
+        'mission_ms': 12340,
+        'group_ms': [10 * i for i in range(groups)],
+        'group_calls': list(range(groups)),
+    }
+
+
+def test_times_are_rounded_and_counts_saturate(telemetry):
+    groups = len(telemetry.PRIMITIVE_GROUPS)
+    data = telemetry.pack_record(0, False, 1004, [5] + [10 ** 7] * (groups - 1),
+                                 [300] * groups)
+    record = telemetry.decode_record(data)
+    assert record['success'] is False
+    assert record['mission_ms'] == 1000
+    assert record['group_ms'][0] == 10
+    assert record['group_ms'][1] == 0xFFFF * telemetry.TIME_UNIT_MS
+    assert record['group_calls'] == [255] * groups
+
+
+def test_history_keeps_the_newest_records(telemetry):
+    runs = telemetry.HISTORY_RECORDS + 3
+    for slot in range(runs):
+        telemetry.append_record(_record(telemetry, slot))
+    history = telemetry.load_history()
+    assert [record['slot'] for record in history] == list(range(3, runs))
+
+
+def test_host_decoder_reads_the_dump(telemetry, capsys):
+    for slot in range(5):
+        telemetry.append_record(_record(telemetry, slot))
+    line = telemetry.dump_history()
+    capsys.readouterr()
+
+    records = decode_telemetry.decode_dump(decode_telemetry.find_dump(["hub says hi", line]))
+    history = telemetry.load_history()
+    assert [{key: r[key] for key in history[0]} for r in records] == history
+    groups_ms = sum(history[0]['group_ms'])
+    assert records[0]['other_ms'] == history[0]['mission_ms'] - groups_ms > 0
+
+
+def test_host_decoder_rejects_other_data():
+    with pytest.raises(ValueError):
+        decode_telemetry.decode_dump(bytes(decode_telemetry.HEADER_SIZE))
@@ -0,0 +1,65 @@
+import pytest
+
+from tools import decode_trace
+
+
+@pytest.fixture
+def recorder(hub):
+    module = hub("trace_recorder")
+    yield module
+    module.release()
+
+
+def _dumped(recorder, capsys):
+    recorder.dump()
+    return capsys.readouterr().out.splitlines()
+
+
+def test_recorder_and_decoder_round_trip(recorder, capsys):
+    assert recorder.enable(samples=64)
+    recorder.mark(recorder.KIND_MISSION, extra=3)
+    recorder.mark(recorder.KIND_GYRO, target=500, speed=300)
+    recorder.sample(recorder.KIND_GYRO, 1.25, 10.4, -9.6, 300, -2.35, 42)
+    recorder.sample(recorder.KIND_GYRO, -0.5, 20, 21, 300, 1.0, -7)
+    recorder.mark(recorder.KIND_SPIN, target=-90.5, speed=200)
+    recorder.sample(recorder.KIND_SPIN, -45.0, 100, -100, 200, -45.5, 300)
+
+    segments, samples = decode_trace.decode_trace(decode_trace.find_trace(_dumped(recorder, capsys)))
+
+    assert [(s['kind'], s['mission'], s['target'], s['speed']) for s in segments] == [
+        (decode_trace.KIND_GYRO, 3, 500.0, 300),
+        (decode_trace.KIND_SPIN, 3, -90.5, 200),
+    ]
+    assert [(s['segment'], s['heading'], s['left'], s['right'], s['command_a'],
+             s['command_b'], s['load']) for s in samples] == [
+        (0, 1.25, 10, -10, 300, pytest.approx(-2.4), 42),
+        (0, -0.5, 20, 21, 300, 1.0, 7),
+        (1, -45.0, 100, -100, 200, -45.5, 255),
+    ]
+
+
+def test_full_buffer_keeps_the_newest_samples(recorder, capsys):
+    recorder.enable(samples=8)
+    for i in range(20):
+        recorder.sample(recorder.KIND_GYRO, 0.0, i, 0, 0, 0, 0)
+    _, samples = decode_trace.decode_trace(decode_trace.find_trace(_dumped(recorder, capsys)))
+    assert [s['left'] for s in samples] == list(range(12, 20))
+
+
+def test_dump_spans_several_lines(recorder, capsys):
+    recorder.enable(samples=100)
+    count = 2 * recorder.DUMP_LINE_SAMPLES + 1
+    for i in range(count):
+        recorder.sample(recorder.KIND_LINE, 0.0, i, i, 100, 0, 50)
+    lines = _dumped(recorder, capsys)
+    assert sum(1 for line in lines if line.startswith(f"TRC{recorder.VERSION}:")) == 3
+    _, samples = decode_trace.decode_trace(decode_trace.find_trace(lines))
+    assert len(samples) == count
+
+
+def test_incomplete_block_is_ignored(recorder, capsys):
+    recorder.enable(samples=8)
+    recorder.sample(recorder.KIND_GYRO, 0.0, 1, 1, 0, 0, 0)
+    lines = _dumped(recorder, capsys)
+    assert decode_trace.find_trace(lines[:-1]) is None
+    assert len(decode_trace.find_traces(lines + lines)) == 2
@@ -0,0 +1,32 @@
+import math
+
+import pytest
+
+
+@pytest.mark.parametrize("distance_mm", [1, 10, 88, 176, 500, 1234.5])
+def test_mm_to_motor_degrees_matches_float_math(hub, distance_mm):
+    robot = hub("robot")
+    exact = distance_mm * 360 / (math.pi * robot.PROFILE.wheel_diameter)
+    assert robot.mm_to_motor_degrees(distance_mm) == round(exact)
+
+
+def test_conversions_keep_the_sign_and_size(hub):
+    robot = hub("robot")
+    for value in (1, 45, 176, 999):
+        assert robot.mm_to_motor_degrees(-value) == -robot.mm_to_motor_degrees(value)
+        assert robot.motor_degrees_to_mm(-value) == -robot.motor_degrees_to_mm(value)
+        assert robot.pivot_motor_degrees(-value) == -robot.pivot_motor_degrees(value)
+
+
+def test_round_trip_is_within_one_mm(hub):
+    robot = hub("robot")
+    for distance_mm in range(0, 2000, 37):
+        degrees = robot.mm_to_motor_degrees(distance_mm)
+        assert abs(robot.motor_degrees_to_mm(degrees) - distance_mm) <= 1
+
+
+def test_pivot_degrees_follow_the_profile(hub):
+    robot = hub("robot")
+    profile = robot.PROFILE
+    exact = 90 * 2 * profile.axle_track / profile.wheel_diameter
+    assert robot.pivot_motor_degrees(90) == round(exact)
@@ -0,0 +1,6 @@
+"""
+Host-side build and analysis tools for the Pybricks robot code.
+
+These run on a laptop with regular Python, never on the hub. Each module is
+a command line tool: python -m tools.<name> --help
+"""
@@ -0,0 +1,296 @@
+"""
+Control-loop metrics from traces recorded by pybricks/trace_recorder.py.
+
+Usage:
+    python -m tools.analyze_trace hub_log.txt
+    python -m tools.analyze_trace practice1.txt practice2.txt --csv loops.csv
+    python -m tools.analyze_trace hub_log.txt --wheel-diameter 88
+
+Reads every trace block in the given logs (needs NumPy) and computes, for
+each recorded loop:
+
+    overshoot    spin: degrees turned past the target
+    settle       spin: time until the heading stays within --tolerance
+    ss_error     gyro: mean heading error over the last half of the drive,
+                 spin: final heading minus target (in the turn direction)
+    max_error    gyro/push/line: largest heading error
+    speed_error  gyro/push/line: mean |actual - commanded| wheel speed (mm/s),
+                 acceleration ramp included
+    stopped      time the wheels were (nearly) still while commanded to move
+
+The loops are then aggregated per primitive (gyro/spin/push/line) and per
+mission slot, and the loops that lost the most time are listed first -
+those are the calls worth speeding up.
+"""
+
+import argparse
+import csv
+import math
+import sys
+
+import numpy as np
+
+from tools.decode_trace import (find_traces, decode_trace, to_array, KIND_NAMES,
+                                KIND_GYRO, KIND_SPIN)
+
+WHEEL_DIAMETER = 56         # mm, competition profile in robot_config.py
+SPIN_TOLERANCE = 2          # degrees, SPIN_TURN_TOLERANCE default
+STOPPED_FRACTION = 0.2      # wheels "stopped" below this share of the command
+STOPPED_MIN_SPEED = 20      # mm/s (deg/s for spin) - floor for slow commands
+
+METRICS = ("duration_ms", "overshoot", "settle_ms", "ss_error", "max_error",
+           "speed_error", "stopped_ms")
+
+# ============================================================================
+# PER-LOOP METRICS
+# ============================================================================
+
+def wheel_speeds(samples, wheel_diameter=WHEEL_DIAMETER):
+    """
+    Mean wheel speed of every sample (mm/s), from the encoder differences.
+
+    Spin samples use the wheel degrees/s instead, since their command is a
+    motor speed. The first sample repeats the second.
+    """
+    t = samples['t_ms'].astype(np.float64)
+    # Forward travel for straight loops, rotation for spins
+    travel = np.where(samples['kind'] == KIND_SPIN,
+                      (samples['left'] - samples['right']) / 2.0,
+                      (samples['left'] + samples['right']) / 2.0)
+    to_mm = np.where(samples['kind'] == KIND_SPIN, 1.0, math.pi * wheel_diameter / 360.0)
+    if len(t) < 2:
+        return np.zeros(len(t))
+    dt = np.diff(t)
+    speed = np.diff(travel * to_mm) / np.where(dt > 0, dt, 1) * 1000.0
+    return np.concatenate((speed[:1], speed))
+
+
+def loop_metrics(segment, samples, speeds, tolerance=SPIN_TOLERANCE):
+    """
+    Metrics of one recorded loop.
+
+    Args:
+        segment (dict): Loop marker from decode_trace()
+        samples (ndarray): That loop's samples (decode_trace.DTYPE)
+        speeds (ndarray): Their wheel speeds (see wheel_speeds())
+        tolerance (float): Spin settling band in degrees
+
+    Returns:
+        dict: The loop marker fields plus METRICS (None where not meaningful)
+    """
+    result = dict(segment)
+    result['primitive'] = KIND_NAMES.get(segment['kind'], "?")
+    for name in METRICS:
+        result[name] = None
+
+    if len(samples) == 0:
+        result['duration_ms'] = 0
+        return result
+
+    t = samples['t_ms'].astype(np.float64)
+    dt = np.diff(t, append=t[-1] + (t[-1] - t[-2] if len(t) > 1 else 10))
+    heading = samples['heading'].astype(np.float64)
+    result['duration_ms'] = int(t[-1] + dt[-1] - segment['t_ms'])
+
+    command = samples['command_a'].astype(np.float64)
+    moving = np.abs(command) > 0
+    floor = np.maximum(STOPPED_FRACTION * np.abs(command), STOPPED_MIN_SPEED)
+    stopped = moving & (np.abs(speeds) < floor)
+    # Spin-up at the start of a loop is not a stop
+    stopped[:min(len(stopped), 5)] = False
+    result['stopped_ms'] = int(dt[stopped].sum())
+
+    if segment['kind'] == KIND_SPIN:
+        target = segment['target']
+        sign = 1.0 if target >= 0 else -1.0
+        turned = heading * sign
+        result['overshoot'] = round(max(0.0, float(turned.max()) - abs(target)), 1)
+        outside = np.nonzero(np.abs(turned - abs(target)) >= tolerance)[0]
+        if len(outside) == 0:
+            settle = 0.0
+        else:
+            settle = t[outside[-1]] + dt[outside[-1]] - segment['t_ms']
+        result['settle_ms'] = int(settle)
+        # Where the turn ended (the loop stops inside the tolerance band)
+        result['ss_error'] = round(float(turned[-1]) - abs(target), 2)
+    else:
+        # Gyro moves reset the heading to 0 when they start, push and line
+        # moves keep driving on the heading they started with
+        if segment['kind'] != KIND_GYRO:
+            heading = heading - heading[0]
+        half = heading[len(heading) // 2:]
+        result['ss_error'] = round(float(half.mean()), 2)
+        result['max_error'] = round(float(np.abs(heading).max()), 1)
+        if moving.any():
+            result['speed_error'] = round(float(np.abs(speeds - command)[moving].mean()), 1)
+
+    return result
+
+
+def analyze(segments, samples, wheel_diameter=WHEEL_DIAMETER, tolerance=SPIN_TOLERANCE):
+    """
+    Metrics for every loop of one trace.
+
+    Args:
+        segments (list): From decode_trace()
+        samples (list): From decode_trace()
+
+    Returns:
+        list: One loop_metrics() dict per segment
+    """
+    array = to_array(samples)
+    speeds = np.zeros(len(array))
+    results = []
+    for segment in segments:
+        mask = array['segment'] == segment['segment']
+        loop = array[mask]
+        speeds[mask] = wheel_speeds(loop, wheel_diameter)
+        results.append(loop_metrics(segment, loop, speeds[mask], tolerance))
+    return results
+
+# ============================================================================
+# AGGREGATION
+# ============================================================================
+
+def _mean(values):
+    values = [v for v in values if v is not None]
+    return float(np.mean(values)) if values else None
+
+
+def aggregate(loops, key):
+    """
+    Sum/mean the loop metrics per key ('primitive' or 'mission').
+
+    Returns:
+        list: dicts {key, 'loops', 'total_ms', 'stopped_ms', and the mean of
+              overshoot, settle_ms, ss_error (absolute), max_error, speed_error}
+    """
+    groups = {}
+    for loop in loops:
+        groups.setdefault(loop[key], []).append(loop)
+
+    summary = []
+    for value in sorted(groups, key=str):
+        members = groups[value]
+        summary.append({
+            key: value,
+            'loops': len(members),
+            'total_ms': sum(m['duration_ms'] for m in members),
+            'stopped_ms': sum(m['stopped_ms'] or 0 for m in members),
+            'overshoot': _mean([m['overshoot'] for m in members]),
+            'settle_ms': _mean([m['settle_ms'] for m in members]),
+            'ss_error': _mean([abs(m['ss_error']) if m['ss_error'] is not None else None
+                               for m in members]),
+            'max_error': _mean([m['max_error'] for m in members]),
+            'speed_error': _mean([m['speed_error'] for m in members]),
+        })
+    return summary
+
+# ============================================================================
+# REPORT
+# ============================================================================
+
+def _fmt(value, width, digits=1):
+    if value is None:
+        return f"{'-':>{width}}"
+    return f"{value:>{width}.{digits}f}"
+
+
+def print_loops(loops):
+    print(f"{'run':>3} {'#':>3} {'mission':>7} {'kind':<5} {'target':>7} {'time':>6} "
+          f"{'oversh':>6} {'settle':>6} {'ss_err':>6} {'max_err':>7} {'spd_err':>7} {'stopped':>7}")
+    for loop in loops:
+        mission = loop['mission'] if loop['mission'] >= 0 else "-"
+        print(f"{loop['run']:>3} {loop['segment']:>3} {mission:>7} {loop['primitive']:<5} "
+              f"{loop['target']:>7.1f} {loop['duration_ms'] / 1000:>5.2f}s "
+              f"{_fmt(loop['overshoot'], 6)} {_fmt(loop['settle_ms'], 6, 0)} "
+              f"{_fmt(loop['ss_error'], 6, 2)} {_fmt(loop['max_error'], 7)} "
+              f"{_fmt(loop['speed_error'], 7)} {loop['stopped_ms']:>5}ms")
+
+
+def print_summary(summary, key):
+    print(f"\nPer {key}:")
+    print(f"  {key:<9} {'loops':>5} {'time':>7} {'stopped':>7} {'oversh':>6} "
+          f"{'settle':>6} {'|ss_err|':>8} {'max_err':>7} {'spd_err':>7}")
+    for row in summary:
+        label = row[key] if row[key] != -1 else "-"
+        print(f"  {str(label):<9} {row['loops']:>5} {row['total_ms'] / 1000:>6.2f}s "
+              f"{row['stopped_ms'] / 1000:>6.2f}s {_fmt(row['overshoot'], 6)} "
+              f"{_fmt(row['settle_ms'], 6, 0)} {_fmt(row['ss_error'], 8, 2)} "
+              f"{_fmt(row['max_error'], 7)} {_fmt(row['speed_error'], 7)}")
+
+
+def print_worst(loops, count=5):
+    """List the loops that lost the most time (stops plus spin settling)."""
+    def lost(loop):
+        settle = 0
+        if loop['settle_ms'] is not None and loop['overshoot']:
+            settle = loop['settle_ms']
+        return (loop['stopped_ms'] or 0) + settle
+
+    ranked = sorted((loop for loop in loops if lost(loop) > 0), key=lambda l: -lost(l))
+    if not ranked:
+        return
+    print("\nMost time lost (stops, plus settling after an overshoot):")
+    for loop in ranked[:count]:
+        mission = loop['mission'] if loop['mission'] >= 0 else "-"
+        print(f"  run {loop['run']} loop {loop['segment']} (mission {mission}, "
+              f"{loop['primitive']} {loop['target']:g}): {lost(loop) / 1000:.2f}s")
+
+
+def write_csv(loops, path):
+    columns = ("run", "segment", "mission", "primitive", "target", "speed") + METRICS
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for loop in loops:
+            writer.writerow(["" if loop[name] is None else loop[name] for name in columns])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Control-loop metrics from hub traces")
+    parser.add_argument("logs", nargs="*", default=["-"],
+                        help="hub outputs containing trace dumps (default: stdin)")
+    parser.add_argument("--wheel-diameter", type=float, default=WHEEL_DIAMETER,
+                        help=f"mm (default: {WHEEL_DIAMETER})")
+    parser.add_argument("--tolerance", type=float, default=SPIN_TOLERANCE,
+                        help=f"spin settling band in degrees (default: {SPIN_TOLERANCE})")
+    parser.add_argument("--csv", help="also write the per-loop metrics to this CSV file")
+    args = parser.parse_args(argv)
+
+    blocks = []
+    for path in args.logs:
+        if path == "-":
+            blocks.extend(find_traces(sys.stdin))
+        else:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                blocks.extend(find_traces(f))
+
+    if not blocks:
+        print("analyze_trace error: no complete trace found", file=sys.stderr)
+        return 1
+
+    loops = []
+    for run, data in enumerate(blocks, 1):
+        segments, samples = decode_trace(data)
+        for loop in analyze(segments, samples, args.wheel_diameter, args.tolerance):
+            loop['run'] = run
+            loops.append(loop)
+
+    if not loops:
+        print("No control loops in the traces")
+        return 0
+
+    print_loops(loops)
+    print_summary(aggregate(loops, 'primitive'), 'primitive')
+    print_summary(aggregate(loops, 'mission'), 'mission')
+    print_worst(loops)
+
+    if args.csv:
+        write_csv(loops, args.csv)
+        print(f"\n✓ Wrote {len(loops)} loops to {args.csv}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,480 @@
+"""
+Build the slot-indexed mission table (pybricks/mission_table.py).
+
+Usage:
+    python -m tools.build_mission_table
+    python -m tools.build_mission_table pybricks/competition_setup.py -o pybricks/mission_table.py
+    python -m tools.build_mission_table --check      # exit 1 if a rebuild would change anything
+
+Reads the register_mission(slot, name, function, description, ...) calls in
+the source files (without running them) and writes a static module:
+
+    MISSIONS = (
+        ("Angler-40pts", "Left: ...", _slot_0, "left", "left", None, 25000, None, None),
+        None,  # slot 1 (empty)
+        ...
+    )
+
+The last six fields are the planning annotations (start_zone, end_zone,
+attachment, estimated_ms, duration_ms, points); they must be literals in
+the source.
+
+Each mission is also written to a module of its own, gen_<function>.py
+next to the table. It holds the mission function plus only the helpers,
+constants and imports that function uses (found with ast), so starting a
+mission loads that one mission - not the whole competition_setup.py with the
+other missions and mission_check. Each _slot_N() imports its module inside
+the function, so nothing is imported at boot and pybricksdev still finds the
+import when uploading. Generated mission modules that no longer belong to a
+slot are deleted.
+
+The function argument may be a name defined in (or imported into) the source
+file, or a "module:function" string. If the mission's module is not found
+next to the source, the slot imports it as it is.
+"""
+
+import argparse
+import ast
+import json
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PYBRICKS_DIR = os.path.join(REPO_ROOT, "pybricks")
+DEFAULT_SOURCES = (os.path.join(PYBRICKS_DIR, "competition_setup.py"),)
+DEFAULT_OUTPUT = os.path.join(PYBRICKS_DIR, "mission_table.py")
+
+MAX_SLOT = 19
+
+# register_mission() keyword arguments copied into the table, in table order
+ANNOTATIONS = ("start_zone", "end_zone", "attachment", "estimated_ms", "duration_ms",
+               "points")
+
+HEADER = '''#!/usr/bin/env pybricks-micropython
+"""
+MISSION TABLE - Generated Slot Table
+====================================
+
+GENERATED by tools/build_mission_table.py from {sources} - DO NOT EDIT.
+Change the register_mission() calls there and rebuild:
+
+    python -m tools.build_mission_table
+
+MISSIONS[slot] is (name, description, run, start_zone, end_zone, attachment,
+estimated_ms, duration_ms, points) or None for an empty slot. run() imports
+the mission's own module (gen_<function>.py: that mission and what it uses)
+only when the mission starts.
+
+Usage:
+    Run this file on the hub to start the competition menu, or:
+
+        from mission_table import MISSIONS
+        use_mission_table(MISSIONS)
+"""
+'''
+
+MISSION_HEADER = '''#!/usr/bin/env pybricks-micropython
+"""
+GENERATED by tools/build_mission_table.py from {source} - DO NOT EDIT.
+
+{function}() and what it uses, so mission_table.py loads only this mission.
+"""
+'''
+
+# First line of MISSION_HEADER's docstring: marks files this tool may delete
+GENERATED_MARK = "GENERATED by tools/build_mission_table.py"
+
+FOOTER = '''
+
+if __name__ == "__main__":
+    from mission_loader import use_mission_table, competition_mode
+
+    use_mission_table(MISSIONS)
+    competition_mode()
+'''
+
+# ============================================================================
+# READING register_mission() CALLS
+# ============================================================================
+
+class MissionSpec:
+    """One register_mission() call found in a source file."""
+
+    def __init__(self, slot, name, module, function, description, source, line,
+                 start_zone=None, end_zone=None, attachment=None, estimated_ms=None,
+                 duration_ms=None, points=None):
+        self.slot = slot
+        self.name = name
+        self.module = module
+        self.function = function
+        self.description = description
+        self.source = source
+        self.line = line
+        self.start_zone = start_zone
+        self.end_zone = end_zone
+        self.attachment = attachment
+        self.estimated_ms = estimated_ms
+        self.duration_ms = duration_ms
+        self.points = points
+        # File the function is defined in; split into its own module if found
+        self.path = os.path.join(os.path.dirname(os.path.abspath(source)), module + ".py")
+        self.split = os.path.exists(self.path)
+
+    def __repr__(self):
+        return f"MissionSpec({self.slot}: {self.name} -> {self.module}:{self.function})"
+
+
+def _imported_names(tree):
+    """Map names brought in with 'from X import name' to module X."""
+    names = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module:
+            for alias in node.names:
+                names[alias.asname or alias.name] = (node.module, alias.name)
+    return names
+
+
+def _call_arguments(call):
+    """register_mission() arguments by parameter name."""
+    params = ("slot", "name", "function", "description") + ANNOTATIONS
+    args = dict(zip(params, call.args))
+    for keyword in call.keywords:
+        args[keyword.arg] = keyword.value
+    return args
+
+
+def _literal(node, what, where):
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        raise ValueError(f"{where}: {what} must be a literal") from None
+
+
+def read_missions(path):
+    """
+    Find every register_mission() call in a source file.
+
+    Args:
+        path (str): Python file (e.g. pybricks/competition_setup.py)
+
+    Returns:
+        list: MissionSpec objects in file order
+    """
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+
+    module = os.path.splitext(os.path.basename(path))[0]
+    imported = _imported_names(tree)
+    missions = []
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        called = func.id if isinstance(func, ast.Name) else getattr(func, "attr", None)
+        if called != "register_mission":
+            continue
+
+        where = f"{os.path.relpath(path, REPO_ROOT)}:{node.lineno}"
+        args = _call_arguments(node)
+        if "slot" not in args or "name" not in args or "function" not in args:
+            raise ValueError(f"{where}: register_mission() needs slot, name and function")
+
+        slot = _literal(args["slot"], "slot", where)
+        name = _literal(args["name"], "name", where)
+        description = _literal(args["description"], "description", where) if "description" in args else ""
+        annotations = {key: _literal(args[key], key, where)
+                       for key in ANNOTATIONS if key in args}
+
+        target = args["function"]
+        if isinstance(target, ast.Name):
+            mission_module, function = imported.get(target.id, (module, target.id))
+        elif isinstance(target, ast.Constant) and isinstance(target.value, str) and ":" in target.value:
+            mission_module, function = target.value.split(":", 1)
+        else:
+            raise ValueError(f"{where}: function must be a name or a 'module:function' string")
+
+        missions.append(MissionSpec(slot, name, mission_module, function,
+                                    description, path, node.lineno, **annotations))
+
+    missions.sort(key=lambda spec: spec.line)
+    return missions
+
+# ============================================================================
+# ONE MODULE PER MISSION
+# ============================================================================
+
+def mission_module_name(spec):
+    """Module the table imports spec's mission from."""
+    return f"gen_{spec.function}" if spec.split else spec.module
+
+
+def _top_level(tree):
+    """Top-level statements by the names they define, and the imports."""
+    defined = {}
+    imports = []
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+            defined[node.name] = node
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                for name in ast.walk(target):
+                    if isinstance(name, ast.Name):
+                        defined[name.id] = node
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            imports.append(node)
+    return defined, imports
+
+
+def _used_names(node):
+    return {n.id for n in ast.walk(node) if isinstance(n, ast.Name)}
+
+
+def extract_mission(path, function):
+    """
+    Source of a module with one mission and what it needs from its file.
+
+    Args:
+        path (str): File the mission function is defined in
+        function (str): Mission function name
+
+    Returns:
+        str: Module source (without MISSION_HEADER)
+
+    Raises:
+        ValueError: If the file has no such function
+    """
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    tree = ast.parse(source, path)
+    defined, imports = _top_level(tree)
+    if not isinstance(defined.get(function), ast.FunctionDef):
+        raise ValueError(f"{os.path.relpath(path, REPO_ROOT)}: no function {function}()")
+
+    # Everything the mission reaches through the file's own definitions
+    needed = []
+    used = set()
+    pending = [defined[function]]
+    while pending:
+        node = pending.pop()
+        if node in needed:
+            continue
+        needed.append(node)
+        names = _used_names(node)
+        used |= names
+        pending.extend(defined[name] for name in names
+                       if name in defined and defined[name] not in needed)
+
+    lines = source.splitlines()
+    parts = []
+    for node in imports:
+        aliases = [a for a in node.names if (a.asname or a.name).split(".")[0] in used]
+        if not aliases:
+            continue
+        names = [f"{a.name} as {a.asname}" if a.asname else a.name for a in aliases]
+        if isinstance(node, ast.Import):
+            parts.append(f"import {', '.join(names)}")
+        else:
+            body = "".join(f"    {name},\n" for name in names)
+            parts.append(f"from {'.' * node.level}{node.module} import (\n{body})")
+    for node in sorted(needed, key=lambda n: n.lineno):
+        first = min([node.lineno] + [d.lineno for d in getattr(node, "decorator_list", [])])
+        parts.append("\n".join(lines[first - 1:node.end_lineno]))
+
+    imports_text = "\n".join(p for p in parts if p.startswith(("import ", "from ")))
+    bodies = [p for p in parts if not p.startswith(("import ", "from "))]
+    return imports_text + "\n\n\n" + "\n\n\n".join(bodies) + "\n"
+
+
+def mission_modules(table, directory):
+    """
+    Text of the module of every split mission.
+
+    Returns:
+        dict: {path: text}
+    """
+    modules = {}
+    for spec in table:
+        if spec is None or not spec.split:
+            continue
+        path = os.path.join(directory, mission_module_name(spec) + ".py")
+        text = extract_mission(spec.path, spec.function)
+        header = MISSION_HEADER.format(source=os.path.basename(spec.path), function=spec.function)
+        modules[path] = header + "\n" + text
+    return modules
+
+
+def stale_mission_modules(directory, keep):
+    """Generated mission modules in directory that are not in keep."""
+    stale = []
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        if not (name.startswith("gen_") and name.endswith(".py")) or path in keep:
+            continue
+        with open(path, encoding="utf-8") as f:
+            head = f.read(300)
+        if GENERATED_MARK in head and "loads only this mission" in head:
+            stale.append(path)
+    return stale
+
+
+def write_mission_modules(table, directory):
+    """
+    Write one module per split mission and delete stale generated ones.
+
+    Returns:
+        list: Paths written
+    """
+    modules = mission_modules(table, directory)
+    for path, text in modules.items():
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+    for path in stale_mission_modules(directory, modules):
+        os.remove(path)
+    return list(modules)
+
+
+def out_of_date(table, sources, output):
+    """
+    Generated files that differ from what a fresh build would write.
+
+    Returns:
+        list: (path, reason) pairs; empty if everything is up to date
+    """
+    expected = mission_modules(table, os.path.dirname(os.path.abspath(output)))
+    expected[output] = render_table(table, sources)
+    problems = []
+    for path, text in expected.items():
+        try:
+            with open(path, encoding="utf-8") as f:
+                current = f.read()
+        except OSError:
+            problems.append((path, "missing"))
+            continue
+        if current != text:
+            problems.append((path, "differs"))
+    for path in stale_mission_modules(os.path.dirname(os.path.abspath(output)), expected):
+        problems.append((path, "stale (its mission is gone)"))
+    return problems
+
+# ============================================================================
+# WRITING THE TABLE
+# ============================================================================
+
+def build_table(missions):
+    """
+    Check slots and arrange missions by slot.
+
+    Later calls for the same slot replace earlier ones, like register_mission().
+
+    Args:
+        missions (list): MissionSpec objects
+
+    Returns:
+        list: Slot-indexed list of MissionSpec or None, trimmed after the last
+              used slot
+    """
+    table = [None] * (MAX_SLOT + 1)
+    for spec in missions:
+        if not isinstance(spec.slot, int) or not 0 <= spec.slot <= MAX_SLOT:
+            raise ValueError(f"{spec.source}:{spec.line}: slot must be 0-{MAX_SLOT}, got {spec.slot!r}")
+        table[spec.slot] = spec
+
+    while table and table[-1] is None:
+        table.pop()
+    return table
+
+
+def _quote(text):
+    """Double-quoted string literal, matching the hub code style."""
+    return json.dumps(text, ensure_ascii=False)
+
+
+def _literal_source(value):
+    """Source for an annotation value (None, number or string)."""
+    if isinstance(value, str):
+        return _quote(value)
+    return repr(value)
+
+
+def render_table(table, sources):
+    """
+    Source code of mission_table.py.
+
+    Args:
+        table (list): From build_table()
+        sources (list): Source file paths (for the header)
+
+    Returns:
+        str: Module source
+    """
+    names = ", ".join(os.path.basename(path) for path in sources)
+    lines = [HEADER.format(sources=names).rstrip("\n")]
+
+    for slot, spec in enumerate(table):
+        if spec is None:
+            continue
+        lines.append("")
+        lines.append("")
+        lines.append(f"def _slot_{slot}():")
+        lines.append(f"    from {mission_module_name(spec)} import {spec.function}")
+        lines.append(f"    return {spec.function}()")
+
+    lines.append("")
+    lines.append("")
+    lines.append("MISSIONS = (")
+    for slot, spec in enumerate(table):
+        if spec is None:
+            lines.append(f"    None,  # slot {slot}")
+        else:
+            fields = [_quote(spec.name), _quote(spec.description), f"_slot_{slot}"]
+            fields.extend(_literal_source(getattr(spec, key)) for key in ANNOTATIONS)
+            lines.append(f"    ({', '.join(fields)}),  # slot {slot}")
+    lines.append(")")
+
+    return "\n".join(lines) + "\n" + FOOTER
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate pybricks/mission_table.py")
+    parser.add_argument("sources", nargs="*", default=list(DEFAULT_SOURCES),
+                        help="files with register_mission() calls")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--check", action="store_true",
+                        help="write nothing; exit 1 if the generated files are out of date")
+    args = parser.parse_args(argv)
+
+    try:
+        missions = []
+        for path in args.sources:
+            missions.extend(read_missions(path))
+        table = build_table(missions)
+        if args.check:
+            problems = out_of_date(table, args.sources, args.output)
+        else:
+            modules = write_mission_modules(table, os.path.dirname(os.path.abspath(args.output)))
+    except (OSError, SyntaxError, ValueError) as e:
+        print(f"build_mission_table error: {e}", file=sys.stderr)
+        return 1
+
+    if args.check:
+        for path, reason in problems:
+            print(f"✗ {os.path.relpath(path, REPO_ROOT)}: {reason}")
+        if problems:
+            print("  → rebuild with: python -m tools.build_mission_table")
+            return 1
+        print("✓ Generated mission files are up to date")
+        return 0
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(render_table(table, args.sources))
+
+    count = sum(1 for spec in table if spec is not None)
+    print(f"✓ Wrote {count} missions to {os.path.relpath(args.output, REPO_ROOT)}"
+          f" ({len(modules)} mission modules)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,477 @@
+"""
+Generate Pybricks and SPIKE-app missions from one mission description.
+
+Usage:
+    python -m tools.build_missions missions/boulder.mission
+    python -m tools.build_missions missions/boulder.mission --target spike --robot joshua
+    python -m tools.build_missions missions/*.mission --target pybricks
+
+A .mission file lists the steps once, in robot.py units (mm, degrees,
+speeds in mm/s or deg/s or the DriveSpeed/TurnSpeed/ArmSpeed preset names
+from pybricks/robot_config.py):
+
+    robot joshua                    # SPIKE profile (ROBOTS in spike/motion.py)
+
+    # Boulder - align at square 3 from the left
+    mission boulder
+        straight 650 pushing        # gyro straight, negative = backward
+        arm left up 90 delicate &   # & = keep going while the arm moves
+        turn -45 precise            # spin turn, positive = clockwise
+        sync                        # wait for the arms started with &
+        pivot 30                    # pivot turn on one wheel
+        wait 200                    # ms
+        straight -650 return
+
+Comment lines right above a mission are copied into the generated code.
+
+Each target gets its best primitives:
+
+    Pybricks   pybricks/<file>.py with move_straight_gyro / spin_turn /
+               pivot_turn / left_arm_up(..., blocking=False) / wait_for_arms(),
+               preset speeds kept as DriveSpeed.PUSHING etc.
+    SPIKE app  build/spike/<file>_<mission>.py, one upload per mission, using
+               move_for_distance_gyro / spin_turn / pivot_turn and together()
+               from spike/motion.py, with speeds converted to wheel degrees/s
+               for the robot and built into a single file
+               (see tools/build_spike_program.py)
+
+The generated Pybricks file is only overwritten if it is a generated file.
+"""
+
+import argparse
+import ast
+import math
+import os
+import sys
+
+from tools.build_spike_program import build_program, output_path as spike_output_path
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROBOT_CONFIG = os.path.join(REPO_ROOT, "pybricks", "robot_config.py")
+SPIKE_LIBRARY = os.path.join(REPO_ROOT, "spike", "motion.py")
+PYBRICKS_DIR = os.path.join(REPO_ROOT, "pybricks")
+SPIKE_SOURCE_DIR = os.path.join(REPO_ROOT, "build", "spike-src")
+
+GENERATED = "GENERATED by tools/build_missions.py"
+
+# Speed preset class used by each kind of step
+PRESET_CLASSES = {"straight": "DriveSpeed", "turn": "TurnSpeed", "pivot": "TurnSpeed",
+                  "arm": "ArmSpeed"}
+
+# SPIKE motors top out around 1000 degrees/second
+SPIKE_MAX_VELOCITY = 1000
+
+# Pybricks names the arms left/right, the SPIKE library front/back
+SPIKE_ARMS = {"left": "move_front_arm", "right": "move_back_arm"}
+
+# ============================================================================
+# READING .mission FILES
+# ============================================================================
+
+class Mission:
+    """One 'mission <name>' block: its steps and the comment above it."""
+
+    def __init__(self, name, comment, line):
+        self.name = name
+        self.comment = comment
+        self.line = line
+        self.steps = []
+
+
+def read_presets(path=ROBOT_CONFIG):
+    """
+    Speed presets from robot_config.py (read with ast, not imported).
+
+    Returns:
+        dict: {'DriveSpeed': {'precise': 100, ...}, 'TurnSpeed': {...}, 'ArmSpeed': {...}}
+    """
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    presets = {}
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name in PRESET_CLASSES.values():
+            values = {}
+            for item in node.body:
+                if (isinstance(item, ast.Assign) and len(item.targets) == 1
+                        and isinstance(item.targets[0], ast.Name)
+                        and isinstance(item.value, ast.Constant)):
+                    values[item.targets[0].id.lower()] = item.value.value
+            presets[node.name] = values
+    return presets
+
+
+def _number(text, where, what):
+    try:
+        value = float(text)
+    except ValueError:
+        raise ValueError(f"{where}: {what} must be a number, got {text!r}") from None
+    return int(value) if value == int(value) else value
+
+
+def _speed(words, op, presets, where):
+    """Optional trailing speed: None, a number, or ('Preset', 'NAME', value)."""
+    if not words:
+        return None
+    if len(words) > 1:
+        raise ValueError(f"{where}: unexpected {' '.join(words[1:])!r}")
+    word = words[0]
+    if word[0].isdigit():
+        return _number(word, where, "speed")
+    preset_class = PRESET_CLASSES[op]
+    values = presets.get(preset_class, {})
+    if word.lower() not in values:
+        raise ValueError(f"{where}: unknown {preset_class} preset {word!r} "
+                         f"(one of {', '.join(sorted(values))})")
+    return (preset_class, word.upper(), values[word.lower()])
+
+
+def parse_missions(text, source="<mission>", presets=None):
+    """
+    Parse a .mission file.
+
+    Args:
+        text (str): File contents
+        source (str): File name for error messages
+        presets (dict): From read_presets() (default: robot_config.py)
+
+    Returns:
+        tuple: (robot, missions) - the SPIKE robot name (or None) and a list
+               of Mission objects whose steps are dicts:
+               {'op', 'line', 'background', and per op:
+                straight: 'distance', 'speed' | turn/pivot: 'angle', 'speed' |
+                arm: 'arm', 'direction', 'degrees', 'speed' | wait: 'ms'}
+
+    Raises:
+        ValueError: On a malformed line ("file:line: message")
+    """
+    if presets is None:
+        presets = read_presets()
+    robot = None
+    missions = []
+    comment = []
+    current = None
+
+    for number, raw in enumerate(text.splitlines(), 1):
+        where = f"{source}:{number}"
+        stripped = raw.strip()
+        # Comment lines right above a mission become its comment
+        if stripped.startswith("#"):
+            comment.append(stripped[1:].strip())
+            continue
+        line = stripped.split("#", 1)[0].strip()
+        if not line:
+            comment = []
+            continue
+
+        background = line.endswith("&")
+        words = line.rstrip("&").split()
+        op = words[0].lower()
+
+        if op == "robot":
+            if len(words) != 2:
+                raise ValueError(f"{where}: robot needs one name")
+            robot = words[1]
+            continue
+        if op == "mission":
+            if len(words) != 2 or not words[1].isidentifier():
+                raise ValueError(f"{where}: mission needs a name usable as a function name")
+            current = Mission(words[1], comment, number)
+            missions.append(current)
+            comment = []
+            continue
+        comment = []
+        if current is None:
+            raise ValueError(f"{where}: {op!r} before the first 'mission'")
+        if background and op != "arm":
+            raise ValueError(f"{where}: only arm steps can run in the background (&)")
+
+        step = {'op': op, 'line': number, 'background': background}
+        if op == "straight" and len(words) >= 2:
+            step['distance'] = _number(words[1], where, "distance")
+            step['speed'] = _speed(words[2:], op, presets, where)
+        elif op in ("turn", "pivot") and len(words) >= 2:
+            step['angle'] = _number(words[1], where, "angle")
+            step['speed'] = _speed(words[2:], op, presets, where)
+        elif op == "arm" and len(words) >= 4:
+            if words[1] not in ("left", "right") or words[2] not in ("up", "down"):
+                raise ValueError(f"{where}: arm needs left/right and up/down")
+            step['arm'] = words[1]
+            step['direction'] = words[2]
+            step['degrees'] = abs(_number(words[3], where, "degrees"))
+            step['speed'] = _speed(words[4:], op, presets, where)
+        elif op == "wait" and len(words) == 2:
+            step['ms'] = int(_number(words[1], where, "time"))
+        elif op == "sync" and len(words) == 1:
+            pass
+        else:
+            raise ValueError(f"{where}: cannot read {line!r}")
+        current.steps.append(step)
+
+    return robot, missions
+
+
+def load_missions(path, presets=None):
+    with open(path, encoding="utf-8") as f:
+        return parse_missions(f.read(), os.path.relpath(path, REPO_ROOT), presets)
+
+# ============================================================================
+# PYBRICKS
+# ============================================================================
+
+def _pybricks_speed(speed):
+    if speed is None:
+        return ""
+    if isinstance(speed, tuple):
+        return f", {speed[0]}.{speed[1]}"
+    return f", {speed}"
+
+
+def pybricks_step(step):
+    """One step as a robot.py call."""
+    op = step['op']
+    speed = _pybricks_speed(step.get('speed'))
+    if op == "straight":
+        return f"move_straight_gyro({step['distance']}{speed})"
+    if op == "turn":
+        return f"spin_turn({step['angle']}{speed})"
+    if op == "pivot":
+        return f"pivot_turn({step['angle']}{speed})"
+    if op == "arm":
+        background = ", blocking=False" if step['background'] else ""
+        return f"{step['arm']}_arm_{step['direction']}({step['degrees']}{speed}{background})"
+    if op == "wait":
+        return f"wait({step['ms']})"
+    return "wait_for_arms()"
+
+
+def generate_pybricks(missions, source):
+    """A robot.py mission module with one function per mission."""
+    lines = [f"# {GENERATED} from {source} - DO NOT EDIT.",
+             f"#     python -m tools.build_missions {source}",
+             "from robot import *", ""]
+    for mission in missions:
+        lines.append("")
+        lines.extend(f"# {text}" if text else "#" for text in mission.comment)
+        lines.append(f"def {mission.name}():")
+        pending = False
+        for step in mission.steps:
+            lines.append(f"    {pybricks_step(step)}")
+            if step['background']:
+                pending = True
+            elif step['op'] == "sync":
+                pending = False
+        if pending:
+            # Arms started with & finish before the mission returns
+            lines.append("    wait_for_arms()")
+        if not mission.steps:
+            lines.append("    pass")
+    return "\n".join(lines) + "\n"
+
+# ============================================================================
+# SPIKE APP
+# ============================================================================
+
+def read_spike_robot(robot, path=SPIKE_LIBRARY):
+    """
+    Wheel circumference and wheel distance (cm) of a ROBOTS entry in spike/motion.py.
+
+    Raises:
+        ValueError: If the robot is not in ROBOTS
+    """
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name)
+                and node.targets[0].id == "ROBOTS" and isinstance(node.value, ast.Dict)):
+            for key, value in zip(node.value.keys, node.value.values):
+                if isinstance(key, ast.Constant) and key.value == robot:
+                    fields = {k.value: v for k, v in zip(value.keys, value.values)}
+                    numbers = {}
+                    for name in ("wheel_circumference", "distance_between_wheels"):
+                        expression = ast.Expression(fields[name])
+                        numbers[name] = eval(compile(expression, path, "eval"),
+                                             {"__builtins__": {}, "math": math})
+                    return numbers
+    raise ValueError(f"unknown SPIKE robot {robot!r} (see ROBOTS in spike/motion.py)")
+
+
+class SpikeUnits:
+    """robot.py units -> spike/motion.py units for one robot."""
+
+    def __init__(self, wheel_circumference, distance_between_wheels):
+        self.wheel_circumference = wheel_circumference        # cm
+        self.distance_between_wheels = distance_between_wheels  # cm
+
+    def distance(self, mm):
+        return round(mm / 10, 1)
+
+    def drive_velocity(self, mm_per_s):
+        """mm/s -> wheel degrees/second."""
+        return min(SPIKE_MAX_VELOCITY, round(mm_per_s / 10 / self.wheel_circumference * 360))
+
+    def turn_velocity(self, degrees_per_s):
+        """Robot turn rate in a spin -> wheel degrees/second."""
+        wheel = degrees_per_s * math.pi * self.distance_between_wheels / self.wheel_circumference
+        return min(SPIKE_MAX_VELOCITY, round(wheel))
+
+
+def _spike_speed(speed, convert):
+    if speed is None:
+        return ""
+    value = speed[2] if isinstance(speed, tuple) else speed
+    return f", {convert(value)}"
+
+
+def spike_step(step, units):
+    """One step as an awaitable from spike/motion.py (None for sync)."""
+    op = step['op']
+    if op == "straight":
+        return (f"move_for_distance_gyro({units.distance(step['distance'])}"
+                f"{_spike_speed(step['speed'], units.drive_velocity)})")
+    if op == "turn":
+        return f"spin_turn({step['angle']}{_spike_speed(step['speed'], units.turn_velocity)})"
+    if op == "pivot":
+        # Both libraries take the pivot speed as the moving wheel's degrees/second
+        speed = _spike_speed(step['speed'], lambda value: min(SPIKE_MAX_VELOCITY, value))
+        return f"pivot_turn({step['angle']}{speed})"
+    if op == "arm":
+        speed = _spike_speed(step['speed'], lambda value: min(SPIKE_MAX_VELOCITY, value))
+        return f"{SPIKE_ARMS[step['arm']]}({step['degrees']}, \"{step['direction']}\"{speed})"
+    if op == "wait":
+        return f"runloop.sleep_ms({step['ms']})"
+    return None
+
+
+def _spike_groups(steps):
+    """
+    Split the steps at the background arms.
+
+    Returns:
+        list: ('step', step) and ('together', [arm steps], [steps meanwhile])
+    """
+    groups = []
+    index = 0
+    while index < len(steps):
+        step = steps[index]
+        if not step['background']:
+            if step['op'] != "sync":
+                groups.append(("step", step))
+            index += 1
+            continue
+        arms = []
+        while index < len(steps) and steps[index]['background']:
+            arms.append(steps[index])
+            index += 1
+        meanwhile = []
+        while index < len(steps) and steps[index]['op'] != "sync" and not steps[index]['background']:
+            meanwhile.append(steps[index])
+            index += 1
+        if index < len(steps) and steps[index]['op'] == "sync":
+            index += 1
+        groups.append(("together", arms, meanwhile))
+    return groups
+
+
+def generate_spike(mission, robot, units, source):
+    """A SPIKE-app program for one mission (still importing spike/motion.py)."""
+    lines = [f"# {GENERATED} from {source} ({mission.name})",
+             "import runloop", "",
+             f"ROBOT = \"{robot}\"",
+             "from motion import *", ""]
+    lines.extend(f"# {text}" if text else "#" for text in mission.comment)
+    lines.append(f"async def {mission.name}():")
+    leg = 0
+    for group in _spike_groups(mission.steps):
+        if group[0] == "step":
+            lines.append(f"    await {spike_step(group[1], units)}")
+            continue
+        _, arms, meanwhile = group
+        moves = [spike_step(arm, units) for arm in arms]
+        if meanwhile:
+            leg += 1
+            lines.append(f"    async def leg_{leg}():")
+            lines.extend(f"        await {spike_step(step, units)}" for step in meanwhile)
+            moves.append(f"leg_{leg}()")
+        lines.append(f"    await together({', '.join(moves)})")
+    if not mission.steps:
+        lines.append("    pass")
+    lines.extend(["", f"runloop.run({mission.name}())"])
+    return "\n".join(lines) + "\n"
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def write_pybricks(missions, source_path, output=None):
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    path = output or os.path.join(PYBRICKS_DIR, f"{stem}.py")
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            if GENERATED not in f.readline():
+                raise ValueError(f"{os.path.relpath(path, REPO_ROOT)} exists and was not "
+                                 "generated; pass -o to write elsewhere")
+    source = os.path.relpath(source_path, REPO_ROOT).replace(os.sep, "/")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(generate_pybricks(missions, source))
+    return path
+
+
+def write_spike(missions, source_path, robot):
+    """Generate and build one SPIKE upload per mission. Returns the built paths."""
+    units = SpikeUnits(**read_spike_robot(robot))
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    source = os.path.relpath(source_path, REPO_ROOT).replace(os.sep, "/")
+    os.makedirs(SPIKE_SOURCE_DIR, exist_ok=True)
+    paths = []
+    for mission in missions:
+        program = os.path.join(SPIKE_SOURCE_DIR, f"{stem}_{mission.name}.py")
+        with open(program, "w", encoding="utf-8") as f:
+            f.write(generate_spike(mission, robot, units, source))
+        result = build_program(program, robot)
+        path = spike_output_path(program)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(result['text'])
+        paths.append(path)
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate Pybricks and SPIKE-app missions")
+    parser.add_argument("sources", nargs="+", help=".mission files")
+    parser.add_argument("--target", choices=("both", "pybricks", "spike"), default="both")
+    parser.add_argument("--robot", help="SPIKE robot (default: the file's 'robot' line)")
+    parser.add_argument("-o", "--output", help="Pybricks output file (one source only)")
+    args = parser.parse_args(argv)
+    if args.output and len(args.sources) != 1:
+        parser.error("-o needs exactly one source")
+
+    try:
+        presets = read_presets()
+    except (OSError, SyntaxError) as e:
+        print(f"build_missions error: {e}", file=sys.stderr)
+        return 1
+
+    failed = 0
+    for source in args.sources:
+        try:
+            robot, missions = load_missions(source, presets)
+            written = []
+            if args.target in ("both", "pybricks"):
+                written.append(write_pybricks(missions, source, args.output))
+            if args.target in ("both", "spike"):
+                robot = args.robot or robot
+                if robot is None:
+                    raise ValueError(f"{source}: no 'robot' line for the SPIKE target (or use --robot)")
+                written.extend(write_spike(missions, source, robot))
+        except (OSError, SyntaxError, ValueError) as e:
+            print(f"build_missions error: {e}", file=sys.stderr)
+            failed += 1
+            continue
+        print(f"✓ {os.path.relpath(source, REPO_ROOT)}: {len(missions)} missions -> "
+              + ", ".join(os.path.relpath(path, REPO_ROOT) for path in written))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+"""
+Build single-file SPIKE app programs from programs that use spike/motion.py.
+
+Usage:
+    python -m tools.build_spike_program                       # all SPIKE programs
+    python -m tools.build_spike_program aadhir/code_2025_march_23.py
+    python -m tools.build_spike_program joshua/fll2-functions.py --robot joshua -o slot2.py
+
+The SPIKE app cannot import other files, so each program is written out with
+the library pasted in where it says "from motion import *". Only the library
+code the program actually uses is included (functions, constants, imports
+and their dependencies, found from the source without running it), the
+ROBOTS table is cut down to the selected robot and docstrings are dropped,
+so every slot holds as little code as possible.
+
+The robot comes from the program's ROBOT = "<name>" line (or --robot).
+Output goes to build/spike/<program>.py unless -o is given; copy it into a
+SPIKE app project or upload it to a slot.
+"""
+
+import argparse
+import ast
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LIBRARY = os.path.join(REPO_ROOT, "spike", "motion.py")
+LIBRARY_MODULE = "motion"
+OUTPUT_DIR = os.path.join(REPO_ROOT, "build", "spike")
+
+# Programs built when no source is given
+DEFAULT_SOURCES = (
+    "aadhir/code_2025_march_9",
+    "aadhir/code_2025_march_16.py",
+    "aadhir/code_2025_march_23.py",
+    "tamil/final_code.py",
+    "tamil/march_30_2025.py",
+    "joshua/fll2-functions.py",
+    "Shay/TestRun-2025-09-14.py",
+)
+
+# First line of the note at the top of every source program; the note is for
+# the source only and is left out of the upload
+SOURCE_NOTE = "# SPIKE APP: do not paste this file into the app"
+
+HEADER = """\
+# GENERATED by tools/build_spike_program.py from {source}
+# and spike/motion.py (robot "{robot}") - DO NOT EDIT.
+# Change the source or the library and rebuild:
+#     python -m tools.build_spike_program {source}
+"""
+
+
+class Definition:
+    """One top-level library statement and the names it defines and uses."""
+
+    def __init__(self, node):
+        self.node = node
+        self.defines = set()
+        self.uses = set()
+        # Statements that do something when run (motor_pair.pair(...)) are always kept
+        self.always = False
+
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            self.defines.add(node.name)
+            self.uses = _loaded_names(node)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                self.defines.add((alias.asname or alias.name).split(".")[0])
+        elif isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                for name in ast.walk(target):
+                    if isinstance(name, ast.Name):
+                        self.defines.add(name.id)
+            if node.value is not None:
+                self.uses = _loaded_names(node.value)
+        else:
+            self.always = True
+            self.uses = _loaded_names(node)
+
+
+def _loaded_names(node):
+    return {child.id for child in ast.walk(node)
+            if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Load)}
+
+
+def _is_library_import(node):
+    return (isinstance(node, ast.ImportFrom) and node.module == LIBRARY_MODULE
+            and any(alias.name == "*" for alias in node.names))
+
+
+def read_robot(tree):
+    """Value of a top-level ROBOT = "<name>" assignment, or None."""
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name) and node.targets[0].id == "ROBOT"
+                and isinstance(node.value, ast.Constant)):
+            return node.value.value
+    return None
+
+
+def used_definitions(definitions, roots):
+    """The definitions needed for the names in roots (and the always-kept ones)."""
+    by_name = {}
+    for definition in definitions:
+        for name in definition.defines:
+            by_name.setdefault(name, []).append(definition)
+
+    needed = set()
+    pending = list(roots)
+    for definition in definitions:
+        if definition.always:
+            pending.extend(definition.uses)
+    seen = set()
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        for definition in by_name.get(name, ()):
+            if id(definition) not in needed:
+                needed.add(id(definition))
+                pending.extend(definition.uses)
+    return [d for d in definitions if d.always or id(d) in needed]
+
+
+def _strip_docstrings(tree):
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Module, ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            body = node.body
+            if (body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant)
+                    and isinstance(body[0].value.value, str)):
+                node.body = body[1:] or [ast.Pass()]
+
+
+def _select_robot(node, robot):
+    """Set ROBOT and cut ROBOTS down to one entry (in place)."""
+    if not isinstance(node, ast.Assign) or len(node.targets) != 1:
+        return
+    target = node.targets[0]
+    if not isinstance(target, ast.Name):
+        return
+    if target.id == "ROBOT":
+        node.value = ast.Constant(robot)
+    elif target.id == "ROBOTS" and isinstance(node.value, ast.Dict):
+        entries = [(key, value) for key, value in zip(node.value.keys, node.value.values)
+                   if isinstance(key, ast.Constant) and key.value == robot]
+        if not entries:
+            raise ValueError(f"unknown robot {robot!r} (see ROBOTS in spike/motion.py)")
+        node.value.keys = [key for key, _ in entries]
+        node.value.values = [value for _, value in entries]
+
+
+def build_program(source_path, robot=None, library_path=LIBRARY):
+    """
+    Build one single-file program.
+
+    Args:
+        source_path (str): Program that does "from motion import *"
+        robot (str): Robot name (None = the program's ROBOT line)
+        library_path (str): The library source
+
+    Returns:
+        dict: {
+            'text': str,                 # the program to upload
+            'robot': str,
+            'kept': int, 'total': int,   # library definitions used / available
+            'shadowed': [str]            # library names the program redefines
+        }
+
+    Raises:
+        ValueError: If the program does not import the library or no robot is set
+    """
+    with open(source_path, encoding="utf-8") as f:
+        source = f.read()
+    with open(library_path, encoding="utf-8") as f:
+        library = ast.parse(f.read())
+
+    program = ast.parse(source)
+    imports = [node for node in program.body if _is_library_import(node)]
+    if not imports:
+        raise ValueError(f"{source_path} has no 'from {LIBRARY_MODULE} import *'")
+
+    robot = robot or read_robot(program)
+    if robot is None:
+        raise ValueError(f"{source_path} has no ROBOT = \"<name>\" line (or use --robot)")
+
+    _strip_docstrings(library)
+    definitions = [Definition(node) for node in library.body]
+
+    program_defines = {d for node in program.body for d in Definition(node).defines}
+    roots = _loaded_names(program) - program_defines
+    kept = used_definitions(definitions, roots)
+    # Importing the same SPIKE modules again is harmless, redefining a function is not
+    kept_names = {n for d in kept if not isinstance(d.node, (ast.Import, ast.ImportFrom))
+                  for n in d.defines}
+    shadowed = sorted(program_defines & kept_names - {"ROBOT"})
+
+    for definition in kept:
+        _select_robot(definition.node, robot)
+    library_code = ast.unparse(ast.Module(body=[d.node for d in kept], type_ignores=[]))
+
+    # Paste the library over the import line
+    lines = source.splitlines()
+    line = imports[0].lineno - 1
+    lines[line:imports[0].end_lineno] = library_code.splitlines()
+    if lines and lines[0].startswith(SOURCE_NOTE):
+        while lines and lines[0].startswith("#"):
+            lines.pop(0)
+        while lines and not lines[0].strip():
+            lines.pop(0)
+    relative = os.path.relpath(source_path, REPO_ROOT).replace(os.sep, "/")
+    text = HEADER.format(source=relative, robot=robot) + "\n".join(lines) + "\n"
+
+    return {
+        'text': text,
+        'robot': robot,
+        'kept': sum(1 for d in kept if not d.always),
+        'total': sum(1 for d in definitions if not d.always),
+        'shadowed': shadowed,
+    }
+
+
+def output_path(source_path):
+    name = os.path.splitext(os.path.basename(source_path))[0]
+    return os.path.join(OUTPUT_DIR, name + ".py")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build single-file SPIKE app programs")
+    parser.add_argument("sources", nargs="*", help="programs to build (default: all SPIKE programs)")
+    parser.add_argument("--robot", help="robot name from ROBOTS (default: the program's ROBOT line)")
+    parser.add_argument("-o", "--output", help="output file (one source only)")
+    args = parser.parse_args(argv)
+
+    sources = args.sources or [os.path.join(REPO_ROOT, path) for path in DEFAULT_SOURCES]
+    if args.output and len(sources) != 1:
+        parser.error("-o needs exactly one source")
+
+    failed = 0
+    for source in sources:
+        try:
+            result = build_program(source, args.robot)
+        except (OSError, SyntaxError, ValueError) as e:
+            print(f"✗ {source}: {e}", file=sys.stderr)
+            failed += 1
+            continue
+
+        path = args.output or output_path(source)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(result['text'])
+
+        print(f"✓ {os.path.relpath(source, REPO_ROOT)} -> {os.path.relpath(path, REPO_ROOT)} "
+              f"(robot {result['robot']}, {result['kept']}/{result['total']} library "
+              f"definitions, {len(result['text'].encode('utf-8')) / 1024:.1f} KB)")
+        for name in result['shadowed']:
+            print(f"  ⚠ the program redefines library '{name}'")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
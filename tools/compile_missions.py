@@ -0,0 +1,380 @@
+"""
+Find (and remove) wasted time in Pybricks mission files.
+
+Usage:
+    python -m tools.compile_missions pybricks/Missions_10_23.py            # report only
+    python -m tools.compile_missions pybricks/Missions_10_23.py --write    # + Missions_10_23_fast.py
+    python -m tools.compile_missions pybricks/Missions_10_23.py -o pybricks/fast.py
+
+Reads the mission functions without running them and looks for:
+
+    straights   back-to-back move_straight_gyro() calls in the same
+                direction (with only short settle waits between them) become
+                one move that does not stop in between - a slower last leg
+                becomes finish_mm/finish_speed:
+                    move_straight_gyro(640, DriveSpeed.APPROACH)
+                    move_straight_gyro(100, DriveSpeed.PRECISE)
+                ->  move_straight_gyro(740, DriveSpeed.APPROACH,
+                                       finish_mm=100, finish_speed=DriveSpeed.PRECISE)
+    waits       wait(0), waits at the end of a mission and waits right after
+                each other (merged into one)
+    arms        a left and a right arm move right after each other run at
+                the same time (blocking=False, then wait_for_arms())
+
+Only literal arguments are folded; anything the tool cannot read stays as
+it is. Without --write/-o the source is not touched. The faster file keeps
+the comments and everything else of the source, so it can be uploaded in
+its place once the changes have been tried on the table.
+"""
+
+import argparse
+import ast
+import os
+import sys
+
+from tools.build_missions import read_presets
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+GENERATED = "GENERATED by tools/compile_missions.py"
+
+# Waits up to this long between two straights only let the robot settle,
+# which the merged move does not need
+SETTLE_WAIT_MS = 200
+
+ARM_CALLS = {"left_arm_up": "left", "left_arm_down": "left",
+             "right_arm_up": "right", "right_arm_down": "right"}
+
+# ============================================================================
+# READING MISSION STATEMENTS
+# ============================================================================
+
+class Step:
+    """
+    One or more statements of a mission body.
+
+    text is None while the statements are unchanged, otherwise the lines
+    that replace them ([] = removed).
+    """
+
+    def __init__(self, statement, kind="other", **info):
+        self.statements = [statement]
+        self.kind = kind
+        self.info = info
+        self.text = None
+        self.note = None
+
+
+def _literal(node):
+    try:
+        value = ast.literal_eval(node)
+    except ValueError:
+        return None
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+
+def _speed_value(node, presets):
+    """Numeric value of a speed argument (number or DriveSpeed.NAME), else None."""
+    if node is None:
+        return None
+    if (isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name)
+            and node.value.id in presets):
+        return presets[node.value.id].get(node.attr.lower())
+    return _literal(node)
+
+
+def read_step(statement, presets):
+    """Classify one statement as a straight, wait, arm move or other."""
+    if not (isinstance(statement, ast.Expr) and isinstance(statement.value, ast.Call)
+            and isinstance(statement.value.func, ast.Name)):
+        return Step(statement)
+    call = statement.value
+    name = call.func.id
+    keywords = {k.arg: k.value for k in call.keywords}
+    if None in keywords:
+        return Step(statement)
+
+    if name == "move_straight_gyro" and 1 <= len(call.args) <= 2:
+        distance = _literal(call.args[0])
+        speed = call.args[1] if len(call.args) == 2 else keywords.pop("speed", None)
+        if distance is None or distance == 0 or keywords:
+            return Step(statement)
+        return Step(statement, "straight", distance=distance, speed=speed,
+                    speed_value=_speed_value(speed, presets))
+    if name == "wait" and len(call.args) == 1 and not keywords:
+        ms = _literal(call.args[0])
+        if ms is not None:
+            return Step(statement, "wait", ms=ms)
+    if name in ARM_CALLS and "blocking" not in keywords:
+        return Step(statement, "arm", arm=ARM_CALLS[name], call=call)
+    return Step(statement)
+
+# ============================================================================
+# PASSES
+# ============================================================================
+
+def _number(value):
+    return int(value) if value == int(value) else round(value, 1)
+
+
+def _same_speed(a, b):
+    if a.info['speed'] is None or b.info['speed'] is None:
+        return a.info['speed'] is None and b.info['speed'] is None
+    if a.info['speed_value'] is not None and b.info['speed_value'] is not None:
+        return a.info['speed_value'] == b.info['speed_value']
+    return ast.dump(a.info['speed']) == ast.dump(b.info['speed'])
+
+
+def merge_straights(steps):
+    """Fold runs of same-direction straights (and settle waits between them)."""
+    result = []
+    index = 0
+    while index < len(steps):
+        first = steps[index]
+        index += 1
+        if first.kind != "straight":
+            result.append(first)
+            continue
+
+        merged = [first]
+        total = first.info['distance']
+        finish = None       # the straight whose speed the finish uses
+        finish_mm = 0
+        waits = []
+        while index < len(steps):
+            step = steps[index]
+            if step.kind == "wait" and step.info['ms'] <= SETTLE_WAIT_MS:
+                waits.append(step)
+                index += 1
+                continue
+            if step.kind != "straight" or (step.info['distance'] > 0) != (total > 0):
+                break
+            if finish is None and _same_speed(step, first):
+                pass
+            elif finish is not None and _same_speed(step, finish):
+                finish_mm += abs(step.info['distance'])
+            elif (finish is None and first.info['speed_value'] is not None
+                    and step.info['speed_value'] is not None
+                    and step.info['speed_value'] < first.info['speed_value']):
+                finish = step
+                finish_mm = abs(step.info['distance'])
+            else:
+                break
+            merged.extend(waits)
+            merged.append(step)
+            waits = []
+            total += step.info['distance']
+            index += 1
+        # Waits that did not lead to another straight stay where they were
+        index -= len(waits)
+
+        if len(merged) == 1:
+            result.append(first)
+            continue
+        arguments = [str(_number(total))]
+        if first.info['speed'] is not None:
+            arguments.append(ast.unparse(first.info['speed']))
+        if finish is not None:
+            arguments.append(f"finish_mm={_number(finish_mm)}")
+            arguments.append(f"finish_speed={ast.unparse(finish.info['speed'])}")
+        step = Step(None, "merged")
+        step.statements = [s for m in merged for s in m.statements]
+        step.text = [f"move_straight_gyro({', '.join(arguments)})"]
+        straights = sum(1 for m in merged if m.kind == "straight")
+        dropped = sum(m.info['ms'] for m in merged if m.kind == "wait")
+        step.note = (f"{straights} straights in one move"
+                     + (f", drops {dropped} ms of waits" if dropped else ""))
+        step.info = {'stops': straights - 1, 'wait_ms': dropped}
+        result.append(step)
+    return result
+
+
+def drop_waits(steps, end_of_mission):
+    """Remove wait(0), merge back-to-back waits and drop a mission's final waits."""
+    result = []
+    for step in steps:
+        if step.kind == "wait" and step.info['ms'] == 0:
+            step.text = []
+            step.note = "wait(0)"
+            step.info = {'wait_ms': 0}
+            result.append(step)
+            continue
+        previous = result[-1] if result else None
+        if step.kind == "wait" and previous is not None and previous.kind == "wait":
+            ms = previous.info['ms'] + step.info['ms']
+            previous.statements.extend(step.statements)
+            previous.text = [f"wait({_number(ms)})"]
+            previous.info['ms'] = ms
+            previous.note = f"back-to-back waits as one wait({_number(ms)})"
+            continue
+        result.append(step)
+
+    if end_of_mission:
+        for step in reversed(result):
+            if step.kind == "wait":
+                step.text = []
+                step.note = f"wait({_number(step.info['ms'])}) at the end of the mission"
+                step.info = {'wait_ms': step.info['ms']}
+            elif step.text != []:
+                break
+    return result
+
+
+def overlap_arms(steps):
+    """Run a left and a right arm move that follow each other at the same time."""
+    result = []
+    index = 0
+    while index < len(steps):
+        step = steps[index]
+        following = steps[index + 1] if index + 1 < len(steps) else None
+        if (step.kind == "arm" and following is not None and following.kind == "arm"
+                and step.info['arm'] != following.info['arm']):
+            calls = []
+            for arm in (step, following):
+                call = arm.info['call']
+                calls.append(ast.unparse(ast.Call(
+                    call.func, call.args,
+                    call.keywords + [ast.keyword("blocking", ast.Constant(False))])))
+            pair = Step(None, "arms")
+            pair.statements = step.statements + following.statements
+            pair.text = calls + ["wait_for_arms()"]
+            pair.note = "left and right arm at the same time"
+            pair.info = {'overlapped': 1}
+            result.append(pair)
+            index += 2
+            continue
+        result.append(step)
+        index += 1
+    return result
+
+
+def compile_body(body, presets, end_of_mission=True):
+    """Run the passes over one statement list (and the bodies nested in it)."""
+    steps = [read_step(statement, presets) for statement in body]
+    steps = merge_straights(steps)
+    steps = drop_waits(steps, end_of_mission)
+    steps = overlap_arms(steps)
+    changed = [step for step in steps if step.text is not None]
+
+    for statement in body:
+        for field in ("body", "orelse"):
+            nested = getattr(statement, field, None)
+            if isinstance(nested, list) and nested and isinstance(nested[0], ast.stmt):
+                changed.extend(compile_body(nested, presets, end_of_mission=False))
+    return changed
+
+
+def compile_missions(source, presets):
+    """
+    Find the changes for every top-level function of a mission file.
+
+    Args:
+        source (str): Mission file contents
+        presets (dict): From tools.build_missions.read_presets()
+
+    Returns:
+        list: (function_name, [Step]) for the functions with changes
+    """
+    tree = ast.parse(source)
+    found = []
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef):
+            steps = compile_body(node.body, presets)
+            if steps:
+                found.append((node.name, sorted(steps, key=lambda s: s.statements[0].lineno)))
+    return found
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def rewrite(source, found):
+    """The source with every change applied (comments inside a change are kept)."""
+    lines = source.splitlines()
+    steps = sorted((step for _, steps in found for step in steps),
+                   key=lambda s: s.statements[0].lineno, reverse=True)
+    for step in steps:
+        first = step.statements[0]
+        start = first.lineno - 1
+        end = max(s.end_lineno for s in step.statements)
+        indent = " " * first.col_offset
+        comments = [line for line in lines[start:end] if line.strip().startswith("#")]
+        lines[start:end] = comments + [indent + text for text in step.text]
+    return "\n".join(lines) + "\n"
+
+
+def summarize(found):
+    """Totals over all changes: stops removed, wait ms dropped, arm moves overlapped."""
+    totals = {'changes': 0, 'stops': 0, 'wait_ms': 0, 'overlapped': 0}
+    for _, steps in found:
+        for step in steps:
+            totals['changes'] += 1
+            for key in ('stops', 'wait_ms', 'overlapped'):
+                totals[key] += step.info.get(key, 0)
+    return totals
+
+
+def print_report(path, found):
+    print(os.path.relpath(path, REPO_ROOT))
+    for name, steps in found:
+        print(f"  {name}()")
+        for step in steps:
+            first = step.statements[0].lineno
+            last = max(s.end_lineno for s in step.statements)
+            lines = f"{first}" if first == last else f"{first}-{last}"
+            result = " / ".join(step.text) if step.text else "removed"
+            print(f"    line {lines:<8} {step.note}: {result}")
+    totals = summarize(found)
+    print(f"✓ {totals['changes']} changes in {len(found)} missions: {totals['stops']} stops "
+          f"and {totals['wait_ms'] / 1000:.1f}s of waits removed, "
+          f"{totals['overlapped']} arm moves overlapped")
+
+
+def output_path(path):
+    stem, extension = os.path.splitext(path)
+    return f"{stem}_fast{extension}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Find and remove wasted time in mission files")
+    parser.add_argument("sources", nargs="+", help="Pybricks mission files")
+    parser.add_argument("--write", action="store_true",
+                        help="write <file>_fast.py next to each source")
+    parser.add_argument("-o", "--output", help="output file (one source only)")
+    args = parser.parse_args(argv)
+    if args.output and len(args.sources) != 1:
+        parser.error("-o needs exactly one source")
+
+    failed = 0
+    presets = read_presets()
+    for path in args.sources:
+        try:
+            with open(path, encoding="utf-8") as f:
+                source = f.read()
+            found = compile_missions(source, presets)
+        except (OSError, SyntaxError) as e:
+            print(f"compile_missions error: {e}", file=sys.stderr)
+            failed += 1
+            continue
+        if not found:
+            print(f"✓ {os.path.relpath(path, REPO_ROOT)}: nothing to change")
+            continue
+        print_report(path, found)
+
+        if args.write or args.output:
+            target = args.output or output_path(path)
+            if os.path.abspath(target) == os.path.abspath(path):
+                print("compile_missions error: will not overwrite the source", file=sys.stderr)
+                failed += 1
+                continue
+            relative = os.path.relpath(path, REPO_ROOT).replace(os.sep, "/")
+            with open(target, "w", encoding="utf-8") as f:
+                f.write(f"# {GENERATED} from {relative} - DO NOT EDIT.\n"
+                        f"#     python -m tools.compile_missions {relative} --write\n")
+                f.write(rewrite(source, found))
+            print(f"✓ Wrote {os.path.relpath(target, REPO_ROOT)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
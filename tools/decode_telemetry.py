@@ -0,0 +1,157 @@
+"""
+Decode the mission timing history dumped by pybricks/telemetry.py.
+
+Usage:
+    python -m tools.decode_telemetry hub_log.txt
+    pybricksdev run ble pybricks/telemetry.py | python -m tools.decode_telemetry
+    python -m tools.decode_telemetry hub_log.txt --csv runs.csv
+
+Finds the "TLM1:<hex>" line in the input (the last one wins), prints every
+stored run, a per-slot summary and where the time went by primitive group.
+It also prints the mean successful duration per slot in the form that
+mission_loader.plan_runs(durations=...) takes.
+"""
+
+import argparse
+import csv
+import struct
+import sys
+
+# Must match pybricks/telemetry.py
+MAGIC = 0x7E
+VERSION = 1
+HEADER_FORMAT = "<BBBB"
+RECORD_FORMAT = "<BBH8H8B"
+HISTORY_RECORDS = 16
+TIME_UNIT_MS = 10
+PRIMITIVE_GROUPS = ("straight", "gyro", "turn", "spin", "arm", "adaptive", "sensor", "setup")
+
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+PREFIX = f"TLM{VERSION}:"
+
+
+def find_dump(lines):
+    """Raw bytes of the last TLM line, or None."""
+    data = None
+    for line in lines:
+        start = line.find(PREFIX)
+        if start >= 0:
+            data = bytes.fromhex(line[start + len(PREFIX):].strip())
+    return data
+
+
+def decode_dump(data):
+    """
+    Decode a storage dump.
+
+    Args:
+        data (bytes): Bytes printed by telemetry.dump_history()
+
+    Returns:
+        list: Records as dicts, oldest first (same keys as
+              telemetry.decode_record() plus 'other_ms')
+    """
+    magic, version, next_index, count = struct.unpack_from(HEADER_FORMAT, data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not a telemetry dump (bad magic/version)")
+    count = min(count, HISTORY_RECORDS)
+
+    groups = len(PRIMITIVE_GROUPS)
+    records = []
+    first = (next_index - count) % HISTORY_RECORDS
+    for i in range(count):
+        index = (first + i) % HISTORY_RECORDS
+        fields = struct.unpack_from(RECORD_FORMAT, data, HEADER_SIZE + index * RECORD_SIZE)
+        group_ms = [units * TIME_UNIT_MS for units in fields[3:3 + groups]]
+        mission_ms = fields[2] * TIME_UNIT_MS
+        records.append({
+            'slot': fields[0],
+            'success': bool(fields[1] & 1),
+            'mission_ms': mission_ms,
+            'group_ms': group_ms,
+            'group_calls': list(fields[3 + groups:3 + 2 * groups]),
+            # Waits, prints and anything not in a timed primitive
+            'other_ms': max(0, mission_ms - sum(group_ms)),
+        })
+    return records
+
+
+def print_report(records):
+    print(f"{'#':>3} {'slot':>4} {'ok':>2} {'total':>6} "
+          + " ".join(f"{name[:6]:>6}" for name in PRIMITIVE_GROUPS) + f" {'other':>6}")
+    for number, record in enumerate(records, 1):
+        groups = " ".join(f"{ms / 1000:>6.2f}" for ms in record['group_ms'])
+        print(f"{number:>3} {record['slot']:>4} {'y' if record['success'] else 'n':>2} "
+              f"{record['mission_ms'] / 1000:>6.2f} {groups} {record['other_ms'] / 1000:>6.2f}")
+
+    print("\nPer slot (successful runs):")
+    durations = {}
+    for slot in sorted({record['slot'] for record in records}):
+        runs = [r['mission_ms'] for r in records if r['slot'] == slot and r['success']]
+        failed = sum(1 for r in records if r['slot'] == slot and not r['success'])
+        if runs:
+            mean = sum(runs) / len(runs)
+            durations[slot] = int(round(mean))
+            print(f"  slot {slot:>2}: {len(runs)} runs  mean {mean / 1000:.2f}s  "
+                  f"min {min(runs) / 1000:.2f}s  max {max(runs) / 1000:.2f}s  failed {failed}")
+        else:
+            print(f"  slot {slot:>2}: no successful runs  failed {failed}")
+
+    print("\nWhere the time went (all runs):")
+    totals = [sum(r['group_ms'][g] for r in records) for g in range(len(PRIMITIVE_GROUPS))]
+    named = list(zip(PRIMITIVE_GROUPS, totals)) + [("other", sum(r['other_ms'] for r in records))]
+    overall = sum(ms for _, ms in named) or 1
+    for name, ms in sorted(named, key=lambda item: -item[1]):
+        print(f"  {name:<9} {ms / 1000:>7.2f}s  {100 * ms / overall:5.1f}%")
+
+    print(f"\nplan_runs(durations={durations})")
+
+
+def write_csv(records, path):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["run", "slot", "success", "mission_ms"]
+                        + [f"{name}_ms" for name in PRIMITIVE_GROUPS]
+                        + [f"{name}_calls" for name in PRIMITIVE_GROUPS]
+                        + ["other_ms"])
+        for number, record in enumerate(records, 1):
+            writer.writerow([number, record['slot'], int(record['success']), record['mission_ms']]
+                            + record['group_ms'] + record['group_calls'] + [record['other_ms']])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Decode hub mission timing telemetry")
+    parser.add_argument("log", nargs="?", help="hub output containing a TLM line (default: stdin)")
+    parser.add_argument("--csv", help="also write the runs to this CSV file")
+    args = parser.parse_args(argv)
+
+    if args.log:
+        with open(args.log, encoding="utf-8", errors="replace") as f:
+            data = find_dump(f)
+    else:
+        data = find_dump(sys.stdin)
+
+    if data is None:
+        print(f"decode_telemetry error: no {PREFIX} line found", file=sys.stderr)
+        return 1
+
+    try:
+        records = decode_dump(data)
+    except (ValueError, struct.error) as e:
+        print(f"decode_telemetry error: {e}", file=sys.stderr)
+        return 1
+
+    if not records:
+        print("No runs recorded")
+        return 0
+
+    print_report(records)
+    if args.csv:
+        write_csv(records, args.csv)
+        print(f"\n✓ Wrote {len(records)} runs to {args.csv}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
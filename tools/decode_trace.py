@@ -0,0 +1,232 @@
+"""
+Decode the control-loop trace dumped by pybricks/trace_recorder.py.
+
+Usage:
+    python -m tools.decode_trace hub_log.txt
+    python -m tools.decode_trace hub_log.txt --csv trace.csv
+    python -m tools.decode_trace hub_log.txt --npz trace.npz    (needs NumPy)
+
+Finds the last complete "TRC2 BEGIN" ... "TRC2 END" block in the input and
+prints one line per recorded loop (kind, target, samples, duration). Each
+sample is labelled with the loop it belongs to ('segment', counted from the
+loop markers) and the mission slot that was running ('mission'). When the
+ring buffer wrapped, samples whose loop marker was overwritten get segment -1.
+"""
+
+import argparse
+import csv
+import struct
+import sys
+
+# Must match pybricks/trace_recorder.py
+VERSION = 2
+SAMPLE_FORMAT = "<IfiihhBB"
+KIND_MISSION = 0
+KIND_GYRO = 1
+KIND_SPIN = 2
+KIND_PUSH = 3
+KIND_LINE = 4
+MARKER = 0x80
+KIND_NAMES = {KIND_MISSION: "mission", KIND_GYRO: "gyro", KIND_SPIN: "spin", KIND_PUSH: "push",
+              KIND_LINE: "line"}
+
+SAMPLE_SIZE = struct.calcsize(SAMPLE_FORMAT)
+PREFIX = f"TRC{VERSION}"
+
+FIELDS = ("t_ms", "kind", "segment", "mission", "heading", "left", "right",
+          "command_a", "command_b", "load")
+
+# NumPy dtype of the decoded samples (see to_array())
+DTYPE = [("t_ms", "i4"), ("kind", "u1"), ("segment", "i2"), ("mission", "i2"),
+         ("heading", "f4"), ("left", "i4"), ("right", "i4"),
+         ("command_a", "f4"), ("command_b", "f4"), ("load", "u1")]
+
+
+def find_traces(lines):
+    """
+    Raw bytes of every complete trace block (one per dumped run).
+
+    Args:
+        lines (iterable): Hub output lines
+
+    Returns:
+        list: bytes per block, in log order (samples oldest first)
+    """
+    blocks = []
+    block = None
+    expected = 0
+    for line in lines:
+        start = line.find(PREFIX)
+        if start < 0:
+            continue
+        text = line[start + len(PREFIX):].strip()
+        if text.startswith("BEGIN"):
+            block = []
+            expected = int(text.split()[1])
+        elif text == "END" and block is not None:
+            raw = bytes.fromhex("".join(block))
+            if len(raw) == expected * SAMPLE_SIZE:
+                blocks.append(raw)
+            block = None
+        elif text.startswith(":") and block is not None:
+            block.append(text[1:])
+    return blocks
+
+
+def find_trace(lines):
+    """Raw bytes of the last complete trace block, or None."""
+    blocks = find_traces(lines)
+    return blocks[-1] if blocks else None
+
+
+def decode_trace(data):
+    """
+    Decode trace bytes into loops and samples.
+
+    Args:
+        data (bytes): Bytes printed by trace_recorder.dump()
+
+    Returns:
+        tuple: (segments, samples)
+            segments: list of dicts, one per loop marker
+                {'segment', 'kind', 'mission', 't_ms', 'target', 'speed', 'extra'}
+            samples: list of dicts with the keys in FIELDS, heading in
+                degrees and command_b in its own units (not 0.1 units)
+    """
+    segments = []
+    samples = []
+    segment = -1
+    mission = -1
+    for fields in struct.iter_unpack(SAMPLE_FORMAT, data):
+        t_ms, heading, left, right, command_a, command_b, load, tag = fields
+        kind = tag & ~MARKER
+        if tag & MARKER:
+            if kind == KIND_MISSION:
+                mission = right
+                continue
+            segment += 1
+            segments.append({
+                'segment': segment,
+                'kind': kind,
+                'mission': mission,
+                't_ms': t_ms,
+                'target': left / 10,
+                'speed': command_a,
+                'extra': right,
+            })
+            continue
+        samples.append({
+            't_ms': t_ms,
+            'kind': kind,
+            'segment': segment,
+            'mission': mission,
+            'heading': heading,
+            'left': left,
+            'right': right,
+            'command_a': command_a,
+            'command_b': command_b / 10,
+            'load': load,
+        })
+    return segments, samples
+
+
+def to_array(samples):
+    """
+    Samples as a NumPy structured array (dtype DTYPE).
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    import numpy as np
+    return np.array([tuple(sample[name] for name in FIELDS) for sample in samples], dtype=DTYPE)
+
+
+def load_trace(path):
+    """
+    Read a hub log and decode its last trace.
+
+    Args:
+        path (str): Hub output file ("-" for stdin)
+
+    Returns:
+        tuple: (segments, samples) as from decode_trace()
+
+    Raises:
+        ValueError: If the log has no complete trace block
+    """
+    if path == "-":
+        data = find_trace(sys.stdin)
+    else:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            data = find_trace(f)
+    if data is None:
+        raise ValueError(f"no complete {PREFIX} BEGIN/END block found")
+    return decode_trace(data)
+
+
+def print_segments(segments, samples):
+    print(f"{'#':>3} {'mission':>7} {'kind':<5} {'target':>8} {'speed':>6} "
+          f"{'samples':>7} {'time':>6} {'period':>7}")
+    for segment in segments:
+        times = [s['t_ms'] for s in samples if s['segment'] == segment['segment']]
+        duration = (times[-1] - segment['t_ms']) if times else 0
+        period = (times[-1] - times[0]) / (len(times) - 1) if len(times) > 1 else 0
+        mission = segment['mission'] if segment['mission'] >= 0 else "-"
+        print(f"{segment['segment']:>3} {mission:>7} {KIND_NAMES.get(segment['kind'], '?'):<5} "
+              f"{segment['target']:>8.1f} {segment['speed']:>6} {len(times):>7} "
+              f"{duration / 1000:>5.2f}s {period:>5.1f}ms")
+
+
+def write_csv(samples, path):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDS)
+        for sample in samples:
+            writer.writerow([sample[name] for name in FIELDS])
+
+
+def write_npz(segments, samples, path):
+    import numpy as np
+    np.savez(path,
+             samples=to_array(samples),
+             segments=np.array([(s['segment'], s['kind'], s['mission'], s['t_ms'],
+                                 s['target'], s['speed'], s['extra']) for s in segments],
+                               dtype=[("segment", "i2"), ("kind", "u1"), ("mission", "i2"),
+                                      ("t_ms", "i4"), ("target", "f4"), ("speed", "i2"),
+                                      ("extra", "i4")]))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Decode a hub control-loop trace")
+    parser.add_argument("log", nargs="?", default="-",
+                        help="hub output containing a trace dump (default: stdin)")
+    parser.add_argument("--csv", help="write the samples to this CSV file")
+    parser.add_argument("--npz", help="write samples and segments to this NumPy .npz file")
+    args = parser.parse_args(argv)
+
+    try:
+        segments, samples = load_trace(args.log)
+    except (ValueError, struct.error) as e:
+        print(f"decode_trace error: {e}", file=sys.stderr)
+        return 1
+
+    if not segments:
+        print(f"No control loops in the trace ({len(samples)} samples)")
+    else:
+        print_segments(segments, samples)
+
+    if args.csv:
+        write_csv(samples, args.csv)
+        print(f"\n✓ Wrote {len(samples)} samples to {args.csv}")
+    if args.npz:
+        try:
+            write_npz(segments, samples, args.npz)
+        except ImportError:
+            print("decode_trace error: --npz needs NumPy (pip install numpy)", file=sys.stderr)
+            return 1
+        print(f"✓ Wrote {len(samples)} samples to {args.npz}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,930 @@
+"""
+Estimate how long missions take, from the source, without a robot.
+
+Usage:
+    python -m tools.estimate_time pybricks/Missions_10_23.py
+    python -m tools.estimate_time pybricks/competition_setup.py --handling 5
+    python -m tools.estimate_time pybricks/RickRoll.py Shay/TestRun-2025-09-14.py
+    python -m tools.estimate_time pybricks/Missions_10_23.py --run mission8_Silo,mission7_HeavyLifting
+
+Walks the mission functions (and the helpers they call, from the file and
+from robot.py / spike/motion.py) with the literal arguments filled in, and
+adds up a time for every motion call:
+
+    Pybricks   move_straight_gyro / move_straight / turn / spin_turn /
+               pivot_turn and the arm calls, from the speeds, accelerations,
+               geometry and spin_turn gains of the robot_config.py profile;
+               wait(); arms started with blocking=False overlap until
+               wait_for_arms()
+    SPIKE app  motor_pair / motor moves and runloop.sleep_ms(), plus
+               move_for_distance_gyro and spin_turn from spike/motion.py,
+               for the program's ROBOT (or its own WHEEL_CIRCUMFERENCE ...);
+               together() counts the longest move, race() the shortest
+
+Calls whose time depends on sensors (line following, pushing until
+resistance, grabbing until a load...) and loops that do not count to a
+literal are listed instead of guessed. If the file registers missions
+(register_mission()), those are the run, in slot order; otherwise every
+function that moves the robot and is not called by another one is a
+mission. The run (plus --handling seconds between missions) is compared
+with the 150 second match; the exit status is 1 if it does not fit.
+
+Only robot_config.py is imported (with the simulator's stand-in pybricks
+package); the programs are read, not run, so a file takes a fraction of a
+second - cheap enough to run on every save.
+"""
+
+import argparse
+import ast
+import math
+import os
+import sys
+
+from simulator import session
+from tools.build_mission_table import read_missions
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SPIKE_DIR = os.path.join(REPO_ROOT, "spike")
+
+MATCH_SECONDS = 150
+
+# Motor limits, the same as the simulator's SimMotor
+MOTOR_MAX_SPEED = 1000      # deg/s
+MOTOR_ACCELERATION = 4000   # deg/s^2 (Pybricks run_angle)
+
+# SPIKE app defaults when a call does not give them
+SPIKE_VELOCITY = 360        # deg/s
+SPIKE_ACCELERATION = 1000   # deg/s^2
+
+# IMU settle wait at the start of move_straight_gyro()/spin_turn()
+SETTLE_SECONDS = 0.05
+
+# Loops are walked at most this many times
+MAX_ITERATIONS = 1000
+MAX_DEPTH = 30
+
+KINDS = ("drive", "turn", "arm", "wait")
+
+# Calls whose time cannot be known from the source
+SENSOR = "depends on sensors"
+POSITION = "moves to a position, from wherever the motor is"
+UNTIMED_CALLS = {
+    "grab_until_load": SENSOR, "lift_adaptive": SENSOR, "push_until_resistance": SENSOR,
+    "move_until_line": SENSOR, "move_until_distance": SENSOR,
+    "left_arm_up_monitored": SENSOR, "right_arm_up_monitored": SENSOR,
+    "reset_arm_to_limit": SENSOR, "square_on_line": SENSOR,
+    "align_robot_on_black": SENSOR, "align_robot_on_red": SENSOR,
+    "align_robot_on_white": SENSOR, "wait_for_button": SENSOR, "runloop.until": SENSOR,
+    "attachment_to_position": POSITION, "left_arm_to": POSITION, "right_arm_to": POSITION,
+    "motor.run_to_absolute_position": POSITION, "motor.run_to_relative_position": POSITION,
+}
+
+# Pure builtins the walker may call
+BUILTINS = {"abs": abs, "int": int, "float": float, "min": min, "max": max,
+            "round": round, "len": len, "range": range, "isinstance": isinstance,
+            "str": str, "bool": bool, "True": True, "False": False, "None": None}
+
+# Methods of plain values that have no side effects
+SAFE_TYPES = (dict, str, tuple, list, int, float)
+
+# ============================================================================
+# MOTION TIMES
+# ============================================================================
+
+def move_time(distance, speed, acceleration, stop=True):
+    """
+    Seconds for a trapezoid move from standstill.
+
+    Args:
+        distance (float): mm or degrees (sign ignored)
+        speed (float): Cruise speed
+        acceleration (float): Acceleration (and deceleration)
+        stop (bool): Decelerate to a stop at the end (False = cut off at speed)
+    """
+    distance = abs(distance)
+    speed = abs(speed)
+    if distance == 0 or speed == 0:
+        return 0.0
+    ramps = 2 if stop else 1
+    ramp_distance = ramps * speed * speed / (2 * acceleration)
+    if distance >= ramp_distance:
+        return (distance - ramp_distance) / speed + ramps * speed / acceleration
+    # Never reaches the cruise speed
+    peak = math.sqrt(2 * acceleration * distance / ramps)
+    return ramps * peak / acceleration
+
+
+def legs_time(legs, acceleration):
+    """
+    Seconds to drive legs [(distance, speed), ...] without stopping between
+    them, speeding up or slowing down at each leg's start.
+    """
+    total = 0.0
+    speed = 0.0
+    for distance, target in legs:
+        distance = abs(distance)
+        target = abs(target)
+        change = abs(target * target - speed * speed) / (2 * acceleration)
+        if distance <= change:
+            sign = 1 if target > speed else -1
+            end = math.sqrt(max(0.0, speed * speed + sign * 2 * acceleration * distance))
+            total += abs(end - speed) / acceleration
+            speed = end
+        elif target > 0:
+            total += abs(target - speed) / acceleration + (distance - change) / target
+            speed = target
+    return total
+
+
+def proportional_turn_time(angle, base, gain, limit, ratio, tolerance, floor=0.0):
+    """
+    Seconds for a turn whose wheel speed follows the heading error.
+
+    Wheel speed = clamp(base + gain * error, floor, limit) (deg/s), robot
+    turn rate = wheel speed / ratio, until the error is inside tolerance.
+    """
+    error = abs(angle)
+    if error <= tolerance or gain <= 0:
+        return 0.0
+    seconds = 0.0
+    # Wheels at the limit while the error is large
+    capped = (limit - base) / gain
+    if error > capped:
+        seconds += (error - capped) * ratio / limit
+        error = capped
+    # At the floor once the error is small
+    floored = max(tolerance, (floor - base) / gain)
+    if error > floored:
+        seconds += ratio / gain * math.log((base + gain * error) / (base + gain * floored))
+        error = floored
+    if error > tolerance:
+        seconds += (error - tolerance) * ratio / max(floor, base + gain * tolerance)
+    return seconds
+
+# ============================================================================
+# TIME OF ONE PIECE OF CODE
+# ============================================================================
+
+class Estimate:
+    """Seconds per kind of step, plus what could not be timed."""
+
+    def __init__(self):
+        self.seconds = dict.fromkeys(KINDS, 0.0)
+        self.unknown = []       # (file:line, text)
+
+    @property
+    def total(self):
+        return sum(self.seconds.values())
+
+    def add(self, other):
+        for kind in KINDS:
+            self.seconds[kind] += other.seconds[kind]
+        for item in other.unknown:
+            if item not in self.unknown:
+                self.unknown.append(item)
+
+
+class Module:
+    """A parsed source file: its top-level statements."""
+
+    _cache = {}
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, encoding="utf-8") as f:
+            self.tree = ast.parse(f.read(), path)
+        self.name = os.path.splitext(os.path.basename(path))[0]
+        self.functions = {node.name: node for node in self.tree.body
+                          if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))}
+
+    @classmethod
+    def load(cls, path):
+        path = os.path.abspath(path)
+        if path not in cls._cache:
+            cls._cache[path] = cls(path)
+        return cls._cache[path]
+
+    @property
+    def spike(self):
+        """True for SPIKE-app programs (they use runloop)."""
+        for node in self.tree.body:
+            if isinstance(node, ast.Import) and any(a.name == "runloop" for a in node.names):
+                return True
+            if isinstance(node, ast.ImportFrom) and node.module == "motion":
+                return True
+        return False
+
+
+class _Return(Exception):
+    def __init__(self, value):
+        self.value = value
+
+
+class _Break(Exception):
+    pass
+
+
+class _Continue(Exception):
+    pass
+
+
+class Walker:
+    """
+    Walks mission code with the literal values it can work out and adds up
+    the time of every motion call.
+
+    Values it cannot work out are None; a call with a None distance is
+    listed as unknown instead of timed.
+    """
+
+    def __init__(self, module, robot=None, profile=None):
+        self.module = module
+        self.spike = module.spike
+        self.globals = dict(BUILTINS)
+        self.functions = {}         # name -> (FunctionDef, Module)
+        self.where = None           # current file:line
+        self.depth = 0
+        self.now = 0.0              # time along the walked path
+        self.arms_until = {}        # arm -> time its blocking=False move ends
+        self.estimate = None
+
+        if self.spike:
+            if robot is not None:
+                self.globals["ROBOT"] = robot
+            self.models = self._spike_models()
+        else:
+            self._load_profile(profile)
+            self.models = self._pybricks_models()
+        self._run_module(module)
+
+    # ---- setup -------------------------------------------------------------
+
+    def _load_profile(self, name):
+        session.install_paths()
+        import robot_config
+        self.profile = robot_config.get_profile(name or robot_config.ACTIVE_PROFILE)
+        for preset in ("DriveSpeed", "TurnSpeed", "ArmSpeed"):
+            self.globals[preset] = getattr(robot_config, preset)
+        self.globals["PROFILE"] = self.profile
+
+    def _library_path(self, module_name):
+        folder = SPIKE_DIR if self.spike and module_name == "motion" else os.path.dirname(self.module.path)
+        path = os.path.join(folder, module_name + ".py")
+        return path if os.path.exists(path) else None
+
+    def _run_module(self, module, seen=None):
+        """Bind a module's functions and constants (imports of sibling files first)."""
+        seen = seen if seen is not None else set()
+        if module.path in seen:
+            return
+        seen.add(module.path)
+        for node in module.tree.body:
+            self.where = f"{os.path.relpath(module.path, REPO_ROOT)}:{node.lineno}"
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    if alias.name == "math":
+                        self.globals[alias.asname or "math"] = math
+            elif isinstance(node, ast.ImportFrom):
+                if node.module == "math":
+                    self.globals.update({n: getattr(math, n) for n in dir(math) if not n.startswith("_")})
+                    continue
+                path = node.module and self._library_path(node.module)
+                if path:
+                    self._run_module(Module.load(path), seen)
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                self.functions[node.name] = (node, module)
+                self.globals.pop(node.name, None)
+            elif isinstance(node, ast.Assign):
+                # The program's ROBOT line picks the library's robot
+                names = [t.id for t in node.targets if isinstance(t, ast.Name)]
+                if names == ["ROBOT"] and "ROBOT" in self.globals:
+                    continue
+                value = self._value(node.value, self.globals, timed=False)
+                if value is not None:
+                    for target in node.targets:
+                        self._bind(target, value, self.globals)
+
+    # ---- values ------------------------------------------------------------
+
+    def _lookup(self, name, names):
+        if name in names:
+            return names[name]
+        return self.globals.get(name)
+
+    def _value(self, node, names, timed=True):
+        """Value of an expression (None if unknown); timed calls add their time."""
+        if isinstance(node, ast.Constant):
+            return node.value
+        if isinstance(node, ast.Name):
+            return self._lookup(node.id, names)
+        if isinstance(node, ast.Await):
+            return self._value(node.value, names, timed)
+        if isinstance(node, ast.Attribute):
+            base = self._value(node.value, names, timed)
+            if base is None or isinstance(base, dict):
+                return None
+            return getattr(base, node.attr, None)
+        if isinstance(node, ast.Subscript):
+            base = self._value(node.value, names, timed)
+            key = self._value(node.slice, names, timed)
+            try:
+                return base[key]
+            except (TypeError, KeyError, IndexError):
+                return None
+        if isinstance(node, (ast.Tuple, ast.List)):
+            return tuple(self._value(item, names, timed) for item in node.elts)
+        if isinstance(node, ast.Dict):
+            return {self._value(k, names, timed): self._value(v, names, timed)
+                    for k, v in zip(node.keys, node.values) if k is not None}
+        if isinstance(node, ast.UnaryOp):
+            operand = self._value(node.operand, names, timed)
+            if isinstance(node.op, ast.Not):
+                return None if operand is None else not operand
+            if not isinstance(operand, (int, float)):
+                return None
+            return -operand if isinstance(node.op, ast.USub) else operand
+        if isinstance(node, ast.BinOp):
+            left = self._value(node.left, names, timed)
+            right = self._value(node.right, names, timed)
+            if not isinstance(left, (int, float)) or not isinstance(right, (int, float)):
+                return None
+            operations = {ast.Add: lambda a, b: a + b, ast.Sub: lambda a, b: a - b,
+                          ast.Mult: lambda a, b: a * b, ast.Div: lambda a, b: a / b,
+                          ast.FloorDiv: lambda a, b: a // b, ast.Mod: lambda a, b: a % b,
+                          ast.Pow: lambda a, b: a ** b}
+            try:
+                return operations[type(node.op)](left, right)
+            except (KeyError, ZeroDivisionError, OverflowError):
+                return None
+        if isinstance(node, ast.Compare) and len(node.ops) == 1:
+            left = self._value(node.left, names, timed)
+            right = self._value(node.comparators[0], names, timed)
+            if left is None or right is None:
+                return None
+            comparisons = {ast.Eq: lambda a, b: a == b, ast.NotEq: lambda a, b: a != b,
+                           ast.Lt: lambda a, b: a < b, ast.LtE: lambda a, b: a <= b,
+                           ast.Gt: lambda a, b: a > b, ast.GtE: lambda a, b: a >= b,
+                           ast.Is: lambda a, b: a is b, ast.IsNot: lambda a, b: a is not b}
+            try:
+                return comparisons[type(node.ops[0])](left, right)
+            except (KeyError, TypeError):
+                return None
+        if isinstance(node, ast.BoolOp):
+            values = [self._value(v, names, timed) for v in node.values]
+            if any(v is None for v in values):
+                return None
+            return all(values) if isinstance(node.op, ast.And) else any(values)
+        if isinstance(node, ast.IfExp):
+            test = self._value(node.test, names, timed)
+            if test is None:
+                return None
+            return self._value(node.body if test else node.orelse, names, timed)
+        if isinstance(node, ast.Call):
+            return self._call(node, names) if timed else self._pure_call(node, names)
+        return None
+
+    def _pure_call(self, node, names):
+        """Builtins and methods of plain values only (for module constants)."""
+        func = node.func
+        args = [self._value(a, names, False) for a in node.args]
+        if isinstance(func, ast.Name) and func.id in BUILTINS and callable(BUILTINS[func.id]):
+            try:
+                return BUILTINS[func.id](*args)
+            except (TypeError, ValueError):
+                return None
+        if isinstance(func, ast.Attribute):
+            base = self._value(func.value, names, False)
+            if base is math or isinstance(base, SAFE_TYPES):
+                try:
+                    return getattr(base, func.attr)(*args)
+                except (AttributeError, TypeError, ValueError, KeyError):
+                    return None
+        return None
+
+    def _bind(self, target, value, names):
+        if isinstance(target, ast.Name):
+            names[target.id] = value
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            values = value if isinstance(value, tuple) and len(value) == len(target.elts) else (None,) * len(target.elts)
+            for item, item_value in zip(target.elts, values):
+                self._bind(item, item_value, names)
+
+    # ---- time --------------------------------------------------------------
+
+    def add_time(self, kind, seconds):
+        self.estimate.seconds[kind] += seconds
+        self.now += seconds
+
+    def unknown(self, text):
+        item = (self.where, text)
+        if item not in self.estimate.unknown:
+            self.estimate.unknown.append(item)
+
+    def _branch(self, run):
+        """Run run() on its own estimate, then undo its time (for max/min picks)."""
+        outer, start = self.estimate, self.now
+        self.estimate = Estimate()
+        try:
+            run()
+        finally:
+            branch, self.estimate, self.now = self.estimate, outer, start
+        return branch
+
+    def _take(self, branch):
+        self.estimate.add(branch)
+        self.now += branch.total
+
+    # ---- calls -------------------------------------------------------------
+
+    def _call_name(self, func):
+        if isinstance(func, ast.Name):
+            return func.id
+        parts = []
+        while isinstance(func, ast.Attribute):
+            parts.append(func.attr)
+            func = func.value
+        if isinstance(func, ast.Name):
+            parts.append(func.id)
+            return ".".join(reversed(parts))
+        return None
+
+    def _call(self, node, names):
+        name = self._call_name(node.func)
+        if name in ("together", "race"):
+            branches = [self._branch(lambda m=move: self._value(m, names)) for move in node.args]
+            if branches:
+                pick = max if name == "together" else min
+                self._take(pick(branches, key=lambda b: b.total))
+            return None
+        if name in UNTIMED_CALLS:
+            self.unknown(f"{name}() {UNTIMED_CALLS[name]}")
+            return None
+
+        args = [self._value(a, names) for a in node.args]
+        kwargs = {k.arg: self._value(k.value, names) for k in node.keywords if k.arg}
+
+        if name in self.models:
+            # A program's own version of a primitive keeps its own defaults
+            if name in self.functions:
+                args = self._signature_values(self.functions[name][0], args, kwargs)
+                kwargs = {}
+            return self.models[name](*args, **kwargs)
+        if name in self.functions:
+            return self._run_function(name, args, kwargs)
+        if isinstance(node.func, ast.Name) and callable(self._lookup(name, names)) \
+                and name in BUILTINS:
+            try:
+                return BUILTINS[name](*args, **kwargs)
+            except (TypeError, ValueError):
+                return None
+        if isinstance(node.func, ast.Attribute):
+            base = self._value(node.func.value, names)
+            if base is math or isinstance(base, SAFE_TYPES):
+                try:
+                    return getattr(base, node.func.attr)(*args, **kwargs)
+                except (AttributeError, TypeError, ValueError, KeyError):
+                    return None
+        return None
+
+    def _signature_values(self, function, args, kwargs):
+        """Positional values for all parameters, defaults filled in."""
+        params = function.args.args
+        defaults = [None] * (len(params) - len(function.args.defaults)) + [
+            self._value(d, {}, timed=False) for d in function.args.defaults]
+        values = []
+        for index, param in enumerate(params):
+            if index < len(args):
+                values.append(args[index])
+            else:
+                values.append(kwargs.get(param.arg, defaults[index]))
+        return values
+
+    def _run_function(self, name, args, kwargs):
+        function, module = self.functions[name]
+        if self.depth >= MAX_DEPTH:
+            self.unknown(f"{name}() calls itself too deep to follow")
+            return None
+        names = dict(zip((p.arg for p in function.args.args),
+                         self._signature_values(function, args, kwargs)))
+        where = self.where
+        self.depth += 1
+        try:
+            self._block(function.body, names, module)
+        except _Return as returned:
+            return returned.value
+        except (_Break, _Continue):
+            pass
+        finally:
+            self.depth -= 1
+            self.where = where
+        return None
+
+    # ---- statements --------------------------------------------------------
+
+    def _block(self, body, names, module):
+        for statement in body:
+            self._statement(statement, names, module)
+
+    def _statement(self, node, names, module):
+        self.where = f"{os.path.relpath(module.path, REPO_ROOT)}:{node.lineno}"
+        if isinstance(node, ast.Expr):
+            self._value(node.value, names)
+        elif isinstance(node, ast.Assign):
+            value = self._value(node.value, names)
+            for target in node.targets:
+                self._bind(target, value, names)
+        elif isinstance(node, (ast.AugAssign, ast.AnnAssign)):
+            if node.value is not None:
+                self._value(node.value, names)
+            if isinstance(node.target, ast.Name):
+                names[node.target.id] = None
+        elif isinstance(node, ast.Return):
+            raise _Return(self._value(node.value, names) if node.value else None)
+        elif isinstance(node, ast.Break):
+            raise _Break()
+        elif isinstance(node, ast.Continue):
+            raise _Continue()
+        elif isinstance(node, ast.If):
+            self._if(node, names, module)
+        elif isinstance(node, ast.For):
+            self._for(node, names, module)
+        elif isinstance(node, ast.While):
+            self._while(node, names, module)
+        elif isinstance(node, ast.Try):
+            self._block(node.body, names, module)
+            self._block(node.orelse, names, module)
+            self._block(node.finalbody, names, module)
+        elif isinstance(node, ast.With):
+            self._block(node.body, names, module)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            self.functions[node.name] = (node, module)
+
+    def _if(self, node, names, module):
+        test = self._value(node.test, names)
+        if test is not None:
+            self._block(node.body if test else node.orelse, names, module)
+            return
+        # Unknown condition: budget for the longer branch
+        results = []
+        for body in (node.body, node.orelse):
+            branch_names = dict(names)
+            holder = {}
+
+            def run(body=body, branch_names=branch_names):
+                try:
+                    self._block(body, branch_names, module)
+                except _Return as returned:
+                    holder['return'] = returned
+            results.append((self._branch(run), holder))
+        branch, holder = max(results, key=lambda r: r[0].total)
+        self._take(branch)
+        if 'return' in holder:
+            raise holder['return']
+
+    def _for(self, node, names, module):
+        iterable = self._value(node.iter, names)
+        if iterable is None:
+            self.unknown("loop over values not known before the run (counted once)")
+            iterable = (None,)
+        items = list(iterable)[:MAX_ITERATIONS]
+        for item in items:
+            self._bind(node.target, item, names)
+            try:
+                self._block(node.body, names, module)
+            except _Break:
+                return
+            except _Continue:
+                continue
+        self._block(node.orelse, names, module)
+
+    def _while(self, node, names, module):
+        if self._value(node.test, names) is False:
+            return
+        self.unknown("while loop (counted once)")
+        try:
+            self._block(node.body, names, module)
+        except (_Break, _Continue):
+            pass
+
+    # ---- entry -------------------------------------------------------------
+
+    def describe(self):
+        """Which robot model the times are for."""
+        if self.spike:
+            robot = self.globals.get("ROBOT")
+            return f"SPIKE app, robot {robot}" if robot else "SPIKE app, the program's own constants"
+        return f"Pybricks, profile {self.profile.name}"
+
+    def estimate_function(self, name):
+        """Estimate one function of the module. Returns an Estimate."""
+        self.estimate = Estimate()
+        self.now = 0.0
+        self.arms_until = {}
+        self.depth = 0
+        function, module = self.functions[name]
+        self.where = f"{os.path.relpath(module.path, REPO_ROOT)}:{function.lineno}"
+        self._run_function(name, [], {})
+        return self.estimate
+
+    # ---- Pybricks models ---------------------------------------------------
+
+    def _pybricks_models(self):
+        p = self.profile
+        g = self.globals
+
+        def preset(cls, name, fallback):
+            return getattr(g.get(cls), name, fallback)
+
+        def distance_needed(value, what):
+            if value is None:
+                self.unknown(f"{what} not known before the run")
+                return False
+            return True
+
+        def straight_gyro(distance_mm, speed=None, kp=None, finish_mm=0, finish_speed=None):
+            if not distance_needed(distance_mm, "move_straight_gyro() distance"):
+                return True
+            speed = speed or p.default_speed
+            legs = [(abs(distance_mm), speed)]
+            if finish_speed and finish_mm:
+                legs = [(abs(distance_mm) - abs(finish_mm), speed), (abs(finish_mm), finish_speed)]
+            self.add_time("drive", SETTLE_SECONDS + legs_time(legs, p.default_acceleration))
+            return True
+
+        def straight(distance_mm, speed=None):
+            if distance_needed(distance_mm, "move_straight() distance"):
+                self.add_time("drive", move_time(distance_mm, speed or p.default_speed,
+                                                 p.default_acceleration))
+            return True
+
+        def drive_turn(angle_degrees, speed=None):
+            if distance_needed(angle_degrees, "turn() angle"):
+                speed = speed or preset("TurnSpeed", "STANDARD", p.default_turn_speed)
+                self.add_time("turn", move_time(angle_degrees, speed, p.default_turn_acceleration))
+            return True
+
+        def spin(target_angle, speed=None, kp=None):
+            if not distance_needed(target_angle, "spin_turn() angle"):
+                return 0
+            speed = speed or preset("TurnSpeed", "PRECISE", p.spin_turn_base_speed)
+            kp = kp or p.spin_gains.get(speed, p.spin_turn_kp)
+            self.add_time("turn", SETTLE_SECONDS + proportional_turn_time(
+                target_angle, speed, kp, MOTOR_MAX_SPEED, p.spin_ratio, p.spin_turn_tolerance))
+            return target_angle
+
+        def pivot(angle_degrees, speed=None):
+            if distance_needed(angle_degrees, "pivot_turn() angle"):
+                speed = min(MOTOR_MAX_SPEED, speed or preset("TurnSpeed", "PIVOT", 80))
+                self.add_time("turn", move_time(p.pivot_ratio * angle_degrees, speed,
+                                                MOTOR_ACCELERATION))
+            return True
+
+        def arm(side):
+            def move(degrees, speed=None, blocking=True):
+                if not distance_needed(degrees, "arm degrees"):
+                    return True
+                speed = min(MOTOR_MAX_SPEED, speed or preset("ArmSpeed", "GRAB", 360))
+                seconds = move_time(degrees, speed, MOTOR_ACCELERATION)
+                # A new move on a busy arm waits for nothing: it replaces the old one
+                if blocking is False:
+                    self.arms_until[side] = self.now + seconds
+                else:
+                    self.arms_until.pop(side, None)
+                    self.add_time("arm", seconds)
+                return True
+            return move
+
+        def wait_for_arms(timeout_ms=5000):
+            end = max(self.arms_until.values(), default=self.now)
+            self.arms_until = {}
+            if end > self.now:
+                self.add_time("arm", min(end - self.now, timeout_ms / 1000))
+
+        def wait(ms):
+            if distance_needed(ms, "wait() time"):
+                self.add_time("wait", ms / 1000)
+
+        return {
+            "move_straight_gyro": straight_gyro,
+            "move_straight": straight,
+            "turn": drive_turn,
+            "spin_turn": spin,
+            "pivot_turn": pivot,
+            "left_arm_up": arm("left"), "left_arm_down": arm("left"),
+            "right_arm_up": arm("right"), "right_arm_down": arm("right"),
+            "wait_for_arms": wait_for_arms,
+            "wait": wait,
+        }
+
+    # ---- SPIKE models ------------------------------------------------------
+
+    def _spike_models(self):
+        g = self.globals
+
+        def constant(name, fallback):
+            value = g.get(name)
+            return value if isinstance(value, (int, float)) else fallback
+
+        def degrees_needed(value, what):
+            if value is None:
+                self.unknown(f"{what} not known before the run")
+                return False
+            return True
+
+        def sleep(ms):
+            if degrees_needed(ms, "sleep time"):
+                self.add_time("wait", ms / 1000)
+
+        def pair_degrees(pair, degrees, steering=0, velocity=None, acceleration=None, **_):
+            if degrees_needed(degrees, "motor_pair degrees"):
+                kind = "turn" if steering and abs(steering) >= 50 else "drive"
+                self.add_time(kind, move_time(degrees, min(MOTOR_MAX_SPEED, velocity or SPIKE_VELOCITY),
+                                              acceleration or SPIKE_ACCELERATION))
+
+        def pair_time(pair, duration, steering=0, **_):
+            if degrees_needed(duration, "motor_pair time"):
+                self.add_time("drive", duration / 1000)
+
+        def motor_degrees(port, degrees, velocity=None, acceleration=None, **_):
+            if degrees_needed(degrees, "motor degrees"):
+                self.add_time("arm", move_time(degrees, min(MOTOR_MAX_SPEED, velocity or SPIKE_VELOCITY),
+                                               acceleration or SPIKE_ACCELERATION))
+
+        def motor_time(port, duration, velocity=None, **_):
+            if degrees_needed(duration, "motor time"):
+                self.add_time("arm", duration / 1000)
+
+        def gyro_drive(distance_cm, velocity=None, cancel=None):
+            if not degrees_needed(distance_cm, "move_for_distance_gyro() distance"):
+                return
+            wheel = abs(distance_cm) / constant("WHEEL_CIRCUMFERENCE", 17.5) * 360
+            velocity = min(MOTOR_MAX_SPEED, velocity or constant("default_velocity", SPIKE_VELOCITY))
+            # Ramps up at SPIKE_ACCELERATION, slows down at GYRO_DECELERATION
+            deceleration = constant("GYRO_DECELERATION", SPIKE_ACCELERATION)
+            up = velocity * velocity / (2 * SPIKE_ACCELERATION)
+            down = velocity * velocity / (2 * deceleration)
+            if wheel >= up + down:
+                seconds = velocity / SPIKE_ACCELERATION + velocity / deceleration + (wheel - up - down) / velocity
+            else:
+                peak = math.sqrt(2 * wheel / (1 / SPIKE_ACCELERATION + 1 / deceleration))
+                seconds = peak / SPIKE_ACCELERATION + peak / deceleration
+            self.add_time("drive", SETTLE_SECONDS + seconds)
+
+        def spin(degrees, velocity=None, cancel=None):
+            if not degrees_needed(degrees, "spin_turn() angle"):
+                return
+            velocity = min(MOTOR_MAX_SPEED, velocity or constant("default_turn_velocity", 200))
+            # Wheel degrees per robot degree
+            ratio = math.pi * constant("DISTANCE_BETWEEN_WHEELS", 9.7) / constant("WHEEL_CIRCUMFERENCE", 17.5)
+            self.add_time("turn", SETTLE_SECONDS + proportional_turn_time(
+                degrees, 0, constant("SPIN_KP", 6), velocity, ratio,
+                constant("SPIN_TOLERANCE", 1), constant("SPIN_MIN_VELOCITY", 40)))
+
+        def after(delay_ms, function, *args, **kwargs):
+            sleep(delay_ms)
+
+        return {
+            "runloop.sleep_ms": sleep,
+            "motor_pair.move_for_degrees": pair_degrees,
+            "motor_pair.move_for_time": pair_time,
+            "motor.run_for_degrees": motor_degrees,
+            "motor.run_for_time": motor_time,
+            "move_for_distance_gyro": gyro_drive,
+            "spin_turn": spin,
+            "after": after,
+        }
+
+# ============================================================================
+# MISSIONS AND RUNS
+# ============================================================================
+
+def _calls_outside_loops(body):
+    """Calls in a body, leaving out those inside while loops (menus, button waits)."""
+    calls = []
+    for node in body:
+        if isinstance(node, ast.While):
+            continue
+        if isinstance(node, ast.Call):
+            calls.append(node)
+        for field in ast.iter_child_nodes(node):
+            calls.extend(_calls_outside_loops([field]))
+    return calls
+
+
+def mission_names(walker):
+    """
+    The functions of the walker's module that are missions.
+
+    A mission takes no arguments and moves the robot itself - it calls a
+    primitive or a helper that takes arguments, outside of a while loop -
+    and is not called by another mission. Menus and mission_N() wrappers,
+    which only call other missions, are left out.
+    """
+    module = walker.module
+    moves = set()
+    for name, function in module.functions.items():
+        if function.args.args:
+            continue
+        for call in _calls_outside_loops(function.body):
+            called = walker._call_name(call.func)
+            if called in walker.models or called in UNTIMED_CALLS or (
+                    called in walker.functions and walker.functions[called][0].args.args):
+                moves.add(name)
+                break
+    called_by_missions = set()
+    for name in moves:
+        called_by_missions |= {walker._call_name(call.func) for call in ast.walk(module.functions[name])
+                               if isinstance(call, ast.Call)} - {name}
+    return [name for name in module.functions if name in moves and name not in called_by_missions]
+
+
+def find_missions(path, robot=None, profile=None):
+    """
+    Estimate the missions of one file.
+
+    Returns:
+        tuple: ([(name, Estimate, planned_ms or None), ...] in run order,
+                description of the robot model used)
+    """
+    module = Module.load(path)
+    try:
+        registered = read_missions(path)
+    except ValueError:
+        registered = []
+
+    walker = Walker(module, robot, profile)
+    if not registered:
+        return ([(name, walker.estimate_function(name), None) for name in mission_names(walker)],
+                walker.describe())
+
+    results = []
+    for spec in sorted(registered, key=lambda s: s.slot):
+        owner = walker
+        if spec.module != module.name:
+            library = os.path.join(os.path.dirname(path), spec.module + ".py")
+            if not os.path.exists(library):
+                continue
+            owner = Walker(Module.load(library), robot, profile)
+        if spec.function in owner.functions:
+            planned = spec.duration_ms if spec.duration_ms is not None else spec.estimated_ms
+            results.append((spec.function, owner.estimate_function(spec.function), planned))
+    return results, walker.describe()
+
+
+def print_report(path, missions, handling_s, backend):
+    print(f"{os.path.relpath(path, REPO_ROOT)} ({backend})")
+    width = max([len("mission")] + [len(name) for name, _, _ in missions])
+    print(f"  {'mission':<{width}} {'time':>7} {'drive':>7} {'turn':>7} {'arms':>7} {'waits':>7} {'planned':>8}")
+    total = 0.0
+    for name, estimate, planned in missions:
+        seconds = estimate.seconds
+        planned_text = f"{planned / 1000:7.1f}s" if planned else f"{'-':>8}"
+        print(f"  {name:<{width}} {estimate.total:6.1f}s {seconds['drive']:6.1f}s {seconds['turn']:6.1f}s "
+              f"{seconds['arm']:6.1f}s {seconds['wait']:6.1f}s {planned_text}")
+        for where, text in estimate.unknown:
+            print(f"    ⚠ {where}: {text}")
+        total += estimate.total
+
+    handling = handling_s * max(0, len(missions) - 1)
+    run = total + handling
+    spare = MATCH_SECONDS - run
+    extra = f" + {handling:.1f}s handling" if handling else ""
+    verdict = f"{spare:.1f}s spare" if spare >= 0 else f"{-spare:.1f}s OVER"
+    mark = "✓" if spare >= 0 else "✗"
+    print(f"  {mark} run: {len(missions)} missions, {total:.1f}s{extra} = {run:.1f}s "
+          f"of {MATCH_SECONDS}s ({verdict})")
+    return spare >= 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Estimate mission times from the source")
+    parser.add_argument("sources", nargs="+", help="mission files (Pybricks or SPIKE app)")
+    parser.add_argument("--profile", help="robot_config profile for Pybricks files (default: active)")
+    parser.add_argument("--robot", help="SPIKE robot from ROBOTS (default: the file's ROBOT line)")
+    parser.add_argument("--handling", type=float, default=0.0,
+                        help="seconds between missions for resets and attachment changes")
+    parser.add_argument("--run", help="comma-separated missions making up the run, in order")
+    args = parser.parse_args(argv)
+
+    over = False
+    for path in args.sources:
+        try:
+            if args.run:
+                walker = Walker(Module.load(path), args.robot, args.profile)
+                missions = []
+                for name in args.run.split(","):
+                    if name not in walker.functions:
+                        raise ValueError(f"{path}: no function {name!r}")
+                    missions.append((name, walker.estimate_function(name), None))
+                backend = walker.describe()
+            else:
+                missions, backend = find_missions(path, args.robot, args.profile)
+        except (OSError, SyntaxError, ValueError) as e:
+            print(f"estimate_time error: {e}", file=sys.stderr)
+            return 1
+        over |= not print_report(path, missions, args.handling, backend)
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
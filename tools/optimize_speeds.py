@@ -0,0 +1,422 @@
+"""
+Find the fastest speed presets a mission can use and still end up in place.
+
+Usage:
+    python -m tools.optimize_speeds pybricks/Missions_10_23.py mission8_Silo
+    python -m tools.optimize_speeds pybricks/Missions_10_23.py --write      # + Missions_10_23_tuned.py
+    python -m tools.optimize_speeds pybricks/Missions_10_23.py mission8_Silo --tolerance 10 --trials 50
+
+Every move_straight / move_straight_gyro / turn / pivot_turn / spin_turn
+call in a mission has a speed - a DriveSpeed or TurnSpeed preset, a number
+or the default. The tool runs the mission in the simulator and records the
+robot's pose after every statement of the mission body (the key points).
+Then, call by call, it tries each preset of the matching class (all of them
+at once, spread over the CPU cores) and keeps the one that makes the mission
+fastest while every key point stays within --tolerance mm and
+--heading-tolerance degrees of the original run. It repeats until a pass
+changes nothing.
+
+A speed only counts as safe if it also holds up when the world is not
+perfect: the mission is run in --trials more worlds with the start pose,
+wheel slip and gyro disturbed (as simulator/sweep.py does, the same worlds
+for every candidate), and in at least --target of them the key points must
+stay within the tolerances of the original speeds in that same world.
+
+Without --write/-o the source is not touched. The tuned file is the source
+with only the speed arguments changed, to be checked on the table before it
+replaces the original.
+"""
+
+import argparse
+import ast
+import contextlib
+import copy
+import io
+import math
+import multiprocessing
+import os
+import random
+import sys
+
+from simulator import session, sweep
+from simulator.world import SimulationTimeout
+from tools.build_missions import read_presets
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+GENERATED = "GENERATED by tools/optimize_speeds.py"
+
+# Calls whose speed is tuned, and the preset class their speed comes from
+TUNED_CALLS = {
+    "move_straight": "DriveSpeed",
+    "move_straight_gyro": "DriveSpeed",
+    "turn": "TurnSpeed",
+    "pivot_turn": "TurnSpeed",
+    "spin_turn": "TurnSpeed",
+}
+
+TOLERANCE_MM = 10.0
+HEADING_TOLERANCE_DEG = 3.0
+TRIALS = 20
+TARGET_SUCCESS = 0.95
+MAX_PASSES = 3
+
+# Simulated time limit per run
+MAX_TIME_MS = 120000
+
+# Name of the function called after every statement of the mission body
+KEYPOINT = "_optimize_speeds_keypoint"
+
+# ============================================================================
+# SPEED ARGUMENTS
+# ============================================================================
+
+class Slot:
+    """The speed argument of one tuned call (node is None when it is left out)."""
+
+    def __init__(self, call, node, preset_class):
+        self.call = call
+        self.node = node
+        self.preset_class = preset_class
+
+    @property
+    def name(self):
+        return self.call.func.id
+
+    @property
+    def text(self):
+        return ast.unparse(self.node) if self.node is not None else "default"
+
+
+def speed_slots(function, presets):
+    """
+    The tunable speed arguments of a mission, in source order.
+
+    Only speeds that are a preset, a number or left out are tuned; a speed
+    computed from a variable stays as it is.
+    """
+    slots = []
+    for call in ast.walk(function):
+        if not (isinstance(call, ast.Call) and isinstance(call.func, ast.Name)
+                and call.func.id in TUNED_CALLS and 1 <= len(call.args) <= 2):
+            continue
+        if any(isinstance(a, ast.Starred) for a in call.args) or any(k.arg is None for k in call.keywords):
+            continue
+        keywords = {k.arg: k.value for k in call.keywords}
+        node = call.args[1] if len(call.args) == 2 else keywords.get("speed")
+        preset_class = TUNED_CALLS[call.func.id]
+        if node is not None and not (
+                (isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name)
+                 and node.value.id in presets)
+                or isinstance(node, ast.Constant)):
+            continue
+        slots.append(Slot(call, node, preset_class))
+    return sorted(slots, key=lambda s: (s.call.lineno, s.call.col_offset))
+
+
+def candidates(preset_class, presets):
+    """Preset expressions of a class, slowest first (one name per value)."""
+    seen = {}
+    for name, value in presets[preset_class].items():
+        seen.setdefault(value, f"{preset_class}.{name.upper()}")
+    return [seen[value] for value in sorted(seen)]
+
+
+def read_function(path, function):
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == function:
+            return node
+    raise ValueError(f"{os.path.relpath(path, REPO_ROOT)} has no function {function}()")
+
+# ============================================================================
+# SIMULATOR RUNS
+# ============================================================================
+
+# Parsed missions per worker process: {(path, function): FunctionDef}
+_functions = {}
+
+
+def variant(function, speeds, presets):
+    """
+    Code object for the mission with some speeds replaced and key points added.
+
+    Args:
+        function (ast.FunctionDef): The mission as written
+        speeds (dict): {slot index: preset expression}
+    """
+    function = copy.deepcopy(function)
+    for index, slot in enumerate(speed_slots(function, presets)):
+        if index not in speeds:
+            continue
+        value = ast.parse(speeds[index], mode="eval").body
+        if len(slot.call.args) == 2:
+            slot.call.args[1] = value
+        else:
+            slot.call.keywords = [k for k in slot.call.keywords if k.arg != "speed"]
+            slot.call.keywords.append(ast.keyword(arg="speed", value=value))
+    body = []
+    for statement in function.body:
+        body.append(statement)
+        body.append(ast.Expr(ast.Call(ast.Name(KEYPOINT, ast.Load()), [], [])))
+    function.body = body
+    module = ast.fix_missing_locations(ast.Module([function], type_ignores=[]))
+    return compile(module, f"<{function.name} tuned>", "exec")
+
+
+def run_variant(task):
+    """
+    Run a mission with some speeds replaced (worker entry point).
+
+    Args:
+        task (tuple): (path, function, speeds, presets, world_params, seed)
+
+    Returns:
+        dict: {'keypoints': [(x, y, heading), ...], 'time_ms', 'timeout'}
+    """
+    path, name, speeds, presets, params, seed = task
+    if (path, name) not in _functions:
+        _functions[path, name] = read_function(path, name)
+    code = variant(_functions[path, name], speeds, presets)
+
+    world = session.new_world(seed=seed, max_time_ms=MAX_TIME_MS, **params)
+    keypoints = []
+    timeout = False
+    with contextlib.redirect_stdout(io.StringIO()):
+        namespace = vars(session.load_module(os.path.splitext(os.path.basename(path))[0]))
+        namespace[KEYPOINT] = lambda: keypoints.append(world.pose())
+        exec(code, namespace)
+        try:
+            namespace[name]()
+        except SimulationTimeout:
+            timeout = True
+    return {'keypoints': keypoints, 'time_ms': world.time, 'timeout': timeout}
+
+
+def holds(result, reference, tolerance, heading_tolerance):
+    """True if a run reached every key point of the reference run."""
+    if result['timeout'] or len(result['keypoints']) != len(reference):
+        return False
+    for (x, y, heading), (rx, ry, rheading) in zip(result['keypoints'], reference):
+        if math.hypot(x - rx, y - ry) > tolerance:
+            return False
+        if abs((heading - rheading + 180) % 360 - 180) > heading_tolerance:
+            return False
+    return True
+
+# ============================================================================
+# SEARCH
+# ============================================================================
+
+class Optimizer:
+    """
+    Coordinate search over the speed slots of one mission.
+
+    Args:
+        path (str): Program in pybricks/
+        function (str): Mission function
+        presets (dict): read_presets()
+        pool (multiprocessing.Pool): Workers
+        trials (int): Disturbed runs per candidate
+    """
+
+    def __init__(self, path, function, presets, pool, trials=TRIALS, target=TARGET_SUCCESS,
+                 tolerance=TOLERANCE_MM, heading_tolerance=HEADING_TOLERANCE_DEG, seed=0):
+        self.path = path
+        self.function = function
+        self.presets = presets
+        self.pool = pool
+        self.tolerance = tolerance
+        self.heading_tolerance = heading_tolerance
+        self.slots = speed_slots(read_function(path, function), presets)
+        spread = {'start_xy': sweep.START_XY_MM, 'start_heading': sweep.START_HEADING_DEG,
+                  'slip': sweep.SLIP, 'imu_noise': sweep.IMU_NOISE_DEG,
+                  'imu_drift': sweep.IMU_DRIFT_DEG_S}
+        # The same disturbed worlds for every candidate, so they compare fairly
+        self.worlds = [({}, seed)] + [
+            (sweep.disturbances(random.Random(seed + index), spread), seed + index)
+            for index in range(1, trials + 1)]
+
+        # The key points of the mission as written, in each of those worlds
+        original = self._run([{}])[0]
+        self.references = [r['keypoints'] for r in original]
+        self.original_time = original[0]['time_ms']
+        if original[0]['timeout']:
+            raise ValueError(f"{function}() times out in the simulator as written")
+        self.target = target
+
+    def _run(self, variants):
+        """
+        Every speeds dict in every world, as one batch for the pool.
+
+        Returns:
+            list: Per speeds dict, the run_variant() results (nominal first)
+        """
+        tasks = [(self.path, self.function, speeds, self.presets, params, seed)
+                 for speeds in variants for params, seed in self.worlds]
+        results = self.pool.map(run_variant, tasks, chunksize=max(1, len(tasks) // 32))
+        runs = len(self.worlds)
+        return [results[index:index + runs] for index in range(0, len(results), runs)]
+
+    def score(self, results):
+        """
+        Share of disturbed runs that keep the key points of the original
+        speeds in the same world, or 0.0 if the nominal run does not.
+        """
+        checks = [holds(result, reference, self.tolerance, self.heading_tolerance)
+                  for result, reference in zip(results, self.references)]
+        if not checks[0]:
+            return 0.0
+        disturbed = checks[1:]
+        return sum(disturbed) / len(disturbed) if disturbed else 1.0
+
+    def optimize(self, passes=MAX_PASSES, report=print):
+        """
+        Search until a pass changes nothing.
+
+        Returns:
+            tuple: (speeds {slot index: expression}, time_ms, success)
+        """
+        speeds = {}
+        best_time = self.original_time
+        best_success = 1.0
+        for number in range(1, passes + 1):
+            changed = False
+            for index, slot in enumerate(self.slots):
+                current = speeds.get(index)
+                options = [c for c in candidates(slot.preset_class, self.presets) if c != current]
+                batches = self._run([{**speeds, index: option} for option in options])
+                for option, results in zip(options, batches):
+                    success = self.score(results)
+                    if success >= self.target and results[0]['time_ms'] < best_time:
+                        speeds[index] = option
+                        best_time = results[0]['time_ms']
+                        best_success = success
+                        changed = True
+            report(f"    pass {number}: {best_time / 1000:.2f}s")
+            if not changed:
+                break
+        return speeds, best_time, best_success
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def rewrite(source, changes):
+    """
+    The source with speed arguments replaced.
+
+    Args:
+        changes (list): (Slot, preset expression) - slots from the source's own tree
+    """
+    lines = source.splitlines(keepends=True)
+    edits = []
+    for slot, expression in changes:
+        if slot.node is not None:
+            edits.append((slot.node.lineno, slot.node.col_offset,
+                          slot.node.end_lineno, slot.node.end_col_offset, expression))
+        else:
+            last = slot.call.args[-1]
+            edits.append((last.end_lineno, last.end_col_offset,
+                          last.end_lineno, last.end_col_offset, f", {expression}"))
+    # From the end, so earlier positions stay valid (offsets are in UTF-8 bytes)
+    for start_line, start_col, end_line, end_col, text in sorted(edits, reverse=True):
+        first = lines[start_line - 1].encode("utf-8")
+        last = lines[end_line - 1].encode("utf-8")
+        merged = first[:start_col] + text.encode("utf-8") + last[end_col:]
+        lines[start_line - 1:end_line] = [merged.decode("utf-8")]
+    return "".join(lines)
+
+
+def output_path(path):
+    stem, extension = os.path.splitext(path)
+    return f"{stem}_tuned{extension}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Find the fastest safe speed presets for missions")
+    parser.add_argument("source", help="Pybricks program in pybricks/")
+    parser.add_argument("functions", nargs="*", help="missions (default: every mission in the file)")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE_MM,
+                        help=f"allowed key point position error in mm (default: {TOLERANCE_MM})")
+    parser.add_argument("--heading-tolerance", type=float, default=HEADING_TOLERANCE_DEG,
+                        help=f"allowed key point heading error in degrees (default: {HEADING_TOLERANCE_DEG})")
+    parser.add_argument("--trials", type=int, default=TRIALS,
+                        help=f"disturbed runs per candidate (default: {TRIALS}, 0 = none)")
+    parser.add_argument("--target", type=float, default=TARGET_SUCCESS,
+                        help=f"share of disturbed runs that must hold (default: {TARGET_SUCCESS})")
+    parser.add_argument("--passes", type=int, default=MAX_PASSES)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="processes (default: one per CPU core)")
+    parser.add_argument("--write", action="store_true", help="write <file>_tuned.py next to the source")
+    parser.add_argument("-o", "--output", help="output file")
+    args = parser.parse_args(argv)
+
+    path = os.path.abspath(args.source)
+    if os.path.dirname(path) != session.PYBRICKS_DIR:
+        print("optimize_speeds error: the program must be in pybricks/ to run in the simulator",
+              file=sys.stderr)
+        return 1
+    try:
+        with open(path, encoding="utf-8") as f:
+            source = f.read()
+        tree = ast.parse(source)
+    except (OSError, SyntaxError) as e:
+        print(f"optimize_speeds error: {e}", file=sys.stderr)
+        return 1
+    module = os.path.splitext(os.path.basename(path))[0]
+    functions = args.functions or sweep.mission_functions(module)
+    presets = read_presets()
+    written = {node.name: node for node in tree.body if isinstance(node, ast.FunctionDef)}
+
+    changes = []
+    failed = 0
+    print(os.path.relpath(path, REPO_ROOT))
+    with multiprocessing.Pool(max(1, args.workers)) as pool:
+        for function in functions:
+            if function not in written:
+                print(f"optimize_speeds error: no function {function}()", file=sys.stderr)
+                failed += 1
+                continue
+            print(f"  {function}()")
+            try:
+                optimizer = Optimizer(path, function, presets, pool, args.trials, args.target,
+                                      args.tolerance, args.heading_tolerance, args.seed)
+            except ValueError as e:
+                print(f"    ✗ {e}")
+                failed += 1
+                continue
+            if not optimizer.slots:
+                print("    ✓ no speeds to tune")
+                continue
+            speeds, time_ms, success = optimizer.optimize(args.passes)
+            slots = speed_slots(written[function], presets)
+            for index, expression in sorted(speeds.items()):
+                slot = slots[index]
+                print(f"    line {slot.call.lineno:<5} {slot.name}: {slot.text} -> {expression}")
+                changes.append((slot, expression))
+            if not speeds:
+                print("    ✓ already as fast as the tolerances allow")
+                continue
+            saved = (optimizer.original_time - time_ms) / 1000
+            print(f"    ✓ {optimizer.original_time / 1000:.2f}s -> {time_ms / 1000:.2f}s "
+                  f"({saved:.2f}s faster, {success * 100:.0f}% of disturbed runs hold)")
+
+    if changes and (args.write or args.output):
+        target = args.output or output_path(path)
+        if os.path.abspath(target) == path:
+            print("optimize_speeds error: will not overwrite the source", file=sys.stderr)
+            return 1
+        relative = os.path.relpath(path, REPO_ROOT).replace(os.sep, "/")
+        with open(target, "w", encoding="utf-8") as f:
+            f.write(f"# {GENERATED} from {relative} - DO NOT EDIT.\n"
+                    f"#     python -m tools.optimize_speeds {relative} --write\n")
+            f.write(rewrite(source, changes))
+        print(f"✓ Wrote {os.path.relpath(target, REPO_ROOT)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())